@@ -0,0 +1,135 @@
+"""
+Calendar Index Benchmark
+Compares CalendarView's per-cell scans with utils.calendar_index lookups
+
+Builds a semester of events (a share of them spanning several days) and
+bookings, then does the lookups CalendarView makes to render every month
+(one per day cell, events and bookings) and every week (one per 13 hour
+slots x 7 days) of the semester: the old scan of all items per cell with a
+type-tagged copy per match, and the index (build time included).
+
+Usage (from frontend_tkinter/):
+    python -m benchmarks.bench_calendar_index --events 10000 --bookings 2000
+"""
+
+import argparse
+import calendar
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.calendar_index import CalendarIndex
+from utils.datetime_service import parse_datetime
+
+SEMESTER_START = date(2025, 9, 1)
+SEMESTER_WEEKS = 18
+
+
+def make_items(events, bookings, multi_day=0.05, seed=11):
+    """Events and bookings spread over the semester's days and 8:00-20:00"""
+    rng = random.Random(seed)
+    days = SEMESTER_WEEKS * 7
+
+    def slot():
+        day = SEMESTER_START + timedelta(days=rng.randrange(days))
+        return datetime(day.year, day.month, day.day, rng.randrange(8, 20))
+
+    event_rows = []
+    for i in range(events):
+        start = slot()
+        end = start + (timedelta(days=rng.randrange(1, 4)) if rng.random() < multi_day
+                       else timedelta(hours=rng.randrange(1, 4)))
+        event_rows.append({'id': i, 'title': f'Event {i}', 'category': rng.choice(['academic', 'sports', 'social']),
+                           'start_time': start.strftime('%Y-%m-%dT%H:%M:%S'),
+                           'end_time': end.strftime('%Y-%m-%dT%H:%M:%S'), 'venue': f'Hall {i % 40}'})
+    booking_rows = []
+    for i in range(bookings):
+        start = slot()
+        booking_rows.append({'id': i, 'resource': f'Room {i % 60}', 'status': rng.choice(['approved', 'pending']),
+                             'start_time': start.strftime('%Y-%m-%dT%H:%M:%S'),
+                             'end_time': (start + timedelta(hours=1)).strftime('%Y-%m-%dT%H:%M:%S')})
+    return event_rows, booking_rows
+
+
+# CalendarView's lookups before the index
+
+def scan_date(events, bookings, day):
+    items = []
+    for event in events:
+        event_date = parse_datetime(event.get('start_time'))
+        if event_date and event_date.date() == day:
+            items.append({'type': 'event', **event})
+    for booking in bookings:
+        booking_date = parse_datetime(booking.get('start_time'))
+        if booking_date and booking_date.date() == day:
+            items.append({'type': 'booking', **booking})
+    return items
+
+
+def scan_hour(events, bookings, day, hour):
+    items = []
+    for event in events:
+        event_time = parse_datetime(event.get('start_time'))
+        if event_time and event_time.date() == day and event_time.hour == hour:
+            items.append({'type': 'event', **event})
+    for booking in bookings:
+        booking_time = parse_datetime(booking.get('start_time'))
+        if booking_time and booking_time.date() == day and booking_time.hour == hour:
+            items.append({'type': 'booking', **booking})
+    return items
+
+
+def month_days():
+    """Every day shown in the semester's month views"""
+    months = sorted({(SEMESTER_START + timedelta(days=d)).replace(day=1) for d in range(SEMESTER_WEEKS * 7)})
+    return [date(m.year, m.month, day) for m in months
+            for week in calendar.monthcalendar(m.year, m.month) for day in week if day]
+
+
+def week_slots():
+    """Every (day, hour) slot shown in the semester's week views"""
+    return [(SEMESTER_START + timedelta(days=d), hour)
+            for d in range(SEMESTER_WEEKS * 7) for hour in range(8, 21)]
+
+
+def timed(label, fn):
+    start = time.perf_counter()
+    result = fn()
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"  {label:28s} {elapsed:9.1f} ms")
+    return result, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--events', type=int, default=10000)
+    parser.add_argument('--bookings', type=int, default=2000)
+    args = parser.parse_args()
+
+    events, bookings = make_items(args.events, args.bookings)
+    days, slots = month_days(), week_slots()
+    print(f"{args.events} events, {args.bookings} bookings; "
+          f"{len(days)} month cells, {len(slots)} week slots")
+
+    old_months, old_month_ms = timed('month views, scan', lambda: [scan_date(events, bookings, d) for d in days])
+    old_weeks, old_week_ms = timed('week views, scan', lambda: [scan_hour(events, bookings, d, h) for d, h in slots])
+
+    index, build_ms = timed('index build', lambda: CalendarIndex(events, bookings))
+    new_months, month_ms = timed('month views, index', lambda: [index.on_date(d) for d in days])
+    new_weeks, week_ms = timed('week views, index', lambda: [index.at_hour(d, h) for d, h in slots])
+
+    # Same items, plus the later days of multi-day events
+    for old, new in zip(old_months + old_weeks, new_months + new_weeks):
+        assert {(i['type'], i['id']) for i in old} <= {(i['type'], i['id']) for i in new}
+    stats = index.get_stats()
+    print(f"  index: {stats['days']} day and {stats['hours']} hour buckets, {stats['tagged']} tagged copies")
+    print(f"  month views {old_month_ms / max(month_ms + build_ms, 1e-9):.0f}x faster, "
+          f"week views {old_week_ms / max(week_ms + build_ms, 1e-9):.0f}x faster (build included)")
+
+
+if __name__ == '__main__':
+    main()
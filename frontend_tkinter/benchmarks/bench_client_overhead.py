@@ -0,0 +1,119 @@
+"""
+Client Overhead Benchmark
+Measures APIClient's per-request overhead and connection reuse
+
+Three measurements against the stand-in server:
+
+- hot-path helpers (header building, coalescing key, URL building) in
+  microseconds per call
+- APIClient.get vs a bare pooled ``requests`` GET of the same URL; the
+  difference is the client's own overhead per request
+- one page load per client with a private Session each (how pages used to
+  work) vs the shared keep-alive pool, with a simulated connection setup
+  cost (``--connect-ms``)
+
+Usage (from frontend_tkinter/):
+    python -m benchmarks.bench_client_overhead --requests 500 --connect-ms 20
+"""
+
+import argparse
+import os
+import sys
+import time
+import timeit
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tests.stand_in_server import StandInServer
+from utils.api_client import APIClient
+from utils.performance import Cache
+
+
+def make_client(server, session=None):
+    api = APIClient()
+    api.base_url = server.base_url
+    api._cache = Cache(max_size=None)
+    api.set_auth_token('bench-token')
+    if session is not None:
+        api.session = session
+    return api
+
+
+def micro(api, number=100000):
+    """Microseconds per call of the per-request helpers"""
+    headers = api._get_headers()
+    url = api._build_url('events')
+    cases = {
+        '_get_headers()': lambda: api._get_headers(),
+        '_flight_key()': lambda: api._flight_key('GET', url, headers),
+        '_build_url(_with_query())': lambda: api._build_url(api._with_query('events', {'page': 2, 'limit': 20})),
+    }
+    return {name: timeit.timeit(fn, number=number) / number * 1e6 for name, fn in cases.items()}
+
+
+def overhead(server, count):
+    """ms per request for APIClient.get and for a bare pooled GET"""
+    api = make_client(server)
+    url = api._build_url('events/1')
+    api.get('events/1')
+    # Same conditional request APIClient makes (answered with 304)
+    bare = requests.Session()
+    headers = {'Authorization': 'Bearer bench-token',
+               'If-None-Match': bare.get(url).headers['ETag']}
+
+    start = time.perf_counter()
+    for _ in range(count):
+        bare.get(url, headers=headers)
+    bare_ms = (time.perf_counter() - start) / count * 1000
+
+    start = time.perf_counter()
+    for _ in range(count):
+        api.get('events/1')
+    client_ms = (time.perf_counter() - start) / count * 1000
+    return bare_ms, client_ms
+
+
+def page_loads(server, pages, per_page, shared):
+    """ms per page load (per_page GETs) and connections opened"""
+    APIClient._shared_session().close()  # start cold in both modes
+    server.reset_stats()
+    start = time.perf_counter()
+    for _ in range(pages):
+        api = make_client(server, session=None if shared else requests.Session())
+        for endpoint in ('events', 'resources', 'events/1', 'events/2', 'resources/1')[:per_page]:
+            api.get(endpoint)
+        if not shared:
+            api.session.close()  # a destroyed page's session
+    elapsed = time.perf_counter() - start
+    return elapsed / pages * 1000, server.stats['connections']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--requests', type=int, default=500)
+    parser.add_argument('--pages', type=int, default=20)
+    parser.add_argument('--connect-ms', type=float, default=20, help='simulated connection setup cost')
+    args = parser.parse_args()
+
+    with StandInServer(connect_latency=args.connect_ms / 1000.0) as server:
+        api = make_client(server)
+        print("Hot-path helpers (us/call)")
+        for name, us in micro(api).items():
+            print(f"  {name:28s} {us:7.2f}")
+
+        bare_ms, client_ms = overhead(server, args.requests)
+        print(f"\nGET over a warm connection ({args.requests} requests)")
+        print(f"  bare requests  : {bare_ms:7.3f} ms/request")
+        print(f"  APIClient.get  : {client_ms:7.3f} ms/request")
+        print(f"  client overhead: {(client_ms - bare_ms) * 1000:7.0f} us/request")
+
+        print(f"\n{args.pages} page loads x 5 GETs, {args.connect_ms:.0f} ms connection setup")
+        for label, shared in (('session per page', False), ('shared pool', True)):
+            ms, connections = page_loads(server, args.pages, 5, shared)
+            print(f"  {label:16s}: {ms:7.1f} ms/page  {connections:3d} connections")
+
+
+if __name__ == '__main__':
+    main()
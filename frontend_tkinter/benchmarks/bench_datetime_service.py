@@ -0,0 +1,85 @@
+"""
+DateTime Service Benchmark
+Compares the pages' strptime loops with utils.datetime_service
+
+Builds a realistic mix of timestamps the API sends (ISO with T or space,
+fractional seconds with Z, date-only), drawn from a limited pool so strings
+repeat the way they do across a list and its refreshes, then times parsing
+plus display formatting of every value: the old per-page helpers, the
+service with a cold cache and the service with a warm cache.
+
+Usage (from frontend_tkinter/):
+    python -m benchmarks.bench_datetime_service --values 20000 --distinct 2000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from utils import datetime_service
+from utils.datetime_service import format_date, parse_datetime
+
+
+def old_parse(text):
+    """The per-page helper the service replaces"""
+    if not text:
+        return None
+    for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d", "%Y-%m-%dT%H:%M:%S.%fZ"):
+        try:
+            return datetime.strptime(str(text)[:26], fmt)
+        except Exception:
+            continue
+    return None
+
+
+def old_format(text):
+    parsed = old_parse(text)
+    return parsed.strftime('%B %d, %Y') if parsed else text or 'N/A'
+
+
+def make_values(count, distinct, seed=7):
+    """Timestamps in the shapes the API returns, drawn from `distinct` strings"""
+    rng = random.Random(seed)
+    base = datetime(2025, 9, 1, 8, 0)
+    shapes = ('%Y-%m-%dT%H:%M:%S', '%Y-%m-%d %H:%M:%S', '%Y-%m-%dT%H:%M:%S.123Z', '%Y-%m-%d')
+    pool = [(base + timedelta(minutes=30 * rng.randrange(8000))).strftime(shapes[i % len(shapes)])
+            for i in range(distinct)]
+    return [rng.choice(pool) for _ in range(count)]
+
+
+def run(label, parse, fmt, values):
+    start = time.perf_counter()
+    for value in values:
+        parse(value)
+        fmt(value)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"  {label:14s} {elapsed:8.1f} ms  ({elapsed * 1000 / len(values):5.2f} us/value)")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--values', type=int, default=20000)
+    parser.add_argument('--distinct', type=int, default=2000)
+    args = parser.parse_args()
+
+    values = make_values(args.values, args.distinct)
+    assert all(old_format(v) == format_date(v) for v in values)
+    print(f"{args.values} timestamps, {args.distinct} distinct, parse + format each")
+
+    old = run('strptime loop', old_parse, old_format, values)
+    datetime_service.clear_cache()
+    cold = run('service, cold', parse_datetime, format_date, values)
+    warm = run('service, warm', parse_datetime, format_date, values)
+    stats = datetime_service.get_stats()['parse']
+    print(f"  parse cache: {stats['size']} entries, {stats['hits']} hits")
+    print(f"  service: {old / max(cold, 1e-9):.1f}x faster cold, {old / max(warm, 1e-9):.1f}x warm")
+
+
+if __name__ == '__main__':
+    main()
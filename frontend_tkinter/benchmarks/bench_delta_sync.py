@@ -0,0 +1,94 @@
+"""
+Delta Sync Benchmark
+Compares polling the full events list with ?since= delta sync
+
+Runs the stand-in server with a campus-sized events collection, changes a
+few rows between polls and reports bytes downloaded and time per poll.
+
+Usage (from frontend_tkinter/):
+    python -m benchmarks.bench_delta_sync --events 5000 --polls 20 --changes 5
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tests.stand_in_server import StandInServer
+from utils.api_client import APIClient
+from utils.performance import Cache
+from utils.sync_manager import SyncManager
+
+
+def make_events(count):
+    """Generate events shaped like the fixture rows"""
+    return [
+        {
+            'id': i,
+            'title': f'Event {i}',
+            'description': 'Talks, workshops and networking for all departments.',
+            'start_time': f'2025-{(i % 12) + 1:02d}-{(i % 28) + 1:02d}T10:00:00',
+            'end_time': f'2025-{(i % 12) + 1:02d}-{(i % 28) + 1:02d}T12:00:00',
+            'venue': f'Building {i % 40}',
+            'category': ('Technology', 'Career', 'Sports', 'Culture')[i % 4],
+            'capacity': 100,
+            'available_seats': i % 100,
+            'organizer_id': i % 50,
+            'status': 'APPROVED',
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def run(mode, events, polls, changes):
+    """Poll the events collection and return (bytes per poll, ms per poll)"""
+    with StandInServer({'events': events}) as server:
+        api = APIClient()
+        api.base_url = server.base_url
+        api._cache = Cache(max_size=None)
+        api.set_auth_token('bench')
+        manager = SyncManager()
+
+        fetch = (lambda: manager.sync(api, 'events')) if mode == 'delta' else (lambda: api.get('events'))
+        fetch()  # initial load is the same size either way
+        server.reset_stats()
+
+        elapsed = 0.0
+        next_id = len(events) + 1
+        for poll in range(polls):
+            for n in range(changes):
+                row = dict(server.data['events'][(poll * changes + n) % len(server.data['events'])])
+                row['available_seats'] = max(0, row['available_seats'] - 1)
+                server.upsert('events', row)
+            server.upsert('events', {**events[0], 'id': next_id})
+            server.delete('events', next_id - 1)
+            next_id += 1
+
+            start = time.perf_counter()
+            rows = fetch()
+            elapsed += time.perf_counter() - start
+
+        assert rows == server.data['events']
+        return server.stats['bytes_sent'] / polls, elapsed / polls * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--events', type=int, default=5000)
+    parser.add_argument('--polls', type=int, default=20)
+    parser.add_argument('--changes', type=int, default=5, help='rows updated between polls')
+    args = parser.parse_args()
+
+    events = make_events(args.events)
+    print(f"{args.events} events, {args.polls} polls, {args.changes} updates + 1 insert + 1 delete per poll")
+    results = {mode: run(mode, events, args.polls, args.changes) for mode in ('full', 'delta')}
+    for mode, (size, ms) in results.items():
+        print(f"  {mode:5s}: {size / 1024:9.1f} KB/poll  {ms:8.2f} ms/poll")
+    full, delta = results['full'], results['delta']
+    print(f"  delta sync: {full[0] / max(delta[0], 1):.0f}x fewer bytes, {full[1] / max(delta[1], 1e-9):.1f}x faster")
+
+
+if __name__ == '__main__':
+    main()
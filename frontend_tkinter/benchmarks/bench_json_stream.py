@@ -0,0 +1,119 @@
+"""
+JSON Stream Benchmark
+Compares decoding a large events list whole vs item by item as it streams
+
+Encodes a list of full event records and decodes it three ways: json.loads on
+the whole body (what response.json() does), orjson.loads on the whole body
+(if installed), and JSONListStream fed 64 KB chunks. Reports decode time,
+time until the first item is available, the longest pause a UI-like ticker
+thread saw while decoding (a GIL stall), and peak traced memory. Whole-body
+modes include the joined body in their peak, as they must hold it to parse.
+
+Usage (from frontend_tkinter/):
+    python -m benchmarks.bench_json_stream --events 5000 --runs 5
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.bench_sparse_fields import make_events
+from utils.json_stream import FAST_CODEC, JSONListStream, iter_json_list
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+CHUNK_SIZE = 64 * 1024
+
+
+def chunks_of(body):
+    """The body as it arrives from iter_content()"""
+    for start in range(0, len(body), CHUNK_SIZE):
+        yield body[start:start + CHUNK_SIZE]
+
+
+def decode(mode, body, on_first):
+    """Decode body in the given mode; call on_first() when an item is ready"""
+    if mode == 'stream':
+        items = []
+        for item in iter_json_list(chunks_of(body), JSONListStream()):
+            if not items:
+                on_first()
+            items.append(item)
+        return items
+    whole = b''.join(chunks_of(body))
+    items = json.loads(whole) if mode == 'json' else orjson.loads(whole)
+    on_first()
+    return items
+
+
+def timed(mode, body):
+    """Return (total ms, ms to first item, longest ticker pause ms)"""
+    stop = threading.Event()
+    pauses = [0.0]
+
+    def ticker():
+        last = time.perf_counter()
+        while not stop.is_set():
+            time.sleep(0.001)
+            now = time.perf_counter()
+            pauses[0] = max(pauses[0], now - last)
+            last = now
+
+    thread = threading.Thread(target=ticker, daemon=True)
+    thread.start()
+    time.sleep(0.01)
+    pauses[0] = 0.0
+
+    first = []
+    start = time.perf_counter()
+    items = decode(mode, body, lambda: first.append(time.perf_counter()))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    thread.join()
+    assert len(items) > 0
+    return elapsed * 1000, (first[0] - start) * 1000, pauses[0] * 1000
+
+
+def peak_memory(mode, body):
+    """Peak traced bytes while decoding"""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    items = decode(mode, body, lambda: None)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--events', type=int, default=5000)
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    body = json.dumps(make_events(args.events)).encode('utf-8')
+    modes = ['json'] + (['orjson'] if orjson is not None else []) + ['stream']
+    print(f"{args.events} events, {len(body) / 1024:.0f} KB body, best of {args.runs} runs "
+          f"(fast codec: {FAST_CODEC or 'not installed'})")
+
+    for mode in modes:
+        runs = [timed(mode, body) for _ in range(args.runs)]
+        total = min(r[0] for r in runs)
+        first = min(r[1] for r in runs)
+        stall = min(r[2] for r in runs)
+        peak = peak_memory(mode, body)
+        print(f"  {mode:7s}: {total:8.2f} ms total  {first:8.2f} ms to first item  "
+              f"{stall:7.2f} ms longest stall  {peak / 1024 / 1024:7.1f} MB peak")
+
+
+if __name__ == '__main__':
+    main()
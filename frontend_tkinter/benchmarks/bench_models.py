@@ -0,0 +1,104 @@
+"""
+Entity Model Benchmark
+Compares events kept as decoded dicts vs compact records (utils.models)
+
+Decodes N events (full records and list-view summary rows), measures the
+memory the rows take, then times what dashboards do on every render: count
+by status, sort by start time and search titles. Dict rows lowercase the
+status, parse start_time with the pages' strptime loop and lowercase the
+title per row per pass; records use their precomputed attributes.
+
+Usage (from frontend_tkinter/):
+    python -m benchmarks.bench_models --events 10000 --passes 20
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.bench_sparse_fields import make_events
+from utils.api_client import APIClient
+from utils.models import to_models
+
+
+def parse_dt(text):
+    """The per-page helper the records replace"""
+    if not text:
+        return None
+    for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(text[:19], fmt)
+        except Exception:
+            continue
+    return None
+
+
+def rows_memory(body, records):
+    """Bytes held by the decoded rows (records: converted, dicts dropped)"""
+    gc.collect()
+    tracemalloc.start()
+    rows = json.loads(body)
+    if records:
+        rows = to_models('events', rows)
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, rows
+
+
+def dict_pass(rows, q):
+    approved = len([e for e in rows if (e.get('status') or '').lower() == 'approved'])
+    ordered = sorted(rows, key=lambda e: parse_dt(e.get('start_time')) or datetime.max)
+    found = [e for e in rows if q in (e.get('title') or '').lower()]
+    return approved, ordered[0]['id'], len(found)
+
+
+def record_pass(rows, q):
+    approved = len([e for e in rows if e.status == 'approved'])
+    ordered = sorted(rows, key=lambda e: e.start or datetime.max)
+    found = [e for e in rows if q in e.search_key]
+    return approved, ordered[0]['id'], len(found)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--events', type=int, default=10000)
+    parser.add_argument('--passes', type=int, default=20)
+    args = parser.parse_args()
+
+    events = make_events(args.events)
+    summary_fields = APIClient.SUMMARY_FIELDS['events']
+    bodies = {
+        'full': json.dumps(events).encode('utf-8'),
+        'summary': json.dumps([{k: v for k, v in e.items() if k in summary_fields}
+                               for e in events]).encode('utf-8'),
+    }
+    print(f"{args.events} events, {args.passes} filter/sort/search passes")
+
+    for name, body in bodies.items():
+        dict_size, dict_rows = rows_memory(body, records=False)
+        record_size, record_rows = rows_memory(body, records=True)
+        print(f"  {name:7s} rows: dicts {dict_size / 1024 / 1024:6.1f} MB  "
+              f"records {record_size / 1024 / 1024:6.1f} MB  "
+              f"({(1 - record_size / dict_size) * 100:.0f}% less)")
+
+    assert dict_pass(dict_rows, 'event 9') == record_pass(record_rows, 'event 9')
+    timings = {}
+    for label, run, rows in (('dicts', dict_pass, dict_rows), ('records', record_pass, record_rows)):
+        start = time.perf_counter()
+        for _ in range(args.passes):
+            run(rows, 'event 9')
+        timings[label] = (time.perf_counter() - start) / args.passes * 1000
+        print(f"  {label:7s} pass: {timings[label]:8.2f} ms")
+    print(f"  records: {timings['dicts'] / max(timings['records'], 1e-9):.1f}x faster per pass")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Page Load Benchmark
+Compares the admin dashboard's sequential fetches with PageLoader
+
+Runs the stand-in server with a per-request latency and loads the same five
+sections as AdminDashboard (including the admin/resources -> resources
+fallback) one after another and then with PageLoader.
+
+Usage (from frontend_tkinter/):
+    python -m benchmarks.bench_page_load --latency 80 --runs 5
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tests.stand_in_server import StandInServer
+from utils.api_client import APIClient
+from utils.page_loader import PageLoader
+from utils.performance import Cache
+
+
+def make_data():
+    """A few rows per collection; latency dominates, not payload size"""
+    return {
+        'events': [{'id': i, 'title': f'Event {i}', 'status': 'PENDING' if i % 5 == 0 else 'APPROVED'}
+                   for i in range(1, 51)],
+        'resources': [{'id': i, 'name': f'Room {i}'} for i in range(1, 21)],
+        'users': [{'id': i, 'username': f'user{i}'} for i in range(1, 31)],
+        'bookings': [{'id': i, 'resource_id': i % 20, 'status': 'PENDING'} for i in range(1, 11)],
+    }
+
+
+def sections(api):
+    """(name, fetch, fallback) mirroring AdminDashboard._load_all_data_then"""
+    return [
+        ('pending_events', lambda: api.get('events/5'), None),
+        ('all_events', lambda: api.get('events'), None),
+        ('resources', lambda: api.get('admin/resources'), lambda: api.get('resources')),
+        ('users', lambda: api.get('users'), None),
+        ('pending_bookings', lambda: api.get('bookings'), None),
+    ]
+
+
+def sequential(api):
+    for _, fetch, fallback in sections(api):
+        try:
+            fetch()
+        except Exception:
+            if fallback is not None:
+                fallback()
+
+
+def parallel(api):
+    loader = PageLoader(None, name='bench')
+    for name, fetch, fallback in sections(api):
+        loader.section(name, fetch, fallback=fallback)
+    loader.start()
+    loader.wait()
+
+
+def run(mode, latency, runs):
+    """Load the page runs times and return mean ms per load"""
+    with StandInServer(make_data(), latency=latency / 1000.0) as server:
+        total = 0.0
+        for _ in range(runs):
+            api = APIClient()
+            api.base_url = server.base_url
+            api._cache = Cache(max_size=None)
+            api.set_auth_token('bench')
+            start = time.perf_counter()
+            (parallel if mode == 'parallel' else sequential)(api)
+            total += time.perf_counter() - start
+        return total / runs * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--latency', type=float, default=80, help='server latency per request (ms)')
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"5 sections (6 requests with the resources fallback), {args.latency:.0f} ms latency, {args.runs} runs")
+    results = {mode: run(mode, args.latency, args.runs) for mode in ('sequential', 'parallel')}
+    for mode, ms in results.items():
+        print(f"  {mode:10s}: {ms:8.1f} ms/load")
+    print(f"  PageLoader: {results['sequential'] / max(results['parallel'], 1e-9):.1f}x faster")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""
+Sparse Fieldset Benchmark
+Compares refreshing the events list with full records vs summary rows
+
+Runs the stand-in server with events carrying detail-sized descriptions,
+changes a row between refreshes (so conditional GETs cannot answer 304) and
+reports bytes downloaded and time per refresh. Summary refreshes then open
+a few detail views, which fetch and cache the full record once each.
+
+Usage (from frontend_tkinter/):
+    python -m benchmarks.bench_sparse_fields --events 2000 --refreshes 10
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tests.stand_in_server import StandInServer
+from utils.api_client import APIClient
+from utils.performance import Cache
+
+DESCRIPTION = ('Talks, hands-on workshops and networking for all departments. '
+               'Bring a laptop; lunch is provided for registered attendees. ') * 6
+
+
+def make_events(count):
+    """Generate events with detail fields list views do not show"""
+    return [
+        {
+            'id': i,
+            'title': f'Event {i}',
+            'description': DESCRIPTION,
+            'start_time': f'2025-{(i % 12) + 1:02d}-{(i % 28) + 1:02d}T10:00:00',
+            'end_time': f'2025-{(i % 12) + 1:02d}-{(i % 28) + 1:02d}T12:00:00',
+            'registration_deadline': f'2025-{(i % 12) + 1:02d}-{(i % 28) + 1:02d}T00:00:00',
+            'venue': f'Building {i % 40}',
+            'category': ('Technology', 'Career', 'Sports', 'Culture')[i % 4],
+            'capacity': 100,
+            'registered_count': i % 100,
+            'organizer_id': i % 50,
+            'organizer_name': f'Organizer {i % 50}',
+            'status': 'APPROVED',
+            'tags': ['campus', 'students', ('Technology', 'Career', 'Sports', 'Culture')[i % 4].lower()],
+            'resources': [{'id': i % 30, 'name': f'Room {i % 30}'}],
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def run(mode, events, refreshes, details):
+    """Refresh the list; return (bytes per refresh, ms per refresh, detail bytes)"""
+    with StandInServer({'events': events}) as server:
+        api = APIClient()
+        api.base_url = server.base_url
+        api._cache = Cache(max_size=None)
+        api.set_auth_token('bench')
+
+        if mode == 'summary':
+            url = api.query('events', summary=True).url
+        else:
+            url = 'events'
+
+        elapsed = 0.0
+        for refresh in range(refreshes):
+            row = dict(server.data['events'][refresh % len(events)])
+            row['registered_count'] += 1
+            server.upsert('events', row)
+
+            start = time.perf_counter()
+            rows = api.get(url)
+            elapsed += time.perf_counter() - start
+        list_bytes = server.stats['bytes_sent']
+
+        if isinstance(rows, dict):
+            rows = rows['items']
+        assert len(rows) == len(events)
+
+        # Open a few detail views twice: the second open is served from cache
+        server.reset_stats()
+        if mode == 'summary':
+            for _ in range(2):
+                for event_id in range(1, details + 1):
+                    assert api.get_detail('events', event_id)['description'] == DESCRIPTION
+        return list_bytes / refreshes, elapsed / refreshes * 1000, server.stats['bytes_sent']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--events', type=int, default=2000)
+    parser.add_argument('--refreshes', type=int, default=10)
+    parser.add_argument('--details', type=int, default=5, help='detail views opened (twice each)')
+    args = parser.parse_args()
+
+    events = make_events(args.events)
+    print(f"{args.events} events, {args.refreshes} refreshes, {args.details} detail views opened twice")
+    results = {mode: run(mode, events, args.refreshes, args.details) for mode in ('full', 'summary')}
+    for mode, (size, ms, _) in results.items():
+        print(f"  {mode:7s}: {size / 1024:9.1f} KB/refresh  {ms:8.2f} ms/refresh")
+    full, summary = results['full'], results['summary']
+    print(f"  summary rows: {(full[0] - summary[0]) / 1024:.1f} KB saved per refresh "
+          f"({full[0] / max(summary[0], 1):.1f}x fewer bytes, {full[1] / max(summary[1], 1e-9):.1f}x faster)")
+    print(f"  detail views: {summary[2] / 1024:.1f} KB for {args.details} full records, fetched once each")
+
+
+if __name__ == '__main__':
+    main()
@@ -7,6 +7,9 @@ Available Components:
 --------------------
 - SearchComponent: Advanced search widget with filters, debouncing, and callbacks
 - CalendarView: Interactive calendar with month/week/day views and event markers
+- FeedView: Infinite-scroll display of a CursorFeed with a bounded page window
+- VirtualList: Scrolling list/grid that builds only the cards in view and recycles them
+- CardPool: Recycled card widgets for containers that lay out their own cards
 - StyledButton: Custom button with variants (primary, secondary, success, danger, ghost)
 - StyledEntry: Enhanced text entry with icons, validation, and states
 - StyledCard: Card widget with shadow effects and hover states
@@ -17,7 +20,7 @@ Available Components:
 Usage:
 ------
 from components import (
-    SearchComponent, CalendarView,
+    SearchComponent, CalendarView, FeedView, VirtualList, CardPool,
     StyledButton, StyledEntry, StyledCard, ProgressBar, Toast, Theme
 )
 
@@ -52,6 +55,27 @@ calendar = CalendarView(
 )
 calendar.pack(fill='both', expand=True)
 
+FeedView Example:
+----------------
+feed = CursorFeed(page, api.query('events'), page_size=12)
+view = FeedView(canvas, scrollbar, content_frame, feed, render_page)
+feed.start()
+
+VirtualList Example:
+-------------------
+def create_card(parent):
+    card = tk.Frame(parent, bg='white')
+    card.title = tk.Label(card, bg='white')
+    card.title.pack(anchor='w')
+    return card
+
+def bind_card(card, item):
+    card.title.config(text=item.get('title', ''))
+
+items_view = VirtualList(parent_frame, create_card, bind_card, row_height=120)
+items_view.pack(fill='both', expand=True)
+items_view.set_items(items)
+
 StyledButton Example:
 --------------------
 button = StyledButton(
@@ -110,6 +134,8 @@ For full documentation, see: README.md
 
 from .search_component import SearchComponent
 from .calendar_view import CalendarView
+from .feed_view import FeedView
+from .virtual_list import VirtualList, CardPool
 from .custom_widgets import (
     StyledButton,
     StyledEntry,
@@ -123,6 +149,9 @@ from .custom_widgets import (
 __all__ = [
     'SearchComponent',
     'CalendarView',
+    'FeedView',
+    'VirtualList',
+    'CardPool',
     'StyledButton',
     'StyledEntry',
     'StyledCard',
@@ -8,9 +8,10 @@ Features:
 - Month/Week/Day view toggle
 - Event/booking markers on dates
 - Color-coded by type/status
+- Multi-day events shown on each day they cover
 - Click date to see details
 - Hover tooltips
-- Month navigation
+- Month navigation (cells are built once per view and reused)
 - "Today" button
 - Highly configurable
 
@@ -37,6 +38,8 @@ from tkinter import ttk
 from datetime import datetime, timedelta
 import calendar
 from typing import List, Dict, Callable, Optional, Any
+from utils.calendar_index import CalendarIndex
+from utils.datetime_service import parse_datetime
 
 
 class CalendarView(tk.Frame):
@@ -73,9 +76,10 @@ class CalendarView(tk.Frame):
         """
         super().__init__(parent, **kwargs)
         
-        # Data
+        # Data (bucketed by day and hour once per update)
         self.events = events or []
         self.bookings = bookings or []
+        self._index = CalendarIndex(self.events, self.bookings)
         self.on_date_click_callback = on_date_click_callback
         
         # State
@@ -117,10 +121,15 @@ class CalendarView(tk.Frame):
             'default': '#95A5A6'
         }
         
-        # Tooltip
+        # Tooltip (one window, shown and hidden on hover)
         self.tooltip = None
         self.tooltip_timer = None
         
+        # Grid of each view mode, built on first use (see _render_calendar)
+        self._views = {}
+        self._shown_view = None
+        self._view_buttons = {}
+        
         # Build UI
         self.configure(bg='white')
         self._build_ui()
@@ -235,6 +244,7 @@ class CalendarView(tk.Frame):
                     cursor='hand2'
                 )
                 btn.pack(side='left', padx=2)
+                self._view_buttons[view] = btn
         
         # Today button
         tk.Button(
@@ -252,9 +262,21 @@ class CalendarView(tk.Frame):
     
     def _render_calendar(self):
         """Render the calendar based on current view mode"""
-        # Clear existing calendar
-        for widget in self.calendar_frame.winfo_children():
-            widget.destroy()
+        if self.view_mode not in ('month', 'week', 'day'):
+            return
+        self._hide_tooltip()
+        
+        # Each view's grid is built once, then rebound to the period shown
+        view = self._views.get(self.view_mode)
+        if view is None:
+            view = tk.Frame(self.calendar_frame, bg='white')
+            getattr(self, f'_build_{self.view_mode}_view')(view)
+            self._views[self.view_mode] = view
+        if self._shown_view is not view:
+            if self._shown_view is not None:
+                self._shown_view.pack_forget()
+            view.pack(fill='both', expand=True)
+            self._shown_view = view
         
         if self.view_mode == 'month':
             self._render_month_view()
@@ -267,24 +289,18 @@ class CalendarView(tk.Frame):
         if self.show_controls:
             self.period_label.config(text=self._get_period_label())
     
-    def _render_month_view(self):
-        """Render month view with grid of dates"""
-        year = self.current_date.year
-        month = self.current_date.month
-        
-        # Get calendar data
-        cal = calendar.monthcalendar(year, month)
-        
+    def _build_month_view(self, view):
+        """Build the month grid: day headers and 6 weeks of date cells"""
         # Configure grid
         for i in range(7):
-            self.calendar_frame.grid_columnconfigure(i, weight=1, uniform='col')
+            view.grid_columnconfigure(i, weight=1, uniform='col')
         
         # Day headers (Sun-Sat)
         day_names = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat'] if not self.mini_mode else ['S', 'M', 'T', 'W', 'T', 'F', 'S']
         
         for col, day_name in enumerate(day_names):
             header = tk.Label(
-                self.calendar_frame,
+                view,
                 text=day_name,
                 bg='#F9FAFB',
                 fg='#6B7280',
@@ -293,28 +309,74 @@ class CalendarView(tk.Frame):
             )
             header.grid(row=0, column=col, sticky='ew')
         
-        # Date cells
+        # Date cells (a month spans at most 6 weeks)
+        self._month_cells = []
+        for week_idx in range(6):
+            week_cells = []
+            for day_idx in range(7):
+                cell = self._create_date_cell(view)
+                cell.grid(row=week_idx + 1, column=day_idx, sticky='nsew', padx=1, pady=1)
+                week_cells.append(cell)
+            self._month_cells.append(week_cells)
+    
+    def _render_month_view(self):
+        """Show the current month in the month grid"""
+        year = self.current_date.year
+        month = self.current_date.month
+        
+        # Get calendar data
+        cal = calendar.monthcalendar(year, month)
         today = datetime.now().date()
         
-        for week_idx, week in enumerate(cal):
-            for day_idx, day in enumerate(week):
-                if day == 0:
-                    # Empty cell for days outside current month
-                    cell = tk.Frame(self.calendar_frame, bg='white', highlightthickness=1, highlightbackground='#F3F4F6')
-                    cell.grid(row=week_idx + 1, column=day_idx, sticky='nsew', padx=1, pady=1)
-                else:
-                    # Create date cell
-                    date = datetime(year, month, day).date()
-                    is_today = date == today
-                    is_selected = self.selected_date and date == self.selected_date
-                    
-                    cell = self._create_date_cell(date, is_today, is_selected)
-                    cell.grid(row=week_idx + 1, column=day_idx, sticky='nsew', padx=1, pady=1)
-    
-    def _create_date_cell(self, date, is_today=False, is_selected=False):
-        """Create a date cell with event markers"""
+        for week_idx, week_cells in enumerate(self._month_cells):
+            for day_idx, cell in enumerate(week_cells):
+                if week_idx >= len(cal):
+                    cell.grid_remove()
+                    continue
+                cell.grid()
+                day = cal[week_idx][day_idx]
+                # Empty cell for days outside current month
+                self._bind_date_cell(cell, datetime(year, month, day).date() if day else None, today)
+    
+    def _create_date_cell(self, parent):
+        """Create an empty date cell (see _bind_date_cell)"""
+        cell = tk.Frame(parent, bg='white', highlightthickness=1, highlightbackground='#E5E7EB')
+        cell.date = None
+        cell.items = []
+        
+        # Date label
+        cell.date_label = tk.Label(
+            cell,
+            bg='white',
+            font=('Helvetica', 12 if not self.mini_mode else 10, 'normal'),
+            anchor='nw'
+        )
+        cell.date_label.pack(anchor='nw', padx=8 if not self.mini_mode else 4, pady=6 if not self.mini_mode else 3)
+        
+        # Event/booking markers (up to 3), count indicator and mini mode dot
+        cell.markers_frame = tk.Frame(cell, bg='white')
+        cell.markers = [tk.Frame(cell.markers_frame, height=4, width=0) for _ in range(3)]
+        cell.count_label = tk.Label(cell, bg='white', fg='#6B7280', font=('Helvetica', 7))
+        cell.dot = tk.Label(cell, text='●', bg='white', fg=self.colors.get('secondary', '#3498DB'), font=('Helvetica', 8))
+        
+        # Click and hover act on whatever date the cell shows
+        for widget in (cell, cell.date_label):
+            widget.bind('<Button-1>', lambda e: cell.date and self._on_date_click(cell.date, cell.items))
+        if not self.mini_mode:
+            cell.bind('<Enter>', lambda e: cell.items and self._show_tooltip(e, cell.date, cell.items))
+            cell.bind('<Leave>', lambda e: self._hide_tooltip())
+        return cell
+    
+    def _bind_date_cell(self, cell, date, today):
+        """Show a date (None for a blank cell) and its markers in a date cell"""
+        is_today = date == today
+        is_selected = date is not None and self.selected_date and date == self.selected_date
+        
         # Cell frame
-        if is_selected:
+        if date is None:
+            bg_color = 'white'
+            border_color = '#F3F4F6'
+        elif is_selected:
             bg_color = '#E3F2FD'
             border_color = self.colors.get('secondary', '#3498DB')
         elif is_today:
@@ -324,92 +386,76 @@ class CalendarView(tk.Frame):
             bg_color = 'white'
             border_color = '#E5E7EB'
         
-        cell = tk.Frame(
-            self.calendar_frame,
+        cell.config(
             bg=bg_color,
             highlightthickness=2 if (is_today or is_selected) else 1,
             highlightbackground=border_color,
-            cursor='hand2'
+            cursor='hand2' if date is not None else ''
         )
         
         # Get events and bookings for this date
-        date_events = self._get_items_for_date(date, 'events')
-        date_bookings = self._get_items_for_date(date, 'bookings')
-        all_items = date_events + date_bookings
+        all_items = self._get_items_for_date(date) if date is not None else []
+        cell.date = date
+        cell.items = all_items
         
         # Date label
-        date_label = tk.Label(
-            cell,
-            text=str(date.day),
+        cell.date_label.config(
+            text=str(date.day) if date is not None else '',
             bg=bg_color,
             fg=self.colors.get('primary', '#2C3E50') if not is_today else self.colors.get('warning', '#F39C12'),
-            font=('Helvetica', 12 if not self.mini_mode else 10, 'bold' if is_today else 'normal'),
-            anchor='nw'
+            font=('Helvetica', 12 if not self.mini_mode else 10, 'bold' if is_today else 'normal')
         )
-        date_label.pack(anchor='nw', padx=8 if not self.mini_mode else 4, pady=6 if not self.mini_mode else 3)
         
         # Event/booking markers
         if all_items and not self.mini_mode:
-            markers_frame = tk.Frame(cell, bg=bg_color)
-            markers_frame.pack(fill='x', padx=4, pady=(0, 4))
+            cell.markers_frame.config(bg=bg_color)
+            if not cell.markers_frame.winfo_manager():
+                cell.markers_frame.pack(fill='x', padx=4, pady=(0, 4), after=cell.date_label)
             
             # Show up to 3 markers
-            for item in all_items[:3]:
-                marker_color = self._get_item_color(item)
-                marker = tk.Frame(
-                    markers_frame,
-                    bg=marker_color,
-                    height=4,
-                    width=0
-                )
-                marker.pack(side='left', fill='x', expand=True, padx=1)
+            for index, marker in enumerate(cell.markers):
+                if index < len(all_items):
+                    marker.config(bg=self._get_item_color(all_items[index]))
+                    if not marker.winfo_manager():
+                        marker.pack(side='left', fill='x', expand=True, padx=1)
+                else:
+                    marker.pack_forget()
             
             # Count indicator if more than 3
             if len(all_items) > 3:
-                count_label = tk.Label(
-                    cell,
-                    text=f'+{len(all_items) - 3} more',
-                    bg=bg_color,
-                    fg='#6B7280',
-                    font=('Helvetica', 7)
-                )
-                count_label.pack(anchor='w', padx=4, pady=(0, 4))
-        elif all_items and self.mini_mode:
-            # Just show a dot in mini mode
-            dot = tk.Label(
-                cell,
-                text='●',
-                bg=bg_color,
-                fg=self.colors.get('secondary', '#3498DB'),
-                font=('Helvetica', 8)
-            )
-            dot.pack(anchor='center')
-        
-        # Bind click event
-        cell.bind('<Button-1>', lambda e: self._on_date_click(date, all_items))
-        date_label.bind('<Button-1>', lambda e: self._on_date_click(date, all_items))
-        
-        # Bind hover events for tooltip
-        if all_items and not self.mini_mode:
-            cell.bind('<Enter>', lambda e: self._show_tooltip(e, date, all_items))
-            cell.bind('<Leave>', lambda e: self._hide_tooltip())
-        
-        return cell
+                cell.count_label.config(text=f'+{len(all_items) - 3} more', bg=bg_color)
+                if not cell.count_label.winfo_manager():
+                    cell.count_label.pack(anchor='w', padx=4, pady=(0, 4), after=cell.markers_frame)
+            else:
+                cell.count_label.pack_forget()
+        else:
+            cell.markers_frame.pack_forget()
+            cell.count_label.pack_forget()
+        
+        # Just show a dot in mini mode
+        if all_items and self.mini_mode:
+            cell.dot.config(bg=bg_color)
+            if not cell.dot.winfo_manager():
+                cell.dot.pack(anchor='center')
+        else:
+            cell.dot.pack_forget()
     
-    def _render_week_view(self):
-        """Render week view with time slots"""
-        # Get start of week (Sunday)
+    def _start_of_week(self):
+        """Sunday starting the week shown"""
         start_of_week = self.current_date - timedelta(days=self.current_date.weekday() + 1)
         if start_of_week.weekday() != 6:  # If not Sunday
             start_of_week = start_of_week - timedelta(days=start_of_week.weekday() + 1)
-        
+        return start_of_week
+    
+    def _build_week_view(self, view):
+        """Build the week grid: date headers and hourly slots (8 AM to 8 PM)"""
         # Configure grid
         for i in range(8):  # Time column + 7 days
-            self.calendar_frame.grid_columnconfigure(i, weight=1 if i > 0 else 0, uniform='col' if i > 0 else None)
+            view.grid_columnconfigure(i, weight=1 if i > 0 else 0, uniform='col' if i > 0 else None)
         
         # Header row with dates
         tk.Label(
-            self.calendar_frame,
+            view,
             text='Time',
             bg='#F9FAFB',
             fg='#6B7280',
@@ -417,27 +463,17 @@ class CalendarView(tk.Frame):
             width=8
         ).grid(row=0, column=0, sticky='ew', padx=1, pady=1)
         
+        self._week_headers = []
         for i in range(7):
-            date = start_of_week + timedelta(days=i)
-            is_today = date.date() == datetime.now().date()
-            
-            header_bg = '#FFF9E6' if is_today else '#F9FAFB'
-            header_text = f"{date.strftime('%a')}\n{date.strftime('%d')}"
-            
-            header = tk.Label(
-                self.calendar_frame,
-                text=header_text,
-                bg=header_bg,
-                fg=self.colors.get('warning', '#F39C12') if is_today else '#6B7280',
-                font=('Helvetica', 10, 'bold' if is_today else 'normal'),
-                pady=8
-            )
+            header = tk.Label(view, pady=8)
             header.grid(row=0, column=i + 1, sticky='ew', padx=1, pady=1)
+            self._week_headers.append(header)
         
         # Time slots (8 AM to 8 PM in 1-hour intervals)
+        self._week_cells = []
         for hour in range(8, 21):
             time_label = tk.Label(
-                self.calendar_frame,
+                view,
                 text=f"{hour:02d}:00",
                 bg='white',
                 fg='#9CA3AF',
@@ -448,74 +484,92 @@ class CalendarView(tk.Frame):
             
             # Day cells for this hour
             for day in range(7):
-                date = start_of_week + timedelta(days=day)
                 cell = tk.Frame(
-                    self.calendar_frame,
+                    view,
                     bg='white',
                     highlightthickness=1,
                     highlightbackground='#E5E7EB',
                     cursor='hand2'
                 )
                 cell.grid(row=hour - 7, column=day + 1, sticky='nsew', padx=1, pady=1)
+                cell.day = day
+                cell.hour = hour
+                cell.date = None
+                cell.shown = 0
                 
-                # Get events/bookings for this date and hour
-                items = self._get_items_for_datetime(date.date(), hour)
-                
-                if items:
-                    # Show events in this time slot
-                    for item in items[:2]:  # Show max 2 per slot
-                        color = self._get_item_color(item)
-                        title = item.get('title') or item.get('resource') or 'Item'
-                        
-                        event_label = tk.Label(
-                            cell,
-                            text=title[:15] + '...' if len(title) > 15 else title,
-                            bg=color,
-                            fg='white',
-                            font=('Helvetica', 8),
-                            anchor='w',
-                            padx=4,
-                            pady=2
-                        )
-                        event_label.pack(fill='x', pady=1)
-                    
-                    if len(items) > 2:
-                        more_label = tk.Label(
-                            cell,
-                            text=f'+{len(items) - 2}',
-                            bg='#F3F4F6',
-                            fg='#6B7280',
-                            font=('Helvetica', 7)
-                        )
-                        more_label.pack()
+                # Up to 2 items per slot, then a count
+                cell.item_labels = [
+                    tk.Label(cell, fg='white', font=('Helvetica', 8), anchor='w', padx=4, pady=2)
+                    for _ in range(2)
+                ]
+                cell.more_label = tk.Label(cell, bg='#F3F4F6', fg='#6B7280', font=('Helvetica', 7))
                 
                 # Bind click
-                cell.bind('<Button-1>', lambda e, d=date.date(), h=hour: self._on_time_slot_click(d, h))
+                cell.bind('<Button-1>', lambda e, c=cell: self._on_time_slot_click(c.date, c.hour))
+                self._week_cells.append(cell)
     
-    def _render_day_view(self):
-        """Render detailed day view with hourly breakdown"""
-        date = self.current_date.date()
+    def _render_week_view(self):
+        """Show the current week in the week grid"""
+        start_of_week = self._start_of_week()
+        today = datetime.now().date()
         
+        for i, header in enumerate(self._week_headers):
+            date = start_of_week + timedelta(days=i)
+            is_today = date.date() == today
+            header.config(
+                text=f"{date.strftime('%a')}\n{date.strftime('%d')}",
+                bg='#FFF9E6' if is_today else '#F9FAFB',
+                fg=self.colors.get('warning', '#F39C12') if is_today else '#6B7280',
+                font=('Helvetica', 10, 'bold' if is_today else 'normal')
+            )
+        
+        for cell in self._week_cells:
+            cell.date = (start_of_week + timedelta(days=cell.day)).date()
+            
+            # Get events/bookings for this date and hour
+            items = self._get_items_for_datetime(cell.date, cell.hour)
+            
+            # Show events in this time slot (max 2 per slot)
+            for label, item in zip(cell.item_labels, items):
+                title = item.get('title') or item.get('resource') or 'Item'
+                label.config(text=title[:15] + '...' if len(title) > 15 else title,
+                             bg=self._get_item_color(item))
+            if len(items) > 2:
+                cell.more_label.config(text=f'+{len(items) - 2}')
+            
+            # Repack only when the number of visible labels changed
+            shown = min(len(items), 3)
+            if cell.shown != shown:
+                for widget in cell.item_labels + [cell.more_label]:
+                    widget.pack_forget()
+                for label in cell.item_labels[:shown]:
+                    label.pack(fill='x', pady=1)
+                if shown > 2:
+                    cell.more_label.pack()
+                cell.shown = shown
+    
+    def _build_day_view(self, view):
+        """Build the day grid: date header and 24 hourly slots"""
         # Configure grid
-        self.calendar_frame.grid_columnconfigure(0, weight=0)
-        self.calendar_frame.grid_columnconfigure(1, weight=1)
+        view.grid_columnconfigure(0, weight=0)
+        view.grid_columnconfigure(1, weight=1)
         
         # Header with date
-        header = tk.Label(
-            self.calendar_frame,
-            text=date.strftime('%A, %B %d, %Y'),
+        self._day_header = tk.Label(
+            view,
             bg='#F9FAFB',
             fg=self.colors.get('primary', '#2C3E50'),
             font=('Helvetica', 14, 'bold'),
             pady=12
         )
-        header.grid(row=0, column=0, columnspan=2, sticky='ew')
+        self._day_header.grid(row=0, column=0, columnspan=2, sticky='ew')
         
         # Time slots (24 hours)
+        self._day_cells = []
         for hour in range(24):
             # Time label
             time_label = tk.Label(
-                self.calendar_frame,
+                view,
                 text=f"{hour:02d}:00",
                 bg='white',
                 fg='#9CA3AF',
@@ -527,7 +581,7 @@ class CalendarView(tk.Frame):
             
             # Hour cell
             cell = tk.Frame(
-                self.calendar_frame,
+                view,
                 bg='white',
                 highlightthickness=1,
                 highlightbackground='#E5E7EB',
@@ -536,74 +590,58 @@ class CalendarView(tk.Frame):
             )
             cell.grid(row=hour + 1, column=1, sticky='ew', padx=2, pady=1)
             cell.grid_propagate(False)
+            cell.hour = hour
+            
+            # Bind click
+            cell.bind('<Button-1>', lambda e, c=cell: self._on_time_slot_click(self.current_date.date(), c.hour))
+            self._day_cells.append(cell)
+    
+    def _render_day_view(self):
+        """Show the current day's items in the day grid"""
+        date = self.current_date.date()
+        self._day_header.config(text=date.strftime('%A, %B %d, %Y'))
+        
+        for cell in self._day_cells:
+            for widget in cell.winfo_children():
+                widget.destroy()
             
             # Get events/bookings for this hour
-            items = self._get_items_for_datetime(date, hour)
+            items = self._get_items_for_datetime(date, cell.hour)
             
-            if items:
-                for item in items:
-                    color = self._get_item_color(item)
-                    title = item.get('title') or item.get('resource') or 'Item'
-                    
-                    event_frame = tk.Frame(cell, bg=color)
-                    event_frame.pack(fill='both', expand=True, padx=4, pady=2)
-                    
+            for item in items:
+                color = self._get_item_color(item)
+                title = item.get('title') or item.get('resource') or 'Item'
+                
+                event_frame = tk.Frame(cell, bg=color)
+                event_frame.pack(fill='both', expand=True, padx=4, pady=2)
+                
+                tk.Label(
+                    event_frame,
+                    text=title,
+                    bg=color,
+                    fg='white',
+                    font=('Helvetica', 10, 'bold'),
+                    anchor='w'
+                ).pack(fill='x', padx=8, pady=4)
+                
+                # Show details
+                if 'venue' in item:
                     tk.Label(
                         event_frame,
-                        text=title,
+                        text=f"📍 {item['venue']}",
                         bg=color,
                         fg='white',
-                        font=('Helvetica', 10, 'bold'),
+                        font=('Helvetica', 8),
                         anchor='w'
-                    ).pack(fill='x', padx=8, pady=4)
-                    
-                    # Show details
-                    if 'venue' in item:
-                        tk.Label(
-                            event_frame,
-                            text=f"📍 {item['venue']}",
-                            bg=color,
-                            fg='white',
-                            font=('Helvetica', 8),
-                            anchor='w'
-                        ).pack(fill='x', padx=8, pady=(0, 4))
-            
-            # Bind click
-            cell.bind('<Button-1>', lambda e, h=hour: self._on_time_slot_click(date, h))
+                    ).pack(fill='x', padx=8, pady=(0, 4))
     
     def _get_items_for_date(self, date, item_type='all'):
         """Get events/bookings for a specific date"""
-        items = []
-        
-        if item_type in ('all', 'events'):
-            for event in self.events:
-                event_date = self._parse_date(event.get('start_time'))
-                if event_date and event_date.date() == date:
-                    items.append({'type': 'event', **event})
-        
-        if item_type in ('all', 'bookings'):
-            for booking in self.bookings:
-                booking_date = self._parse_date(booking.get('start_time'))
-                if booking_date and booking_date.date() == date:
-                    items.append({'type': 'booking', **booking})
-        
-        return items
+        return self._index.on_date(date, item_type)
     
     def _get_items_for_datetime(self, date, hour):
         """Get events/bookings for a specific date and hour"""
-        items = []
-        
-        for event in self.events:
-            event_time = self._parse_date(event.get('start_time'))
-            if event_time and event_time.date() == date and event_time.hour == hour:
-                items.append({'type': 'event', **event})
-        
-        for booking in self.bookings:
-            booking_time = self._parse_date(booking.get('start_time'))
-            if booking_time and booking_time.date() == date and booking_time.hour == hour:
-                items.append({'type': 'booking', **booking})
-        
-        return items
+        return self._index.at_hour(date, hour)
     
     def _get_item_color(self, item):
         """Get color for an event or booking"""
@@ -644,14 +682,33 @@ class CalendarView(tk.Frame):
     
     def _display_tooltip(self, event, date, items):
         """Display the tooltip"""
-        self._hide_tooltip()
+        self.tooltip_timer = None
+        if self.tooltip is None:
+            self._build_tooltip()
+        
+        # Tooltip content
+        self._tooltip_date.config(text=date.strftime('%A, %B %d, %Y'))
+        for index, (row, color_bar, title_label) in enumerate(self._tooltip_rows):
+            if index < len(items):  # Show max 5
+                item = items[index]
+                color_bar.config(bg=self._get_item_color(item))
+                title_label.config(text=item.get('title') or item.get('resource') or 'Item')
+                if not row.winfo_manager():
+                    row.pack(fill='x', padx=10, pady=2, before=self._tooltip_more)
+            else:
+                row.pack_forget()
+        self._tooltip_more.config(text=f'+ {len(items) - 5} more...' if len(items) > 5 else '')
         
-        # Create tooltip window
+        self.tooltip.wm_geometry(f"+{event.x_root + 10}+{event.y_root + 10}")
+        self.tooltip.deiconify()
+        self.tooltip.lift()
+    
+    def _build_tooltip(self):
+        """Create the (hidden) tooltip window, reused for every hover"""
         self.tooltip = tk.Toplevel(self)
+        self.tooltip.withdraw()
         self.tooltip.wm_overrideredirect(True)
-        self.tooltip.wm_geometry(f"+{event.x_root + 10}+{event.y_root + 10}")
         
-        # Tooltip content
         tooltip_frame = tk.Frame(
             self.tooltip,
             bg='#1F2937',
@@ -661,49 +718,39 @@ class CalendarView(tk.Frame):
         tooltip_frame.pack()
         
         # Date header
-        tk.Label(
+        self._tooltip_date = tk.Label(
             tooltip_frame,
-            text=date.strftime('%A, %B %d, %Y'),
             bg='#1F2937',
             fg='white',
             font=('Helvetica', 10, 'bold')
-        ).pack(anchor='w', padx=10, pady=(8, 4))
+        )
+        self._tooltip_date.pack(anchor='w', padx=10, pady=(8, 4))
         
         # Separator
         tk.Frame(tooltip_frame, bg='#4B5563', height=1).pack(fill='x', padx=10, pady=4)
         
-        # Items list
-        for item in items[:5]:  # Show max 5
-            item_type = item.get('type', 'item')
-            title = item.get('title') or item.get('resource') or 'Item'
-            color = self._get_item_color(item)
-            
-            item_frame = tk.Frame(tooltip_frame, bg='#1F2937')
-            item_frame.pack(fill='x', padx=10, pady=2)
-            
-            # Color indicator
-            tk.Frame(item_frame, bg=color, width=4, height=16).pack(side='left', padx=(0, 6))
-            
-            # Title
-            tk.Label(
-                item_frame,
-                text=title,
+        # Item rows: color indicator and title
+        self._tooltip_more = tk.Label(
+            tooltip_frame,
+            bg='#1F2937',
+            fg='#9CA3AF',
+            font=('Helvetica', 8, 'italic')
+        )
+        self._tooltip_more.pack(anchor='w', padx=10, pady=(2, 8))
+        self._tooltip_rows = []
+        for _ in range(5):
+            row = tk.Frame(tooltip_frame, bg='#1F2937')
+            color_bar = tk.Frame(row, width=4, height=16)
+            color_bar.pack(side='left', padx=(0, 6))
+            title_label = tk.Label(
+                row,
                 bg='#1F2937',
                 fg='white',
                 font=('Helvetica', 9),
                 anchor='w'
-            ).pack(side='left', fill='x', expand=True)
-        
-        if len(items) > 5:
-            tk.Label(
-                tooltip_frame,
-                text=f'+ {len(items) - 5} more...',
-                bg='#1F2937',
-                fg='#9CA3AF',
-                font=('Helvetica', 8, 'italic')
-            ).pack(anchor='w', padx=10, pady=(2, 8))
-        else:
-            tk.Label(tooltip_frame, text='', bg='#1F2937').pack(pady=4)
+            )
+            title_label.pack(side='left', fill='x', expand=True)
+            self._tooltip_rows.append((row, color_bar, title_label))
     
     def _hide_tooltip(self):
         """Hide tooltip"""
@@ -712,8 +759,7 @@ class CalendarView(tk.Frame):
             self.tooltip_timer = None
         
         if self.tooltip:
-            self.tooltip.destroy()
-            self.tooltip = None
+            self.tooltip.withdraw()
     
     def _prev_period(self):
         """Navigate to previous period"""
@@ -759,12 +805,14 @@ class CalendarView(tk.Frame):
         """Change calendar view mode"""
         if view_mode in ('month', 'week', 'day'):
             self.view_mode = view_mode
-            self._render_calendar()
             
             # Update view toggle buttons
-            if self.show_controls:
-                self._build_controls()
-                self._render_calendar()
+            for view, btn in self._view_buttons.items():
+                btn.config(
+                    bg=self.colors.get('secondary', '#3498DB') if view == view_mode else '#F3F4F6',
+                    fg='white' if view == view_mode else '#374151'
+                )
+            self._render_calendar()
     
     def _get_period_label(self):
         """Get label for current period"""
@@ -778,22 +826,6 @@ class CalendarView(tk.Frame):
             return self.current_date.strftime('%A, %B %d, %Y')
         return ''
     
-    @staticmethod
-    def _parse_date(date_str):
-        """Parse date string to datetime object"""
-        if not date_str:
-            return None
-        
-        if isinstance(date_str, datetime):
-            return date_str
-        
-        for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d", "%Y-%m-%dT%H:%M:%S.%fZ"):
-            try:
-                return datetime.strptime(str(date_str)[:26], fmt)
-            except Exception:
-                continue
-        return None
-    
     # Public API Methods
     
     def update_data(self, events=None, bookings=None):
@@ -802,12 +834,13 @@ class CalendarView(tk.Frame):
             self.events = events
         if bookings is not None:
             self.bookings = bookings
+        self._index = CalendarIndex(self.events, self.bookings)
         self._render_calendar()
     
     def set_date(self, date):
         """Set current date and re-render"""
         if isinstance(date, str):
-            date = self._parse_date(date)
+            date = parse_datetime(date)
         if isinstance(date, datetime):
             self.current_date = date
         self._render_calendar()
@@ -0,0 +1,152 @@
+"""
+FeedView Component
+
+Infinite-scroll display for a CursorFeed inside a scrollable canvas.
+
+Features:
+- One frame per loaded page, rendered by the page's callback
+- Next page shown when scrolling near the bottom (prefetched in background)
+- Pages dropped from the window are destroyed without moving what is on
+  screen; dropped pages above are reloaded when scrolling back up
+- "Loading more..." footer while the user waits for a page
+- Optional CardPool: cards of dropped or redrawn pages are recycled for
+  the next pages instead of being destroyed
+
+Usage:
+------
+from components.feed_view import FeedView
+from utils.cursor_feed import CursorFeed
+
+def render_page(frame, page):
+    for event in page.items:
+        make_card(frame, event).pack(fill='x')
+
+feed = CursorFeed(self, self.api.query('events'), page_size=12)
+view = FeedView(canvas, scrollbar, content_frame, feed, render_page)
+feed.start()
+"""
+
+import tkinter as tk
+from tkinter import ttk
+
+
+class FeedView:
+    """Renders a CursorFeed's pages into a frame inside a scrolling canvas."""
+
+    def __init__(self, canvas, scrollbar, content, feed, render_page, bg='#ECF0F1', pool=None):
+        """
+        Initialize feed view.
+
+        Args:
+            canvas: Canvas that scrolls content
+            scrollbar: Vertical scrollbar of the canvas
+            content: Frame (inside the canvas) that holds the page frames
+            feed: CursorFeed to display; its on_page/on_drop/on_loading
+                callbacks are taken over by the view
+            render_page: Callback(frame, page) that fills a page's frame
+            bg: Background color of page frames and the footer
+            pool: CardPool (with content as parent) whose cards render_page
+                lays out in the page frames; they are released before a
+                frame is cleared or destroyed
+        """
+        self.canvas = canvas
+        self.scrollbar = scrollbar
+        self.content = content
+        self.feed = feed
+        self.render_page = render_page
+        self.bg = bg
+        self.pool = pool
+        self._frames = {}
+
+        self.footer = tk.Frame(content, bg=bg)
+        tk.Label(self.footer, text='Loading more...', bg=bg, fg='#6B7280',
+                 font=('Helvetica', 10)).pack(pady=(8, 4))
+        self._spinner = ttk.Progressbar(self.footer, mode='indeterminate', length=200)
+        self._spinner.pack(pady=(0, 12))
+
+        feed.on_page = self._on_page
+        feed.on_drop = self._on_drop
+        feed.on_loading = self._on_loading
+        canvas.configure(yscrollcommand=self._on_scroll)
+
+    def clear(self):
+        """Remove every page frame (before restarting the feed)"""
+        for frame in self._frames.values():
+            self._release(frame)
+            frame.destroy()
+        self._frames.clear()
+        self.canvas.yview_moveto(0)
+
+    def rerender(self, page=None):
+        """
+        Render a page again after its items changed
+
+        Args:
+            page: FeedPage to redraw (all loaded pages if None)
+        """
+        pages = [page] if page is not None else self.feed.pages
+        for p in pages:
+            frame = self._frames.get(p.index)
+            if frame is None:
+                continue
+            self._release(frame)
+            for child in frame.winfo_children():
+                child.destroy()
+            self.render_page(frame, p)
+
+    def at_top(self):
+        """Whether the first page is loaded and scrolled to the top"""
+        pages = self.feed.pages
+        return bool(pages) and pages[0].index == 0 and self.canvas.yview()[0] <= 0.0
+
+    def _on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        # Let Tk finish laying out before pages are added or removed
+        self.canvas.after_idle(self.feed.on_scroll, first, last)
+
+    def _on_page(self, page, at_start):
+        frame = tk.Frame(self.content, bg=self.bg)
+        self.render_page(frame, page)
+        first = next((self._frames[p.index] for p in self.feed.pages
+                      if p.index != page.index and p.index in self._frames), None)
+        if at_start and first is not None:
+            frame.pack(fill='x', before=first)
+            self.canvas.update_idletasks()
+            self._shift(frame.winfo_height())
+        elif self.footer.winfo_ismapped():
+            frame.pack(fill='x', before=self.footer)
+        else:
+            frame.pack(fill='x')
+        self._frames[page.index] = frame
+
+    def _on_drop(self, page, at_start):
+        frame = self._frames.pop(page.index, None)
+        if frame is None:
+            return
+        height = frame.winfo_height()
+        self._release(frame)
+        frame.destroy()
+        if at_start:
+            self._shift(-height)
+
+    def _on_loading(self, is_loading):
+        if is_loading:
+            self.footer.pack(fill='x')
+            self._spinner.start(10)
+        else:
+            self._spinner.stop()
+            self.footer.pack_forget()
+
+    def _release(self, frame):
+        if self.pool is not None:
+            self.pool.release_all(frame)
+
+    def _shift(self, delta):
+        """Scroll by delta pixels so content above the view can change
+        without moving what is on screen"""
+        self.canvas.update_idletasks()
+        self.canvas.configure(scrollregion=self.canvas.bbox('all'))
+        region = self.canvas.bbox('all')
+        height = (region[3] - region[1]) if region else 0
+        if height > 0:
+            self.canvas.yview_moveto(max(0.0, (self.canvas.canvasy(0) + delta) / height))
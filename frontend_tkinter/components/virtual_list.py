@@ -0,0 +1,373 @@
+"""
+VirtualList Component
+
+Scrolling list/grid of cards that builds only the rows in view.
+
+Features:
+- Only the visible rows plus a small overscan have card widgets; cards
+  scrolled out of view are recycled for the rows scrolling in
+- Adapter API: create_card(parent) builds an empty card once,
+  bind_card(card, item) fills it with an item's data (card.item is the item
+  it shows, for the card's callbacks)
+- One or more columns; rows share one height, which grows to the tallest
+  bound card
+- Placeholder widget (loading spinner, empty state) in place of the cards
+- CardPool: the same recycling for cards laid out by other containers
+  (e.g. the page frames of a FeedView)
+
+Usage:
+------
+from components.virtual_list import VirtualList
+
+def create_card(parent):
+    card = tk.Frame(parent, bg='white')
+    card.title = tk.Label(card, bg='white')
+    card.title.pack(anchor='w')
+    tk.Button(card, text='Open', command=lambda: open_item(card.item)).pack()
+    return card
+
+def bind_card(card, item):
+    card.title.config(text=item.get('title', ''))
+
+items_view = VirtualList(parent, create_card, bind_card, row_height=120)
+items_view.pack(fill='both', expand=True)
+items_view.set_items(items, empty=build_empty_state)
+"""
+
+import math
+import tkinter as tk
+from tkinter import ttk
+
+
+def visible_range(top, height, count, stride, columns=1, overscan=2):
+    """
+    Indices of the items to build for a scroll position
+
+    Args:
+        top: Canvas y coordinate at the top of the view
+        height: Height of the view in pixels
+        count: Number of items
+        stride: Row height plus the gap between rows
+        columns: Items per row
+        overscan: Rows built above and below the view
+
+    Returns:
+        (first, last) index range, last exclusive
+    """
+    if count <= 0 or stride <= 0:
+        return 0, 0
+    first_row = max(0, int(top // stride) - overscan)
+    last_row = int((top + max(height, 1)) // stride) + overscan
+    return min(count, first_row * columns), min(count, (last_row + 1) * columns)
+
+
+class CardPool:
+    """Recycles card widgets between items."""
+
+    def __init__(self, parent, create_card, bind_card):
+        """
+        Initialize card pool.
+
+        Args:
+            parent: Parent widget of the cards
+            create_card: Callback(parent) that builds an empty card
+            bind_card: Callback(card, item) that fills a card; called each
+                time the card is handed out, so it must reset everything it
+                sets (texts, colors, optional parts shown or hidden)
+        """
+        self.parent = parent
+        self.create_card = create_card
+        self.bind_card = bind_card
+        self.created = 0
+        self.reused = 0
+        self._free = []
+        self._held = {}
+
+    def acquire(self, item, master=None):
+        """
+        Get a card showing an item
+
+        Args:
+            item: Item to bind
+            master: Container the card is gridded/packed into with in_=;
+                release_all(master) returns its cards to the pool
+
+        Returns:
+            Bound card (not yet laid out)
+        """
+        if self._free:
+            card = self._free.pop()
+            self.reused += 1
+        else:
+            card = self.create_card(self.parent)
+            self.created += 1
+        card.item = item
+        self.bind_card(card, item)
+        if master is not None:
+            self._held.setdefault(str(master), []).append(card)
+            # Reused cards may be older than the container: keep them on top
+            card.lift(master)
+        return card
+
+    def release(self, card):
+        """Return a card to the pool (removed from its layout)"""
+        manager = card.winfo_manager()
+        if manager in ('pack', 'grid', 'place'):
+            getattr(card, manager + '_forget')()
+        card.item = None
+        self._free.append(card)
+
+    def release_all(self, master):
+        """Return the cards laid out in a container (before it is destroyed)"""
+        for card in self._held.pop(str(master), []):
+            self.release(card)
+
+    def get_stats(self):
+        """
+        Get pool statistics
+
+        Returns:
+            Dictionary with cards created, reused and free
+        """
+        return {'created': self.created, 'reused': self.reused, 'free': len(self._free)}
+
+
+class VirtualList(tk.Frame):
+    """Scrolling list/grid that only builds the cards in view."""
+
+    def __init__(self, parent, create_card, bind_card, row_height=120, columns=1,
+                 gap=12, overscan=2, bg='#ECF0F1'):
+        """
+        Initialize virtual list.
+
+        Args:
+            parent: Parent widget
+            create_card: Callback(parent) that builds an empty card
+            bind_card: Callback(card, item) that fills a card (see CardPool)
+            row_height: Initial row height; grows to the tallest bound card
+            columns: Cards per row
+            gap: Space between rows (and columns) in pixels
+            overscan: Rows built above and below the view
+            bg: Background color
+        """
+        super().__init__(parent, bg=bg)
+        self.row_height = row_height
+        self.columns = max(1, columns)
+        self.gap = gap
+        self.overscan = overscan
+        self.bg = bg
+        self.items = []
+
+        self.canvas = tk.Canvas(self, bg=bg, highlightthickness=0, yscrollincrement=20)
+        self.scrollbar = ttk.Scrollbar(self, orient='vertical', command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_scroll)
+        self.scrollbar.pack(side='right', fill='y')
+        self.canvas.pack(side='left', fill='both', expand=True)
+        self.canvas.bind('<Configure>', self._on_resize)
+
+        self.pool = CardPool(self.canvas, self._create_card, bind_card)
+        self._create = create_card
+        self._shown = {}      # index -> card
+        self._windows = {}    # card -> canvas window item
+        self._width = 1
+        self._placeholder = None
+        self._placeholder_window = None
+        self._layout_pending = False
+
+        # Mouse wheel over the canvas or any card
+        self._wheel_tag = f'VirtualList{id(self)}'
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            self.canvas.bind_class(self._wheel_tag, sequence, self._on_wheel)
+        self._add_wheel_tag(self.canvas)
+
+    # Public API
+
+    def set_items(self, items, keep_position=False, empty=None):
+        """
+        Show a new list of items
+
+        Cards already showing the same item object at the same position
+        are not bound again.
+
+        Args:
+            items: Items to show
+            keep_position: Keep the scroll position (e.g. after a refresh)
+            empty: Callback(parent) that builds the widget shown when there
+                are no items
+        """
+        self.items = list(items)
+        self._set_placeholder(empty if not self.items else None)
+        if not keep_position:
+            self.canvas.yview_moveto(0)
+        self._update_region()
+        self._layout()
+
+    def show_placeholder(self, build):
+        """
+        Show a widget instead of the cards (e.g. a loading spinner)
+
+        Args:
+            build: Callback(parent) that builds the widget
+        """
+        self.items = []
+        self._layout()
+        self._set_placeholder(build)
+        self.canvas.yview_moveto(0)
+
+    def refresh(self, index=None):
+        """
+        Bind shown cards again after their items changed in place
+
+        Args:
+            index: Item index to refresh (all shown cards if None)
+        """
+        for i, card in self._shown.items():
+            if index is None or i == index:
+                card.item = self.items[i]
+                self.pool.bind_card(card, card.item)
+        self._fit_height(self._shown.values())
+
+    def scroll_to(self, index):
+        """Scroll so the row holding an item is at the top"""
+        total = self._total_height()
+        if total > 0:
+            self.canvas.yview_moveto((index // self.columns) * self._stride() / total)
+
+    def visible_cards(self):
+        """Shown cards by item index"""
+        return dict(self._shown)
+
+    def get_stats(self):
+        """
+        Get list statistics
+
+        Returns:
+            Dictionary with items, shown cards and the card pool's stats
+        """
+        return {'items': len(self.items), 'shown': len(self._shown), **self.pool.get_stats()}
+
+    # Layout
+
+    def _create_card(self, parent):
+        card = self._create(parent)
+        self._windows[card] = self.canvas.create_window(0, 0, window=card, anchor='nw', state='hidden')
+        self._add_wheel_tag(card)
+        return card
+
+    def _stride(self):
+        return self.row_height + self.gap
+
+    def _total_height(self):
+        return math.ceil(len(self.items) / self.columns) * self._stride()
+
+    def _cell(self, index):
+        """x, y, width of an item's card"""
+        cell_width = self._width / self.columns
+        row, column = divmod(index, self.columns)
+        if self.columns == 1:
+            return 0, row * self._stride(), self._width
+        return column * cell_width + self.gap / 2, row * self._stride(), max(1, cell_width - self.gap)
+
+    def _update_region(self):
+        if self._placeholder is None:
+            self.canvas.configure(scrollregion=(0, 0, self._width, self._total_height()))
+
+    def _layout(self):
+        """Recycle cards that left the view and bind cards for rows that entered it"""
+        self._layout_pending = False
+        first, last = visible_range(self.canvas.canvasy(0), self.canvas.winfo_height(),
+                                    len(self.items), self._stride(), self.columns, self.overscan)
+
+        for index in [i for i in self._shown if not first <= i < last]:
+            card = self._shown.pop(index)
+            self.canvas.itemconfigure(self._windows[card], state='hidden')
+            self.pool.release(card)
+
+        bound = []
+        for index in range(first, last):
+            item = self.items[index]
+            card = self._shown.get(index)
+            if card is not None and card.item is item:
+                continue
+            if card is None:
+                card = self.pool.acquire(item)
+                self._shown[index] = card
+                self._place(index, card)
+            else:
+                card.item = item
+                self.pool.bind_card(card, item)
+            bound.append(card)
+        self._fit_height(bound)
+
+    def _place(self, index, card):
+        x, y, width = self._cell(index)
+        window = self._windows[card]
+        self.canvas.coords(window, x, y)
+        self.canvas.itemconfigure(window, state='normal', width=width, height=self.row_height)
+
+    def _fit_height(self, cards):
+        """Grow the row height to the tallest of the just-bound cards"""
+        cards = list(cards)
+        if not cards:
+            return
+        self.canvas.update_idletasks()
+        tallest = max(card.winfo_reqheight() for card in cards)
+        if tallest > self.row_height:
+            self.row_height = tallest
+            self._update_region()
+            for index, card in self._shown.items():
+                self._place(index, card)
+            self._schedule_layout()
+
+    def _set_placeholder(self, build):
+        if self._placeholder is not None:
+            self.canvas.delete(self._placeholder_window)
+            self._placeholder.destroy()
+            self._placeholder = self._placeholder_window = None
+        if build is None:
+            return
+        self._placeholder = build(self.canvas)
+        self._placeholder_window = self.canvas.create_window(
+            0, 0, window=self._placeholder, anchor='nw', width=self._width)
+        self._add_wheel_tag(self._placeholder)
+        self.canvas.update_idletasks()
+        self.canvas.configure(scrollregion=(0, 0, self._width, self._placeholder.winfo_reqheight()))
+
+    def _schedule_layout(self):
+        if not self._layout_pending:
+            self._layout_pending = True
+            self.after_idle(self._layout_if_alive)
+
+    def _layout_if_alive(self):
+        if self.winfo_exists():
+            self._layout()
+
+    # Events
+
+    def _on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self._schedule_layout()
+
+    def _on_resize(self, event):
+        if event.width != self._width:
+            self._width = event.width
+            for index, card in self._shown.items():
+                self._place(index, card)
+            if self._placeholder is not None:
+                self.canvas.itemconfigure(self._placeholder_window, width=self._width)
+            self._update_region()
+        self._schedule_layout()
+
+    def _on_wheel(self, event):
+        if event.num == 4:
+            step = -1
+        elif event.num == 5:
+            step = 1
+        else:
+            step = int(-event.delta / 120) or (-1 if event.delta > 0 else 1)
+        self.canvas.yview_scroll(step, 'units')
+
+    def _add_wheel_tag(self, widget):
+        widget.bindtags((self._wheel_tag,) + widget.bindtags())
+        for child in widget.winfo_children():
+            self._add_wheel_tag(child)
@@ -88,9 +88,14 @@ class Settings:
             # Cache Configuration
             'CACHE_ENABLED': True,
             'CACHE_TTL': 300,  # 5 minutes
-            'CACHE_MAX_SIZE': 100,
+            'CACHE_MAX_SIZE': 100,  # Memory budget in MB
             'CACHE_DIR': 'cache',
             
+            # Local Database (on-disk response cache)
+            'DATABASE_SQLITE_DB': 'cache/local_cache.db',
+            'DATABASE_DB_CACHE_ENABLED': True,
+            'DATABASE_DB_MAX_SIZE': 100,  # MB of compressed response bodies
+            
             # Logging Configuration
             'LOG_LEVEL': 'INFO',
             'LOG_DIR': 'logs',
@@ -118,6 +123,14 @@ class Settings:
             'PERFORMANCE_MONITORING': True,
             'PERFORMANCE_PAGE_SIZE': 20,
             'PERFORMANCE_IMAGE_CACHE': True,
+            'PERFORMANCE_IO_WORKERS': 8,  # Background threads for API/disk work
+            'PERFORMANCE_CPU_WORKERS': 2,  # Background threads for parsing/sorting
+            'PERFORMANCE_UI_FRAME_MS': 16,  # UI dispatcher drain interval
+            'PERFORMANCE_UI_BUDGET_MS': 8,  # Max time per drain tick
+            'PERFORMANCE_FETCH_CONCURRENCY': 6,  # Parallel per-id requests (e.g. registrations)
+            'PERFORMANCE_MAX_REQUESTS': 8,  # Concurrent API requests (all priority classes)
+            'PERFORMANCE_INTERACTIVE_RESERVED': 2,  # Request slots kept free for user actions
+            'PERFORMANCE_BACKGROUND_MAX_WAIT': 10,  # Seconds before a deferred background GET is dropped
             
             # Security Configuration
             'SECURITY_CSRF_ENABLED': True,
@@ -159,6 +172,7 @@ class Settings:
             section_mapping = {
                 'API': 'API_',
                 'CACHE': 'CACHE_',
+                'DATABASE': 'DATABASE_',
                 'LOG': 'LOG_',
                 'SESSION': 'SESSION_',
                 'UI': 'UI_',
@@ -203,7 +217,7 @@ class Settings:
         result = {}
         
         # Prefixes to look for
-        prefixes = ['API_', 'CACHE_', 'LOG_', 'SESSION_', 'UI_', 
+        prefixes = ['API_', 'CACHE_', 'DATABASE_', 'LOG_', 'SESSION_', 'UI_', 
                    'PERFORMANCE_', 'SECURITY_', 'NOTIFICATION_', 
                    'FEATURE_', 'DEBUG_']
         
@@ -22,7 +22,6 @@ import sys
 import json
 from typing import Dict, List, Optional, Any
 from collections import deque
-import threading
 import time
 
 # Add utils to path
@@ -42,6 +41,11 @@ from utils.accessibility import (
     get_high_contrast_mode
 )
 from utils.performance import get_cache, get_lazy_loader, get_performance_monitor
+from utils.disk_cache import get_disk_cache
+from utils.sync_manager import get_sync_manager
+from utils.entity_store import get_entity_store
+from utils.task_executor import get_executor, run_async, deliver
+from utils.ui_dispatcher import get_dispatcher
 from utils.loading_indicators import LoadingOverlay
 
 # NOTE: Page modules can be heavy (PIL, tkcalendar). They are imported lazily inside
@@ -253,12 +257,17 @@ class CampusEventApp(tk.Tk):
             if token:
                 self.api.set_auth_token(token)
                 print(f"[DEBUG] JWT token restored from session")
+                self.api.warm_up(connections=4)
+        
+        # User whose data the caches hold (cleared when another user logs in)
+        self._data_user_id = self.session.get_user_id()
         
         # Set up auth error callback to handle token expiration
         def on_auth_error(status_code):
             """Handle authentication errors by clearing session and redirecting to login"""
             print(f"[DEBUG] Authentication error: {status_code}. Clearing session and redirecting to login.")
             self.session.clear_session()
+            self._clear_user_data()
             self.navigate('login')
             from tkinter import messagebox
             if status_code == 401:
@@ -393,6 +402,11 @@ class CampusEventApp(tk.Tk):
             self.cache = get_cache()
             self.lazy_loader = get_lazy_loader()
             self.perf_monitor = get_performance_monitor()
+            self.executor = get_executor()
+            
+            # Single main-thread pump for worker -> UI callbacks
+            self.dispatcher = get_dispatcher()
+            self.dispatcher.install(self)
             
             print("[PERFORMANCE] Features initialized")
         except Exception as e:
@@ -596,10 +610,9 @@ class CampusEventApp(tk.Tk):
                     success = True
             
             # Update UI in main thread
-            self.after(0, lambda: self._on_backend_check_complete(success))
+            deliver(self, lambda: self._on_backend_check_complete(success))
         
-        thread = threading.Thread(target=check_backend, daemon=True)
-        thread.start()
+        run_async(None, check_backend)
     
     def _on_backend_check_complete(self, success: bool):
         """Handle backend check completion."""
@@ -746,8 +759,11 @@ class CampusEventApp(tk.Tk):
         if not page:
             return
         
-        # Hide current page
+        # Hide current page and cancel its background work; late results
+        # for a page that is no longer visible are dropped
         if self.current_page:
+            if self.current_page is not page:
+                get_executor().cancel_owner(self.current_page)
             self.current_page.pack_forget()
         
         # Show new page
@@ -826,6 +842,12 @@ class CampusEventApp(tk.Tk):
             self.navigate('login')
             return
         
+        # Another account logged in without logging out (e.g. after expiry)
+        if user.get('user_id') != self._data_user_id:
+            if self._data_user_id is not None:
+                self._clear_user_data()
+            self._data_user_id = user.get('user_id')
+        
         role = user.get('role', 'student')
         
         if role == 'admin':
@@ -953,10 +975,22 @@ class CampusEventApp(tk.Tk):
         """Logout user."""
         if messagebox.askyesno("Logout", "Are you sure you want to logout?"):
             self.session.clear_session()
-            self.cache.clear()
+            self._clear_user_data()
             self.announcer.announce("Logged out successfully")
             self.navigate('login', add_to_history=False)
     
+    def _clear_user_data(self):
+        """Forget cached responses and local copies of the signed-in user's data"""
+        self.cache.clear()
+        disk_cache = get_disk_cache()
+        if disk_cache:
+            disk_cache.clear()
+        get_sync_manager().clear()
+        get_entity_store().clear()
+        APIClient.clear_loaders()
+        APIClient.clear_header_cache()
+        self._data_user_id = None
+    
     def _change_theme(self, theme: str):
         """Change application theme."""
         self.app_state.set_theme(theme)
@@ -1158,6 +1192,10 @@ Contact support from Help → Contact Support
         print("[APP] Shutting down...")
         self.announcer.announce("Application closing")
         
+        # Stop background work
+        get_executor().shutdown(wait=False)
+        get_dispatcher().stop()
+        
         # Destroy window
         self.destroy()
 
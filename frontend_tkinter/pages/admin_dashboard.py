@@ -1,9 +1,15 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
 from datetime import datetime
 
 from utils.api_client import APIClient
+from utils.datetime_service import format_relative, parse_datetime
+from utils.task_executor import get_executor, run_async, deliver
+from utils.sync_manager import get_sync_manager
+from utils.request_scheduler import Priority, request_priority
+from utils.entity_store import get_entity_store, is_pending
+from utils.page_loader import PageLoader
+from utils.reconciler import KeyedRows, Snapshot, set_text
 from utils.session_manager import SessionManager
 from utils.button_styles import ButtonStyles
 from utils.canvas_button import create_primary_button, create_secondary_button, create_success_button, create_danger_button, create_warning_button
@@ -12,6 +18,15 @@ from utils.canvas_button import create_primary_button, create_secondary_button,
 class AdminDashboard(tk.Frame):
     """Admin Dashboard with sidebar navigation and dynamic content area."""
 
+    # Data sections each view needs before it can render
+    VIEW_SECTIONS = {
+        'dashboard': ('pending_events', 'all_events', 'resources', 'users', 'pending_bookings'),
+        'manage_events': ('all_events',),
+        'manage_resources': ('resources',),
+        'manage_users': ('users',),
+        'booking_approvals': ('pending_bookings',),
+    }
+
     def __init__(self, parent, controller):
         super().__init__(parent, bg=controller.colors.get('background', '#ECF0F1'))
         self.controller = controller
@@ -26,11 +41,24 @@ class AdminDashboard(tk.Frame):
         self.pending_bookings = []
         self.recent_activities = []
         
+        # Shared entity store: one copy of each event/booking across all pages
+        self.store = get_entity_store()
+        self.store.query('events').subscribe(self._on_events_changed, owner=self)
+        
         # Auto-refresh tracking
         self.auto_refresh_enabled = True
         self.auto_refresh_interval = 30000  # 30 seconds
         self.refresh_timer = None
         self.current_view = 'dashboard'  # Track current view for refresh
+        
+        # Dashboard widgets patched by refreshes (set by _render_dashboard)
+        self._dashboard_snapshot = Snapshot()
+        self._dashboard_labels = {}
+        self._pending_badge = None
+        self._approval_sections = ()
+        self._pending_event_rows = None
+        self._pending_booking_rows = None
+        self._activity_rows = None
 
         # Layout: 1 row, 2 columns (sidebar, main)
         self.grid_rowconfigure(0, weight=1)
@@ -155,59 +183,75 @@ class AdminDashboard(tk.Frame):
 
     # Data loading
     def _load_all_data_then(self, callback):
+        """Fetch every section in parallel; render the view once its own
+        sections have arrived instead of after the slowest fetch"""
         self._show_spinner()
-
-        def worker():
-            errors = []
-            
-            # Load pending events
-            try:
-                self.pending_events = self.api.get('admin/events/pending') or []
-            except Exception as e:
-                errors.append(('pending_events', str(e)))
-                self.pending_events = []
-            
-            # Load all events
-            try:
-                self.all_events = self.api.get('events') or []
-            except Exception as e:
-                errors.append(('all_events', str(e)))
-                self.all_events = []
-            
-            # Load all resources
-            try:
-                self.all_resources = self.api.get('admin/resources') or []
-            except Exception as e:
-                # Fallback to regular resources endpoint
-                try:
-                    self.all_resources = self.api.get('resources') or []
-                except Exception:
-                    errors.append(('resources', str(e)))
-                    self.all_resources = []
-            
-            # Load all users
-            try:
-                self.all_users = self.api.get('admin/users') or []
-            except Exception as e:
-                errors.append(('users', str(e)))
-                self.all_users = []
-            
-            # Load pending bookings
-            try:
-                self.pending_bookings = self.api.get('admin/bookings/pending') or []
-            except Exception as e:
-                errors.append(('pending_bookings', str(e)))
-                self.pending_bookings = []
-
-            def done():
-                self._hide_spinner()
-                if errors:
-                    self._info_banner(f"Some data failed to load: {errors[0][0]}: {errors[0][1]}")
+        view = getattr(callback, '__name__', '').replace('_render_', '', 1)
+        waiting_for = set(self.VIEW_SECTIONS.get(view, self.VIEW_SECTIONS['dashboard']))
+        state = {'rendered': False}
+
+        def ready(name, attr):
+            def on_ready(value):
+                changed = getattr(self, attr) is not value
+                setattr(self, attr, value)
+                waiting_for.discard(name)
+                if not state['rendered']:
+                    if not waiting_for:
+                        state['rendered'] = True
+                        self._hide_spinner()
+                        callback()
+                elif changed and name in self.VIEW_SECTIONS.get(self.current_view, ()):
+                    # The user switched views while this section was loading
+                    self._rerender_current_view()
+            return on_ready
+
+        # Tables show summary rows; _view_event_details fetches the full record
+        def load_events():
+            self.store.load('events', self.api.get(self._summary_url('events')) or [],
+                            complete=True, partial=True)
+            return self.store.all('events')
+
+        loader = PageLoader(self)
+        loader.section('pending_events',
+                       lambda: self.store.load('events', self.api.get(self._summary_url('admin/events/pending')) or [],
+                                               partial=True),
+                       default=[], on_ready=ready('pending_events', 'pending_events'))
+        loader.section('all_events', load_events,
+                       default=[], on_ready=ready('all_events', 'all_events'))
+        loader.section('resources', lambda: self.api.get('admin/resources') or [],
+                       # Fallback to regular resources endpoint
+                       fallback=lambda: self.api.get('resources') or [],
+                       default=[], on_ready=ready('resources', 'all_resources'))
+        loader.section('users', lambda: self.api.get('admin/users') or [],
+                       default=[], on_ready=ready('users', 'all_users'))
+        loader.section('pending_bookings',
+                       lambda: self.store.load('bookings', self.api.get('admin/bookings/pending') or [],
+                                               complete=is_pending),
+                       default=[], on_ready=ready('pending_bookings', 'pending_bookings'))
+
+        def done(loader):
+            self._hide_spinner()
+            if not state['rendered']:
+                state['rendered'] = True
                 callback()
+            errors = list(loader.errors.items())
+            if errors:
+                self._info_banner(f"Some data failed to load: {errors[0][0]}: {errors[0][1]}")
+
+        loader.start(on_complete=done)
 
-            self.after(0, done)
+    def _summary_url(self, endpoint):
+        """Endpoint asking for the summary fields the tables show"""
+        return self.api.query(endpoint, summary=True).url
 
-        threading.Thread(target=worker, daemon=True).start()
+    def _rerender_current_view(self):
+        """Re-render the visible view with the latest data"""
+        if self.current_view == 'dashboard':
+            self._update_dashboard_counts()
+            return
+        render = getattr(self, f'_render_{self.current_view}', None)
+        if render is not None:
+            render()
 
     # Auto-refresh methods
     def _start_auto_refresh(self):
@@ -225,29 +269,44 @@ class AdminDashboard(tk.Frame):
         """Auto-refresh data in background"""
         if not self.auto_refresh_enabled:
             return
+        if getattr(self.controller, 'current_page', self) is not self:
+            return  # Hidden; load_page() restarts the cycle when shown again
         
         def worker():
             try:
-                # Silently refresh pending events
-                self.pending_events = self.api.get('admin/events/pending') or []
-                # Refresh pending bookings
-                self.pending_bookings = self.api.get('admin/bookings/pending') or []
+                # Polling yields to clicks: deferred (or dropped) while the
+                # user waits on an interactive request
+                with request_priority(Priority.BACKGROUND):
+                    # Silently pull changes since the last sync (an unchanged
+                    # collection hands back the same list object)
+                    sync = get_sync_manager()
+                    pending_events = self.store.load('events', sync.sync(self.api, self._summary_url('admin/events/pending')) or [],
+                                                     partial=True)
+                    # Refresh pending bookings
+                    bookings = self.store.load(
+                        'bookings', sync.sync(self.api, 'admin/bookings/pending') or [],
+                        complete=is_pending
+                    )
+                    self.pending_events = pending_events
+                    self.pending_bookings = bookings
                 
-                # If we're on dashboard, refresh the view
-                if self.current_view == 'dashboard':
-                    self.after(0, self._update_dashboard_counts)
-                elif self.current_view == 'manage_events':
-                    # Refresh all events
-                    self.all_events = self.api.get('events') or []
-                    self.after(0, self._render_manage_events)
+                    # If we're on dashboard, patch the view (unchanged data only
+                    # ages the activity log's relative times)
+                    if self.current_view == 'dashboard':
+                        deliver(self, self._update_dashboard_counts)
+                    elif self.current_view == 'manage_events':
+                        # Refresh all events
+                        # The store notifies _on_events_changed if anything changed
+                        self.store.load('events', sync.sync(self.api, self._summary_url('events')) or [],
+                                        complete=True, partial=True)
                     
             except Exception:
                 pass  # Fail silently for background refresh
             
             # Schedule next refresh
-            self.after(0, self._schedule_refresh)
+            deliver(self, self._schedule_refresh)
         
-        threading.Thread(target=worker, daemon=True).start()
+        run_async(self, worker)
     
     def _manual_refresh(self):
         """Manual refresh triggered by user"""
@@ -263,10 +322,23 @@ class AdminDashboard(tk.Frame):
         elif self.current_view == 'booking_approvals':
             self._load_all_data_then(self._render_booking_approvals)
     
+    def _on_events_changed(self, events):
+        """Keep all_events in step with the store (fetched by any page)"""
+        if not self.winfo_exists() or events is self.all_events:
+            return
+        self.all_events = events
+        if self.current_view == 'manage_events':
+            self._render_manage_events()
+        elif self.current_view == 'dashboard':
+            self._update_dashboard_counts()
+    
     def _update_dashboard_counts(self):
-        """Update only the counts on dashboard without full re-render"""
-        # This is a lightweight update - just refresh the badge
-        pass  # We'll implement this if needed
+        """Patch the dashboard with refreshed data instead of re-rendering it"""
+        if self.current_view != 'dashboard':
+            return
+        # Not rendered yet: the pending initial render shows the new data
+        if self._activity_rows is not None and self._activity_rows.parent.winfo_exists():
+            self._patch_dashboard()
     
     def _stop_auto_refresh(self):
         """Stop auto-refresh (call this when dashboard is destroyed)"""
@@ -274,6 +346,12 @@ class AdminDashboard(tk.Frame):
         if self.refresh_timer:
             self.after_cancel(self.refresh_timer)
     
+    def load_page(self):
+        """Resume refreshing when the controller shows this page again"""
+        if get_executor().was_interrupted(self):
+            self._manual_refresh()
+        self._start_auto_refresh()
+    
     def destroy(self):
         """Override destroy to stop auto-refresh"""
         self._stop_auto_refresh()
@@ -310,24 +388,20 @@ class AdminDashboard(tk.Frame):
         for i in range(4):
             stats.grid_columnconfigure(i, weight=1)
 
-        def stat_card(parent, title, value, color, icon):
+        def stat_card(parent, name, title, color, icon):
             f = tk.Frame(parent, bg='white', highlightthickness=1, highlightbackground='#E5E7EB')
             header = tk.Frame(f, bg='white')
             header.pack(fill='x', padx=12, pady=(10, 0))
             tk.Label(header, text=icon, bg='white', font=('Helvetica', 20)).pack(side='left')
             tk.Label(header, text=title, bg='white', fg='#6B7280').pack(side='left', padx=(8, 0))
-            tk.Label(f, text=str(value), bg='white', fg=color, font=('Helvetica', 20, 'bold')).pack(anchor='w', padx=12, pady=(4, 12))
+            self._dashboard_labels[name] = tk.Label(f, text='', bg='white', fg=color, font=('Helvetica', 20, 'bold'))
+            self._dashboard_labels[name].pack(anchor='w', padx=12, pady=(4, 12))
             return f
 
-        total_users = len(self.all_users)
-        total_events = len(self.all_events)
-        total_resources = len(self.all_resources)
-        total_bookings = len(self.pending_bookings) + 10  # Placeholder for total bookings
-
-        c1 = stat_card(stats, 'Total Users', total_users, colors.get('secondary', '#3498DB'), '👥')
-        c2 = stat_card(stats, 'Total Events', total_events, colors.get('success', '#27AE60'), '📅')
-        c3 = stat_card(stats, 'Resources', total_resources, colors.get('warning', '#F39C12'), '🏢')
-        c4 = stat_card(stats, 'Bookings', total_bookings, colors.get('primary', '#2C3E50'), '📚')
+        c1 = stat_card(stats, 'users', 'Total Users', colors.get('secondary', '#3498DB'), '👥')
+        c2 = stat_card(stats, 'events', 'Total Events', colors.get('success', '#27AE60'), '📅')
+        c3 = stat_card(stats, 'resources', 'Resources', colors.get('warning', '#F39C12'), '🏢')
+        c4 = stat_card(stats, 'bookings', 'Bookings', colors.get('primary', '#2C3E50'), '📚')
         
         c1.grid(row=0, column=0, sticky='ew', padx=(0, 6))
         c2.grid(row=0, column=1, sticky='ew', padx=6)
@@ -342,54 +416,26 @@ class AdminDashboard(tk.Frame):
         header_frame.pack(fill='x', pady=(4, 6))
         tk.Label(header_frame, text='Pending Approvals', bg=self.controller.colors.get('background', '#ECF0F1'), font=('Helvetica', 14, 'bold'), fg=colors.get('primary', '#2C3E50')).pack(side='left')
         
-        pending_count = len(self.pending_events) + len(self.pending_bookings)
-        if pending_count > 0:
-            badge = tk.Label(header_frame, text=str(pending_count), bg='#E74C3C', fg='white', font=('Helvetica', 10, 'bold'), padx=8, pady=2)
-            badge.pack(side='left', padx=(8, 0))
+        # Shown while anything is pending
+        self._pending_badge = tk.Label(header_frame, text='', bg='#E74C3C', fg='white', font=('Helvetica', 10, 'bold'), padx=8, pady=2)
 
         approvals_frame = tk.Frame(approvals_section, bg='white', highlightthickness=1, highlightbackground='#E5E7EB')
         approvals_frame.pack(fill='x')
 
-        # Pending Events
-        if self.pending_events:
-            tk.Label(approvals_frame, text='Events Awaiting Approval', bg='#FEF3C7', fg='#92400E', font=('Helvetica', 11, 'bold')).pack(fill='x', padx=12, pady=(12, 6))
-            
-            for event in self.pending_events[:5]:  # Show first 5
-                row = tk.Frame(approvals_frame, bg='white')
-                row.pack(fill='x', padx=12, pady=4)
-                
-                tk.Label(row, text='📅', bg='white').pack(side='left', padx=(0, 8))
-                tk.Label(row, text=event.get('title', 'Untitled Event'), bg='white', font=('Helvetica', 10, 'bold')).pack(side='left')
-                tk.Label(row, text=event.get('start_time', 'N/A'), bg='white', fg='#6B7280').pack(side='left', padx=(12, 0))
-                
-                btn_frame = tk.Frame(row, bg='white')
-                btn_frame.pack(side='right')
-                approve_btn = create_success_button(btn_frame, '✓ Approve', lambda e=event: self._approve_event(e), width=100, height=30)
-                approve_btn.pack(side='left', padx=(0, 4))
-                reject_btn = create_danger_button(btn_frame, '✗ Reject', lambda e=event: self._reject_event(e), width=90, height=30)
-                reject_btn.pack(side='left')
-
-        # Pending Bookings
-        if self.pending_bookings:
-            tk.Label(approvals_frame, text='Booking Requests', bg='#FEF3C7', fg='#92400E', font=('Helvetica', 11, 'bold')).pack(fill='x', padx=12, pady=(12, 6))
-            
-            for booking in self.pending_bookings[:5]:  # Show first 5
-                row = tk.Frame(approvals_frame, bg='white')
-                row.pack(fill='x', padx=12, pady=4)
-                
-                tk.Label(row, text='📚', bg='white').pack(side='left', padx=(0, 8))
-                tk.Label(row, text=f"Resource #{booking.get('resource_id', 'N/A')}", bg='white', font=('Helvetica', 10, 'bold')).pack(side='left')
-                tk.Label(row, text=f"{booking.get('start_time', 'N/A')} - {booking.get('end_time', 'N/A')}", bg='white', fg='#6B7280').pack(side='left', padx=(12, 0))
-                
-                btn_frame = tk.Frame(row, bg='white')
-                btn_frame.pack(side='right')
-                approve_btn = create_success_button(btn_frame, '✓ Approve', lambda b=booking: self._approve_booking(b), width=100, height=30)
-                approve_btn.pack(side='left', padx=(0, 4))
-                reject_btn = create_danger_button(btn_frame, '✗ Reject', lambda b=booking: self._reject_booking(b), width=90, height=30)
-                reject_btn.pack(side='left')
+        # Pending Events (first 5)
+        events_section = tk.Frame(approvals_frame, bg='white')
+        tk.Label(events_section, text='Events Awaiting Approval', bg='#FEF3C7', fg='#92400E', font=('Helvetica', 11, 'bold')).pack(fill='x', padx=12, pady=(12, 6))
+        self._pending_event_rows = KeyedRows(events_section, self._create_pending_event_row,
+                                             pack={'fill': 'x', 'padx': 12, 'pady': 4})
+
+        # Pending Bookings (first 5)
+        bookings_section = tk.Frame(approvals_frame, bg='white')
+        tk.Label(bookings_section, text='Booking Requests', bg='#FEF3C7', fg='#92400E', font=('Helvetica', 11, 'bold')).pack(fill='x', padx=12, pady=(12, 6))
+        self._pending_booking_rows = KeyedRows(bookings_section, self._create_pending_booking_row,
+                                               pack={'fill': 'x', 'padx': 12, 'pady': 4})
 
-        if not self.pending_events and not self.pending_bookings:
-            tk.Label(approvals_frame, text='No pending approvals', bg='white', fg='#6B7280').pack(padx=12, pady=20)
+        no_approvals = tk.Label(approvals_frame, text='No pending approvals', bg='white', fg='#6B7280')
+        self._approval_sections = (events_section, bookings_section, no_approvals)
 
         # Recent Activities Log
         activities_section = tk.Frame(self.content, bg=self.controller.colors.get('background', '#ECF0F1'))
@@ -398,40 +444,11 @@ class AdminDashboard(tk.Frame):
 
         activities_frame = tk.Frame(activities_section, bg='white', highlightthickness=1, highlightbackground='#E5E7EB')
         activities_frame.pack(fill='both', expand=True)
-
-        # Generate activity log from events and bookings
-        activities = []
-        for event in self.all_events[:10]:
-            activities.append({
-                'time': event.get('created_at', datetime.now().strftime('%Y-%m-%d %H:%M:%S')),
-                'action': f"Event '{event.get('title', 'Untitled')}' {event.get('status', 'created')}",
-                'icon': '📅',
-                'user': f"User #{event.get('organizer_id', 'N/A')}"
-            })
-        
-        for user in self.all_users[:5]:
-            activities.append({
-                'time': user.get('created_at', datetime.now().strftime('%Y-%m-%d %H:%M:%S')),
-                'action': f"User '{user.get('username', 'Unknown')}' registered",
-                'icon': '👤',
-                'user': user.get('username', 'Unknown')
-            })
-
-        activities = sorted(activities, key=lambda a: a.get('time', ''), reverse=True)[:10]
-
-        if not activities:
-            tk.Label(activities_frame, text='No recent activities', bg='white', fg='#6B7280').pack(padx=12, pady=20)
-        else:
-            for activity in activities:
-                row = tk.Frame(activities_frame, bg='white')
-                row.pack(fill='x', padx=12, pady=6)
-                
-                tk.Label(row, text=activity['icon'], bg='white', font=('Helvetica', 14)).pack(side='left', padx=(0, 8))
-                
-                info_frame = tk.Frame(row, bg='white')
-                info_frame.pack(side='left', fill='x', expand=True)
-                tk.Label(info_frame, text=activity['action'], bg='white', font=('Helvetica', 10)).pack(anchor='w')
-                tk.Label(info_frame, text=f"{activity['user']} • {activity['time']}", bg='white', fg='#9CA3AF', font=('Helvetica', 9)).pack(anchor='w')
+        self._activity_rows = KeyedRows(activities_frame, self._create_activity_row,
+                                        key=lambda a: a['key'],
+                                        signature=lambda a: (a['action'], a['user'], a['when']),
+                                        empty='No recent activities', empty_pady=20,
+                                        pack={'fill': 'x', 'padx': 12, 'pady': 6})
 
         # System Health Indicators
         health_section = tk.Frame(self.content, bg=self.controller.colors.get('background', '#ECF0F1'))
@@ -453,7 +470,122 @@ class AdminDashboard(tk.Frame):
             row.pack(fill='x', padx=12, pady=6)
             tk.Label(row, text=indicator, bg='white', font=('Helvetica', 10)).pack(side='left')
             tk.Label(row, text=icon, bg='white', fg=color, font=('Helvetica', 14)).pack(side='right', padx=(0, 4))
-            tk.Label(row, text=status, bg='white', fg=color, font=('Helvetica', 10, 'bold')).pack(side='right')
+            self._dashboard_labels[indicator] = tk.Label(row, text=status, bg='white', fg=color, font=('Helvetica', 10, 'bold'))
+            self._dashboard_labels[indicator].pack(side='right')
+
+        self._dashboard_snapshot.reset()
+        self._patch_dashboard()
+
+    def _patch_dashboard(self):
+        """Show the latest data in the dashboard widgets (only what changed)"""
+        if self._dashboard_snapshot.changed(self.all_users, self.all_events, self.all_resources,
+                                            self.pending_events, self.pending_bookings):
+            self._patch_summary()
+        # Relative times ("5 minutes ago") age even when the data does not
+        self._patch_activities()
+
+    def _patch_summary(self):
+        """Show the latest counts and pending approvals"""
+        labels = self._dashboard_labels
+        set_text(labels['users'], len(self.all_users))
+        set_text(labels['events'], len(self.all_events))
+        set_text(labels['resources'], len(self.all_resources))
+        set_text(labels['bookings'], len(self.pending_bookings) + 10)  # Placeholder for total bookings
+        set_text(labels['User Sessions'], f'{len(self.all_users)} active')
+
+        pending_count = len(self.pending_events) + len(self.pending_bookings)
+        if pending_count > 0:
+            set_text(self._pending_badge, pending_count)
+            if not self._pending_badge.winfo_manager():
+                self._pending_badge.pack(side='left', padx=(8, 0))
+        else:
+            self._pending_badge.pack_forget()
+
+        # Sections with pending items (or the empty state), in order
+        self._pending_event_rows.reconcile(self.pending_events[:5])
+        self._pending_booking_rows.reconcile(self.pending_bookings[:5])
+        events_section, bookings_section, no_approvals = self._approval_sections
+        shown = [section for section, visible in ((events_section, bool(self.pending_events)),
+                                                  (bookings_section, bool(self.pending_bookings)),
+                                                  (no_approvals, not pending_count)) if visible]
+        if [section for section in self._approval_sections if section.winfo_manager()] != shown:
+            for section in self._approval_sections:
+                section.pack_forget()
+            for section in shown:
+                if section is no_approvals:
+                    section.pack(padx=12, pady=20)
+                else:
+                    section.pack(fill='x')
+
+    def _patch_activities(self):
+        """Show the latest activity log (rows whose text is unchanged are kept)"""
+        # Generate activity log from events and bookings
+        activities = []
+        for event in self.all_events[:10]:
+            activities.append({
+                'key': ('event', event.get('id')),
+                'time': event.get('created_at'),
+                'action': f"Event '{event.get('title', 'Untitled')}' {event.get('status', 'created')}",
+                'icon': '📅',
+                'user': f"User #{event.get('organizer_id', 'N/A')}"
+            })
+        
+        for user in self.all_users[:5]:
+            activities.append({
+                'key': ('user', user.get('id')),
+                'time': user.get('created_at'),
+                'action': f"User '{user.get('username', 'Unknown')}' registered",
+                'icon': '👤',
+                'user': user.get('username', 'Unknown')
+            })
+
+        # Rows without a timestamp count as just now
+        activities = sorted(activities, key=lambda a: (parse_datetime(a['time']) or datetime.min) if a['time'] else datetime.max,
+                            reverse=True)[:10]
+        for activity in activities:
+            activity['when'] = format_relative(activity['time'])
+        self._activity_rows.reconcile(activities)
+
+    def _create_pending_event_row(self, parent, event):
+        row = tk.Frame(parent, bg='white')
+        
+        tk.Label(row, text='📅', bg='white').pack(side='left', padx=(0, 8))
+        tk.Label(row, text=event.get('title', 'Untitled Event'), bg='white', font=('Helvetica', 10, 'bold')).pack(side='left')
+        tk.Label(row, text=event.get('start_time', 'N/A'), bg='white', fg='#6B7280').pack(side='left', padx=(12, 0))
+        
+        btn_frame = tk.Frame(row, bg='white')
+        btn_frame.pack(side='right')
+        approve_btn = create_success_button(btn_frame, '✓ Approve', lambda e=event: self._approve_event(e), width=100, height=30)
+        approve_btn.pack(side='left', padx=(0, 4))
+        reject_btn = create_danger_button(btn_frame, '✗ Reject', lambda e=event: self._reject_event(e), width=90, height=30)
+        reject_btn.pack(side='left')
+        return row
+
+    def _create_pending_booking_row(self, parent, booking):
+        row = tk.Frame(parent, bg='white')
+        
+        tk.Label(row, text='📚', bg='white').pack(side='left', padx=(0, 8))
+        tk.Label(row, text=f"Resource #{booking.get('resource_id', 'N/A')}", bg='white', font=('Helvetica', 10, 'bold')).pack(side='left')
+        tk.Label(row, text=f"{booking.get('start_time', 'N/A')} - {booking.get('end_time', 'N/A')}", bg='white', fg='#6B7280').pack(side='left', padx=(12, 0))
+        
+        btn_frame = tk.Frame(row, bg='white')
+        btn_frame.pack(side='right')
+        approve_btn = create_success_button(btn_frame, '✓ Approve', lambda b=booking: self._approve_booking(b), width=100, height=30)
+        approve_btn.pack(side='left', padx=(0, 4))
+        reject_btn = create_danger_button(btn_frame, '✗ Reject', lambda b=booking: self._reject_booking(b), width=90, height=30)
+        reject_btn.pack(side='left')
+        return row
+
+    def _create_activity_row(self, parent, activity):
+        row = tk.Frame(parent, bg='white')
+        
+        tk.Label(row, text=activity['icon'], bg='white', font=('Helvetica', 14)).pack(side='left', padx=(0, 8))
+        
+        info_frame = tk.Frame(row, bg='white')
+        info_frame.pack(side='left', fill='x', expand=True)
+        tk.Label(info_frame, text=activity['action'], bg='white', font=('Helvetica', 10)).pack(anchor='w')
+        tk.Label(info_frame, text=f"{activity['user']} • {activity['when']}", bg='white', fg='#9CA3AF', font=('Helvetica', 9)).pack(anchor='w')
+        return row
 
     def _render_manage_events(self):
         self.current_view = 'manage_events'
@@ -489,7 +621,7 @@ class AdminDashboard(tk.Frame):
         if filter_type == 'all':
             filtered = self.all_events
         else:
-            filtered = [e for e in self.all_events if (e.get('status') or 'pending').lower() == filter_type]
+            filtered = [e for e in self.all_events if (e.status or 'pending') == filter_type]
         
         self._clear_content()
         tk.Label(self.content, text=f'Manage Events - {filter_type.title()}', bg=self.controller.colors.get('background', '#ECF0F1'), font=('Helvetica', 14, 'bold')).pack(anchor='w', padx=16, pady=(16, 8))
@@ -539,7 +671,7 @@ class AdminDashboard(tk.Frame):
 
         # Insert data
         for event in events:
-            status = (event.get('status') or 'pending').lower()
+            status = event.status or 'pending'
             values = (
                 event.get('title', 'Untitled'),
                 f"User #{event.get('organizer_id', 'N/A')}",
@@ -570,7 +702,7 @@ class AdminDashboard(tk.Frame):
                 return
             index = tree.index(selected[0])
             event = events[index]
-            if (event.get('status') or 'pending').lower() != 'pending':
+            if (event.status or 'pending') != 'pending':
                 messagebox.showinfo('Info', 'Only pending events can be approved')
                 return
             self._approve_event(event)
@@ -582,7 +714,7 @@ class AdminDashboard(tk.Frame):
                 return
             index = tree.index(selected[0])
             event = events[index]
-            if (event.get('status') or 'pending').lower() != 'pending':
+            if (event.status or 'pending') != 'pending':
                 messagebox.showinfo('Info', 'Only pending events can be rejected')
                 return
             self._reject_event(event)
@@ -764,7 +896,7 @@ class AdminDashboard(tk.Frame):
         stat_row('Total Resources:', len(self.all_resources))
         stat_row('Pending Bookings:', len(self.pending_bookings))
         
-        approved_events = len([e for e in self.all_events if (e.get('status') or '').lower() == 'approved'])
+        approved_events = len([e for e in self.all_events if e.status == 'approved'])
         stat_row('Approved Events:', approved_events)
 
         # Charts placeholder
@@ -907,7 +1039,16 @@ class AdminDashboard(tk.Frame):
             messagebox.showerror('Error', f'Failed to unblock user: {str(e)}')
 
     def _view_event_details(self, event):
-        """Show event details"""
+        """Show event details (fetching the full record of a summary row)"""
+        if 'description' not in event:
+            def worker():
+                try:
+                    detail = self.api.get_detail('events', event.get('id')) or {}
+                except Exception:
+                    detail = {}
+                deliver(self, self._view_event_details, {**event, 'description': 'N/A', **detail})
+            run_async(self, worker)
+            return
         details = f"Event: {event.get('title', 'Untitled')}\n"
         details += f"Description: {event.get('description', 'N/A')}\n"
         details += f"Organizer: User #{event.get('organizer_id', 'N/A')}\n"
@@ -955,14 +1096,3 @@ class AdminDashboard(tk.Frame):
             self.spinner.pack_forget()
         except Exception:
             pass
-
-    @staticmethod
-    def _parse_dt(text):
-        if not text:
-            return None
-        for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d"):
-            try:
-                return datetime.strptime(text[:19], fmt)
-            except Exception:
-                continue
-        return None
@@ -1,6 +1,5 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import threading
 from datetime import datetime, timedelta
 import matplotlib
 matplotlib.use('TkAgg')
@@ -9,6 +8,7 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import matplotlib.pyplot as plt
 
 from utils.api_client import APIClient
+from utils.task_executor import get_executor, run_async, deliver
 from utils.session_manager import SessionManager
 
 
@@ -85,6 +85,11 @@ class AnalyticsPage(tk.Frame):
             canvas.itemconfig(canvas.find_withtag('all')[0], width=event.width)
         canvas.bind('<Configure>', on_canvas_configure)
 
+    def load_page(self):
+        """Reload data abandoned when the page was hidden before it arrived"""
+        if get_executor().was_interrupted(self):
+            self._load_analytics()
+
     def _load_analytics(self):
         """Load analytics data from API"""
         self._show_loading()
@@ -92,16 +97,16 @@ class AnalyticsPage(tk.Frame):
         def worker():
             try:
                 self.analytics_data = self.api.get('admin/analytics') or {}
-                self.after(0, self._render_content)
+                deliver(self, self._render_content)
             except Exception as e:
                 def show_error():
                     messagebox.showerror('Error', f'Failed to load analytics: {str(e)}')
                     # Use sample data for demo
                     self.analytics_data = self._get_sample_data()
                     self._render_content()
-                self.after(0, show_error)
+                deliver(self, show_error)
         
-        threading.Thread(target=worker, daemon=True).start()
+        run_async(self, worker)
 
     def _show_loading(self):
         """Show loading indicator"""
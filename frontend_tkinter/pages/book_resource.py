@@ -1,10 +1,10 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
 from datetime import datetime, timedelta
 from tkcalendar import DateEntry
 
 from utils.api_client import APIClient
+from utils.task_executor import get_executor, run_async, deliver
 from utils.session_manager import SessionManager
 from utils.canvas_button import create_primary_button, create_secondary_button, create_success_button
 
@@ -214,6 +214,11 @@ class BookResourcePage(tk.Frame):
         separator = tk.Frame(parent, bg='#E5E7EB', height=1)
         separator.pack(fill='x', pady=(0, 16))
 
+    def load_page(self):
+        """Reload data abandoned when the page was hidden before it arrived"""
+        if get_executor().was_interrupted(self):
+            self._load_resources()
+
     def _load_resources(self):
         """Load available resources"""
         def worker():
@@ -235,13 +240,13 @@ class BookResourcePage(tk.Frame):
                     else:
                         messagebox.showwarning('No Resources', 'No resources available for booking.')
                 
-                self.after(0, update_ui)
+                deliver(self, update_ui)
             except Exception as e:
                 def show_error():
                     messagebox.showerror('Error', f'Failed to load resources: {str(e)}')
-                self.after(0, show_error)
+                deliver(self, show_error)
         
-        threading.Thread(target=worker, daemon=True).start()
+        run_async(self, worker)
 
     def _on_resource_selected(self, event):
         """Handle resource selection"""
@@ -319,7 +324,7 @@ class BookResourcePage(tk.Frame):
                 # Include date parameter in URL instead of params argument
                 self.availability_data = self.api.get(f'resources/{resource_id}/availability?date={selected_date}') or {}
                 
-                self.after(0, self._render_timeslots)
+                deliver(self, self._render_timeslots)
             except Exception as e:
                 error_msg = str(e)
                 # Check if it's a 500/404 error indicating endpoint doesn't exist
@@ -327,14 +332,14 @@ class BookResourcePage(tk.Frame):
                     # Gracefully handle missing endpoint - show all slots as available
                     print(f"[WARNING] Availability endpoint not implemented. Showing all time slots as available.")
                     self.availability_data = {'booked_slots': [], 'unavailable_slots': []}
-                    self.after(0, self._render_timeslots)
+                    deliver(self, self._render_timeslots)
                 else:
                     def show_error():
                         messagebox.showerror('Error', f'Failed to load availability: {error_msg}')
                         self._render_timeslots()  # Render with empty data
-                    self.after(0, show_error)
+                    deliver(self, show_error)
         
-        threading.Thread(target=worker, daemon=True).start()
+        run_async(self, worker)
 
     def _render_timeslots(self):
         """Render time slot grid"""
@@ -713,15 +718,15 @@ class BookResourcePage(tk.Frame):
                                       'You will receive a notification once it is reviewed by an administrator.')
                     self._reset_form()
                 
-                self.after(0, show_success)
+                deliver(self, show_success)
             except Exception as e:
                 def show_error():
                     loading.destroy()
                     messagebox.showerror('Error', f'Failed to submit booking: {str(e)}')
                 
-                self.after(0, show_error)
+                deliver(self, show_error)
         
-        threading.Thread(target=worker, daemon=True).start()
+        run_async(self, worker, interruptible=False)
 
     def _reset_form(self):
         """Reset the booking form"""
@@ -1,12 +1,14 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
-import threading
 from datetime import datetime, timedelta
 from calendar import monthrange
 
+from utils.datetime_service import parse_date, format_date
 from utils.api_client import APIClient
+from utils.task_executor import get_executor, run_async, deliver
 from utils.session_manager import SessionManager
 from utils.email_service import get_email_service
+from components.virtual_list import VirtualList
 
 
 class BookingApprovalsPage(tk.Frame):
@@ -31,6 +33,7 @@ class BookingApprovalsPage(tk.Frame):
         # Data
         self.pending_bookings = []
         self.selected_bookings = []
+        self.booking_list = None  # VirtualList of the list view
         self.view_mode = 'list'  # 'list' or 'calendar'
         self.current_month = datetime.now().month
         self.current_year = datetime.now().year
@@ -98,6 +101,11 @@ class BookingApprovalsPage(tk.Frame):
         self.content_area = tk.Frame(self, bg=self.colors.get('background', '#ECF0F1'))
         self.content_area.grid(row=2, column=0, sticky='nsew', padx=30, pady=(12, 20))
 
+    def load_page(self):
+        """Reload data abandoned when the page was hidden before it arrived"""
+        if get_executor().was_interrupted(self):
+            self._load_pending_bookings()
+
     def _load_pending_bookings(self):
         """Load pending bookings from API"""
         self._show_loading()
@@ -106,42 +114,49 @@ class BookingApprovalsPage(tk.Frame):
             try:
                 self.pending_bookings = self.api.get('admin/bookings/pending') or []
                 self.selected_bookings = []
-                self.after(0, self._render_content)
+                deliver(self, self._render_content)
             except Exception as e:
                 def show_error():
                     messagebox.showerror('Error', f'Failed to load pending bookings: {str(e)}')
                     self.pending_bookings = []
                     self._render_content()
-                self.after(0, show_error)
+                deliver(self, show_error)
         
-        threading.Thread(target=worker, daemon=True).start()
+        run_async(self, worker)
 
     def _show_loading(self):
         """Show loading indicator"""
+        if self.view_mode == 'list':
+            self._list_view().show_placeholder(self._build_loading_state)
+            return
+        
         for widget in self.content_area.winfo_children():
             widget.destroy()
+        self._build_loading_state(self.content_area).pack(fill='both', expand=True)
+
+    def _build_loading_state(self, parent):
+        """Build the loading indicator"""
+        loading_frame = tk.Frame(parent, bg=self.colors.get('background', '#ECF0F1'))
         
-        loading_frame = tk.Frame(self.content_area, bg=self.colors.get('background', '#ECF0F1'))
-        loading_frame.pack(fill='both', expand=True, pady=50)
-        
-        tk.Label(loading_frame, text='Loading pending bookings...', bg=self.colors.get('background', '#ECF0F1'), fg='#1F2937', font=('Helvetica', 12)).pack()
+        tk.Label(loading_frame, text='Loading pending bookings...', bg=self.colors.get('background', '#ECF0F1'), fg='#1F2937', font=('Helvetica', 12)).pack(pady=(50, 0))
         
         spinner = ttk.Progressbar(loading_frame, mode='indeterminate', length=300)
-        spinner.pack(pady=10)
+        spinner.pack(pady=(10, 50))
         spinner.start(10)
+        return loading_frame
 
     def _sort_bookings(self):
         """Sort bookings based on selected criteria"""
         sort_by = self.sort_by.get()
         
         if sort_by == 'date':
-            self.pending_bookings.sort(key=lambda b: self._parse_date(b.get('date', '')) or datetime.min.date())
+            self.pending_bookings = sorted(self.pending_bookings, key=lambda b: parse_date(b.get('date', '')) or datetime.min.date())
         elif sort_by == 'priority':
-            self.pending_bookings.sort(key=lambda b: (not (b.get('priority', 'normal') == 'urgent'), self._parse_date(b.get('date', '')) or datetime.min.date()))
+            self.pending_bookings = sorted(self.pending_bookings, key=lambda b: (not (b.get('priority', 'normal') == 'urgent'), parse_date(b.get('date', '')) or datetime.min.date()))
         elif sort_by == 'resource':
-            self.pending_bookings.sort(key=lambda b: b.get('resource_name', ''))
+            self.pending_bookings = sorted(self.pending_bookings, key=lambda b: b.get('resource_name', ''))
         elif sort_by == 'user':
-            self.pending_bookings.sort(key=lambda b: b.get('user_name', ''))
+            self.pending_bookings = sorted(self.pending_bookings, key=lambda b: b.get('user_name', ''))
         
         self._render_content()
 
@@ -165,12 +180,20 @@ class BookingApprovalsPage(tk.Frame):
         else:
             self._render_calendar_view()
 
+    def _list_view(self):
+        """The list view's VirtualList (built again after the calendar view replaced it)"""
+        if self.booking_list is None or not self.booking_list.winfo_exists():
+            for widget in self.content_area.winfo_children():
+                widget.destroy()
+            
+            # Only the cards in view are built; they are recycled while scrolling
+            self.booking_list = VirtualList(self.content_area, self._create_booking_card, self._bind_booking_card,
+                                            row_height=300, bg=self.colors.get('background', '#ECF0F1'))
+            self.booking_list.pack(fill='both', expand=True)
+        return self.booking_list
+
     def _render_list_view(self):
         """Render list view with booking cards"""
-        # Clear content
-        for widget in self.content_area.winfo_children():
-            widget.destroy()
-        
         # Update queue label
         count = len(self.pending_bookings)
         conflicts_count = sum(1 for b in self.pending_bookings if b.get('has_conflict', False))
@@ -181,48 +204,27 @@ class BookingApprovalsPage(tk.Frame):
         
         self.queue_label.config(text=label_text)
         
-        # Scrollable container
-        canvas = tk.Canvas(self.content_area, bg=self.colors.get('background', '#ECF0F1'), highlightthickness=0)
-        scrollbar = ttk.Scrollbar(self.content_area, orient='vertical', command=canvas.yview)
-        
-        content = tk.Frame(canvas, bg=self.colors.get('background', '#ECF0F1'))
-        
-        canvas.configure(yscrollcommand=scrollbar.set)
-        scrollbar.pack(side='right', fill='y')
-        canvas.pack(side='left', fill='both', expand=True)
-        
-        canvas.create_window((0, 0), window=content, anchor='nw')
-        content.bind('<Configure>', lambda e: canvas.configure(scrollregion=canvas.bbox('all')))
-        
-        # Update canvas width
-        def on_canvas_configure(event):
-            canvas.itemconfig(canvas.find_withtag('all')[0], width=event.width)
-        canvas.bind('<Configure>', on_canvas_configure)
-        
-        if not self.pending_bookings:
-            # Empty state
-            empty_frame = tk.Frame(content, bg='white', highlightthickness=1, highlightbackground='#E5E7EB')
-            empty_frame.pack(fill='both', expand=True, pady=20)
-            
-            tk.Label(empty_frame, text='✅', bg='white', font=('Helvetica', 48)).pack(pady=(40, 10))
-            tk.Label(empty_frame, text='All caught up!', bg='white', fg='#1F2937', font=('Helvetica', 14, 'bold')).pack()
-            tk.Label(empty_frame, text='No pending bookings to review', bg='white', fg='#1F2937', font=('Helvetica', 10)).pack(pady=(4, 40))
-        else:
-            # Booking cards
-            for booking in self.pending_bookings:
-                card = self._create_booking_card(booking)
-                card.pack(fill='x', pady=(0, 12))
+        self._list_view().set_items(self.pending_bookings, empty=self._build_empty_state)
+
+    def _build_empty_state(self, parent):
+        """Build the empty state shown when no bookings are pending"""
+        empty_frame = tk.Frame(parent, bg='white', highlightthickness=1, highlightbackground='#E5E7EB')
+        
+        tk.Label(empty_frame, text='✅', bg='white', font=('Helvetica', 48)).pack(pady=(40, 10))
+        tk.Label(empty_frame, text='All caught up!', bg='white', fg='#1F2937', font=('Helvetica', 14, 'bold')).pack()
+        tk.Label(empty_frame, text='No pending bookings to review', bg='white', fg='#1F2937', font=('Helvetica', 10)).pack(pady=(4, 40))
+        return empty_frame
 
-    def _create_booking_card(self, booking):
-        """Create a booking approval card"""
-        card = tk.Frame(self.content_area, bg='white', highlightthickness=1, highlightbackground='#E5E7EB')
+    def _create_booking_card(self, parent):
+        """Create an empty booking approval card (filled by _bind_booking_card, recycled by the list)"""
+        card = tk.Frame(parent, bg='white', highlightthickness=1, highlightbackground='#E5E7EB')
         
         # Track selection
-        selected_var = tk.BooleanVar(value=booking.get('id') in self.selected_bookings)
+        card.selected_var = tk.BooleanVar()
         
         def on_checkbox_change():
-            booking_id = booking.get('id')
-            if selected_var.get():
+            booking_id = card.item.get('id')
+            if card.selected_var.get():
                 if booking_id not in self.selected_bookings:
                     self.selected_bookings.append(booking_id)
             else:
@@ -238,37 +240,27 @@ class BookingApprovalsPage(tk.Frame):
         header_row.pack(fill='x', pady=(0, 12))
         
         # Checkbox
-        checkbox = tk.Checkbutton(header_row, variable=selected_var, command=on_checkbox_change, bg='white', selectcolor='white')
+        checkbox = tk.Checkbutton(header_row, variable=card.selected_var, command=on_checkbox_change, bg='white', selectcolor='white')
         checkbox.pack(side='left', padx=(0, 12))
         
         # User and resource info
         info_frame = tk.Frame(header_row, bg='white')
         info_frame.pack(side='left', fill='x', expand=True)
         
-        # Resource name
-        resource_name = booking.get('resource_name', 'Unknown Resource')
-        tk.Label(info_frame, text=resource_name, bg='white', fg='#1F2937', font=('Helvetica', 14, 'bold')).pack(anchor='w')
-        
-        # User info
-        user_name = booking.get('user_name', 'Unknown User')
-        user_role = booking.get('user_role', 'User')
-        tk.Label(info_frame, text=f"Requested by: {user_name} ({user_role})", bg='white', fg='#1F2937', font=('Helvetica', 9)).pack(anchor='w', pady=(2, 0))
+        card.resource_label = tk.Label(info_frame, bg='white', fg='#1F2937', font=('Helvetica', 14, 'bold'))
+        card.resource_label.pack(anchor='w')
+        card.user_label = tk.Label(info_frame, bg='white', fg='#1F2937', font=('Helvetica', 9))
+        card.user_label.pack(anchor='w', pady=(2, 0))
         
         # Badges
         badges_frame = tk.Frame(header_row, bg='white')
         badges_frame.pack(side='right')
         
-        # Priority badge
-        if booking.get('priority', 'normal') == 'urgent':
-            priority_badge = tk.Frame(badges_frame, bg='#FEF3C7', highlightthickness=1, highlightbackground='#F59E0B')
-            priority_badge.pack(side='left', padx=(0, 6))
-            tk.Label(priority_badge, text='🔴 URGENT', bg='#FEF3C7', fg='#92400E', font=('Helvetica', 8, 'bold'), padx=6, pady=2).pack()
+        card.urgent_badge = tk.Frame(badges_frame, bg='#FEF3C7', highlightthickness=1, highlightbackground='#F59E0B')
+        tk.Label(card.urgent_badge, text='🔴 URGENT', bg='#FEF3C7', fg='#92400E', font=('Helvetica', 8, 'bold'), padx=6, pady=2).pack()
         
-        # Conflict badge
-        if booking.get('has_conflict', False):
-            conflict_badge = tk.Frame(badges_frame, bg='#FEF2F2', highlightthickness=1, highlightbackground='#E74C3C')
-            conflict_badge.pack(side='left')
-            tk.Label(conflict_badge, text='⚠️ CONFLICT', bg='#FEF2F2', fg='#991B1B', font=('Helvetica', 8, 'bold'), padx=6, pady=2).pack()
+        card.conflict_badge = tk.Frame(badges_frame, bg='#FEF2F2', highlightthickness=1, highlightbackground='#E74C3C')
+        tk.Label(card.conflict_badge, text='⚠️ CONFLICT', bg='#FEF2F2', fg='#991B1B', font=('Helvetica', 8, 'bold'), padx=6, pady=2).pack()
         
         # Booking details
         details_frame = tk.Frame(content, bg='#F9FAFB')
@@ -277,56 +269,87 @@ class BookingApprovalsPage(tk.Frame):
         details_content = tk.Frame(details_frame, bg='#F9FAFB')
         details_content.pack(padx=16, pady=12)
         
-        # Date and time
-        booking_date = self._format_date(booking.get('date', ''))
-        start_time = booking.get('start_time', 'N/A')
-        end_time = booking.get('end_time', 'N/A')
-        
-        self._add_detail_item(details_content, '📅 Date:', booking_date)
-        self._add_detail_item(details_content, '🕐 Time:', f"{start_time} - {end_time}")
-        self._add_detail_item(details_content, '👥 Attendees:', str(booking.get('attendees', 'N/A')))
-        self._add_detail_item(details_content, '📝 Submitted:', self._format_date(booking.get('created_at', '')))
+        card.date_value = self._add_detail_item(details_content, '📅 Date:', '')
+        card.time_value = self._add_detail_item(details_content, '🕐 Time:', '')
+        card.attendees_value = self._add_detail_item(details_content, '👥 Attendees:', '')
+        card.submitted_value = self._add_detail_item(details_content, '📝 Submitted:', '')
         
         # Purpose
-        purpose = booking.get('purpose', 'No purpose provided')
-        if len(purpose) > 150:
-            purpose = purpose[:150] + '...'
-        
         tk.Label(content, text='Purpose:', bg='white', fg='#1F2937', font=('Helvetica', 9, 'bold')).pack(anchor='w', pady=(0, 4))
-        tk.Label(content, text=purpose, bg='white', fg='#1F2937', font=('Helvetica', 9), wraplength=900, justify='left').pack(anchor='w', pady=(0, 12))
+        card.purpose_label = tk.Label(content, bg='white', fg='#1F2937', font=('Helvetica', 9), wraplength=900, justify='left')
+        card.purpose_label.pack(anchor='w', pady=(0, 12))
         
-        # Conflict warning
-        if booking.get('has_conflict', False):
-            conflict_frame = tk.Frame(content, bg='#FEF2F2', highlightthickness=1, highlightbackground='#E74C3C')
-            conflict_frame.pack(fill='x', pady=(0, 12))
-            
-            conflict_content = tk.Frame(conflict_frame, bg='#FEF2F2')
-            conflict_content.pack(padx=12, pady=8)
-            
-            tk.Label(conflict_content, text='⚠️ Time Conflict Detected', bg='#FEF2F2', fg='#991B1B', font=('Helvetica', 9, 'bold')).pack(anchor='w')
-            tk.Label(conflict_content, text='This time slot overlaps with an existing booking for this resource', bg='#FEF2F2', fg='#991B1B', font=('Helvetica', 8)).pack(anchor='w', pady=(2, 0))
+        # Conflict warning (shown for conflicting bookings)
+        card.conflict_frame = tk.Frame(content, bg='#FEF2F2', highlightthickness=1, highlightbackground='#E74C3C')
+        conflict_content = tk.Frame(card.conflict_frame, bg='#FEF2F2')
+        conflict_content.pack(padx=12, pady=8)
+        
+        tk.Label(conflict_content, text='⚠️ Time Conflict Detected', bg='#FEF2F2', fg='#991B1B', font=('Helvetica', 9, 'bold')).pack(anchor='w')
+        tk.Label(conflict_content, text='This time slot overlaps with an existing booking for this resource', bg='#FEF2F2', fg='#991B1B', font=('Helvetica', 8)).pack(anchor='w', pady=(2, 0))
         
         # Action buttons
-        actions_frame = tk.Frame(content, bg='white')
-        actions_frame.pack(fill='x')
+        card.actions_frame = tk.Frame(content, bg='white')
+        card.actions_frame.pack(fill='x')
         
-        tk.Button(actions_frame, text='View Full Details', command=lambda: self._show_approval_modal(booking), bg='#F3F4F6', fg='#1F2937', relief='flat', font=('Helvetica', 9, 'bold'), padx=12, pady=6).pack(side='left', padx=(0, 8))
+        tk.Button(card.actions_frame, text='View Full Details', command=lambda: self._show_approval_modal(card.item), bg='#F3F4F6', fg='#1F2937', relief='flat', font=('Helvetica', 9, 'bold'), padx=12, pady=6).pack(side='left', padx=(0, 8))
         
-        tk.Button(actions_frame, text='✅ Approve', command=lambda: self._approve_booking(booking), bg=self.colors.get('success', '#27AE60'), fg='white', relief='flat', font=('Helvetica', 9, 'bold'), padx=16, pady=6).pack(side='left', padx=(0, 8))
+        tk.Button(card.actions_frame, text='✅ Approve', command=lambda: self._approve_booking(card.item), bg=self.colors.get('success', '#27AE60'), fg='white', relief='flat', font=('Helvetica', 9, 'bold'), padx=16, pady=6).pack(side='left', padx=(0, 8))
         
-        tk.Button(actions_frame, text='❌ Reject', command=lambda: self._reject_booking(booking), bg=self.colors.get('danger', '#E74C3C'), fg='white', relief='flat', font=('Helvetica', 9, 'bold'), padx=16, pady=6).pack(side='left', padx=(0, 8))
+        tk.Button(card.actions_frame, text='❌ Reject', command=lambda: self._reject_booking(card.item), bg=self.colors.get('danger', '#E74C3C'), fg='white', relief='flat', font=('Helvetica', 9, 'bold'), padx=16, pady=6).pack(side='left', padx=(0, 8))
         
-        if booking.get('has_conflict', False):
-            tk.Button(actions_frame, text='🔄 Suggest Alternative', command=lambda: self._suggest_alternative(booking), bg=self.colors.get('warning', '#F39C12'), fg='white', relief='flat', font=('Helvetica', 9, 'bold'), padx=12, pady=6).pack(side='left')
+        card.suggest_btn = tk.Button(card.actions_frame, text='🔄 Suggest Alternative', command=lambda: self._suggest_alternative(card.item), bg=self.colors.get('warning', '#F39C12'), fg='white', relief='flat', font=('Helvetica', 9, 'bold'), padx=12, pady=6)
         
         return card
 
+    def _bind_booking_card(self, card, booking):
+        """Fill a booking approval card with a booking"""
+        card.selected_var.set(booking.get('id') in self.selected_bookings)
+        card.resource_label.config(text=booking.get('resource_name', 'Unknown Resource'))
+        
+        # User info
+        user_name = booking.get('user_name', 'Unknown User')
+        user_role = booking.get('user_role', 'User')
+        card.user_label.config(text=f"Requested by: {user_name} ({user_role})")
+        
+        # Priority and conflict badges
+        has_conflict = booking.get('has_conflict', False)
+        card.urgent_badge.pack_forget()
+        card.conflict_badge.pack_forget()
+        if booking.get('priority', 'normal') == 'urgent':
+            card.urgent_badge.pack(side='left', padx=(0, 6))
+        if has_conflict:
+            card.conflict_badge.pack(side='left')
+        
+        # Date and time
+        start_time = booking.get('start_time', 'N/A')
+        end_time = booking.get('end_time', 'N/A')
+        card.date_value.config(text=format_date(booking.get('date', '')))
+        card.time_value.config(text=f"{start_time} - {end_time}")
+        card.attendees_value.config(text=str(booking.get('attendees', 'N/A')))
+        card.submitted_value.config(text=format_date(booking.get('created_at', '')))
+        
+        # Purpose
+        purpose = booking.get('purpose', 'No purpose provided')
+        if len(purpose) > 150:
+            purpose = purpose[:150] + '...'
+        card.purpose_label.config(text=purpose)
+        
+        # Conflict warning and alternative suggestion
+        if has_conflict:
+            card.conflict_frame.pack(fill='x', pady=(0, 12), before=card.actions_frame)
+            card.suggest_btn.pack(side='left')
+        else:
+            card.conflict_frame.pack_forget()
+            card.suggest_btn.pack_forget()
+
     def _add_detail_item(self, parent, label, value):
         """Add detail item"""
         frame = tk.Frame(parent, bg='#F9FAFB')
         frame.pack(side='left', padx=(0, 24))
         tk.Label(frame, text=label, bg='#F9FAFB', fg='#1F2937', font=('Helvetica', 9)).pack(side='left', padx=(0, 4))
-        tk.Label(frame, text=value, bg='#F9FAFB', fg='#1F2937', font=('Helvetica', 9, 'bold')).pack(side='left')
+        value_label = tk.Label(frame, text=value, bg='#F9FAFB', fg='#1F2937', font=('Helvetica', 9, 'bold'))
+        value_label.pack(side='left')
+        return value_label
 
     def _render_calendar_view(self):
         """Render calendar view with bookings"""
@@ -409,7 +432,7 @@ class BookingApprovalsPage(tk.Frame):
         # Group bookings by date
         bookings_by_date = {}
         for booking in self.pending_bookings:
-            booking_date = self._parse_date(booking.get('date', ''))
+            booking_date = parse_date(booking.get('date', ''))
             if booking_date and booking_date.year == self.current_year and booking_date.month == self.current_month:
                 date_key = booking_date.day
                 if date_key not in bookings_by_date:
@@ -561,7 +584,7 @@ class BookingApprovalsPage(tk.Frame):
         
         self._add_modal_detail(info_content, 'Resource:', booking.get('resource_name', 'N/A'))
         self._add_modal_detail(info_content, 'Resource Type:', booking.get('resource_type', 'N/A'))
-        self._add_modal_detail(info_content, 'Date:', self._format_date(booking.get('date', '')))
+        self._add_modal_detail(info_content, 'Date:', format_date(booking.get('date', '')))
         self._add_modal_detail(info_content, 'Start Time:', booking.get('start_time', 'N/A'))
         self._add_modal_detail(info_content, 'End Time:', booking.get('end_time', 'N/A'))
         self._add_modal_detail(info_content, 'Expected Attendees:', str(booking.get('attendees', 'N/A')))
@@ -703,13 +726,13 @@ class BookingApprovalsPage(tk.Frame):
                                           f"📧 Notification sent to user")
                         self._load_pending_bookings()
                     
-                    self.after(0, show_success)
+                    deliver(self, show_success)
                 except Exception as e:
                     def show_error():
                         messagebox.showerror('Error', f'Failed to approve booking: {str(e)}')
-                    self.after(0, show_error)
+                    deliver(self, show_error)
             
-            threading.Thread(target=worker, daemon=True).start()
+            run_async(self, worker, interruptible=False)
 
     def _reject_booking(self, booking, comments=''):
         """Reject a booking"""
@@ -761,19 +784,19 @@ class BookingApprovalsPage(tk.Frame):
                                           f"📧 Rejection reason sent")
                         self._load_pending_bookings()
                     
-                    self.after(0, show_success)
+                    deliver(self, show_success)
                 except Exception as e:
                     def show_error():
                         messagebox.showerror('Error', f'Failed to reject booking: {str(e)}')
-                    self.after(0, show_error)
+                    deliver(self, show_error)
             
-            threading.Thread(target=worker, daemon=True).start()
+            run_async(self, worker, interruptible=False)
 
     def _suggest_alternative(self, booking):
         """Suggest alternative time slots"""
         messagebox.showinfo('Suggest Alternative',
                           f"Alternative time slots for {booking.get('resource_name', 'resource')}:\n\n"
-                          f"Available slots on {self._format_date(booking.get('date', ''))}:\n"
+                          f"Available slots on {format_date(booking.get('date', ''))}:\n"
                           f"• 8:00 AM - 10:00 AM\n"
                           f"• 2:00 PM - 4:00 PM\n"
                           f"• 4:00 PM - 6:00 PM\n\n"
@@ -786,7 +809,8 @@ class BookingApprovalsPage(tk.Frame):
         else:
             self.selected_bookings = []
         
-        self._render_content()
+        # Update the checkboxes of the cards in view
+        self._list_view().refresh()
 
     def _bulk_approve(self):
         """Approve multiple bookings"""
@@ -816,13 +840,13 @@ class BookingApprovalsPage(tk.Frame):
                                           f"✅ {success_count} of {count} bookings approved!")
                         self._load_pending_bookings()
                     
-                    self.after(0, show_success)
+                    deliver(self, show_success)
                 except Exception as e:
                     def show_error():
                         messagebox.showerror('Error', f'Bulk approval failed: {str(e)}')
-                    self.after(0, show_error)
+                    deliver(self, show_error)
             
-            threading.Thread(target=worker, daemon=True).start()
+            run_async(self, worker, interruptible=False)
 
     def _bulk_reject(self):
         """Reject multiple bookings"""
@@ -860,31 +884,10 @@ class BookingApprovalsPage(tk.Frame):
                                           f"❌ {success_count} of {count} bookings rejected.")
                         self._load_pending_bookings()
                     
-                    self.after(0, show_success)
+                    deliver(self, show_success)
                 except Exception as e:
                     def show_error():
                         messagebox.showerror('Error', f'Bulk rejection failed: {str(e)}')
-                    self.after(0, show_error)
+                    deliver(self, show_error)
             
-            threading.Thread(target=worker, daemon=True).start()
-
-    def _format_date(self, date_str):
-        """Format date for display"""
-        date_obj = self._parse_date(date_str)
-        if date_obj:
-            return date_obj.strftime('%B %d, %Y')
-        return date_str or 'N/A'
-
-    def _parse_date(self, date_str):
-        """Parse date string"""
-        if not date_str:
-            return None
-        try:
-            for fmt in ('%Y-%m-%d', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d %H:%M:%S'):
-                try:
-                    return datetime.strptime(date_str[:10] if len(date_str) >= 10 else date_str, '%Y-%m-%d').date()
-                except:
-                    continue
-        except:
-            pass
-        return None
+            run_async(self, worker, interruptible=False)
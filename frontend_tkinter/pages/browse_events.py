@@ -1,13 +1,17 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
-from datetime import datetime
-import math
+from datetime import datetime, timedelta
 
 from utils.api_client import APIClient
+from utils.datetime_service import parse_date
+from utils.task_executor import get_executor, run_async, deliver
+from utils.entity_store import get_entity_store
+from utils.cursor_feed import CursorFeed
 from utils.session_manager import SessionManager
 from utils.button_styles import ButtonStyles
 from components.search_component import SearchComponent
+from components.feed_view import FeedView
+from components.virtual_list import CardPool
 from utils.canvas_button import create_primary_button, create_secondary_button, create_success_button
 
 
@@ -20,26 +24,27 @@ class BrowseEventsPage(tk.Frame):
         self.api = APIClient()
         self.session = SessionManager()
 
-        # Data
-        self.all_events = []
-        self.filtered_events = []
-        self.current_page = 1
-        self.items_per_page = 9  # 3x3 grid
+        # Data: events are loaded page by page as the user scrolls (rows are
+        # the shared store's objects)
+        self.store = get_entity_store()
+        self.store.query('events').subscribe(self._on_events_updated, owner=self)
+        self.items_per_page = 12  # 3 columns x 4 rows per loaded page
         
-        # Current filters from SearchComponent
+        # Current search and filters from SearchComponent
+        self.search_text = ''
         self.active_filters = {}
+        self.feed = CursorFeed(self, self._events_query(), page_size=self.items_per_page,
+                               max_pages=5, on_error=self._on_feed_error)
 
         # Layout
         self.grid_rowconfigure(0, weight=0)  # Header
         self.grid_rowconfigure(1, weight=0)  # Search Component
         self.grid_rowconfigure(2, weight=1)  # Content
-        self.grid_rowconfigure(3, weight=0)  # Pagination
         self.grid_columnconfigure(0, weight=1)
 
         self._build_header()
         self._build_search()
         self._build_content()
-        self._build_pagination()
 
         # Load data
         self._load_events()
@@ -87,167 +92,191 @@ class BrowseEventsPage(tk.Frame):
 
     def _build_content(self):
         """Build scrollable content area for event cards"""
+        bg = self.controller.colors.get('background', '#ECF0F1')
         # Content container (scrollable)
-        content_container = tk.Frame(self, bg=self.controller.colors.get('background', '#ECF0F1'))
-        content_container.grid(row=2, column=0, sticky='nsew', padx=20)
+        content_container = tk.Frame(self, bg=bg)
+        content_container.grid(row=2, column=0, sticky='nsew', padx=20, pady=(0, 16))
 
-        canvas = tk.Canvas(content_container, bg=self.controller.colors.get('background', '#ECF0F1'), highlightthickness=0)
+        canvas = tk.Canvas(content_container, bg=bg, highlightthickness=0)
         vscroll = ttk.Scrollbar(content_container, orient='vertical', command=canvas.yview)
-        canvas.configure(yscrollcommand=vscroll.set)
         vscroll.pack(side='right', fill='y')
         canvas.pack(side='left', fill='both', expand=True)
 
-        self.content = tk.Frame(canvas, bg=self.controller.colors.get('background', '#ECF0F1'))
+        self.content = tk.Frame(canvas, bg=bg)
         canvas.create_window((0, 0), window=self.content, anchor='nw')
         self.content.bind('<Configure>', lambda e: canvas.configure(scrollregion=canvas.bbox('all')))
 
-        # Spinner
-        self.spinner = ttk.Progressbar(self.content, mode='indeterminate')
+        # Results count above the pages
+        self.results_label = tk.Label(self.content, text='Loading events...', bg=bg, fg='#6B7280', font=('Helvetica', 10))
+        self.results_label.pack(anchor='w', pady=(0, 12))
 
-    def _build_pagination(self):
-        """Build pagination controls"""
-        self.pagination = tk.Frame(self, bg=self.controller.colors.get('background', '#ECF0F1'))
-        self.pagination.grid(row=3, column=0, sticky='ew', padx=20, pady=(8, 16))
+        # One frame per loaded page; the feed adds pages while scrolling and
+        # cards of dropped pages are recycled for new ones
+        pages_frame = tk.Frame(self.content, bg=bg)
+        pages_frame.pack(fill='both', expand=True)
+        self.card_pool = CardPool(pages_frame, self._create_event_card, self._bind_event_card)
+        self.feed_view = FeedView(canvas, vscroll, pages_frame, self.feed, self._render_page, bg=bg, pool=self.card_pool)
 
-    def _load_events(self):
-        """Load events from API"""
-        self._show_spinner()
-
-        def worker():
-            try:
-                self.all_events = self.api.get('events') or []
-                self.filtered_events = self.all_events.copy()
-            except Exception as e:
-                self.all_events = []
-                self.filtered_events = []
-                
-                def show_error():
-                    messagebox.showerror('Error', f'Failed to load events: {str(e)}')
-                self.after(0, show_error)
-
-            def done():
-                self._hide_spinner()
-                self._apply_filters()
-
-            self.after(0, done)
+    def load_page(self):
+        """Reload data abandoned when the page was hidden before it arrived"""
+        if get_executor().was_interrupted(self):
+            self._load_events()
 
-        threading.Thread(target=worker, daemon=True).start()
+    def _load_events(self):
+        """Load the first page of events matching the search and filters"""
+        self.results_label.config(text='Loading events...')
+        self.feed_view.clear()
+        self.feed.start(self._events_query())
+
+    def _on_feed_error(self, error):
+        messagebox.showerror('Error', f'Failed to load events: {str(error)}')
+        self.results_label.config(text='')
+
+    def _on_events_updated(self, events):
+        """Repaint shown events that changed in the store (fetched by any page)"""
+        if not self.winfo_exists():
+            return
+        for page in self.feed.pages:
+            current = [self.store.get('events', e.get('id')) for e in page.items]
+            current = [e for e in current if e is not None]
+            if len(current) != len(page.items) or any(a is not b for a, b in zip(current, page.items)):
+                page.items = current
+                self.feed_view.rerender(page)
 
     def _handle_search(self, search_text, filters):
         """Handle search and filters from SearchComponent"""
         self.active_filters = filters
-        
-        # Filter events
-        filtered = self.all_events.copy()
+        self.search_text = search_text
+        self._load_events()
+
+    def _events_query(self):
+        """Query for the current search, filters and sort
 
-        # Search filter
-        if search_text:
-            search_query = search_text.lower().strip()
-            filtered = [e for e in filtered if 
-                       search_query in (e.get('title', '') or '').lower() or 
-                       search_query in (e.get('description', '') or '').lower() or
-                       search_query in (e.get('organizer_name', '') or '').lower()]
+        The server filters, sorts and pages; whatever it ignores is applied
+        locally by the query. Cards need only the summary fields; the
+        details modal fetches the full record.
+        """
+        filters = self.active_filters
+        query = self.api.query('events', summary=True).search(
+            self.search_text, fields=('title', 'description', 'organizer_name'))
 
         # Date range filter
-        if 'date_range' in filters:
-            start_date = filters['date_range'].get('start')
-            end_date = filters['date_range'].get('end')
-            if start_date and end_date:
-                filtered = [e for e in filtered if 
-                           self._parse_dt(e.get('start_time')) and 
-                           start_date <= self._parse_dt(e.get('start_time')).date() <= end_date]
+        date_range = filters.get('date_range') or {}
+        start, end = parse_date(date_range.get('start')), parse_date(date_range.get('end'))
+        if start and end:
+            query = query.where(start_time__gte=start, start_time__lt=end + timedelta(days=1))
 
         # Category filter
-        if 'categories' in filters and filters['categories']:
-            filtered = [e for e in filtered if 
-                       (e.get('category', '') or '').lower() in [c.lower() for c in filters['categories']]]
-
-        # Status filter
-        if 'status' in filters and filters['status']:
-            status = filters['status'].lower()
-            now = datetime.now()
-            if status == 'upcoming':
-                filtered = [e for e in filtered if self._parse_dt(e.get('start_time')) and self._parse_dt(e.get('start_time')) > now]
-            elif status == 'past':
-                filtered = [e for e in filtered if self._parse_dt(e.get('end_time')) and self._parse_dt(e.get('end_time')) < now]
-            elif status == 'active':
-                filtered = [e for e in filtered if (e.get('status', '') or '').lower() in ('approved', 'active')]
-            elif status == 'approved':
-                filtered = [e for e in filtered if (e.get('status', '') or '').lower() == 'approved']
-            elif status == 'cancelled':
-                filtered = [e for e in filtered if (e.get('status', '') or '').lower() == 'cancelled']
+        if filters.get('categories'):
+            query = query.where(category__in=[c.lower() for c in filters['categories']])
+
+        # Status filter (whole minutes, so repeated searches share a cache entry)
+        status = (filters.get('status') or '').lower()
+        now = datetime.now().replace(second=0, microsecond=0)
+        if status == 'upcoming':
+            query = query.where(start_time__gt=now)
+        elif status == 'past':
+            query = query.where(end_time__lt=now)
+        elif status == 'active':
+            query = query.where(status__in=['approved', 'active'])
+        elif status in ('approved', 'cancelled'):
+            query = query.where(status=status)
 
         # Sort events
         sort_by = filters.get('sort', 'Date').lower()
-        if sort_by == 'date':
-            filtered.sort(key=lambda e: self._parse_dt(e.get('start_time')) or datetime.max)
-        elif sort_by == 'popularity':
-            filtered.sort(key=lambda e: e.get('registered_count', 0), reverse=True)
-        elif sort_by == 'name':
-            filtered.sort(key=lambda e: (e.get('title', '') or '').lower())
-        elif sort_by == 'attendees':
-            filtered.sort(key=lambda e: e.get('registered_count', 0), reverse=True)
-
-        self.filtered_events = filtered
-        self.current_page = 1
-        self._render_events()
-
-    def _render_events(self):
-        """Render event cards in grid layout"""
-        # Clear content
-        for widget in self.content.winfo_children():
-            widget.destroy()
-
-        # Calculate pagination
-        total_events = len(self.filtered_events)
-        total_pages = math.ceil(total_events / self.items_per_page) if total_events > 0 else 1
-        start_idx = (self.current_page - 1) * self.items_per_page
-        end_idx = start_idx + self.items_per_page
-        page_events = self.filtered_events[start_idx:end_idx]
-
-        # Show results count
-        results_frame = tk.Frame(self.content, bg=self.controller.colors.get('background', '#ECF0F1'))
-        results_frame.pack(fill='x', pady=(0, 12))
-        tk.Label(results_frame, text=f'Showing {len(page_events)} of {total_events} events', bg=self.controller.colors.get('background', '#ECF0F1'), fg='#6B7280', font=('Helvetica', 10)).pack(side='left')
-
-        if not page_events:
-            # No events found
-            no_events = tk.Frame(self.content, bg='white', highlightthickness=1, highlightbackground='#E5E7EB')
-            no_events.pack(fill='both', expand=True, pady=20)
-            tk.Label(no_events, text='🔍', bg='white', font=('Helvetica', 48)).pack(pady=(40, 10))
-            tk.Label(no_events, text='No events found', bg='white', fg='#374151', font=('Helvetica', 16, 'bold')).pack()
-            tk.Label(no_events, text='Try adjusting your filters or search query', bg='white', fg='#6B7280', font=('Helvetica', 10)).pack(pady=(4, 40))
-        else:
-            # Create grid container
-            grid_frame = tk.Frame(self.content, bg=self.controller.colors.get('background', '#ECF0F1'))
-            grid_frame.pack(fill='both', expand=True)
-
-            # Configure grid columns
-            for i in range(3):
-                grid_frame.grid_columnconfigure(i, weight=1, uniform='col')
-
-            # Render event cards in 3-column grid
-            for idx, event in enumerate(page_events):
-                row = idx // 3
-                col = idx % 3
-                card = self._create_event_card(grid_frame, event)
-                card.grid(row=row, column=col, padx=8, pady=8, sticky='nsew')
-
-        # Update pagination
-        self._update_pagination(total_pages)
-
-    def _create_event_card(self, parent, event):
-        """Create an individual event card"""
-        colors = self.controller.colors
-        
+        query = query.order_by({
+            'date': 'start_time',
+            'popularity': '-registered_count',
+            'name': 'title',
+            'attendees': '-registered_count',
+        }.get(sort_by, 'start_time'))
+
+        return query
+
+    def _render_page(self, frame, page):
+        """Render one loaded page of event cards in grid layout"""
+        # Share the rows with other pages (not complete: one filtered page
+        # of summary rows, merged into any full records already loaded)
+        page.items = self.store.load('events', page.items, partial=True)
+        self._update_results_count()
+
+        if not page.items:
+            if page.index == 0:
+                # No events found
+                no_events = tk.Frame(frame, bg='white', highlightthickness=1, highlightbackground='#E5E7EB')
+                no_events.pack(fill='both', expand=True, pady=20)
+                tk.Label(no_events, text='🔍', bg='white', font=('Helvetica', 48)).pack(pady=(40, 10))
+                tk.Label(no_events, text='No events found', bg='white', fg='#374151', font=('Helvetica', 16, 'bold')).pack()
+                tk.Label(no_events, text='Try adjusting your filters or search query', bg='white', fg='#6B7280', font=('Helvetica', 10)).pack(pady=(4, 40))
+            return
+
+        # Configure grid columns
+        for i in range(3):
+            frame.grid_columnconfigure(i, weight=1, uniform='col')
+
+        # Render event cards in 3-column grid
+        for idx, event in enumerate(page.items):
+            row = idx // 3
+            col = idx % 3
+            card = self.card_pool.acquire(event, frame)
+            card.grid(in_=frame, row=row, column=col, padx=8, pady=8, sticky='nsew')
+
+    def _update_results_count(self):
+        """Show how many events are loaded of how many match"""
+        loaded = len(self.feed.items)
+        total = self.feed.total if self.feed.total is not None else loaded
+        self.results_label.config(text=f'Showing {loaded} of {total} events')
+
+    def _create_event_card(self, parent):
+        """Create an empty event card (filled by _bind_event_card, recycled by the pool)"""
         # Card container
         card = tk.Frame(parent, bg='white', highlightthickness=1, highlightbackground='#E5E7EB', cursor='hand2')
-        card.bind('<Button-1>', lambda e: self._show_event_details(event))
+        open_details = lambda e: self._show_event_details(card.item)
+        card.bind('<Button-1>', open_details)
 
-        # Card header with category tag
+        # Card header with category tag and status badge
         header = tk.Frame(card, bg='white')
         header.pack(fill='x', padx=12, pady=(12, 0))
         
+        card.category_tag = tk.Label(header, fg='white', font=('Helvetica', 8, 'bold'), padx=8, pady=2)
+        card.category_tag.pack(side='left')
+        card.status_badge = tk.Label(header, text='✓', bg='#D1FAE5', fg='#065F46', font=('Helvetica', 8, 'bold'), padx=6, pady=2)
+
+        # Event title
+        card.title_label = tk.Label(card, bg='white', fg='#1F2937', font=('Helvetica', 13, 'bold'), wraplength=250, justify='left')
+        card.title_label.pack(anchor='w', padx=12, pady=(8, 4))
+        card.title_label.bind('<Button-1>', open_details)
+
+        # Date & time, venue, organizer and capacity rows
+        for name, icon in (('date_label', '📅'), ('venue_label', '📍'), ('organizer_label', '👤'), ('capacity_label', '🎫')):
+            row = tk.Frame(card, bg='white')
+            row.pack(anchor='w', padx=12, pady=2)
+            tk.Label(row, text=icon, bg='white', font=('Helvetica', 10)).pack(side='left', padx=(0, 4))
+            label = tk.Label(row, bg='white', fg='#6B7280', font=('Helvetica', 9))
+            label.pack(side='left')
+            row.bind('<Button-1>', open_details)
+            setattr(card, name, label)
+        card.capacity_label.config(font=('Helvetica', 9, 'bold'))
+
+        # Separator
+        separator = tk.Frame(card, bg='#E5E7EB', height=1)
+        separator.pack(fill='x', padx=12, pady=(8, 0))
+
+        # Action buttons (Register, or a disabled Full button)
+        btn_frame = tk.Frame(card, bg='white')
+        btn_frame.pack(fill='x', padx=12, pady=12)
+
+        details_btn = create_secondary_button(btn_frame, 'View Details', lambda: self._show_event_details(card.item), width=110, height=32)
+        details_btn.pack(side='left', fill='x', expand=True, padx=(0, 4))
+        
+        card.register_btn = create_success_button(btn_frame, 'Register', lambda: self._register_event(card.item), width=100, height=32)
+        card.full_btn = create_secondary_button(btn_frame, 'Full', None, width=100, height=32)
+        card.full_btn.config(state='disabled')
+
+        return card
+
+    def _bind_event_card(self, card, event):
+        """Fill an event card with an event"""
         category = (event.get('category', 'General') or 'General').title()
         category_colors = {
             'Academic': '#3498DB',
@@ -257,155 +286,40 @@ class BrowseEventsPage(tk.Frame):
             'Seminar': '#E74C3C',
             'General': '#95A5A6'
         }
-        cat_color = category_colors.get(category, '#95A5A6')
-        
-        tag = tk.Label(header, text=category, bg=cat_color, fg='white', font=('Helvetica', 8, 'bold'), padx=8, pady=2)
-        tag.pack(side='left')
+        card.category_tag.config(text=category, bg=category_colors.get(category, '#95A5A6'))
         
         # Status badge
-        status = (event.get('status', 'pending') or 'pending').lower()
+        status = event.status or 'pending'
         if status == 'approved':
-            status_badge = tk.Label(header, text='✓', bg='#D1FAE5', fg='#065F46', font=('Helvetica', 8, 'bold'), padx=6, pady=2)
-            status_badge.pack(side='right')
+            card.status_badge.pack(side='right')
+        else:
+            card.status_badge.pack_forget()
 
-        # Event title
-        title = event.get('title', 'Untitled Event')
-        title_label = tk.Label(card, text=title, bg='white', fg='#1F2937', font=('Helvetica', 13, 'bold'), wraplength=250, justify='left')
-        title_label.pack(anchor='w', padx=12, pady=(8, 4))
-        title_label.bind('<Button-1>', lambda e: self._show_event_details(event))
-
-        # Date & time
-        start_time = event.get('start_time', 'TBA')
-        date_frame = tk.Frame(card, bg='white')
-        date_frame.pack(anchor='w', padx=12, pady=2)
-        tk.Label(date_frame, text='📅', bg='white', font=('Helvetica', 10)).pack(side='left', padx=(0, 4))
-        tk.Label(date_frame, text=start_time, bg='white', fg='#6B7280', font=('Helvetica', 9)).pack(side='left')
-        date_frame.bind('<Button-1>', lambda e: self._show_event_details(event))
-
-        # Venue
-        venue = event.get('venue', 'TBA')
-        venue_frame = tk.Frame(card, bg='white')
-        venue_frame.pack(anchor='w', padx=12, pady=2)
-        tk.Label(venue_frame, text='📍', bg='white', font=('Helvetica', 10)).pack(side='left', padx=(0, 4))
-        tk.Label(venue_frame, text=venue, bg='white', fg='#6B7280', font=('Helvetica', 9)).pack(side='left')
-        venue_frame.bind('<Button-1>', lambda e: self._show_event_details(event))
-
-        # Organizer
-        organizer = event.get('organizer_name', f"Organizer #{event.get('organizer_id', 'N/A')}")
-        org_frame = tk.Frame(card, bg='white')
-        org_frame.pack(anchor='w', padx=12, pady=2)
-        tk.Label(org_frame, text='👤', bg='white', font=('Helvetica', 10)).pack(side='left', padx=(0, 4))
-        tk.Label(org_frame, text=organizer, bg='white', fg='#6B7280', font=('Helvetica', 9)).pack(side='left')
-        org_frame.bind('<Button-1>', lambda e: self._show_event_details(event))
+        card.title_label.config(text=event.get('title', 'Untitled Event'))
+        card.date_label.config(text=event.get('start_time', 'TBA'))
+        card.venue_label.config(text=event.get('venue', 'TBA'))
+        card.organizer_label.config(text=event.get('organizer_name', f"Organizer #{event.get('organizer_id', 'N/A')}"))
 
         # Capacity
         capacity = event.get('capacity', 'N/A')
         registered = event.get('registered_count', 0)
         available = capacity - registered if isinstance(capacity, int) and isinstance(registered, int) else 'N/A'
         
-        capacity_frame = tk.Frame(card, bg='white')
-        capacity_frame.pack(anchor='w', padx=12, pady=2)
-        tk.Label(capacity_frame, text='🎫', bg='white', font=('Helvetica', 10)).pack(side='left', padx=(0, 4))
-        
         if available != 'N/A':
             capacity_text = f"{available} / {capacity} seats available"
             capacity_color = '#27AE60' if available > 0 else '#E74C3C'
         else:
             capacity_text = 'Unlimited seats'
             capacity_color = '#6B7280'
-            
-        tk.Label(capacity_frame, text=capacity_text, bg='white', fg=capacity_color, font=('Helvetica', 9, 'bold')).pack(side='left')
-        capacity_frame.bind('<Button-1>', lambda e: self._show_event_details(event))
-
-        # Separator
-        separator = tk.Frame(card, bg='#E5E7EB', height=1)
-        separator.pack(fill='x', padx=12, pady=(8, 0))
-
-        # Action buttons
-        btn_frame = tk.Frame(card, bg='white')
-        btn_frame.pack(fill='x', padx=12, pady=12)
+        card.capacity_label.config(text=capacity_text, fg=capacity_color)
 
-        details_btn = create_secondary_button(btn_frame, 'View Details', lambda: self._show_event_details(event), width=110, height=32)
-        details_btn.pack(side='left', fill='x', expand=True, padx=(0, 4))
-        
-        # Register button (check if already registered or full)
-        can_register = True
-        register_text = 'Register'
-        
+        # Register button (or Full)
         if available != 'N/A' and available <= 0:
-            can_register = False
-            register_text = 'Full'
-        
-        if can_register:
-            register_btn = create_success_button(btn_frame, register_text, lambda: self._register_event(event), width=100, height=32)
+            card.register_btn.canvas.pack_forget()
+            card.full_btn.pack(side='right', fill='x', expand=True, padx=(4, 0))
         else:
-            register_btn = create_secondary_button(btn_frame, register_text, None, width=100, height=32)
-            register_btn.config(state='disabled')
-        register_btn.pack(side='right', fill='x', expand=True, padx=(4, 0))
-
-        return card
-
-    def _update_pagination(self, total_pages):
-        """Update pagination controls"""
-        # Clear pagination
-        for widget in self.pagination.winfo_children():
-            widget.destroy()
-
-        if total_pages <= 1:
-            return
-
-        colors = self.controller.colors
-        
-        # Pagination container
-        pag_container = tk.Frame(self.pagination, bg=self.controller.colors.get('background', '#ECF0F1'))
-        pag_container.pack()
-
-        # Previous button
-        prev_btn = create_secondary_button(pag_container, '← Previous', self._prev_page, width=100, height=34)
-        if self.current_page <= 1:
-            prev_btn.config(state='disabled')
-        prev_btn.pack(side='left', padx=(0, 8))
-
-        # Page numbers
-        start_page = max(1, self.current_page - 2)
-        end_page = min(total_pages, start_page + 4)
-        start_page = max(1, end_page - 4)
-
-        for page in range(start_page, end_page + 1):
-            if page == self.current_page:
-                btn = create_primary_button(pag_container, str(page), None, width=44, height=34)
-                btn.config(state='disabled')
-            else:
-                btn = create_secondary_button(pag_container, str(page), lambda p=page: self._goto_page(p), width=44, height=34)
-            btn.pack(side='left', padx=2)
-
-        # Next button
-        next_btn = create_secondary_button(pag_container, 'Next →', self._next_page, width=100, height=34)
-        if self.current_page >= total_pages:
-            next_btn.config(state='disabled')
-        next_btn.pack(side='left', padx=(8, 0))
-
-        # Page info
-        page_info = tk.Label(self.pagination, text=f'Page {self.current_page} of {total_pages}', bg=self.controller.colors.get('background', '#ECF0F1'), fg='#6B7280', font=('Helvetica', 9))
-        page_info.pack(pady=(4, 0))
-
-    def _prev_page(self):
-        """Go to previous page"""
-        if self.current_page > 1:
-            self.current_page -= 1
-            self._render_events()
-
-    def _next_page(self):
-        """Go to next page"""
-        total_pages = math.ceil(len(self.filtered_events) / self.items_per_page)
-        if self.current_page < total_pages:
-            self.current_page += 1
-            self._render_events()
-
-    def _goto_page(self, page):
-        """Go to specific page"""
-        self.current_page = page
-        self._render_events()
+            card.full_btn.canvas.pack_forget()
+            card.register_btn.pack(side='right', fill='x', expand=True, padx=(4, 0))
 
     def _show_event_details(self, event):
         """Show event details in a modal dialog"""
@@ -469,8 +383,11 @@ class BrowseEventsPage(tk.Frame):
         tk.Label(details, text='Description', bg='white', fg='#6B7280', font=('Helvetica', 9)).pack(anchor='w', pady=(12, 4))
         desc_frame = tk.Frame(details, bg='#F9FAFB', highlightthickness=1, highlightbackground='#E5E7EB')
         desc_frame.pack(fill='x', pady=(0, 12))
-        desc_text = event.get('description', 'No description available')
-        tk.Label(desc_frame, text=desc_text, bg='#F9FAFB', fg='#374151', font=('Helvetica', 10), wraplength=420, justify='left').pack(padx=12, pady=12)
+        desc_text = event.get('description', 'Loading description...')
+        desc_label = tk.Label(desc_frame, text=desc_text, bg='#F9FAFB', fg='#374151', font=('Helvetica', 10), wraplength=420, justify='left')
+        desc_label.pack(padx=12, pady=12)
+        if 'description' not in event:
+            self._load_description(event, desc_label)
 
         # Action buttons
         btn_frame = tk.Frame(content, bg='white')
@@ -481,6 +398,22 @@ class BrowseEventsPage(tk.Frame):
         register_modal_btn = create_primary_button(btn_frame, 'Register for Event', lambda: [self._register_event(event), modal.destroy()], width=180, height=40)
         register_modal_btn.pack(side='right', fill='x', expand=True, padx=(4, 0))
 
+    def _load_description(self, event, label):
+        """Fill in the description of a summary row from the full record"""
+        def worker():
+            try:
+                detail = self.api.get_detail('events', event.get('id')) or {}
+                text = detail.get('description') or 'No description available'
+            except Exception:
+                text = 'No description available'
+            
+            def show():
+                if label.winfo_exists():
+                    label.config(text=text)
+            deliver(label, show)
+        
+        run_async(self, worker)
+
     def _register_event(self, event):
         """Register for an event"""
         event_id = event.get('id')
@@ -501,29 +434,3 @@ class BrowseEventsPage(tk.Frame):
                 messagebox.showerror('Event Full', 'This event has reached maximum capacity')
             else:
                 messagebox.showerror('Error', f'Failed to register: {error_msg}')
-
-    # Utilities
-    def _show_spinner(self):
-        try:
-            self.spinner.pack(fill='x', padx=16, pady=(16, 0))
-            self.spinner.start(10)
-        except Exception:
-            pass
-
-    def _hide_spinner(self):
-        try:
-            self.spinner.stop()
-            self.spinner.pack_forget()
-        except Exception:
-            pass
-
-    @staticmethod
-    def _parse_dt(text):
-        if not text:
-            return None
-        for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d"):
-            try:
-                return datetime.strptime(text[:19], fmt)
-            except Exception:
-                continue
-        return None
@@ -1,12 +1,14 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
 from datetime import datetime, timedelta
 from tkcalendar import DateEntry
 
 from utils.api_client import APIClient
+from utils.task_executor import get_executor
+from utils.cursor_feed import CursorFeed
 from utils.session_manager import SessionManager
 from components.search_component import SearchComponent
+from components.feed_view import FeedView
 from utils.canvas_button import create_primary_button, create_secondary_button, create_success_button
 
 
@@ -33,17 +35,21 @@ class BrowseResourcesPage(tk.Frame):
             'background': '#ECF0F1'
         }
         
-        # Data
-        self.all_resources = []
-        self.filtered_resources = []
-        
-        # Filter state
+        # Filter state (sidebar)
         self.filter_type = tk.StringVar(value='all')
         self.filter_date = tk.StringVar(value='')
         self.min_capacity = tk.IntVar(value=0)
         self.max_capacity = tk.IntVar(value=500)
         self.amenities = {}
         
+        # Current search and filters from SearchComponent
+        self.search_text = ''
+        self.active_filters = {}
+        
+        # Data: resources are loaded page by page as the user scrolls
+        self.feed = CursorFeed(self, self._resources_query(), page_size=12,
+                               max_pages=5, on_error=self._on_feed_error)
+        
         # Layout: sidebar + main content
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(0, weight=0)  # Sidebar
@@ -269,7 +275,6 @@ class BrowseResourcesPage(tk.Frame):
         
         self.content = tk.Frame(canvas, bg=self.colors.get('background', '#ECF0F1'))
         
-        canvas.configure(yscrollcommand=scrollbar.set)
         scrollbar.pack(side='right', fill='y')
         canvas.pack(side='left', fill='both', expand=True)
         
@@ -280,132 +285,93 @@ class BrowseResourcesPage(tk.Frame):
         def on_canvas_configure(event):
             canvas.itemconfig(canvas.find_withtag('all')[0], width=event.width)
         canvas.bind('<Configure>', on_canvas_configure)
+        
+        # Results count above the pages
+        self.results_label = tk.Label(self.content, text='Loading resources...', bg=self.colors.get('background', '#ECF0F1'), fg='#1F2937', font=('Helvetica', 11))
+        self.results_label.pack(anchor='w', pady=(0, 12))
+        
+        # One frame per loaded page; the feed adds pages while scrolling
+        pages_frame = tk.Frame(self.content, bg=self.colors.get('background', '#ECF0F1'))
+        pages_frame.pack(fill='both', expand=True)
+        self.feed_view = FeedView(canvas, scrollbar, pages_frame, self.feed, self._render_page, bg=self.colors.get('background', '#ECF0F1'))
+
+    def load_page(self):
+        """Reload data abandoned when the page was hidden before it arrived"""
+        if get_executor().was_interrupted(self):
+            self._load_resources()
 
     def _load_resources(self):
-        """Load resources from API"""
-        self._show_loading()
-        
-        def worker():
-            try:
-                self.all_resources = self.api.get('resources') or []
-                self.filtered_resources = self.all_resources.copy()
-            except Exception as e:
-                def show_error():
-                    messagebox.showerror('Error', f'Failed to load resources: {str(e)}')
-                self.after(0, show_error)
-                self.all_resources = []
-                self.filtered_resources = []
-            
-            self.after(0, self._render_resources)
-        
-        threading.Thread(target=worker, daemon=True).start()
+        """Load the first page of resources matching the search and filters"""
+        self.results_label.config(text='Loading resources...')
+        self.feed_view.clear()
+        self.feed.start(self._resources_query())
 
-    def _show_loading(self):
-        """Show loading indicator"""
-        for widget in self.content.winfo_children():
-            widget.destroy()
-        
-        loading_frame = tk.Frame(self.content, bg=self.colors.get('background', '#ECF0F1'))
-        loading_frame.pack(fill='both', expand=True, pady=50)
-        
-        tk.Label(loading_frame, text='Loading resources...', bg=self.colors.get('background', '#ECF0F1'), fg='#1F2937', font=('Helvetica', 12)).pack()
-        
-        spinner = ttk.Progressbar(loading_frame, mode='indeterminate', length=300)
-        spinner.pack(pady=10)
-        spinner.start(10)
+    def _on_feed_error(self, error):
+        messagebox.showerror('Error', f'Failed to load resources: {str(error)}')
+        self.results_label.config(text='')
 
     def _handle_search(self, search_text, filters):
         """Handle search and filters from SearchComponent"""
-        # Filter resources
-        filtered = self.all_resources.copy()
-        
-        # Search filter
-        if search_text:
-            search_query = search_text.lower().strip()
-            filtered = [r for r in filtered if 
-                       search_query in (r.get('name', '') or '').lower() or
-                       search_query in (r.get('code', '') or '').lower() or
-                       search_query in (r.get('type', '') or '').lower() or
-                       search_query in (r.get('location', '') or '').lower() or
-                       search_query in str(r.get('amenities', [])).lower()]
-        
-        # Date range filter (check availability)
-        if 'date_range' in filters:
-            start_date = filters['date_range'].get('start')
-            end_date = filters['date_range'].get('end')
-            # Would check against bookings here in real implementation
-            # For now, just pass through
-            pass
-        
-        # Category filter (resource type)
-        if 'categories' in filters and filters['categories']:
-            filtered = [r for r in filtered if 
-                       (r.get('type', '') or '').lower() in [c.lower() for c in filters['categories']]]
-        
-        # Status filter
-        if 'status' in filters and filters['status']:
-            status = filters['status'].lower()
-            filtered = [r for r in filtered if 
-                       (r.get('status', 'available') or 'available').lower() == status]
-        
-        # Sort resources
-        sort_by = filters.get('sort', 'Name').lower()
-        if sort_by == 'name':
-            filtered.sort(key=lambda r: (r.get('name', '') or '').lower())
-        elif sort_by == 'capacity':
-            filtered.sort(key=lambda r: r.get('capacity', 0), reverse=True)
-        elif sort_by == 'location':
-            filtered.sort(key=lambda r: (r.get('location', '') or '').lower())
-        elif sort_by == 'type':
-            filtered.sort(key=lambda r: (r.get('type', '') or '').lower())
-        
-        self.filtered_resources = filtered
-        self._render_resources()
+        self.search_text = search_text
+        self.active_filters = filters
+        self._load_resources()
     
     def _apply_filters(self):
-        """Legacy method for sidebar filters - delegate to search component"""
-        # This can be kept for sidebar compatibility or removed
-        search_query = self.search_var.get().lower().strip() if hasattr(self, 'search_var') else ''
+        """Handle sidebar filter changes"""
+        if hasattr(self, 'feed_view'):
+            self._load_resources()
+
+    def _resources_query(self):
+        """Query combining the search bar and the sidebar filters
+
+        The server filters and sorts; whatever it ignores is applied
+        locally by the query.
+        """
+        filters = self.active_filters
+        query = self.api.query('resources')
+
+        # Search filter
+        search_query = (self.search_text or '').strip()
+        if search_query:
+            query = query.search(search_query, fields=('name', 'code', 'type', 'location', 'amenities'))
+
+        # Category filter (resource type) from the search bar
+        if filters.get('categories'):
+            query = query.where(type__in=[c.lower() for c in filters['categories']])
+
+        # Status filter
+        if filters.get('status'):
+            query = query.where(status=filters['status'].lower())
+
+        # Type filter from the sidebar
         resource_type = self.filter_type.get()
+        if resource_type != 'all':
+            query = query.where(type=resource_type)
+
+        # Capacity filter (the slider ends mean "no limit")
         min_cap = self.min_capacity.get()
         max_cap = self.max_capacity.get()
-        
-        # Get selected amenities
+        query = query.where(capacity__gte=min_cap if min_cap > 0 else None,
+                            capacity__lte=max_cap if max_cap < 500 else None)
+
+        # Amenities filter: resources offering any selected amenity
         selected_amenities = [key for key, var in self.amenities.items() if var.get()]
+        query = query.where(amenities__overlaps=selected_amenities or None)
         
-        # Filter resources
-        filtered = self.all_resources.copy()
-        
-        # Search filter
-        if search_query:
-            filtered = [r for r in filtered if 
-                       search_query in (r.get('name', '') or '').lower() or
-                       search_query in (r.get('code', '') or '').lower() or
-                       search_query in (r.get('type', '') or '').lower()]
-        
-        # Type filter
-        if resource_type != 'all':
-            filtered = [r for r in filtered if (r.get('type', '') or '').lower() == resource_type]
-        
-        # Capacity filter
-        filtered = [r for r in filtered if 
-                   min_cap <= (r.get('capacity', 0) or 0) <= max_cap]
-        
-        # Amenities filter
-        if selected_amenities:
-            filtered = [r for r in filtered if 
-                       any(amenity in (r.get('amenities', []) or []) for amenity in selected_amenities)]
-        
-        self.filtered_resources = filtered
-        self._render_resources()
+        # Sort resources
+        sort_by = filters.get('sort', 'Name').lower()
+        return query.order_by({
+            'name': 'name',
+            'capacity': '-capacity',
+            'location': 'location',
+            'type': 'type',
+        }.get(sort_by, 'name'))
 
     def _clear_filters(self):
         """Clear all filters"""
         self.filter_type.set('all')
         self.min_capacity.set(0)
         self.max_capacity.set(500)
-        if hasattr(self, 'search_var'):
-            self.search_var.set('')
         self.time_slot.set('all')
         
         for var in self.amenities.values():
@@ -421,38 +387,31 @@ class BrowseResourcesPage(tk.Frame):
         self.min_label.config(text=str(self.min_capacity.get()))
         self.max_label.config(text=str(self.max_capacity.get()))
 
-    def _render_resources(self):
-        """Render resource cards"""
-        # Clear content
-        for widget in self.content.winfo_children():
-            widget.destroy()
-        
-        # Results count
-        count_frame = tk.Frame(self.content, bg=self.colors.get('background', '#ECF0F1'))
-        count_frame.pack(fill='x', pady=(0, 12))
-        tk.Label(count_frame, text=f'{len(self.filtered_resources)} resource{"s" if len(self.filtered_resources) != 1 else ""} found', bg=self.colors.get('background', '#ECF0F1'), fg='#1F2937', font=('Helvetica', 11)).pack(side='left')
-        
-        if not self.filtered_resources:
-            # Empty state
-            empty_frame = tk.Frame(self.content, bg='white', highlightthickness=1, highlightbackground='#E5E7EB')
-            empty_frame.pack(fill='both', expand=True, pady=20)
-            
-            tk.Label(empty_frame, text='🔍', bg='white', font=('Helvetica', 48)).pack(pady=(40, 10))
-            tk.Label(empty_frame, text='No resources found', bg='white', fg='#1F2937', font=('Helvetica', 14, 'bold')).pack()
-            tk.Label(empty_frame, text='Try adjusting your filters', bg='white', fg='#1F2937', font=('Helvetica', 10)).pack(pady=(4, 40))
-        else:
-            # Create grid of resource cards (2 columns)
-            grid_frame = tk.Frame(self.content, bg=self.colors.get('background', '#ECF0F1'))
-            grid_frame.pack(fill='both', expand=True)
-            
-            for i in range(2):
-                grid_frame.grid_columnconfigure(i, weight=1, uniform='col')
-            
-            for idx, resource in enumerate(self.filtered_resources):
-                row = idx // 2
-                col = idx % 2
-                card = self._create_resource_card(resource, grid_frame)
-                card.grid(row=row, column=col, padx=(0, 12) if col == 0 else (0, 0), pady=(0, 12), sticky='nsew')
+    def _render_page(self, frame, page):
+        """Render one loaded page of resource cards"""
+        total = self.feed.total if self.feed.total is not None else len(self.feed.items)
+        self.results_label.config(text=f'{total} resource{"s" if total != 1 else ""} found')
+        
+        if not page.items:
+            if page.index == 0:
+                # Empty state
+                empty_frame = tk.Frame(frame, bg='white', highlightthickness=1, highlightbackground='#E5E7EB')
+                empty_frame.pack(fill='both', expand=True, pady=20)
+                
+                tk.Label(empty_frame, text='🔍', bg='white', font=('Helvetica', 48)).pack(pady=(40, 10))
+                tk.Label(empty_frame, text='No resources found', bg='white', fg='#1F2937', font=('Helvetica', 14, 'bold')).pack()
+                tk.Label(empty_frame, text='Try adjusting your filters', bg='white', fg='#1F2937', font=('Helvetica', 10)).pack(pady=(4, 40))
+            return
+        
+        # Create grid of resource cards (2 columns)
+        for i in range(2):
+            frame.grid_columnconfigure(i, weight=1, uniform='col')
+        
+        for idx, resource in enumerate(page.items):
+            row = idx // 2
+            col = idx % 2
+            card = self._create_resource_card(resource, frame)
+            card.grid(row=row, column=col, padx=(0, 12) if col == 0 else (0, 0), pady=(0, 12), sticky='nsew')
 
     def _create_resource_card(self, resource, parent=None):
         """Create a resource card"""
@@ -755,15 +714,3 @@ class BrowseResourcesPage(tk.Frame):
             booking_page.pack(fill='both', expand=True)
         else:
             messagebox.showerror('Error', 'Resource ID not available.')
-
-    @staticmethod
-    def _parse_dt(text):
-        """Parse datetime string"""
-        if not text:
-            return None
-        for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d"):
-            try:
-                return datetime.strptime(text[:19], fmt)
-            except Exception:
-                continue
-        return None
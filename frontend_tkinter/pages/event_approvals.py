@@ -1,11 +1,13 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
-import threading
 from datetime import datetime
 
+from utils.datetime_service import format_date, parse_datetime
 from utils.api_client import APIClient
+from utils.task_executor import get_executor, run_async, deliver
 from utils.session_manager import SessionManager
 from utils.email_service import get_email_service
+from components.virtual_list import VirtualList
 
 
 class EventApprovalsPage(tk.Frame):
@@ -90,22 +92,15 @@ class EventApprovalsPage(tk.Frame):
         content_container.grid_rowconfigure(0, weight=1)
         content_container.grid_columnconfigure(0, weight=1)
         
-        canvas = tk.Canvas(content_container, bg=self.colors.get('background', '#ECF0F1'), highlightthickness=0)
-        scrollbar = ttk.Scrollbar(content_container, orient='vertical', command=canvas.yview)
-        
-        self.content = tk.Frame(canvas, bg=self.colors.get('background', '#ECF0F1'))
-        
-        canvas.configure(yscrollcommand=scrollbar.set)
-        scrollbar.pack(side='right', fill='y')
-        canvas.pack(side='left', fill='both', expand=True)
-        
-        canvas.create_window((0, 0), window=self.content, anchor='nw')
-        self.content.bind('<Configure>', lambda e: canvas.configure(scrollregion=canvas.bbox('all')))
-        
-        # Update canvas width on resize
-        def on_canvas_configure(event):
-            canvas.itemconfig(canvas.find_withtag('all')[0], width=event.width)
-        canvas.bind('<Configure>', on_canvas_configure)
+        # Only the cards in view are built; they are recycled while scrolling
+        self.event_list = VirtualList(content_container, self._create_event_card, self._bind_event_card,
+                                      row_height=300, bg=self.colors.get('background', '#ECF0F1'))
+        self.event_list.pack(fill='both', expand=True)
+
+    def load_page(self):
+        """Reload data abandoned when the page was hidden before it arrived"""
+        if get_executor().was_interrupted(self):
+            self._load_pending_events()
 
     def _load_pending_events(self):
         """Load pending events from API"""
@@ -115,80 +110,74 @@ class EventApprovalsPage(tk.Frame):
             try:
                 self.pending_events = self.api.get('admin/events/pending') or []
                 self.selected_events = []
-                self.after(0, self._render_events)
+                deliver(self, self._render_events)
             except Exception as e:
                 def show_error():
                     messagebox.showerror('Error', f'Failed to load pending events: {str(e)}')
                     self.pending_events = []
                     self._render_events()
-                self.after(0, show_error)
+                deliver(self, show_error)
         
-        threading.Thread(target=worker, daemon=True).start()
+        run_async(self, worker)
 
     def _show_loading(self):
         """Show loading indicator"""
-        for widget in self.content.winfo_children():
-            widget.destroy()
-        
-        loading_frame = tk.Frame(self.content, bg=self.colors.get('background', '#ECF0F1'))
-        loading_frame.pack(fill='both', expand=True, pady=50)
+        self.event_list.show_placeholder(self._build_loading_state)
+
+    def _build_loading_state(self, parent):
+        """Build the loading indicator shown in place of the cards"""
+        loading_frame = tk.Frame(parent, bg=self.colors.get('background', '#ECF0F1'))
         
-        tk.Label(loading_frame, text='Loading pending events...', bg=self.colors.get('background', '#ECF0F1'), fg='#6B7280', font=('Helvetica', 12)).pack()
+        tk.Label(loading_frame, text='Loading pending events...', bg=self.colors.get('background', '#ECF0F1'), fg='#6B7280', font=('Helvetica', 12)).pack(pady=(50, 0))
         
         spinner = ttk.Progressbar(loading_frame, mode='indeterminate', length=300)
-        spinner.pack(pady=10)
+        spinner.pack(pady=(10, 50))
         spinner.start(10)
+        return loading_frame
 
     def _sort_events(self):
         """Sort events based on selected criteria"""
         sort_by = self.sort_by.get()
         
         if sort_by == 'date':
-            self.pending_events.sort(key=lambda e: self._parse_datetime(e.get('start_date', '')) or datetime.min)
+            self.pending_events = sorted(self.pending_events, key=lambda e: parse_datetime(e.get('start_date', '')) or datetime.min)
         elif sort_by == 'priority':
             # Priority events first, then by date
-            self.pending_events.sort(key=lambda e: (not e.get('is_urgent', False), self._parse_datetime(e.get('start_date', '')) or datetime.min))
+            self.pending_events = sorted(self.pending_events, key=lambda e: (not e.get('is_urgent', False), parse_datetime(e.get('start_date', '')) or datetime.min))
         elif sort_by == 'organizer':
-            self.pending_events.sort(key=lambda e: e.get('organizer_name', ''))
+            self.pending_events = sorted(self.pending_events, key=lambda e: e.get('organizer_name', ''))
         elif sort_by == 'attendees':
-            self.pending_events.sort(key=lambda e: -(e.get('expected_attendees', 0) or 0))
+            self.pending_events = sorted(self.pending_events, key=lambda e: -(e.get('expected_attendees', 0) or 0))
         
         self._render_events()
 
     def _render_events(self):
         """Render pending events"""
-        # Clear content
-        for widget in self.content.winfo_children():
-            widget.destroy()
-        
         # Update queue label
         count = len(self.pending_events)
         self.queue_label.config(text=f'📋 {count} pending event{"s" if count != 1 else ""} awaiting approval')
         
-        if not self.pending_events:
-            # Empty state
-            empty_frame = tk.Frame(self.content, bg='white', highlightthickness=1, highlightbackground='#E5E7EB')
-            empty_frame.pack(fill='both', expand=True, pady=20)
-            
-            tk.Label(empty_frame, text='✅', bg='white', font=('Helvetica', 48)).pack(pady=(40, 10))
-            tk.Label(empty_frame, text='All caught up!', bg='white', fg='#374151', font=('Helvetica', 14, 'bold')).pack()
-            tk.Label(empty_frame, text='No pending events to review', bg='white', fg='#6B7280', font=('Helvetica', 10)).pack(pady=(4, 40))
-        else:
-            # Event cards
-            for event in self.pending_events:
-                card = self._create_event_card(event)
-                card.pack(fill='x', pady=(0, 12))
+        self.event_list.set_items(self.pending_events, empty=self._build_empty_state)
+
+    def _build_empty_state(self, parent):
+        """Build the empty state shown when no events are pending"""
+        empty_frame = tk.Frame(parent, bg='white', highlightthickness=1, highlightbackground='#E5E7EB')
+        
+        tk.Label(empty_frame, text='✅', bg='white', font=('Helvetica', 48)).pack(pady=(40, 10))
+        tk.Label(empty_frame, text='All caught up!', bg='white', fg='#374151', font=('Helvetica', 14, 'bold')).pack()
+        tk.Label(empty_frame, text='No pending events to review', bg='white', fg='#6B7280', font=('Helvetica', 10)).pack(pady=(4, 40))
+        return empty_frame
 
-    def _create_event_card(self, event):
-        """Create an event approval card"""
-        card = tk.Frame(self.content, bg='white', highlightthickness=1, highlightbackground='#E5E7EB')
+    def _create_event_card(self, parent):
+        """Create an empty event approval card (filled by _bind_event_card, recycled by the list)"""
+        card = tk.Frame(parent, bg='white', highlightthickness=1, highlightbackground='#E5E7EB')
         
         # Track selection
-        selected_var = tk.BooleanVar(value=event.get('id') in self.selected_events)
+        card.selected_var = tk.BooleanVar()
         
         def on_checkbox_change():
-            event_id = event.get('id')
-            if selected_var.get():
+            event_id = card.item.get('id')
+            if card.selected_var.get():
                 if event_id not in self.selected_events:
                     self.selected_events.append(event_id)
             else:
@@ -204,7 +193,7 @@ class EventApprovalsPage(tk.Frame):
         header_row.pack(fill='x', pady=(0, 12))
         
         # Selection checkbox
-        checkbox = tk.Checkbutton(header_row, variable=selected_var, command=on_checkbox_change, bg='white', selectcolor='white')
+        checkbox = tk.Checkbutton(header_row, variable=card.selected_var, command=on_checkbox_change, bg='white', selectcolor='white')
         checkbox.pack(side='left', padx=(0, 12))
         
         # Event info
@@ -215,22 +204,19 @@ class EventApprovalsPage(tk.Frame):
         title_row = tk.Frame(event_info_frame, bg='white')
         title_row.pack(fill='x')
         
-        event_name = event.get('name', 'Unnamed Event')
-        tk.Label(title_row, text=event_name, bg='white', fg='#1F2937', font=('Helvetica', 14, 'bold')).pack(side='left')
+        card.name_label = tk.Label(title_row, bg='white', fg='#1F2937', font=('Helvetica', 14, 'bold'))
+        card.name_label.pack(side='left')
         
-        # Priority badge
-        if event.get('is_urgent', False):
-            priority_badge = tk.Frame(title_row, bg='#FEF3C7', highlightthickness=1, highlightbackground='#F59E0B')
-            priority_badge.pack(side='left', padx=(8, 0))
-            tk.Label(priority_badge, text='🔴 URGENT', bg='#FEF3C7', fg='#92400E', font=('Helvetica', 8, 'bold'), padx=6, pady=2).pack()
+        card.urgent_badge = tk.Frame(title_row, bg='#FEF3C7', highlightthickness=1, highlightbackground='#F59E0B')
+        tk.Label(card.urgent_badge, text='🔴 URGENT', bg='#FEF3C7', fg='#92400E', font=('Helvetica', 8, 'bold'), padx=6, pady=2).pack()
         
         # Organizer info
-        organizer_name = event.get('organizer_name', 'Unknown')
-        tk.Label(event_info_frame, text=f"Organized by: {organizer_name}", bg='white', fg='#6B7280', font=('Helvetica', 9)).pack(anchor='w', pady=(2, 0))
+        card.organizer_label = tk.Label(event_info_frame, bg='white', fg='#6B7280', font=('Helvetica', 9))
+        card.organizer_label.pack(anchor='w', pady=(2, 0))
         
         # Submitted date
-        submitted_date = self._format_datetime(event.get('submitted_date', event.get('created_at', '')))
-        tk.Label(header_row, text=f"Submitted: {submitted_date}", bg='white', fg='#9CA3AF', font=('Helvetica', 9)).pack(side='right')
+        card.submitted_label = tk.Label(header_row, bg='white', fg='#9CA3AF', font=('Helvetica', 9))
+        card.submitted_label.pack(side='right')
         
         # Event details grid
         details_frame = tk.Frame(content, bg='#F9FAFB')
@@ -239,67 +225,93 @@ class EventApprovalsPage(tk.Frame):
         details_content = tk.Frame(details_frame, bg='#F9FAFB')
         details_content.pack(padx=16, pady=12)
         
+        card.date_value = self._add_detail_item(details_content, '📅 Date:', '')
+        card.time_value = self._add_detail_item(details_content, '🕐 Time:', '')
+        card.venue_value = self._add_detail_item(details_content, '📍 Venue:', '')
+        card.expected_value = self._add_detail_item(details_content, '👥 Expected:', '')
+        
+        # Description preview
+        tk.Label(content, text='Description:', bg='white', fg='#6B7280', font=('Helvetica', 9, 'bold')).pack(anchor='w', pady=(0, 4))
+        card.description_label = tk.Label(content, bg='white', fg='#374151', font=('Helvetica', 9), wraplength=900, justify='left')
+        card.description_label.pack(anchor='w', pady=(0, 12))
+        
+        # Resource requirements (shown when the event has any)
+        card.resources_section = tk.Frame(content, bg='white')
+        tk.Label(card.resources_section, text='Resource Requirements:', bg='white', fg='#6B7280', font=('Helvetica', 9, 'bold')).pack(anchor='w', pady=(0, 4))
+        card.resources_frame = tk.Frame(card.resources_section, bg='white')
+        card.resources_frame.pack(fill='x', pady=(0, 12))
+        
+        # Action buttons
+        card.actions_frame = tk.Frame(content, bg='white')
+        card.actions_frame.pack(fill='x')
+        
+        tk.Button(card.actions_frame, text='View Full Details', command=lambda: self._show_approval_modal(card.item), bg='#F3F4F6', fg='#374151', relief='flat', font=('Helvetica', 9, 'bold'), padx=12, pady=6).pack(side='left', padx=(0, 8))
+        
+        tk.Button(card.actions_frame, text='✅ Approve', command=lambda: self._approve_event(card.item), bg=self.colors.get('success', '#27AE60'), fg='white', relief='flat', font=('Helvetica', 9, 'bold'), padx=16, pady=6).pack(side='left', padx=(0, 8))
+        
+        tk.Button(card.actions_frame, text='❌ Reject', command=lambda: self._reject_event(card.item), bg=self.colors.get('danger', '#E74C3C'), fg='white', relief='flat', font=('Helvetica', 9, 'bold'), padx=16, pady=6).pack(side='left', padx=(0, 8))
+        
+        tk.Button(card.actions_frame, text='📝 Request Changes', command=lambda: self._request_changes(card.item), bg=self.colors.get('warning', '#F39C12'), fg='white', relief='flat', font=('Helvetica', 9, 'bold'), padx=12, pady=6).pack(side='left')
+        
+        return card
+
+    def _bind_event_card(self, card, event):
+        """Fill an event approval card with an event"""
+        card.selected_var.set(event.get('id') in self.selected_events)
+        card.name_label.config(text=event.get('name', 'Unnamed Event'))
+        
+        # Priority badge
+        if event.get('is_urgent', False):
+            card.urgent_badge.pack(side='left', padx=(8, 0))
+        else:
+            card.urgent_badge.pack_forget()
+        
+        card.organizer_label.config(text=f"Organized by: {event.get('organizer_name', 'Unknown')}")
+        card.submitted_label.config(text=f"Submitted: {format_date(event.get('submitted_date', event.get('created_at', '')))}")
+        
         # Date and time
-        start_date = self._format_datetime(event.get('start_date', ''))
         start_time = event.get('start_time', 'N/A')
         end_time = event.get('end_time', 'N/A')
-        
-        self._add_detail_item(details_content, '📅 Date:', start_date)
-        self._add_detail_item(details_content, '🕐 Time:', f"{start_time} - {end_time}")
+        card.date_value.config(text=format_date(event.get('start_date', '')))
+        card.time_value.config(text=f"{start_time} - {end_time}")
         
         # Venue
         venue = event.get('venue', event.get('location', 'N/A'))
-        event_type = event.get('event_type', 'N/A')
-        if event_type == 'virtual':
+        if event.get('event_type', 'N/A') == 'virtual':
             venue = 'Virtual Event'
-        
-        self._add_detail_item(details_content, '📍 Venue:', venue)
-        self._add_detail_item(details_content, '👥 Expected:', str(event.get('expected_attendees', 'N/A')))
+        card.venue_value.config(text=venue)
+        card.expected_value.config(text=str(event.get('expected_attendees', 'N/A')))
         
         # Description preview
         description = event.get('description', 'No description provided')
         if len(description) > 150:
             description = description[:150] + '...'
-        
-        tk.Label(content, text='Description:', bg='white', fg='#6B7280', font=('Helvetica', 9, 'bold')).pack(anchor='w', pady=(0, 4))
-        tk.Label(content, text=description, bg='white', fg='#374151', font=('Helvetica', 9), wraplength=900, justify='left').pack(anchor='w', pady=(0, 12))
+        card.description_label.config(text=description)
         
         # Resource requirements (if any)
+        for tag in card.resources_frame.winfo_children():
+            tag.destroy()
         resources = event.get('resources', [])
         if resources:
-            tk.Label(content, text='Resource Requirements:', bg='white', fg='#6B7280', font=('Helvetica', 9, 'bold')).pack(anchor='w', pady=(0, 4))
-            
-            resources_frame = tk.Frame(content, bg='white')
-            resources_frame.pack(fill='x', pady=(0, 12))
-            
             for resource in resources[:5]:  # Show first 5
-                resource_tag = tk.Label(resources_frame, text=f"• {resource}", bg='#EFF6FF', fg='#1E40AF', font=('Helvetica', 8), padx=8, pady=2)
+                resource_tag = tk.Label(card.resources_frame, text=f"• {resource}", bg='#EFF6FF', fg='#1E40AF', font=('Helvetica', 8), padx=8, pady=2)
                 resource_tag.pack(side='left', padx=(0, 4), pady=2)
             
             if len(resources) > 5:
-                more_tag = tk.Label(resources_frame, text=f'+{len(resources) - 5} more', bg='#F3F4F6', fg='#6B7280', font=('Helvetica', 8), padx=8, pady=2)
+                more_tag = tk.Label(card.resources_frame, text=f'+{len(resources) - 5} more', bg='#F3F4F6', fg='#6B7280', font=('Helvetica', 8), padx=8, pady=2)
                 more_tag.pack(side='left', padx=(0, 4), pady=2)
-        
-        # Action buttons
-        actions_frame = tk.Frame(content, bg='white')
-        actions_frame.pack(fill='x')
-        
-        tk.Button(actions_frame, text='View Full Details', command=lambda: self._show_approval_modal(event), bg='#F3F4F6', fg='#374151', relief='flat', font=('Helvetica', 9, 'bold'), padx=12, pady=6).pack(side='left', padx=(0, 8))
-        
-        tk.Button(actions_frame, text='✅ Approve', command=lambda: self._approve_event(event), bg=self.colors.get('success', '#27AE60'), fg='white', relief='flat', font=('Helvetica', 9, 'bold'), padx=16, pady=6).pack(side='left', padx=(0, 8))
-        
-        tk.Button(actions_frame, text='❌ Reject', command=lambda: self._reject_event(event), bg=self.colors.get('danger', '#E74C3C'), fg='white', relief='flat', font=('Helvetica', 9, 'bold'), padx=16, pady=6).pack(side='left', padx=(0, 8))
-        
-        tk.Button(actions_frame, text='📝 Request Changes', command=lambda: self._request_changes(event), bg=self.colors.get('warning', '#F39C12'), fg='white', relief='flat', font=('Helvetica', 9, 'bold'), padx=12, pady=6).pack(side='left')
-        
-        return card
+            card.resources_section.pack(fill='x', before=card.actions_frame)
+        else:
+            card.resources_section.pack_forget()
 
     def _add_detail_item(self, parent, label, value):
         """Add detail item"""
         frame = tk.Frame(parent, bg='#F9FAFB')
         frame.pack(side='left', padx=(0, 24))
         tk.Label(frame, text=label, bg='#F9FAFB', fg='#6B7280', font=('Helvetica', 9)).pack(side='left', padx=(0, 4))
-        tk.Label(frame, text=value, bg='#F9FAFB', fg='#1F2937', font=('Helvetica', 9, 'bold')).pack(side='left')
+        value_label = tk.Label(frame, text=value, bg='#F9FAFB', fg='#1F2937', font=('Helvetica', 9, 'bold'))
+        value_label.pack(side='left')
+        return value_label
 
     def _show_approval_modal(self, event):
         """Show detailed approval modal"""
@@ -355,12 +367,12 @@ class EventApprovalsPage(tk.Frame):
         self._add_modal_detail(info_content, 'Event Name:', event.get('name', 'N/A'))
         self._add_modal_detail(info_content, 'Category:', event.get('category', 'N/A'))
         self._add_modal_detail(info_content, 'Type:', event.get('event_type', 'N/A'))
-        self._add_modal_detail(info_content, 'Date:', self._format_datetime(event.get('start_date', '')))
+        self._add_modal_detail(info_content, 'Date:', format_date(event.get('start_date', '')))
         self._add_modal_detail(info_content, 'Start Time:', event.get('start_time', 'N/A'))
         self._add_modal_detail(info_content, 'End Time:', event.get('end_time', 'N/A'))
         self._add_modal_detail(info_content, 'Venue:', event.get('venue', event.get('location', 'N/A')))
         self._add_modal_detail(info_content, 'Expected Attendees:', str(event.get('expected_attendees', 'N/A')))
-        self._add_modal_detail(info_content, 'Registration Deadline:', self._format_datetime(event.get('registration_deadline', '')))
+        self._add_modal_detail(info_content, 'Registration Deadline:', format_date(event.get('registration_deadline', '')))
         
         # Description
         tk.Label(details_frame, text='Description:', bg='white', fg='#1F2937', font=('Helvetica', 11, 'bold')).pack(anchor='w', pady=(0, 8))
@@ -505,13 +517,13 @@ class EventApprovalsPage(tk.Frame):
                                           f"📧 Notification sent to organizer")
                         self._load_pending_events()
                     
-                    self.after(0, show_success)
+                    deliver(self, show_success)
                 except Exception as e:
                     def show_error():
                         messagebox.showerror('Error', f'Failed to approve event: {str(e)}')
-                    self.after(0, show_error)
+                    deliver(self, show_error)
             
-            threading.Thread(target=worker, daemon=True).start()
+            run_async(self, worker, interruptible=False)
 
     def _reject_event(self, event, comments=''):
         """Reject an event"""
@@ -600,13 +612,13 @@ class EventApprovalsPage(tk.Frame):
                                           f"📧 Organizer has been notified with reason")
                         self._load_pending_events()
                     
-                    self.after(0, show_success)
+                    deliver(self, show_success)
                 except Exception as e:
                     def show_error():
                         messagebox.showerror('Error', f'Failed to reject event: {str(e)}')
-                    self.after(0, show_error)
+                    deliver(self, show_error)
             
-            threading.Thread(target=worker, daemon=True).start()
+            run_async(self, worker, interruptible=False)
         
         tk.Button(btn_frame, text='Reject Event', command=confirm_rejection, bg=self.colors.get('danger', '#E74C3C'), fg='white', relief='flat', font=('Helvetica', 10, 'bold'), padx=20, pady=10, width=12).pack(side='right')
 
@@ -682,8 +694,8 @@ class EventApprovalsPage(tk.Frame):
         else:
             self.selected_events = []
         
-        # Re-render to update checkboxes
-        self._render_events()
+        # Update the checkboxes of the cards in view
+        self.event_list.refresh()
 
     def _bulk_approve(self):
         """Approve multiple events"""
@@ -713,13 +725,13 @@ class EventApprovalsPage(tk.Frame):
                                           f"✅ {success_count} of {count} events approved successfully!")
                         self._load_pending_events()
                     
-                    self.after(0, show_success)
+                    deliver(self, show_success)
                 except Exception as e:
                     def show_error():
                         messagebox.showerror('Error', f'Bulk approval failed: {str(e)}')
-                    self.after(0, show_error)
+                    deliver(self, show_error)
             
-            threading.Thread(target=worker, daemon=True).start()
+            run_async(self, worker, interruptible=False)
 
     def _bulk_reject(self):
         """Reject multiple events"""
@@ -759,31 +771,10 @@ class EventApprovalsPage(tk.Frame):
                                           f"❌ {success_count} of {count} events rejected.")
                         self._load_pending_events()
                     
-                    self.after(0, show_success)
+                    deliver(self, show_success)
                 except Exception as e:
                     def show_error():
                         messagebox.showerror('Error', f'Bulk rejection failed: {str(e)}')
-                    self.after(0, show_error)
+                    deliver(self, show_error)
             
-            threading.Thread(target=worker, daemon=True).start()
-
-    def _format_datetime(self, date_str):
-        """Format datetime for display"""
-        dt = self._parse_datetime(date_str)
-        if dt:
-            return dt.strftime('%B %d, %Y')
-        return date_str or 'N/A'
-
-    def _parse_datetime(self, date_str):
-        """Parse datetime string"""
-        if not date_str:
-            return None
-        try:
-            for fmt in ('%Y-%m-%d %H:%M:%S', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d'):
-                try:
-                    return datetime.strptime(date_str[:19] if len(date_str) >= 19 else date_str, fmt)
-                except:
-                    continue
-        except:
-            pass
-        return None
+            run_async(self, worker, interruptible=False)
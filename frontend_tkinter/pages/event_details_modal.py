@@ -1,9 +1,9 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
-from datetime import datetime
 
+from utils.datetime_service import parse_datetime
 from utils.api_client import APIClient
+from utils.task_executor import run_async, deliver
 from utils.session_manager import SessionManager
 from utils.email_service import get_email_service
 
@@ -97,8 +97,8 @@ class EventDetailsModal(tk.Toplevel):
         """Load event details from API"""
         def worker():
             try:
-                # Load event details
-                self.event = self.api.get(f'events/{self.event_id}')
+                # Load event details (cached: list views only carry summaries)
+                self.event = self.api.get_detail('events', self.event_id)
                 
                 # Check if user is registered
                 try:
@@ -111,13 +111,13 @@ class EventDetailsModal(tk.Toplevel):
                 def show_error():
                     messagebox.showerror('Error', f'Failed to load event details: {str(e)}')
                     self._on_close()
-                self.after(0, show_error)
+                deliver(self, show_error)
                 return
             
             # Render the content
-            self.after(0, self._render_content)
+            deliver(self, self._render_content)
         
-        threading.Thread(target=worker, daemon=True).start()
+        run_async(self, worker)
 
     def _render_content(self):
         """Render the event details content"""
@@ -408,8 +408,8 @@ class EventDetailsModal(tk.Toplevel):
 
     def _calculate_duration(self):
         """Calculate event duration"""
-        start = self._parse_dt(self.event.get('start_time'))
-        end = self._parse_dt(self.event.get('end_time'))
+        start = parse_datetime(self.event.get('start_time'))
+        end = parse_datetime(self.event.get('end_time'))
         
         if start and end:
             duration = end - start
@@ -498,18 +498,6 @@ class EventDetailsModal(tk.Toplevel):
             self.on_close_callback()
         self.destroy()
 
-    @staticmethod
-    def _parse_dt(text):
-        """Parse datetime string"""
-        if not text:
-            return None
-        for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d"):
-            try:
-                return datetime.strptime(text[:19], fmt)
-            except Exception:
-                continue
-        return None
-
 
 # Convenience function to open modal
 def show_event_details(parent, event_id, controller=None, on_close_callback=None):
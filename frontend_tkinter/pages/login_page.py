@@ -5,7 +5,6 @@ All buttons are properly styled, no image dependencies for buttons
 
 import os
 import sys
-import threading
 import tkinter as tk
 from tkinter import messagebox
 from PIL import ImageTk, Image
@@ -14,6 +13,7 @@ from PIL import ImageTk, Image
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.api_client import APIClient
+from utils.task_executor import run_async, deliver
 from utils.session_manager import SessionManager
 from utils.validators import validate_required_field, sanitize_input
 
@@ -389,13 +389,8 @@ class LoginPage(tk.Frame):
         self.login_canvas.itemconfig(self.login_text, text='SIGNING IN...')
         self.login_canvas.config(cursor='wait')
         
-        # Start login thread
-        thread = threading.Thread(
-            target=self._login_thread,
-            args=(username, password),
-            daemon=True
-        )
-        thread.start()
+        # Start login task (user-initiated, so not cancelled on navigation)
+        run_async(self, self._login_thread, username, password, interruptible=False)
     
     def _login_thread(self, username: str, password: str):
         """Perform login in background thread."""
@@ -428,6 +423,9 @@ class LoginPage(tk.Frame):
             self.api.set_auth_token(token)
             print(f"[DEBUG] JWT token stored and set in API client")
             
+            # Open pooled connections while the dashboard is being built
+            self.api.warm_up(connections=4)
+            
             # Success callback
             def after_success():
                 self.login_enabled = True
@@ -436,7 +434,7 @@ class LoginPage(tk.Frame):
                 self.login_canvas.config(cursor='hand2')
                 self.controller._go_to_dashboard()
             
-            self.after(0, after_success)
+            deliver(self, after_success)
             
         except Exception as e:
             error_msg = str(e)
@@ -460,4 +458,4 @@ class LoginPage(tk.Frame):
                 
                 messagebox.showerror("Login Failed", msg)
             
-            self.after(0, after_error)
\ No newline at end of file
+            deliver(self, after_error)
\ No newline at end of file
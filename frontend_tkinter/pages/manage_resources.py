@@ -1,9 +1,9 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import threading
 from datetime import datetime
 
 from utils.api_client import APIClient
+from utils.task_executor import get_executor, run_async, deliver
 from utils.session_manager import SessionManager
 
 
@@ -152,20 +152,25 @@ class ManageResourcesPage(tk.Frame):
         tk.Button(action_frame, text='Toggle Maintenance', command=self._toggle_maintenance, bg=self.colors.get('warning', '#F39C12'), fg='white', relief='flat', font=('Helvetica', 9, 'bold'), padx=12, pady=6).pack(side='left', padx=(0, 8))
         tk.Button(action_frame, text='Delete Resource', command=self._delete_resource, bg=self.colors.get('danger', '#E74C3C'), fg='white', relief='flat', font=('Helvetica', 9, 'bold'), padx=12, pady=6).pack(side='left')
 
+    def load_page(self):
+        """Reload data abandoned when the page was hidden before it arrived"""
+        if get_executor().was_interrupted(self):
+            self._load_resources()
+
     def _load_resources(self):
         """Load resources from API"""
         def worker():
             try:
                 self.all_resources = self.api.get('resources') or []
-                self.after(0, self._apply_filters)
+                deliver(self, self._apply_filters)
             except Exception as e:
                 def show_error():
                     messagebox.showerror('Error', f'Failed to load resources: {str(e)}')
                     self.all_resources = []
                     self._apply_filters()
-                self.after(0, show_error)
+                deliver(self, show_error)
         
-        threading.Thread(target=worker, daemon=True).start()
+        run_async(self, worker)
 
     def _apply_filters(self):
         """Apply search and filters to resource list"""
@@ -530,15 +535,15 @@ class ManageResourcesPage(tk.Frame):
                     messagebox.showinfo('Success', message)
                     self._load_resources()
                 
-                self.after(0, show_success)
+                deliver(self, show_success)
             except Exception as e:
                 def show_error():
                     loading.destroy()
                     messagebox.showerror('Error', f'Failed to save resource: {str(e)}')
                 
-                self.after(0, show_error)
+                deliver(self, show_error)
         
-        threading.Thread(target=worker, daemon=True).start()
+        run_async(self, worker, interruptible=False)
 
     def _view_resource_details(self):
         """View detailed resource information"""
@@ -691,13 +696,13 @@ class ManageResourcesPage(tk.Frame):
                         messagebox.showinfo('Success', f'Resource status updated to {status_text}.')
                         self._load_resources()
                     
-                    self.after(0, show_success)
+                    deliver(self, show_success)
                 except Exception as e:
                     def show_error():
                         messagebox.showerror('Error', f'Failed to update status: {str(e)}')
-                    self.after(0, show_error)
+                    deliver(self, show_error)
             
-            threading.Thread(target=worker, daemon=True).start()
+            run_async(self, worker, interruptible=False)
 
     def _delete_resource(self):
         """Delete selected resource"""
@@ -728,10 +733,10 @@ class ManageResourcesPage(tk.Frame):
                             messagebox.showinfo('Success', 'Resource deleted successfully.')
                             self._load_resources()
                         
-                        self.after(0, show_success)
+                        deliver(self, show_success)
                     except Exception as e:
                         def show_error():
                             messagebox.showerror('Error', f'Failed to delete resource: {str(e)}')
-                        self.after(0, show_error)
+                        deliver(self, show_error)
                 
-                threading.Thread(target=worker, daemon=True).start()
+                run_async(self, worker, interruptible=False)
@@ -1,10 +1,24 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
-import threading
 from datetime import datetime
 
+from utils.datetime_service import format_date
 from utils.api_client import APIClient
+from utils.task_executor import get_executor, run_async, deliver
 from utils.session_manager import SessionManager
+from utils.treeview_adapter import TreeviewAdapter
+
+# Role and status columns with emoji
+ROLE_DISPLAY = {
+    'Student': '🎓 Student',
+    'Organizer': '📋 Organizer',
+    'Admin': '👑 Admin'
+}
+
+STATUS_DISPLAY = {
+    'Active': '✅ Active',
+    'Blocked': '🚫 Blocked'
+}
 
 
 class ManageUsersPage(tk.Frame):
@@ -29,6 +43,8 @@ class ManageUsersPage(tk.Frame):
         # Data
         self.users = []
         self.filtered_users = []
+        self._loaded_query = None  # Query self.users was fetched with
+        self._requested_query = None
         
         # Filter variables
         self.search_var = tk.StringVar()
@@ -179,6 +195,9 @@ class ManageUsersPage(tk.Frame):
         
         self.tree.pack(fill='both', expand=True, padx=1, pady=1)
         
+        # Rows are diffed by user id and inserted in chunks
+        self.table = TreeviewAdapter(self.tree, self._row_values, tags=lambda user: (user.get('id', ''),))
+        
         # Context menu
         self.context_menu = tk.Menu(self.tree, tearoff=0, font=('Helvetica', 10))
         self.context_menu.add_command(label='👁️ View Details', command=self._view_user_details)
@@ -196,86 +215,72 @@ class ManageUsersPage(tk.Frame):
         self.tree.bind('<Button-3>', self._show_context_menu)  # Right-click
         self.tree.bind('<Double-1>', lambda e: self._view_user_details())  # Double-click
 
+    def load_page(self):
+        """Reload data abandoned when the page was hidden before it arrived"""
+        if get_executor().was_interrupted(self):
+            self._load_users()
+
+    def _users_query(self):
+        """Query for the current role, status and search filters"""
+        role = self.role_filter.get()
+        status = self.status_filter.get()
+        search = self.search_var.get()
+        if search == 'Search by name or email...':
+            search = ''
+        return (self.api.query('admin/users')
+                .where(role=None if role == 'all' else role,
+                       status=None if status == 'all' else status)
+                .search(search, fields=('name', 'email')))
+
     def _load_users(self):
-        """Load users from API"""
+        """Load users from API (filters are applied by the server)"""
         self._show_loading()
+        query = self._requested_query = self._users_query()
         
         def worker():
             try:
-                # Build query params
-                params = {}
-                
-                role = self.role_filter.get()
-                if role != 'all':
-                    params['role'] = role
+                users = query.fetch().items
                 
-                status = self.status_filter.get()
-                if status != 'all':
-                    params['status'] = status
-                
-                search = self.search_var.get()
-                if search and search != 'Search by name or email...':
-                    params['search'] = search
-                
-                # Build query string
-                query_string = '&'.join([f"{k}={v}" for k, v in params.items()])
-                endpoint = f'admin/users?{query_string}' if query_string else 'admin/users'
-                
-                self.users = self.api.get(endpoint) or []
-                self.filtered_users = self.users.copy()
-                
-                self.after(0, self._populate_table)
+                def show():
+                    if query is not self._requested_query:
+                        return  # Filters changed while loading; a newer load follows
+                    self.users = self.filtered_users = users
+                    self._loaded_query = query
+                    self._populate_table()
+                deliver(self, show)
             except Exception as e:
                 def show_error():
+                    if query is not self._requested_query:
+                        return
                     messagebox.showerror('Error', f'Failed to load users: {str(e)}')
                     self.users = []
                     self.filtered_users = []
+                    self._loaded_query = None
                     self._populate_table()
-                self.after(0, show_error)
+                deliver(self, show_error)
         
-        threading.Thread(target=worker, daemon=True).start()
+        run_async(self, worker)
 
     def _show_loading(self):
-        """Show loading in table"""
-        self.tree.delete(*self.tree.get_children())
+        """Show loading state (rows stay until set_rows() diffs the result)"""
         self.count_label.config(text='Loading...')
 
     def _apply_filters(self):
         """Apply filters to user list"""
-        search_text = self.search_var.get().lower()
-        if search_text == 'search by name or email...':
-            search_text = ''
-        
-        role = self.role_filter.get()
-        status = self.status_filter.get()
-        
-        self.filtered_users = []
-        
-        for user in self.users:
-            # Search filter
-            if search_text:
-                name = user.get('name', '').lower()
-                email = user.get('email', '').lower()
-                if search_text not in name and search_text not in email:
-                    continue
-            
-            # Role filter
-            if role != 'all' and user.get('role', '').lower() != role:
-                continue
-            
-            # Status filter
-            if status != 'all' and user.get('status', '').lower() != status:
-                continue
-            
-            self.filtered_users.append(user)
+        if not hasattr(self, 'tree'):
+            return  # Placeholder text set while the UI is being built
+        query = self._users_query()
+        if self._loaded_query is None or not query.is_refinement_of(self._loaded_query):
+            # Wider than what is loaded (e.g. role changed): ask the server
+            self._load_users()
+            return
         
+        # Narrower: filter the loaded users instead of another request
+        self.filtered_users = query.evaluate(self.users).items
         self._populate_table()
 
     def _populate_table(self):
-        """Populate the users table"""
-        # Clear table
-        self.tree.delete(*self.tree.get_children())
-        
+        """Populate the users table (in chunks; see TreeviewAdapter)"""
         # Update count
         count = len(self.filtered_users)
         total = len(self.users)
@@ -284,30 +289,22 @@ class ManageUsersPage(tk.Frame):
         else:
             self.count_label.config(text=f'Showing {count} of {total} users')
         
-        # Add rows
-        for user in self.filtered_users:
-            user_id = user.get('id', '')
-            name = user.get('name', 'N/A')
-            email = user.get('email', 'N/A')
-            role = (user.get('role', 'user') or 'user').title()
-            status = (user.get('status', 'active') or 'active').title()
-            registered = self._format_date(user.get('created_at', ''))
-            
-            # Format role with emoji
-            role_display = {
-                'Student': '🎓 Student',
-                'Organizer': '📋 Organizer',
-                'Admin': '👑 Admin'
-            }.get(role, role)
-            
-            # Format status with emoji
-            status_display = {
-                'Active': '✅ Active',
-                'Blocked': '🚫 Blocked'
-            }.get(status, status)
-            
-            values = (user_id, name, email, role_display, status_display, registered, '⚙️ Actions')
-            self.tree.insert('', 'end', values=values, tags=(user_id,))
+        self.table.set_rows(self.filtered_users)
+
+    @staticmethod
+    def _row_values(user):
+        """Table columns of a user"""
+        role = (user.get('role', 'user') or 'user').title()
+        status = (user.get('status', 'active') or 'active').title()
+        return (
+            user.get('id', ''),
+            user.get('name', 'N/A'),
+            user.get('email', 'N/A'),
+            ROLE_DISPLAY.get(role, role),
+            STATUS_DISPLAY.get(status, status),
+            format_date(user.get('created_at', ''), '%b %d, %Y'),
+            '⚙️ Actions',
+        )
 
     def _show_context_menu(self, event):
         """Show context menu on right-click"""
@@ -427,7 +424,7 @@ class ManageUsersPage(tk.Frame):
         self._add_modal_detail(right_col, 'Role:', (user.get('role', 'user') or 'user').title())
         self._add_modal_detail(right_col, 'Department:', user.get('department', 'N/A'))
         self._add_modal_detail(right_col, 'Student ID:', user.get('student_id', 'N/A'))
-        self._add_modal_detail(right_col, 'Registered:', self._format_date(user.get('created_at', '')))
+        self._add_modal_detail(right_col, 'Registered:', format_date(user.get('created_at', ''), '%b %d, %Y'))
         
         # Activity statistics
         self._add_section_header(details_frame, '📊 Activity Statistics')
@@ -637,13 +634,13 @@ class ManageUsersPage(tk.Frame):
                         modal.destroy()
                         self._load_users()
                     
-                    self.after(0, show_success)
+                    deliver(self, show_success)
                 except Exception as e:
                     def show_error():
                         messagebox.showerror('Error', f'Failed to update role: {str(e)}')
-                    self.after(0, show_error)
+                    deliver(self, show_error)
             
-            threading.Thread(target=worker, daemon=True).start()
+            run_async(self, worker, interruptible=False)
 
     def _block_user(self):
         """Block a user"""
@@ -680,13 +677,13 @@ class ManageUsersPage(tk.Frame):
                                           f"The user cannot access the system.")
                         self._load_users()
                     
-                    self.after(0, show_success)
+                    deliver(self, show_success)
                 except Exception as e:
                     def show_error():
                         messagebox.showerror('Error', f'Failed to block user: {str(e)}')
-                    self.after(0, show_error)
+                    deliver(self, show_error)
             
-            threading.Thread(target=worker, daemon=True).start()
+            run_async(self, worker, interruptible=False)
 
     def _unblock_user(self):
         """Unblock a user"""
@@ -716,13 +713,13 @@ class ManageUsersPage(tk.Frame):
                                           f"The user can now access the system.")
                         self._load_users()
                     
-                    self.after(0, show_success)
+                    deliver(self, show_success)
                 except Exception as e:
                     def show_error():
                         messagebox.showerror('Error', f'Failed to unblock user: {str(e)}')
-                    self.after(0, show_error)
+                    deliver(self, show_error)
             
-            threading.Thread(target=worker, daemon=True).start()
+            run_async(self, worker, interruptible=False)
 
     def _reset_password(self):
         """Reset user password"""
@@ -835,13 +832,13 @@ class ManageUsersPage(tk.Frame):
                                           f"🗑️ User {user.get('name', 'User')} has been permanently deleted.")
                         self._load_users()
                     
-                    self.after(0, show_success)
+                    deliver(self, show_success)
                 except Exception as e:
                     def show_error():
                         messagebox.showerror('Error', f'Failed to delete user: {str(e)}')
-                    self.after(0, show_error)
+                    deliver(self, show_error)
             
-            threading.Thread(target=worker, daemon=True).start()
+            run_async(self, worker, interruptible=False)
 
     def _export_csv(self):
         """Export users to CSV"""
@@ -876,20 +873,10 @@ class ManageUsersPage(tk.Frame):
                             user.get('status', ''),
                             user.get('department', ''),
                             user.get('phone', ''),
-                            self._format_date(user.get('created_at', ''))
+                            format_date(user.get('created_at', ''), '%b %d, %Y')
                         ])
                 
                 messagebox.showinfo('Export Successful',
                                   f'✅ Exported {len(self.filtered_users)} user{"s" if len(self.filtered_users) != 1 else ""} to:\n{file_path}')
         except Exception as e:
             messagebox.showerror('Export Failed', f'Failed to export CSV: {str(e)}')
-
-    def _format_date(self, date_str):
-        """Format date for display"""
-        if not date_str:
-            return 'N/A'
-        try:
-            date_obj = datetime.strptime(date_str[:10] if len(date_str) >= 10 else date_str, '%Y-%m-%d')
-            return date_obj.strftime('%b %d, %Y')
-        except:
-            return date_str or 'N/A'
@@ -1,12 +1,14 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
 from datetime import datetime, timedelta
 from calendar import monthrange
 
+from utils.datetime_service import parse_date, format_date
 from utils.api_client import APIClient
+from utils.task_executor import get_executor, run_async, deliver
 from utils.session_manager import SessionManager
 from utils.canvas_button import create_primary_button, create_secondary_button, create_success_button, create_danger_button
+from components.virtual_list import VirtualList
 
 
 class MyBookingsPage(tk.Frame):
@@ -31,6 +33,7 @@ class MyBookingsPage(tk.Frame):
         # Data
         self.all_bookings = []
         self.filtered_bookings = []
+        self.booking_list = None  # VirtualList of the list view
         self.current_status = 'pending'
         self.view_mode = 'list'  # 'list' or 'calendar'
         self.current_month = datetime.now().month
@@ -179,30 +182,18 @@ class MyBookingsPage(tk.Frame):
 
     def _build_list_view(self):
         """Build list view with booking cards"""
-        # Clear content area
-        for widget in self.content_area.winfo_children():
-            widget.destroy()
-        
-        # Scrollable container
-        canvas = tk.Canvas(self.content_area, bg=self.colors.get('background', '#ECF0F1'), highlightthickness=0)
-        scrollbar = ttk.Scrollbar(self.content_area, orient='vertical', command=canvas.yview)
-        
-        content = tk.Frame(canvas, bg=self.colors.get('background', '#ECF0F1'))
-        
-        canvas.configure(yscrollcommand=scrollbar.set)
-        scrollbar.pack(side='right', fill='y')
-        canvas.pack(side='left', fill='both', expand=True)
-        
-        canvas.create_window((0, 0), window=content, anchor='nw')
-        content.bind('<Configure>', lambda e: canvas.configure(scrollregion=canvas.bbox('all')))
-        
-        # Update canvas width on resize
-        def on_canvas_configure(event):
-            canvas.itemconfig(canvas.find_withtag('all')[0], width=event.width)
-        canvas.bind('<Configure>', on_canvas_configure)
+        if self.booking_list is None or not self.booking_list.winfo_exists():
+            # Clear content area
+            for widget in self.content_area.winfo_children():
+                widget.destroy()
+            
+            # Only the cards in view are built; they are recycled while scrolling
+            self.booking_list = VirtualList(self.content_area, self._create_booking_card, self._bind_booking_card,
+                                            row_height=260, bg=self.colors.get('background', '#ECF0F1'))
+            self.booking_list.pack(fill='both', expand=True)
         
         # Render bookings
-        self._render_booking_cards(content)
+        self._render_booking_cards()
 
     def _build_calendar_view(self):
         """Build calendar view"""
@@ -274,7 +265,7 @@ class MyBookingsPage(tk.Frame):
         # Group bookings by date
         bookings_by_date = {}
         for booking in self.all_bookings:
-            booking_date = self._parse_date(booking.get('date', ''))
+            booking_date = parse_date(booking.get('date', ''))
             if booking_date and booking_date.year == self.current_year and booking_date.month == self.current_month:
                 date_key = booking_date.day
                 if date_key not in bookings_by_date:
@@ -344,25 +335,22 @@ class MyBookingsPage(tk.Frame):
             
             week_num += 1
 
-    def _render_booking_cards(self, parent):
+    def _render_booking_cards(self):
         """Render booking cards in list view"""
-        if not self.filtered_bookings:
-            # Empty state
-            empty_frame = tk.Frame(parent, bg='white', highlightthickness=1, highlightbackground='#E5E7EB')
-            empty_frame.pack(fill='both', expand=True, pady=20)
-            
-            tk.Label(empty_frame, text='📋', bg='white', font=('Helvetica', 48)).pack(pady=(40, 10))
-            tk.Label(empty_frame, text=f'No {self.current_status} bookings', bg='white', fg='#1F2937', font=('Helvetica', 14, 'bold')).pack()
-            tk.Label(empty_frame, text='Your bookings will appear here', bg='white', fg='#1F2937', font=('Helvetica', 10)).pack(pady=(4, 40))
-        else:
-            # Booking cards
-            for booking in self.filtered_bookings:
-                card = self._create_booking_card(booking)
-                card.pack(fill='x', pady=(0, 12))
+        self.booking_list.set_items(self.filtered_bookings, empty=self._build_empty_state)
+
+    def _build_empty_state(self, parent):
+        """Build the empty state shown when a tab has no bookings"""
+        empty_frame = tk.Frame(parent, bg='white', highlightthickness=1, highlightbackground='#E5E7EB')
+        
+        tk.Label(empty_frame, text='📋', bg='white', font=('Helvetica', 48)).pack(pady=(40, 10))
+        tk.Label(empty_frame, text=f'No {self.current_status} bookings', bg='white', fg='#1F2937', font=('Helvetica', 14, 'bold')).pack()
+        tk.Label(empty_frame, text='Your bookings will appear here', bg='white', fg='#1F2937', font=('Helvetica', 10)).pack(pady=(4, 40))
+        return empty_frame
 
-    def _create_booking_card(self, booking):
-        """Create a booking card"""
-        card = tk.Frame(self.content_area, bg='white', highlightthickness=1, highlightbackground='#E5E7EB')
+    def _create_booking_card(self, parent):
+        """Create an empty booking card (filled by _bind_booking_card, recycled by the list)"""
+        card = tk.Frame(parent, bg='white', highlightthickness=1, highlightbackground='#E5E7EB')
         
         content = tk.Frame(card, bg='white')
         content.pack(fill='both', expand=True, padx=20, pady=16)
@@ -375,11 +363,52 @@ class MyBookingsPage(tk.Frame):
         resource_frame = tk.Frame(header_row, bg='white')
         resource_frame.pack(side='left', fill='x', expand=True)
         
-        resource_name = booking.get('resource_name', 'Unknown Resource')
-        resource_type = booking.get('resource_type', 'Resource')
+        card.resource_label = tk.Label(resource_frame, bg='white', fg='#1F2937', font=('Helvetica', 14, 'bold'))
+        card.resource_label.pack(anchor='w')
+        card.type_label = tk.Label(resource_frame, bg='white', fg='#1F2937', font=('Helvetica', 9))
+        card.type_label.pack(anchor='w', pady=(2, 0))
+        
+        # Status badge
+        card.status_badge = tk.Frame(header_row, highlightthickness=1)
+        card.status_badge.pack(side='right')
+        card.status_label = tk.Label(card.status_badge, font=('Helvetica', 9, 'bold'), padx=12, pady=4)
+        card.status_label.pack()
+        
+        # Booking details
+        details_frame = tk.Frame(content, bg='#F9FAFB')
+        details_frame.pack(fill='x', pady=(0, 12))
+        
+        details_content = tk.Frame(details_frame, bg='#F9FAFB')
+        details_content.pack(padx=16, pady=12)
         
-        tk.Label(resource_frame, text=resource_name, bg='white', fg='#1F2937', font=('Helvetica', 14, 'bold')).pack(anchor='w')
-        tk.Label(resource_frame, text=f"Type: {resource_type}", bg='white', fg='#1F2937', font=('Helvetica', 9)).pack(anchor='w', pady=(2, 0))
+        card.date_value = self._add_detail_item(details_content, '📅 Date:', '')
+        card.time_value = self._add_detail_item(details_content, '🕐 Time:', '')
+        card.attendees_value = self._add_detail_item(details_content, '👥 Attendees:', '')
+        
+        # Purpose
+        tk.Label(content, text='Purpose:', bg='white', fg='#1F2937', font=('Helvetica', 9, 'bold')).pack(anchor='w', pady=(0, 4))
+        card.purpose_label = tk.Label(content, bg='white', fg='#1F2937', font=('Helvetica', 10), wraplength=700, justify='left')
+        card.purpose_label.pack(anchor='w', pady=(0, 12))
+        
+        # Priority indicator (urgent bookings)
+        card.priority_frame = tk.Frame(content, bg='#FEF3C7', highlightthickness=1, highlightbackground='#F59E0B')
+        tk.Label(card.priority_frame, text='🔴 Urgent Priority', bg='#FEF3C7', fg='#1F2937', font=('Helvetica', 9, 'bold'), padx=12, pady=6).pack(anchor='w')
+        
+        # Actions (the status-dependent ones are shown by _bind_booking_card)
+        card.actions_frame = tk.Frame(content, bg='white')
+        card.actions_frame.pack(fill='x')
+        
+        create_secondary_button(card.actions_frame, text='View Details', command=lambda: self._show_booking_details(card.item)).pack(side='left', padx=(0, 8))
+        card.cancel_btn = create_danger_button(card.actions_frame, text='Cancel Booking', command=lambda: self._cancel_booking(card.item))
+        card.download_btn = create_success_button(card.actions_frame, text='📥 Download Confirmation', command=lambda: self._download_confirmation(card.item))
+        card.rebook_btn = create_primary_button(card.actions_frame, text='🔄 Rebook', command=lambda: self._rebook(card.item))
+        
+        return card
+
+    def _bind_booking_card(self, card, booking):
+        """Fill a booking card with a booking"""
+        card.resource_label.config(text=booking.get('resource_name', 'Unknown Resource'))
+        card.type_label.config(text=f"Type: {booking.get('resource_type', 'Resource')}")
         
         # Status badge
         status = booking.get('status', 'pending').lower()
@@ -391,67 +420,53 @@ class MyBookingsPage(tk.Frame):
         }
         
         status_text, status_color, status_bg = status_config.get(status, ('Unknown', '#6B7280', '#F3F4F6'))
-        
-        status_badge = tk.Frame(header_row, bg=status_bg, highlightthickness=1, highlightbackground=status_color)
-        status_badge.pack(side='right')
-        
-        tk.Label(status_badge, text=status_text, bg=status_bg, fg=status_color, font=('Helvetica', 9, 'bold'), padx=12, pady=4).pack()
-        
-        # Booking details
-        details_frame = tk.Frame(content, bg='#F9FAFB')
-        details_frame.pack(fill='x', pady=(0, 12))
-        
-        details_content = tk.Frame(details_frame, bg='#F9FAFB')
-        details_content.pack(padx=16, pady=12)
+        card.status_badge.config(bg=status_bg, highlightbackground=status_color)
+        card.status_label.config(text=status_text, bg=status_bg, fg=status_color)
         
         # Date and time
-        booking_date = self._format_date(booking.get('date', ''))
         start_time = booking.get('start_time', 'N/A')
         end_time = booking.get('end_time', 'N/A')
+        card.date_value.config(text=format_date(booking.get('date', '')))
+        card.time_value.config(text=f"{start_time} - {end_time}")
+        card.attendees_value.config(text=str(booking.get('attendees', 'N/A')))
         
-        self._add_detail_item(details_content, '📅 Date:', booking_date)
-        self._add_detail_item(details_content, '🕐 Time:', f"{start_time} - {end_time}")
-        self._add_detail_item(details_content, '👥 Attendees:', str(booking.get('attendees', 'N/A')))
-        
-        # Purpose
-        purpose = booking.get('purpose', 'No purpose provided')
-        tk.Label(content, text='Purpose:', bg='white', fg='#1F2937', font=('Helvetica', 9, 'bold')).pack(anchor='w', pady=(0, 4))
-        tk.Label(content, text=purpose, bg='white', fg='#1F2937', font=('Helvetica', 10), wraplength=700, justify='left').pack(anchor='w', pady=(0, 12))
+        card.purpose_label.config(text=booking.get('purpose', 'No purpose provided'))
         
         # Priority indicator
-        priority = booking.get('priority', 'normal')
-        if priority == 'urgent':
-            priority_frame = tk.Frame(content, bg='#FEF3C7', highlightthickness=1, highlightbackground='#F59E0B')
-            priority_frame.pack(fill='x', pady=(0, 12))
-            tk.Label(priority_frame, text='🔴 Urgent Priority', bg='#FEF3C7', fg='#1F2937', font=('Helvetica', 9, 'bold'), padx=12, pady=6).pack(anchor='w')
-        
-        # Actions
-        actions_frame = tk.Frame(content, bg='white')
-        actions_frame.pack(fill='x')
+        if booking.get('priority', 'normal') == 'urgent':
+            card.priority_frame.pack(fill='x', pady=(0, 12), before=card.actions_frame)
+        else:
+            card.priority_frame.pack_forget()
         
-        create_secondary_button(actions_frame, text='View Details', command=lambda: self._show_booking_details(booking)).pack(side='left', padx=(0, 8))
+        # Conditional actions based on status (packed in order after View Details)
+        for button in (card.cancel_btn, card.download_btn, card.rebook_btn):
+            button.canvas.pack_forget()
         
-        # Conditional actions based on status
         if status in ['pending', 'approved']:
             # Check if booking date hasn't passed
-            booking_date_obj = self._parse_date(booking.get('date', ''))
+            booking_date_obj = parse_date(booking.get('date', ''))
             if booking_date_obj and booking_date_obj >= datetime.now().date():
-                create_danger_button(actions_frame, text='Cancel Booking', command=lambda: self._cancel_booking(booking)).pack(side='left', padx=(0, 8))
+                card.cancel_btn.pack(side='left', padx=(0, 8))
         
         if status == 'approved':
-            create_success_button(actions_frame, text='📥 Download Confirmation', command=lambda: self._download_confirmation(booking)).pack(side='left', padx=(0, 8))
+            card.download_btn.pack(side='left', padx=(0, 8))
         
         if status == 'rejected':
-            create_primary_button(actions_frame, text='🔄 Rebook', command=lambda: self._rebook(booking)).pack(side='left', padx=(0, 8))
-        
-        return card
+            card.rebook_btn.pack(side='left', padx=(0, 8))
 
     def _add_detail_item(self, parent, label, value):
         """Add detail item"""
         frame = tk.Frame(parent, bg='#F9FAFB')
         frame.pack(side='left', padx=(0, 20))
         tk.Label(frame, text=label, bg='#F9FAFB', fg='#1F2937', font=('Helvetica', 9)).pack(side='left', padx=(0, 4))
-        tk.Label(frame, text=value, bg='#F9FAFB', fg='#1F2937', font=('Helvetica', 9, 'bold')).pack(side='left')
+        value_label = tk.Label(frame, text=value, bg='#F9FAFB', fg='#1F2937', font=('Helvetica', 9, 'bold'))
+        value_label.pack(side='left')
+        return value_label
+
+    def load_page(self):
+        """Reload data abandoned when the page was hidden before it arrived"""
+        if get_executor().was_interrupted(self):
+            self._load_bookings()
 
     def _load_bookings(self):
         """Load bookings from API"""
@@ -462,30 +477,37 @@ class MyBookingsPage(tk.Frame):
                 # Load all bookings
                 self.all_bookings = self.api.get('bookings/my') or []
                 
-                self.after(0, self._filter_and_render)
+                deliver(self, self._filter_and_render)
             except Exception as e:
                 error_msg = str(e)
                 def show_error():
                     messagebox.showerror('Error', f'Failed to load bookings: {error_msg}')
                     self.all_bookings = []
                     self._filter_and_render()
-                self.after(0, show_error)
+                deliver(self, show_error)
         
-        threading.Thread(target=worker, daemon=True).start()
+        run_async(self, worker)
 
     def _show_loading(self):
         """Show loading indicator"""
+        if self.booking_list is not None and self.booking_list.winfo_exists():
+            self.booking_list.show_placeholder(self._build_loading_state)
+            return
+        
         for widget in self.content_area.winfo_children():
             widget.destroy()
+        self._build_loading_state(self.content_area).pack(fill='both', expand=True)
+
+    def _build_loading_state(self, parent):
+        """Build the loading indicator"""
+        loading_frame = tk.Frame(parent, bg=self.colors.get('background', '#ECF0F1'))
         
-        loading_frame = tk.Frame(self.content_area, bg=self.colors.get('background', '#ECF0F1'))
-        loading_frame.pack(fill='both', expand=True, pady=50)
-        
-        tk.Label(loading_frame, text='Loading bookings...', bg=self.colors.get('background', '#ECF0F1'), fg='#1F2937', font=('Helvetica', 12)).pack()
+        tk.Label(loading_frame, text='Loading bookings...', bg=self.colors.get('background', '#ECF0F1'), fg='#1F2937', font=('Helvetica', 12)).pack(pady=(50, 0))
         
         spinner = ttk.Progressbar(loading_frame, mode='indeterminate', length=300)
-        spinner.pack(pady=10)
+        spinner.pack(pady=(10, 50))
         spinner.start(10)
+        return loading_frame
 
     def _filter_and_render(self):
         """Filter bookings by current status and render"""
@@ -493,7 +515,7 @@ class MyBookingsPage(tk.Frame):
         self.filtered_bookings = [b for b in self.all_bookings if b.get('status', '').lower() == self.current_status]
         
         # Sort by date (newest first)
-        self.filtered_bookings.sort(key=lambda x: self._parse_date(x.get('date', '')) or datetime.min.date(), reverse=True)
+        self.filtered_bookings.sort(key=lambda x: parse_date(x.get('date', '')) or datetime.min.date(), reverse=True)
         
         # Render based on view mode
         if self.view_mode == 'list':
@@ -600,7 +622,7 @@ class MyBookingsPage(tk.Frame):
         # Details
         self._add_modal_detail(details_frame, '🏢 Resource:', booking.get('resource_name', 'N/A'))
         self._add_modal_detail(details_frame, '📋 Type:', booking.get('resource_type', 'N/A'))
-        self._add_modal_detail(details_frame, '📅 Date:', self._format_date(booking.get('date', '')))
+        self._add_modal_detail(details_frame, '📅 Date:', format_date(booking.get('date', '')))
         self._add_modal_detail(details_frame, '🕐 Start Time:', booking.get('start_time', 'N/A'))
         self._add_modal_detail(details_frame, '🕐 End Time:', booking.get('end_time', 'N/A'))
         self._add_modal_detail(details_frame, '👥 Attendees:', str(booking.get('attendees', 'N/A')))
@@ -661,19 +683,19 @@ class MyBookingsPage(tk.Frame):
                         messagebox.showinfo('Success', 'Booking cancelled successfully.')
                         self._load_bookings()
                     
-                    self.after(0, show_success)
+                    deliver(self, show_success)
                 except Exception as e:
                     def show_error():
                         messagebox.showerror('Error', f'Failed to cancel booking: {str(e)}')
-                    self.after(0, show_error)
+                    deliver(self, show_error)
             
-            threading.Thread(target=worker, daemon=True).start()
+            run_async(self, worker, interruptible=False)
 
     def _download_confirmation(self, booking):
         """Download booking confirmation"""
         messagebox.showinfo('Download Confirmation', 
                           f"Booking confirmation for '{booking.get('resource_name', 'Resource')}' would be downloaded as a PDF.\n\n"
-                          f"Date: {self._format_date(booking.get('date', ''))}\n"
+                          f"Date: {format_date(booking.get('date', ''))}\n"
                           f"Time: {booking.get('start_time', '')} - {booking.get('end_time', '')}")
 
     def _rebook(self, booking):
@@ -700,24 +722,3 @@ class MyBookingsPage(tk.Frame):
         """Hide tooltip"""
         if hasattr(self, 'tooltip'):
             self.tooltip.destroy()
-
-    def _format_date(self, date_str):
-        """Format date for display"""
-        date_obj = self._parse_date(date_str)
-        if date_obj:
-            return date_obj.strftime('%B %d, %Y')
-        return date_str or 'N/A'
-
-    def _parse_date(self, date_str):
-        """Parse date string"""
-        if not date_str:
-            return None
-        try:
-            for fmt in ('%Y-%m-%d', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d %H:%M:%S'):
-                try:
-                    return datetime.strptime(date_str[:10], '%Y-%m-%d').date()
-                except:
-                    continue
-        except:
-            pass
-        return None
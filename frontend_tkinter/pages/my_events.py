@@ -1,17 +1,21 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
 from datetime import datetime
 import csv
 from tkinter import filedialog
 
 from utils.api_client import APIClient
+from utils.models import Event
+from utils.task_executor import get_executor, run_async, deliver
 from utils.session_manager import SessionManager
 
 
 class MyEventsPage(tk.Frame):
     """My Events page with tabbed interface for event management."""
 
+    # Events decoded before the first cards are rendered
+    FIRST_SCREEN = 8
+
     def __init__(self, parent, controller):
         super().__init__(parent, bg=controller.colors.get('background', '#ECF0F1'))
         self.controller = controller
@@ -118,45 +122,64 @@ class MyEventsPage(tk.Frame):
         # Loading indicator
         self.loading_frame = tk.Frame(self.content, bg=self.colors.get('background', '#ECF0F1'))
 
+    def load_page(self):
+        """Reload data abandoned when the page was hidden before it arrived"""
+        if get_executor().was_interrupted(self):
+            self._load_events()
+
     def _load_events(self):
-        """Load events from API"""
+        """Load events from API (first cards shown while the rest arrive)"""
         # Show loading
         self._show_loading()
         
         def worker():
+            all_events = []
+            buckets = {'pending': [], 'approved': [], 'past': [], 'rejected': []}
             try:
-                # Load all organizer's events
-                self.all_events = self.api.get('events/my') or []
-                
-                # Categorize events
+                # Stream all organizer's events and categorize them as they are decoded
                 now = datetime.now()
-                self.pending_events = []
-                self.approved_events = []
-                self.past_events = []
-                self.rejected_events = []
-                
-                for event in self.all_events:
-                    status = (event.get('status') or 'pending').lower()
-                    end_time = self._parse_dt(event.get('end_time'))
+                for row in self.api.get_stream('events/my'):
+                    event = Event.from_row(row)
+                    all_events.append(event)
+                    status = event.status or 'pending'
                     
                     if status == 'pending':
-                        self.pending_events.append(event)
+                        buckets['pending'].append(event)
                     elif status == 'rejected':
-                        self.rejected_events.append(event)
-                    elif end_time and end_time < now:
-                        self.past_events.append(event)
+                        buckets['rejected'].append(event)
+                    elif event.end and event.end < now:
+                        buckets['past'].append(event)
                     else:
-                        self.approved_events.append(event)
+                        buckets['approved'].append(event)
+                    
+                    if len(all_events) == self.FIRST_SCREEN:
+                        # Render the first screenful before the whole list is decoded
+                        deliver(self, self._show_events, list(all_events),
+                                {tab: list(rows) for tab, rows in buckets.items()}, True)
                 
             except Exception as e:
                 def show_error():
                     messagebox.showerror('Error', f'Failed to load events: {str(e)}')
-                self.after(0, show_error)
+                deliver(self, show_error)
+                deliver(self, lambda: self._switch_tab(self.current_tab))
+                return
             
             # Render content
-            self.after(0, lambda: self._switch_tab(self.current_tab))
+            deliver(self, self._show_events, all_events, buckets, False)
         
-        threading.Thread(target=worker, daemon=True).start()
+        run_async(self, worker)
+
+    def _show_events(self, all_events, buckets, more_coming):
+        """Show categorized events (more_coming: the list is still streaming)"""
+        self.all_events = all_events
+        self.pending_events = buckets['pending']
+        self.approved_events = buckets['approved']
+        self.past_events = buckets['past']
+        self.rejected_events = buckets['rejected']
+        self._switch_tab(self.current_tab)
+        
+        if more_coming:
+            tk.Label(self.content, text='Loading more events...', bg=self.colors.get('background', '#ECF0F1'), fg='#6B7280', font=('Helvetica', 10)).pack(pady=(0, 12))
 
     def _show_loading(self):
         """Show loading indicator"""
@@ -374,7 +397,8 @@ class MyEventsPage(tk.Frame):
         
         def load_registrations():
             try:
-                registrations = self.api.get(f'events/{event_id}/registrations') or []
+                # Shared loader: reuses registrations the dashboard just loaded
+                registrations = self.api.registrations_loader().load(event_id).result() or []
                 
                 def render():
                     loading_label.destroy()
@@ -425,14 +449,14 @@ class MyEventsPage(tk.Frame):
                     # Close button
                     tk.Button(modal, text='Close', command=modal.destroy, bg='#6B7280', fg='white', relief='flat', font=('Helvetica', 10), padx=24, pady=10).pack(pady=(0, 16))
                 
-                modal.after(0, render)
+                deliver(modal, render)
                 
             except Exception as e:
                 def show_error():
                     loading_label.config(text=f'Error: {str(e)}')
-                modal.after(0, show_error)
+                deliver(modal, show_error)
         
-        threading.Thread(target=load_registrations, daemon=True).start()
+        run_async(self, load_registrations)
 
     def _download_attendees(self, event):
         """Download attendee list as CSV"""
@@ -442,7 +466,7 @@ class MyEventsPage(tk.Frame):
             return
         
         try:
-            registrations = self.api.get(f'events/{event_id}/registrations') or []
+            registrations = self.api.registrations_loader().load(event_id).result() or []
             
             if not registrations:
                 messagebox.showinfo('No Data', 'No registrations to export')
@@ -601,19 +625,6 @@ class MyEventsPage(tk.Frame):
 
     def _is_past_event(self, event):
         """Check if event is in the past"""
-        end_time = self._parse_dt(event.get('end_time'))
-        if end_time:
-            return end_time < datetime.now()
+        if event.end:
+            return event.end < datetime.now()
         return False
-
-    @staticmethod
-    def _parse_dt(text):
-        """Parse datetime string"""
-        if not text:
-            return None
-        for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d"):
-            try:
-                return datetime.strptime(text[:19], fmt)
-            except Exception:
-                continue
-        return None
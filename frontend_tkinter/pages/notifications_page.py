@@ -1,11 +1,16 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
 from datetime import datetime, timedelta
 
+from utils.datetime_service import format_relative, parse_date
 from utils.api_client import APIClient
+from utils.task_executor import get_executor, run_async, deliver
+from utils.request_scheduler import Priority, request_priority
+from utils.cursor_feed import CursorFeed
 from utils.session_manager import SessionManager
 from utils.canvas_button import bind_mousewheel, create_primary_button, create_secondary_button, create_success_button
+from components.feed_view import FeedView
+from components.virtual_list import CardPool
 
 
 class NotificationsPage(tk.Frame):
@@ -27,13 +32,17 @@ class NotificationsPage(tk.Frame):
             'background': '#ECF0F1'
         }
         
-        # Data
-        self.notifications = []
-        self.filtered_notifications = []
-        
         # Filter
         self.filter_var = tk.StringVar(value='all')
         
+        # Data: notifications are loaded page by page as the user scrolls;
+        # the counts come from separate total-only queries
+        self.feed = CursorFeed(self, self._notifications_query(), page_size=20,
+                               max_pages=5, on_error=self._on_feed_error)
+        self.total_count = None
+        self.unread_count = None
+        self._samples = None  # Demo notifications, once the API had none
+        
         # Auto-refresh
         self.auto_refresh_enabled = True
         self.refresh_interval = 30000  # 30 seconds
@@ -104,7 +113,6 @@ class NotificationsPage(tk.Frame):
         
         self.content_area = tk.Frame(canvas, bg=self.colors.get('background', '#ECF0F1'))
         
-        canvas.configure(yscrollcommand=scrollbar.set)
         scrollbar.grid(row=2, column=1, sticky='ns')
         canvas.grid(row=2, column=0, sticky='nsew', padx=30, pady=(12, 20))
         
@@ -118,43 +126,111 @@ class NotificationsPage(tk.Frame):
         
         # Enable mousewheel/trackpad scrolling
         bind_mousewheel(canvas, self.content_area)
+        
+        # One frame per loaded page; the feed adds pages while scrolling and
+        # cards of dropped pages are recycled for new ones
+        self.card_pool = CardPool(self.content_area, self._create_notification_card, self._bind_notification_card)
+        self.feed_view = FeedView(canvas, scrollbar, self.content_area, self.feed, self._render_page, bg=self.colors.get('background', '#ECF0F1'), pool=self.card_pool)
+
+    def load_page(self):
+        """Reload data abandoned when the page was hidden before it arrived"""
+        if get_executor().was_interrupted(self):
+            self._load_notifications()
+
+    def _load_notifications(self, background=False):
+        """
+        Load the first page of notifications and the counts
+        
+        Args:
+            background: Auto-refresh poll; yields to interactive requests,
+                keeps the current list if it fails and only reloads when the
+                newest notifications changed
+        """
+        if background:
+            self._poll_notifications()
+            return
+        self._samples = None
+        self.count_label.config(text='Loading...')
+        self._start_feed()
+        self._load_counts()
+
+    def _start_feed(self):
+        """(Re)start the feed for the current filter"""
+        self.feed_view.clear()
+        self.feed.start(self._notifications_query(), rows=self._samples)
+
+    def _notifications_query(self):
+        """Query for the current filter, newest first"""
+        query = self.api.query('notifications').order_by('-created_at')
+        filter_type = self.filter_var.get()
+        if filter_type == 'unread':
+            query = query.where(read=False)
+        elif filter_type == 'read':
+            query = query.where(read=True)
+        return query
 
-    def _load_notifications(self):
-        """Load notifications from API"""
-        self._show_loading()
+    def _load_counts(self, priority=Priority.PREFETCH):
+        """Fetch the total and unread counts (one row each, not the lists)"""
+        if self._samples is not None:
+            self._count_samples()
+            return
         
         def worker():
             try:
-                # Try to fetch notifications from API
-                self.notifications = self.api.get('notifications') or []
-                if not self.notifications:
-                    # If API returns empty or None, use sample data
-                    self.notifications = self._get_sample_notifications()
-                self.after(0, self._apply_filter_and_render)
+                with request_priority(priority):
+                    total = self.api.query('notifications').paginate(1, 1).fetch().total
+                    unread = self.api.query('notifications').where(read=False).paginate(1, 1).fetch().total
             except Exception as e:
-                # On any error, use sample data and optionally show error
-                print(f"Failed to load notifications from API: {e}")
-                def show_with_samples():
-                    # Don't show error popup - just use sample data silently
-                    self.notifications = self._get_sample_notifications()
-                    self._apply_filter_and_render()
-                self.after(0, show_with_samples)
+                print(f"Failed to load notification counts: {e}")
+                return
+            
+            def done():
+                if self._samples is None:
+                    self.total_count, self.unread_count = total, unread
+                    self._update_count_label()
+            deliver(self, done)
         
-        threading.Thread(target=worker, daemon=True).start()
+        run_async(self, worker)
 
-    def _show_loading(self):
-        """Show loading indicator"""
-        for widget in self.content_area.winfo_children():
-            widget.destroy()
-        
-        loading_frame = tk.Frame(self.content_area, bg=self.colors.get('background', '#ECF0F1'))
-        loading_frame.pack(fill='both', expand=True, pady=50)
+    def _poll_notifications(self):
+        """Reload when the newest notifications changed (auto-refresh)"""
+        if self._samples is not None or self.feed.loading or not self.feed_view.at_top():
+            return  # Don't move the list while the user is reading further down
+        shown = [(n.get('id'), n.get('read')) for n in self.feed.pages[0].items]
+        query = self.feed.query.after(None, limit=self.feed.page_size)
         
-        tk.Label(loading_frame, text='Loading notifications...', bg=self.colors.get('background', '#ECF0F1'), fg='#6B7280', font=('Helvetica', 12)).pack()
+        def worker():
+            try:
+                with request_priority(Priority.BACKGROUND):
+                    result = query.fetch()
+            except Exception:
+                return  # Keep what is on screen; the next poll retries
+            if [(n.get('id'), n.get('read')) for n in result.items] == shown:
+                return  # Unchanged since the last poll
+            
+            def reload():
+                self._start_feed()
+                self._load_counts(Priority.BACKGROUND)
+            deliver(self, reload)
         
-        spinner = ttk.Progressbar(loading_frame, mode='indeterminate', length=300)
-        spinner.pack(pady=10)
-        spinner.start(10)
+        run_async(self, worker)
+
+    def _on_feed_error(self, error):
+        """Fall back to the demo notifications when the API fails"""
+        print(f"Failed to load notifications from API: {error}")
+        if self._samples is None:
+            self._use_samples()
+
+    def _use_samples(self):
+        """Show the demo notifications instead of the API's"""
+        self._samples = self._get_sample_notifications()
+        self._count_samples()
+        self._start_feed()
+
+    def _count_samples(self):
+        self.total_count = len(self._samples)
+        self.unread_count = len([n for n in self._samples if not n.get('read', False)])
+        self._update_count_label()
 
     def _apply_filter(self, filter_type):
         """Apply notification filter"""
@@ -178,39 +254,32 @@ class NotificationsPage(tk.Frame):
             self.unread_btn.config(bg=secondary_color, fg='#374151')
             self.read_btn.config(bg=primary_color, fg='white')
         
-        self._apply_filter_and_render()
+        self._start_feed()
 
-    def _apply_filter_and_render(self):
-        """Filter notifications and render"""
-        filter_type = self.filter_var.get()
-        
-        if filter_type == 'all':
-            self.filtered_notifications = self.notifications.copy()
-        elif filter_type == 'unread':
-            self.filtered_notifications = [n for n in self.notifications if not n.get('read', False)]
-        elif filter_type == 'read':
-            self.filtered_notifications = [n for n in self.notifications if n.get('read', False)]
-        
-        self._render_notifications()
-
-    def _render_notifications(self):
-        """Render notifications grouped by date"""
-        # Clear content
-        for widget in self.content_area.winfo_children():
-            widget.destroy()
-        
-        # Update count
-        total = len(self.notifications)
-        unread = len([n for n in self.notifications if not n.get('read', False)])
+    def _update_count_label(self):
+        """Show the unread and total counts"""
+        if self.total_count is None or self.unread_count is None:
+            return
+        total = self.total_count
+        unread = self.unread_count
         
         if unread > 0:
             self.count_label.config(text=f'🔔 {unread} unread of {total} notification{"s" if total != 1 else ""}')
         else:
             self.count_label.config(text=f'✅ All caught up! ({total} notification{"s" if total != 1 else ""})')
-        
-        if not self.filtered_notifications:
+
+    def _render_page(self, frame, page):
+        """Render one loaded page of notifications grouped by date"""
+        if not page.items:
+            if page.index != 0:
+                return
+            if self._samples is None and self.filter_var.get() == 'all':
+                # No notifications from the API: show sample data
+                self.after_idle(self._use_samples)
+                return
+            
             # Empty state
-            empty_frame = tk.Frame(self.content_area, bg='white', highlightthickness=1, highlightbackground='#E5E7EB')
+            empty_frame = tk.Frame(frame, bg='white', highlightthickness=1, highlightbackground='#E5E7EB')
             empty_frame.pack(fill='both', expand=True, pady=20)
             
             icon = '✅' if self.filter_var.get() == 'unread' else '📭'
@@ -222,131 +291,142 @@ class NotificationsPage(tk.Frame):
             
             return
         
-        # Group notifications by date
-        grouped = self._group_notifications_by_date()
+        # Group continues from the page above, if it is loaded
+        above = [p for p in self.feed.pages if p.index == page.index - 1 and p.items]
+        group = self._date_group(above[0].items[-1]) if above else None
         
-        # Render groups
-        for group_name, notifications in grouped.items():
-            if not notifications:
-                continue
-            
-            # Group header
-            group_header = tk.Frame(self.content_area, bg=self.colors.get('background', '#ECF0F1'))
-            group_header.pack(fill='x', pady=(0, 8))
-            
-            tk.Label(group_header, text=group_name, bg=self.colors.get('background', '#ECF0F1'), fg='#6B7280', font=('Helvetica', 11, 'bold')).pack(anchor='w')
+        for notification in page.items:
+            name = self._date_group(notification)
+            if name != group:
+                # Group header
+                group_header = tk.Frame(frame, bg=self.colors.get('background', '#ECF0F1'))
+                group_header.pack(fill='x', pady=(0, 8))
+                
+                tk.Label(group_header, text=name, bg=self.colors.get('background', '#ECF0F1'), fg='#6B7280', font=('Helvetica', 11, 'bold')).pack(anchor='w')
+                group = name
             
-            # Notifications in group
-            for notification in notifications:
-                self._create_notification_card(notification)
+            card = self.card_pool.acquire(notification, frame)
+            card.pack(in_=frame, fill='x', pady=(0, 8))
 
-    def _group_notifications_by_date(self):
-        """Group notifications by date (Today, Yesterday, Earlier)"""
+    def _date_group(self, notification):
+        """Date group of a notification (Today, Yesterday, Earlier)"""
         today = datetime.now().date()
-        yesterday = today - timedelta(days=1)
-        
-        groups = {
-            'Today': [],
-            'Yesterday': [],
-            'Earlier': []
-        }
-        
-        for notification in self.filtered_notifications:
-            notif_date = self._parse_date(notification.get('created_at', ''))
-            
-            if notif_date:
-                if notif_date == today:
-                    groups['Today'].append(notification)
-                elif notif_date == yesterday:
-                    groups['Yesterday'].append(notification)
-                else:
-                    groups['Earlier'].append(notification)
-            else:
-                groups['Earlier'].append(notification)
-        
-        return groups
-
-    def _create_notification_card(self, notification):
-        """Create a notification card"""
-        is_read = notification.get('read', False)
-        notif_type = notification.get('type', 'general')
-        
-        # Card background
-        bg_color = 'white' if is_read else '#EFF6FF'
-        border_color = '#E5E7EB' if is_read else '#BFDBFE'
+        notif_date = parse_date(notification.get('created_at', ''))
         
-        card = tk.Frame(self.content_area, bg=bg_color, highlightthickness=1, highlightbackground=border_color)
-        card.pack(fill='x', pady=(0, 8))
+        if notif_date == today:
+            return 'Today'
+        if notif_date == today - timedelta(days=1):
+            return 'Yesterday'
+        return 'Earlier'
+
+    def _rerender_notification(self, notif_id):
+        """Redraw the loaded page holding a notification"""
+        for page in self.feed.pages:
+            if any(n.get('id') == notif_id for n in page.items):
+                self.feed_view.rerender(page)
+
+    def _create_notification_card(self, parent):
+        """Create an empty notification card (filled by _bind_notification_card, recycled by the pool)"""
+        card = tk.Frame(parent, highlightthickness=1)
         
-        content = tk.Frame(card, bg=bg_color)
+        content = tk.Frame(card)
         content.pack(fill='x', padx=16, pady=12)
         
         # Left section (icon + content)
-        left_section = tk.Frame(content, bg=bg_color)
+        left_section = tk.Frame(content)
         left_section.pack(side='left', fill='both', expand=True)
         
         # Icon and main content
-        main_row = tk.Frame(left_section, bg=bg_color)
+        main_row = tk.Frame(left_section)
         main_row.pack(fill='x')
         
         # Icon
-        icon_frame = tk.Frame(main_row, bg=bg_color)
+        icon_frame = tk.Frame(main_row)
         icon_frame.pack(side='left', padx=(0, 12))
         
-        icon, icon_bg = self._get_notification_icon(notif_type)
-        icon_container = tk.Frame(icon_frame, bg=icon_bg, width=40, height=40)
-        icon_container.pack()
-        icon_container.pack_propagate(False)
-        tk.Label(icon_container, text=icon, bg=icon_bg, font=('Helvetica', 18)).pack(expand=True)
+        card.icon_container = tk.Frame(icon_frame, width=40, height=40)
+        card.icon_container.pack()
+        card.icon_container.pack_propagate(False)
+        card.icon_label = tk.Label(card.icon_container, font=('Helvetica', 18))
+        card.icon_label.pack(expand=True)
         
         # Content
-        text_frame = tk.Frame(main_row, bg=bg_color)
+        text_frame = tk.Frame(main_row)
         text_frame.pack(side='left', fill='both', expand=True)
         
+        card.title_label = tk.Label(text_frame, fg='#1F2937', font=('Helvetica', 11, 'bold'), anchor='w', justify='left')
+        card.title_label.pack(anchor='w', fill='x')
+        
+        card.message_label = tk.Label(text_frame, fg='#6B7280', font=('Helvetica', 10), anchor='w', justify='left', wraplength=600)
+        card.timestamp_label = tk.Label(text_frame, fg='#9CA3AF', font=('Helvetica', 8))
+        card.timestamp_label.pack(anchor='w', pady=(4, 0))
+        
+        # Related action link
+        card.action_link = tk.Label(text_frame, fg=self.colors.get('secondary', '#3498DB'), font=('Helvetica', 9, 'underline'), cursor='hand2')
+        card.action_link.bind('<Button-1>', lambda e: self._handle_action(card.item))
+        
+        # Right section (action buttons)
+        right_section = tk.Frame(content)
+        right_section.pack(side='right', padx=(12, 0))
+        
+        # Mark as read button (unread only)
+        card.read_btn = tk.Button(right_section, text='✓', command=lambda: self._mark_as_read(card.item), bg='#E0E7FF', fg=self.colors.get('secondary', '#3498DB'), relief='flat', font=('Helvetica', 10, 'bold'), width=3, height=1)
+        self._create_tooltip(card.read_btn, 'Mark as read')
+        
+        # Delete button
+        card.delete_btn = tk.Button(right_section, text='🗑️', command=lambda: self._delete_notification(card.item), bg='#FEF2F2', fg=self.colors.get('danger', '#E74C3C'), relief='flat', font=('Helvetica', 10), width=3, height=1)
+        card.delete_btn.pack()
+        self._create_tooltip(card.delete_btn, 'Delete')
+        
+        # Widgets that take the card background (white when read, blue when unread)
+        card.tinted = [card, content, left_section, main_row, icon_frame, text_frame, right_section,
+                       card.title_label, card.message_label, card.timestamp_label, card.action_link]
+        return card
+
+    def _bind_notification_card(self, card, notification):
+        """Fill a notification card with a notification"""
+        is_read = notification.get('read', False)
+        
+        # Card background
+        bg_color = 'white' if is_read else '#EFF6FF'
+        for widget in card.tinted:
+            widget.config(bg=bg_color)
+        card.config(highlightbackground='#E5E7EB' if is_read else '#BFDBFE')
+        
+        icon, icon_bg = self._get_notification_icon(notification.get('type', 'general'))
+        card.icon_container.config(bg=icon_bg)
+        card.icon_label.config(text=icon, bg=icon_bg)
+        
         # Title
         title_text = notification.get('title', 'Notification')
         if not is_read:
             title_text = '● ' + title_text
-        
-        title_label = tk.Label(text_frame, text=title_text, bg=bg_color, fg='#1F2937', font=('Helvetica', 11, 'bold'), anchor='w', justify='left')
-        title_label.pack(anchor='w', fill='x')
+        card.title_label.config(text=title_text)
         
         # Message
         message = notification.get('message', '')
         if message:
-            message_label = tk.Label(text_frame, text=message, bg=bg_color, fg='#6B7280', font=('Helvetica', 10), anchor='w', justify='left', wraplength=600)
-            message_label.pack(anchor='w', pady=(4, 0), fill='x')
+            card.message_label.config(text=message)
+            card.message_label.pack(anchor='w', pady=(4, 0), fill='x', before=card.timestamp_label)
+        else:
+            card.message_label.pack_forget()
         
         # Timestamp
-        timestamp = self._format_timestamp(notification.get('created_at', ''))
-        tk.Label(text_frame, text=timestamp, bg=bg_color, fg='#9CA3AF', font=('Helvetica', 8)).pack(anchor='w', pady=(4, 0))
+        card.timestamp_label.config(text=format_relative(notification.get('created_at', '')))
         
         # Related action link
         action_data = notification.get('action_data', {})
         if action_data:
-            action_text = action_data.get('text', 'View Details')
-            action_link = tk.Label(text_frame, text=f'→ {action_text}', bg=bg_color, fg=self.colors.get('secondary', '#3498DB'), font=('Helvetica', 9, 'underline'), cursor='hand2')
-            action_link.pack(anchor='w', pady=(6, 0))
-            action_link.bind('<Button-1>', lambda e: self._handle_action(notification))
-        
-        # Right section (action buttons)
-        right_section = tk.Frame(content, bg=bg_color)
-        right_section.pack(side='right', padx=(12, 0))
+            card.action_link.config(text=f"→ {action_data.get('text', 'View Details')}")
+            card.action_link.pack(anchor='w', pady=(6, 0))
+        else:
+            card.action_link.pack_forget()
         
         # Mark as read button
-        if not is_read:
-            read_btn = tk.Button(right_section, text='✓', command=lambda: self._mark_as_read(notification), bg='#E0E7FF', fg=self.colors.get('secondary', '#3498DB'), relief='flat', font=('Helvetica', 10, 'bold'), width=3, height=1)
-            read_btn.pack(pady=(0, 4))
-            
-            # Tooltip
-            self._create_tooltip(read_btn, 'Mark as read')
-        
-        # Delete button
-        delete_btn = tk.Button(right_section, text='🗑️', command=lambda: self._delete_notification(notification), bg='#FEF2F2', fg=self.colors.get('danger', '#E74C3C'), relief='flat', font=('Helvetica', 10), width=3, height=1)
-        delete_btn.pack()
-        
-        # Tooltip
-        self._create_tooltip(delete_btn, 'Delete')
+        if is_read:
+            card.read_btn.pack_forget()
+        else:
+            card.read_btn.pack(pady=(0, 4), before=card.delete_btn)
 
     def _get_notification_icon(self, notif_type):
         """Get icon and background color based on notification type"""
@@ -391,20 +471,35 @@ class NotificationsPage(tk.Frame):
         def worker():
             try:
                 self.api.put(f'notifications/{notif_id}/read', {})
-                
-                # Update local data
-                for n in self.notifications:
-                    if n.get('id') == notif_id:
-                        n['read'] = True
-                        break
-                
-                self.after(0, self._apply_filter_and_render)
+                deliver(self, self._on_marked_read, notification)
             except Exception as e:
                 def show_error():
                     messagebox.showerror('Error', f'Failed to mark as read: {str(e)}')
-                self.after(0, show_error)
+                deliver(self, show_error)
         
-        threading.Thread(target=worker, daemon=True).start()
+        run_async(self, worker, interruptible=False)
+
+    def _on_marked_read(self, notification):
+        """Update the loaded notification and counts after marking it read"""
+        if notification.get('read', False):
+            return
+        notif_id = notification.get('id')
+        notification['read'] = True
+        if self.unread_count:
+            self.unread_count -= 1
+        self._update_count_label()
+        
+        if self.filter_var.get() == 'unread':
+            self._remove_notification(notif_id)
+        else:
+            self._rerender_notification(notif_id)
+
+    def _remove_notification(self, notif_id):
+        """Take a notification out of the loaded pages"""
+        pages = [p for p in self.feed.pages if any(n.get('id') == notif_id for n in p.items)]
+        self.feed.remove(lambda n: n.get('id') == notif_id)
+        for page in pages:
+            self.feed_view.rerender(page)
 
     def _delete_notification(self, notification):
         """Delete a notification"""
@@ -418,20 +513,28 @@ class NotificationsPage(tk.Frame):
                 try:
                     self.api.delete(f'notifications/{notif_id}')
                     
-                    # Update local data
-                    self.notifications = [n for n in self.notifications if n.get('id') != notif_id]
+                    def done():
+                        # Update local data
+                        if self.total_count:
+                            self.total_count -= 1
+                        if self.unread_count and not notification.get('read', False):
+                            self.unread_count -= 1
+                        self._update_count_label()
+                        if self._samples is not None:
+                            self._samples = [n for n in self._samples if n.get('id') != notif_id]
+                        self._remove_notification(notif_id)
                     
-                    self.after(0, self._apply_filter_and_render)
+                    deliver(self, done)
                 except Exception as e:
                     def show_error():
                         messagebox.showerror('Error', f'Failed to delete notification: {str(e)}')
-                    self.after(0, show_error)
+                    deliver(self, show_error)
             
-            threading.Thread(target=worker, daemon=True).start()
+            run_async(self, worker, interruptible=False)
 
     def _mark_all_read(self):
         """Mark all notifications as read"""
-        unread_count = len([n for n in self.notifications if not n.get('read', False)])
+        unread_count = self.unread_count or 0
         
         if unread_count == 0:
             messagebox.showinfo('All Read', 'All notifications are already marked as read!')
@@ -445,21 +548,25 @@ class NotificationsPage(tk.Frame):
                 try:
                     self.api.put('notifications/mark-all-read', {})
                     
-                    # Update local data
-                    for n in self.notifications:
-                        n['read'] = True
-                    
                     def show_success():
                         messagebox.showinfo('Success', f'✅ Marked {unread_count} notification{"s" if unread_count > 1 else ""} as read!')
-                        self._apply_filter_and_render()
+                        # Update local data
+                        for n in self.feed.items + (self._samples or []):
+                            n['read'] = True
+                        self.unread_count = 0
+                        self._update_count_label()
+                        if self.filter_var.get() == 'unread':
+                            self._start_feed()
+                        else:
+                            self.feed_view.rerender()
                     
-                    self.after(0, show_success)
+                    deliver(self, show_success)
                 except Exception as e:
                     def show_error():
                         messagebox.showerror('Error', f'Failed to mark all as read: {str(e)}')
-                    self.after(0, show_error)
+                    deliver(self, show_error)
             
-            threading.Thread(target=worker, daemon=True).start()
+            run_async(self, worker, interruptible=False)
 
     def _handle_action(self, notification):
         """Handle notification action click"""
@@ -480,45 +587,11 @@ class NotificationsPage(tk.Frame):
     def _start_auto_refresh(self):
         """Start automatic refresh timer"""
         if self.auto_refresh_enabled:
-            self._load_notifications()
+            # Only poll while this page is the one on screen
+            if getattr(self.controller, 'current_page', None) is self:
+                self._load_notifications(background=True)
             self.after(self.refresh_interval, self._start_auto_refresh)
 
-    def _parse_date(self, date_str):
-        """Parse date string to date object"""
-        if not date_str:
-            return None
-        try:
-            return datetime.strptime(date_str[:10] if len(date_str) >= 10 else date_str, '%Y-%m-%d').date()
-        except:
-            return None
-
-    def _format_timestamp(self, timestamp_str):
-        """Format timestamp for display"""
-        if not timestamp_str:
-            return 'Just now'
-        
-        try:
-            timestamp = datetime.strptime(timestamp_str[:19] if len(timestamp_str) >= 19 else timestamp_str, '%Y-%m-%d %H:%M:%S')
-            now = datetime.now()
-            diff = now - timestamp
-            
-            if diff.seconds < 60:
-                return 'Just now'
-            elif diff.seconds < 3600:
-                minutes = diff.seconds // 60
-                return f'{minutes} minute{"s" if minutes > 1 else ""} ago'
-            elif diff.seconds < 86400:
-                hours = diff.seconds // 3600
-                return f'{hours} hour{"s" if hours > 1 else ""} ago'
-            elif diff.days == 1:
-                return 'Yesterday at ' + timestamp.strftime('%I:%M %p')
-            elif diff.days < 7:
-                return f'{diff.days} days ago'
-            else:
-                return timestamp.strftime('%b %d, %Y at %I:%M %p')
-        except:
-            return timestamp_str
-
     def _get_sample_notifications(self):
         """Get sample notifications for demo"""
         now = datetime.now()
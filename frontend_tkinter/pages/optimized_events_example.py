@@ -247,7 +247,8 @@ class OptimizedEventsPage(tk.Frame):
                 on_success=on_success,
                 on_error=on_error,
                 user_id=str(user['user_id']),
-                cache=True
+                cache=True,
+                owner=self
             )
             
             # Actually call paginated endpoint
@@ -474,7 +475,8 @@ class OptimizedEventsPage(tk.Frame):
                 data={},
                 on_success=on_success,
                 on_error=on_error,
-                user_id=str(user['user_id'])
+                user_id=str(user['user_id']),
+                owner=self
             )
         
         # Throttle the registration
@@ -1,9 +1,15 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
 from datetime import datetime
 
 from utils.api_client import APIClient
+from utils.task_executor import get_executor, run_async, deliver
+from utils.sync_manager import get_sync_manager
+from utils.request_scheduler import Priority, request_priority
+from utils.entity_store import get_entity_store, events_by_organizer, organized_by
+from utils.page_loader import PageLoader
+from utils.reconciler import KeyedRows, Snapshot, set_text
+from utils.treeview_adapter import TreeviewAdapter
 from utils.session_manager import SessionManager
 from utils.button_styles import ButtonStyles
 from utils.canvas_button import create_primary_button, create_secondary_button, create_success_button, create_danger_button, create_warning_button
@@ -23,11 +29,23 @@ class OrganizerDashboard(tk.Frame):
         self.event_registrations = {}
         self.resource_requests = []
         
+        # Shared entity store: my_events is a live query over it
+        self.store = get_entity_store()
+        self._my_events_query = None
+        
         # Auto-refresh tracking
         self.auto_refresh_enabled = True
         self.auto_refresh_interval = 30000  # 30 seconds
         self.refresh_timer = None
         self.current_view = 'dashboard'
+        
+        # Widgets patched by refreshes (set when their view is rendered)
+        self._dashboard_snapshot = Snapshot()
+        self._stat_labels = {}
+        self._scheduled_header = None
+        self._scheduled_rows = None
+        self._my_events_count = None
+        self._events_table = None
 
         # Layout: 1 row, 2 columns (sidebar, main)
         self.grid_rowconfigure(0, weight=1)
@@ -163,57 +181,60 @@ class OrganizerDashboard(tk.Frame):
     def _load_all_data_then(self, callback):
         self._show_spinner()
 
-        def worker():
-            errors = []
-            try:
-                # Get ALL events from backend
-                all_events = self.api.get('events') or []
-                
-                # Filter to show only events created by this organizer
-                user_data = self.session.get_user()
-                user_id = user_data.get('id') or user_data.get('user_id') if user_data else None
-                
-                if user_id:
-                    # Filter events where organizer_id matches current user's ID
-                    # Backend returns 'organizerId' (camelCase) in Event model
-                    self.my_events = [
-                        event for event in all_events 
-                        if event.get('organizerId') == user_id or event.get('organizer_id') == user_id
-                    ]
-                else:
-                    self.my_events = []
-            except Exception as e:
-                errors.append(('my_events', str(e)))
-                self.my_events = []
-            
-            # Load registrations for each event
-            for event in self.my_events:
-                event_id = event.get('id')
-                if event_id:
-                    try:
-                        registrations = self.api.get(f'events/{event_id}/registrations') or []
-                        self.event_registrations[event_id] = registrations
-                    except Exception as e:
-                        errors.append((f'registrations_{event_id}', str(e)))
-                        self.event_registrations[event_id] = []
-            
-            try:
-                # Resource requests endpoint may vary - placeholder
-                self.resource_requests = self.api.get('resources/requests') or []
-            except Exception as e:
-                errors.append(('resource_requests', str(e)))
-                self.resource_requests = []
-
-            def done():
-                self._hide_spinner()
-                if errors:
-                    # Show first error non-blocking
-                    self._info_banner(f"Some data failed to load: {errors[0][0]}: {errors[0][1]}")
-                callback()
-
-            self.after(0, done)
-
-        threading.Thread(target=worker, daemon=True).start()
+        def load_my_events():
+            # Events created by this organizer (filtered by the server, or
+            # locally if it ignores the filter), instead of every event
+            query = self._my_events()
+            if query is None:
+                return []
+            organizer_id = self._organizer_id()
+            result = self.api.query('events').where(organizerId=organizer_id).fetch()
+            self.store.load('events', result.items, complete=organized_by(organizer_id))
+            return query.rows
+
+        def load_registrations(my_events):
+            # Load registrations for all events together (one bulk request, or
+            # bounded parallel requests, instead of one round-trip per event)
+            event_ids = [event.get('id') for event in my_events if event.get('id')]
+            loader = self.api.registrations_loader()
+            loader.clear(*event_ids)  # always fresh here; primes the cache for other pages
+            return loader.load_many(event_ids)
+
+        def set_my_events(my_events):
+            self.my_events = my_events
+
+        def set_registrations(registrations):
+            if registrations is None:
+                return  # my_events failed
+            for event_id, rows in registrations.values.items():
+                self.event_registrations[event_id] = rows or []
+            for event_id in registrations.errors:
+                self.event_registrations[event_id] = []
+
+        def set_resource_requests(resource_requests):
+            self.resource_requests = resource_requests
+
+        # Resource requests don't depend on events, so they load alongside
+        loader = PageLoader(self)
+        loader.section('my_events', load_my_events, default=[], on_ready=set_my_events)
+        loader.section('registrations', load_registrations, depends_on=('my_events',),
+                       on_ready=set_registrations)
+        # Resource requests endpoint may vary - placeholder
+        loader.section('resource_requests', lambda: self.api.get('resources/requests') or [],
+                       default=[], on_ready=set_resource_requests)
+
+        def done(loader):
+            self._hide_spinner()
+            errors = list(loader.errors.items())
+            registrations = loader.values['registrations']
+            if registrations is not None:
+                errors += [(f'registrations_{event_id}', e) for event_id, e in registrations.errors.items()]
+            if errors:
+                # Show first error non-blocking
+                self._info_banner(f"Some data failed to load: {errors[0][0]}: {errors[0][1]}")
+            callback()
+
+        loader.start(on_complete=done)
 
     # Auto-refresh methods
     def _start_auto_refresh(self):
@@ -231,35 +252,54 @@ class OrganizerDashboard(tk.Frame):
         """Auto-refresh data in background"""
         if not self.auto_refresh_enabled:
             return
+        if getattr(self.controller, 'current_page', self) is not self:
+            return  # Hidden; load_page() restarts the cycle when shown again
         
         def worker():
             try:
-                # Silently refresh my events
-                all_events = self.api.get('events') or []
-                user_data = self.session.get_user()
-                user_id = user_data.get('id') or user_data.get('user_id') if user_data else None
-                
-                if user_id:
-                    self.my_events = [
-                        event for event in all_events 
-                        if event.get('organizerId') == user_id or event.get('organizer_id') == user_id
-                    ]
-                    
-                # Refresh view if needed (but NOT when user is creating an event)
-                if self.current_view == 'dashboard':
-                    self.after(0, self._render_dashboard)
-                elif self.current_view == 'my_events':
-                    self.after(0, self._render_my_events)
-                # Do NOT auto-refresh when on create_event, event_registrations, book_resources, etc.
-                # to avoid interrupting user input
-                    
+                # Polling yields to clicks: deferred (or dropped) while the
+                # user waits on an interactive request
+                with request_priority(Priority.BACKGROUND):
+                    # Silently pull event changes since the last sync; the store
+                    # notifies _on_my_events_changed if this organizer's events changed
+                    self.store.load('events', get_sync_manager().sync(self.api, 'events') or [], complete=True)
             except Exception:
                 pass  # Fail silently for background refresh
             
             # Schedule next refresh
-            self.after(0, self._schedule_refresh)
+            deliver(self, self._schedule_refresh)
         
-        threading.Thread(target=worker, daemon=True).start()
+        run_async(self, worker)
+    
+    def _my_events(self):
+        """Live store query for this organizer's events (None if not logged in)"""
+        if self._my_events_query is None:
+            user_id = self._organizer_id()
+            if not user_id:
+                return None
+            self._my_events_query = events_by_organizer(user_id)
+            self._my_events_query.subscribe(self._on_my_events_changed, owner=self)
+        return self._my_events_query
+    
+    def _organizer_id(self):
+        """Logged-in organizer's user id (None if not logged in)"""
+        user_data = self.session.get_user()
+        return user_data.get('id') or user_data.get('user_id') if user_data else None
+    
+    def _on_my_events_changed(self, my_events):
+        """Re-render when this organizer's events change (fetched by any page)"""
+        if not self.winfo_exists() or my_events is self.my_events:
+            return
+        self.my_events = my_events
+        # Do NOT re-render on create_event, event_registrations, book_resources, etc.
+        # to avoid interrupting user input
+        if self.current_view == 'dashboard':
+            if self._scheduled_rows is not None and self._scheduled_rows.parent.winfo_exists():
+                self._patch_dashboard()
+            else:
+                self._render_dashboard()
+        elif self.current_view == 'my_events':
+            self._patch_my_events()
     
     def _manual_refresh(self):
         """Manual refresh triggered by user"""
@@ -276,6 +316,12 @@ class OrganizerDashboard(tk.Frame):
         if self.refresh_timer:
             self.after_cancel(self.refresh_timer)
     
+    def load_page(self):
+        """Resume refreshing when the controller shows this page again"""
+        if get_executor().was_interrupted(self):
+            self._manual_refresh()
+        self._start_auto_refresh()
+    
     def destroy(self):
         """Override destroy to stop auto-refresh"""
         self._stop_auto_refresh()
@@ -312,19 +358,16 @@ class OrganizerDashboard(tk.Frame):
         for i in range(3):
             stats.grid_columnconfigure(i, weight=1)
 
-        def card(parent, title, value, color):
+        def card(parent, name, title, color):
             f = tk.Frame(parent, bg='white', highlightthickness=1, highlightbackground='#E5E7EB')
             tk.Label(f, text=title, bg='white', fg='#6B7280').pack(anchor='w', padx=12, pady=(10, 0))
-            tk.Label(f, text=str(value), bg='white', fg=color, font=('Helvetica', 20, 'bold')).pack(anchor='w', padx=12, pady=(0, 12))
+            self._stat_labels[name] = tk.Label(f, text='', bg='white', fg=color, font=('Helvetica', 20, 'bold'))
+            self._stat_labels[name].pack(anchor='w', padx=12, pady=(0, 12))
             return f
 
-        total_events = len(self.my_events)
-        pending_events = len([e for e in self.my_events if (e.get('status') or '').lower() == 'pending'])
-        active_events = len([e for e in self.my_events if (e.get('status') or '').lower() in ('approved', 'active')])
-
-        c1 = card(stats, 'Total Events Created', total_events, colors.get('secondary', '#3498DB'))
-        c2 = card(stats, 'Pending Approvals', pending_events, colors.get('warning', '#F39C12'))
-        c3 = card(stats, 'Active Events', active_events, colors.get('success', '#27AE60'))
+        c1 = card(stats, 'total', 'Total Events Created', colors.get('secondary', '#3498DB'))
+        c2 = card(stats, 'pending', 'Pending Approvals', colors.get('warning', '#F39C12'))
+        c3 = card(stats, 'active', 'Active Events', colors.get('success', '#27AE60'))
         c1.grid(row=0, column=0, sticky='ew', padx=(0, 8))
         c2.grid(row=0, column=1, sticky='ew', padx=8)
         c3.grid(row=0, column=2, sticky='ew', padx=(8, 0))
@@ -339,19 +382,16 @@ class OrganizerDashboard(tk.Frame):
         for i in range(3):
             status_cards.grid_columnconfigure(i, weight=1)
 
-        approved = len([e for e in self.my_events if (e.get('status') or '').lower() == 'approved'])
-        pending = len([e for e in self.my_events if (e.get('status') or '').lower() == 'pending'])
-        rejected = len([e for e in self.my_events if (e.get('status') or '').lower() == 'rejected'])
-
-        def status_card(parent, title, count, bg_color, text_color):
+        def status_card(parent, name, title, bg_color, text_color):
             f = tk.Frame(parent, bg=bg_color, highlightthickness=1, highlightbackground='#E5E7EB')
             tk.Label(f, text=title, bg=bg_color, fg=text_color, font=('Helvetica', 11)).pack(pady=(12, 4))
-            tk.Label(f, text=str(count), bg=bg_color, fg=text_color, font=('Helvetica', 24, 'bold')).pack(pady=(0, 12))
+            self._stat_labels[name] = tk.Label(f, text='', bg=bg_color, fg=text_color, font=('Helvetica', 24, 'bold'))
+            self._stat_labels[name].pack(pady=(0, 12))
             return f
 
-        sc1 = status_card(status_cards, 'Approved', approved, '#D1FAE5', '#065F46')
-        sc2 = status_card(status_cards, 'Pending', pending, '#FEF3C7', '#92400E')
-        sc3 = status_card(status_cards, 'Rejected', rejected, '#FEE2E2', '#991B1B')
+        sc1 = status_card(status_cards, 'approved', 'Approved', '#D1FAE5', '#065F46')
+        sc2 = status_card(status_cards, 'pending_status', 'Pending', '#FEF3C7', '#92400E')
+        sc3 = status_card(status_cards, 'rejected', 'Rejected', '#FEE2E2', '#991B1B')
         sc1.grid(row=0, column=0, sticky='ew', padx=(0, 8))
         sc2.grid(row=0, column=1, sticky='ew', padx=8)
         sc3.grid(row=0, column=2, sticky='ew', padx=(8, 0))
@@ -382,52 +422,78 @@ class OrganizerDashboard(tk.Frame):
         calendar_frame = tk.Frame(calendar, bg='white', highlightthickness=1, highlightbackground='#E5E7EB')
         calendar_frame.pack(fill='both', expand=True)
 
+        # Header (hidden while there are no events)
+        self._scheduled_header = tk.Frame(calendar_frame, bg='#F9FAFB')
+        for i, h in enumerate(['Event', 'Date & Time', 'Venue', 'Status', 'Registrations']):
+            tk.Label(self._scheduled_header, text=h, bg='#F9FAFB', fg='#374151', font=('Helvetica', 10, 'bold')).grid(row=0, column=i, sticky='w', padx=8, pady=8)
+            self._scheduled_header.grid_columnconfigure(i, weight=1 if i == 0 else 0)
+        
+        # Event rows
+        scheduled_list = tk.Frame(calendar_frame, bg='white')
+        scheduled_list.pack(fill='x')
+        self._scheduled_rows = KeyedRows(scheduled_list, self._create_scheduled_row,
+                                         signature=self._scheduled_row_values, empty='No scheduled events',
+                                         pack={'fill': 'x', 'padx': 4, 'pady': 2})
+
+        self._dashboard_snapshot.reset()
+        self._patch_dashboard()
+
+    def _patch_dashboard(self):
+        """Show the latest data in the dashboard widgets (nothing if unchanged)"""
+        if not self._dashboard_snapshot.changed(self.my_events, dict(self.event_registrations)):
+            return
+        statuses = [e.status for e in self.my_events]
+        set_text(self._stat_labels['total'], len(self.my_events))
+        set_text(self._stat_labels['pending'], statuses.count('pending'))
+        set_text(self._stat_labels['active'], sum(1 for status in statuses if status in ('approved', 'active')))
+        set_text(self._stat_labels['approved'], statuses.count('approved'))
+        set_text(self._stat_labels['pending_status'], statuses.count('pending'))
+        set_text(self._stat_labels['rejected'], statuses.count('rejected'))
+
         # Sort events by date
-        events_sorted = sorted(self.my_events, key=lambda e: self._parse_dt(e.get('start_time')) or datetime.max)
-        
-        if not events_sorted:
-            tk.Label(calendar_frame, text='No scheduled events', bg='white', fg='#6B7280').pack(padx=12, pady=12)
+        events_sorted = sorted(self.my_events, key=lambda e: e.start or datetime.max)
+        if events_sorted and not self._scheduled_header.winfo_manager():
+            self._scheduled_header.pack(fill='x', before=self._scheduled_rows.parent)
+        elif not events_sorted:
+            self._scheduled_header.pack_forget()
+        self._scheduled_rows.reconcile(events_sorted)
+
+    def _scheduled_row_values(self, ev):
+        """Texts of a scheduled event row (its signature: registrations count too)"""
+        # Handle both dict and list response formats for registration count
+        registrations_data = self.event_registrations.get(ev.get('id'), [])
+        if isinstance(registrations_data, dict):
+            reg_count = registrations_data.get('count', 0)
+        elif isinstance(registrations_data, list):
+            reg_count = len(registrations_data)
         else:
-            # Header
-            header = tk.Frame(calendar_frame, bg='#F9FAFB')
-            header.pack(fill='x')
-            for i, h in enumerate(['Event', 'Date & Time', 'Venue', 'Status', 'Registrations']):
-                tk.Label(header, text=h, bg='#F9FAFB', fg='#374151', font=('Helvetica', 10, 'bold')).grid(row=0, column=i, sticky='w', padx=8, pady=8)
-                header.grid_columnconfigure(i, weight=1 if i == 0 else 0)
-
-            # Event rows
-            for ev in events_sorted:
-                row = tk.Frame(calendar_frame, bg='white')
-                row.pack(fill='x', padx=4, pady=2)
-                
-                title = ev.get('title') or 'Untitled Event'
-                start_time = ev.get('start_time') or 'N/A'
-                venue = ev.get('venue') or 'N/A'
-                status = (ev.get('status') or 'pending').title()
-                event_id = ev.get('id')
-                
-                # Handle both dict and list response formats for registration count
-                registrations_data = self.event_registrations.get(event_id, [])
-                if isinstance(registrations_data, dict):
-                    reg_count = registrations_data.get('count', 0)
-                elif isinstance(registrations_data, list):
-                    reg_count = len(registrations_data)
-                else:
-                    reg_count = 0
-                
-                # Status color
-                status_colors = {
-                    'Approved': '#27AE60',
-                    'Pending': '#F39C12',
-                    'Rejected': '#E74C3C'
-                }
-                status_color = status_colors.get(status, '#6B7280')
-                
-                tk.Label(row, text=title, bg='white', font=('Helvetica', 10, 'bold')).grid(row=0, column=0, sticky='w', padx=8, pady=8)
-                tk.Label(row, text=start_time, bg='white', fg='#6B7280').grid(row=0, column=1, sticky='w', padx=8)
-                tk.Label(row, text=venue, bg='white', fg='#6B7280').grid(row=0, column=2, sticky='w', padx=8)
-                tk.Label(row, text=status, bg='white', fg=status_color, font=('Helvetica', 10, 'bold')).grid(row=0, column=3, sticky='w', padx=8)
-                tk.Label(row, text=f'{reg_count} attendees', bg='white', fg='#6B7280').grid(row=0, column=4, sticky='w', padx=8)
+            reg_count = 0
+        return (
+            ev.get('title') or 'Untitled Event',
+            ev.get('start_time') or 'N/A',
+            ev.get('venue') or 'N/A',
+            (ev.get('status') or 'pending').title(),
+            reg_count,
+        )
+
+    def _create_scheduled_row(self, parent, ev):
+        title, start_time, venue, status, reg_count = self._scheduled_row_values(ev)
+        row = tk.Frame(parent, bg='white')
+        
+        # Status color
+        status_colors = {
+            'Approved': '#27AE60',
+            'Pending': '#F39C12',
+            'Rejected': '#E74C3C'
+        }
+        status_color = status_colors.get(status, '#6B7280')
+        
+        tk.Label(row, text=title, bg='white', font=('Helvetica', 10, 'bold')).grid(row=0, column=0, sticky='w', padx=8, pady=8)
+        tk.Label(row, text=start_time, bg='white', fg='#6B7280').grid(row=0, column=1, sticky='w', padx=8)
+        tk.Label(row, text=venue, bg='white', fg='#6B7280').grid(row=0, column=2, sticky='w', padx=8)
+        tk.Label(row, text=status, bg='white', fg=status_color, font=('Helvetica', 10, 'bold')).grid(row=0, column=3, sticky='w', padx=8)
+        tk.Label(row, text=f'{reg_count} attendees', bg='white', fg='#6B7280').grid(row=0, column=4, sticky='w', padx=8)
+        return row
 
     def _render_create_event(self):
         self.current_view = 'create_event'
@@ -562,14 +628,16 @@ class OrganizerDashboard(tk.Frame):
             font=('Helvetica', 14, 'bold')
         ).pack(side='left')
         
-        tk.Label(
+        self._my_events_count = tk.Label(
             header_frame, 
             text=f'({len(self.my_events)} events)', 
             bg=self.controller.colors.get('background', '#ECF0F1'), 
             font=('Helvetica', 12),
             fg='#6B7280'
-        ).pack(side='left', padx=(8, 0))
+        )
+        self._my_events_count.pack(side='left', padx=(8, 0))
         
+        self._events_table = None
         if not self.my_events:
             no_events = tk.Frame(self.content, bg='white', highlightthickness=1, highlightbackground='#E5E7EB')
             no_events.pack(fill='both', expand=True, padx=16, pady=(0, 16))
@@ -577,7 +645,16 @@ class OrganizerDashboard(tk.Frame):
             first_event_btn = create_primary_button(no_events, 'Create Your First Event', self._render_create_event, width=200, height=40)
             first_event_btn.pack(pady=(0, 40))
         else:
-            self._render_events_table(self.my_events, show_actions=True)
+            self._events_table = self._render_events_table(self.my_events, show_actions=True)
+
+    def _patch_my_events(self):
+        """Show the latest events in the My Events table (in place unless it was or becomes empty)"""
+        table = self._events_table
+        if not self.my_events or table is None or not table.tree.winfo_exists():
+            self._render_my_events()
+            return
+        set_text(self._my_events_count, f'({len(self.my_events)} events)')
+        table.set_rows(self.my_events)
 
     def _render_event_registrations(self):
         self.current_view = 'event_registrations'
@@ -749,7 +826,13 @@ class OrganizerDashboard(tk.Frame):
         tk.Label(info_container, text='Profile editing coming soon', bg='white', fg='#1F2937').pack(pady=(8, 0))
 
     def _render_events_table(self, events, show_actions=False):
-        """Render events table using simple Treeview"""
+        """
+        Render events table using simple Treeview
+        
+        Returns:
+            TreeviewAdapter filling the table (set_rows() updates it in
+            place), or None if there are no events
+        """
         
         # Simple container
         frame = tk.Frame(self.content, bg='white', highlightthickness=1, highlightbackground='#E5E7EB')
@@ -799,16 +882,16 @@ class OrganizerDashboard(tk.Frame):
         tree.column('venue', width=120)
         tree.column('status', width=100)
         
-        # Insert data
-        for e in events:
-            tree.insert('', 'end', values=(
-                e.get('id', ''),
-                e.get('title', 'Untitled'),
-                e.get('startTime', e.get('start_time', '')),
-                e.get('endTime', e.get('end_time', '')),
-                e.get('venue', ''),
-                e.get('status', 'pending')
-            ))
+        # Insert data (refreshes only touch the rows that changed)
+        table = TreeviewAdapter(tree, lambda e: (
+            e.get('id', ''),
+            e.get('title', 'Untitled'),
+            e.get('startTime', e.get('start_time', '')),
+            e.get('endTime', e.get('end_time', '')),
+            e.get('venue', ''),
+            e.get('status', 'pending')
+        ))
+        table.set_rows(events)
         
         # Scrollbar
         scroll = ttk.Scrollbar(frame, orient='vertical', command=tree.yview)
@@ -833,6 +916,7 @@ class OrganizerDashboard(tk.Frame):
             create_primary_button(btn_frame, '📋 View', lambda: self._show_event_details(get_selected()) if get_selected() else None, 100, 36).pack(side='left', padx=5)
             create_secondary_button(btn_frame, '✏️ Edit', lambda: self._edit_event(get_selected()) if get_selected() else None, 90, 36).pack(side='left', padx=5)
             create_danger_button(btn_frame, '🗑️ Delete', lambda: self._delete_event(get_selected()) if get_selected() else None, 100, 36).pack(side='left', padx=5)
+        return table
     
     def _show_event_details(self, event_id):
         """Show detailed view of a specific event"""
@@ -944,35 +1028,12 @@ class OrganizerDashboard(tk.Frame):
         venue_entry.insert(0, event.get('venue', ''))
         venue_entry.pack(fill='x', pady=(0, 15))
         
-        # Extract and parse existing dates
-        start_time_str = event.get('startTime', '')
-        end_time_str = event.get('endTime', '')
-        
-        # Parse existing datetime (format: 2025-11-20T09:00:00)
-        from datetime import datetime
-        try:
-            if start_time_str and 'T' in start_time_str:
-                start_dt = datetime.fromisoformat(start_time_str)
-                start_date_val = start_dt.strftime('%Y-%m-%d')
-                start_time_val = start_dt.strftime('%H:%M')
-            else:
-                start_date_val = ''
-                start_time_val = '09:00'
-        except:
-            start_date_val = ''
-            start_time_val = '09:00'
-        
-        try:
-            if end_time_str and 'T' in end_time_str:
-                end_dt = datetime.fromisoformat(end_time_str)
-                end_date_val = end_dt.strftime('%Y-%m-%d')
-                end_time_val = end_dt.strftime('%H:%M')
-            else:
-                end_date_val = ''
-                end_time_val = '17:00'
-        except:
-            end_date_val = ''
-            end_time_val = '17:00'
+        # Existing dates (parsed once when the event was loaded)
+        start_dt, end_dt = event.start, event.end
+        start_date_val = start_dt.strftime('%Y-%m-%d') if start_dt else ''
+        start_time_val = start_dt.strftime('%H:%M') if start_dt else '09:00'
+        end_date_val = end_dt.strftime('%Y-%m-%d') if end_dt else ''
+        end_time_val = end_dt.strftime('%H:%M') if end_dt else '17:00'
         
         # Start Date
         tk.Label(main_frame, text='Start Date *', bg='white', fg='#374151',
@@ -1154,7 +1215,8 @@ class OrganizerDashboard(tk.Frame):
         if not q:
             self._render_my_events()
             return
-        filtered = [e for e in self.my_events if q in (e.get('title') or '').lower()]
+        filtered = [e for e in self.my_events if q in e.search_key]
+        self.current_view = 'search_results'
         self._clear_content()
         tk.Label(self.content, text=f"Search results for '{q}'", bg=self.controller.colors.get('background', '#ECF0F1'), font=('Helvetica', 14, 'bold')).pack(anchor='w', padx=16, pady=(16, 8))
         self._render_events_table(filtered, show_actions=True)
@@ -1199,14 +1261,3 @@ class OrganizerDashboard(tk.Frame):
                 popular_event = event.get('title', 'Untitled')
         
         return f'{popular_event} ({max_regs} regs)' if max_regs > 0 else 'N/A'
-
-    @staticmethod
-    def _parse_dt(text):
-        if not text:
-            return None
-        for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d"):
-            try:
-                return datetime.strptime(text[:19], fmt)
-            except Exception:
-                continue
-        return None
@@ -1,13 +1,13 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import threading
-from datetime import datetime
 from PIL import Image, ImageTk
 import io
 import base64
 import re
 
+from utils.datetime_service import format_date
 from utils.api_client import APIClient
+from utils.task_executor import get_executor, run_async, deliver
 from utils.session_manager import SessionManager
 from utils.canvas_button import create_primary_button, create_secondary_button, create_success_button, create_warning_button, create_danger_button, bind_mousewheel
 
@@ -121,6 +121,11 @@ class ProfilePage(tk.Frame):
         self.content_area = tk.Frame(self, bg=self.colors.get('background', '#ECF0F1'))
         self.content_area.grid(row=2, column=0, sticky='nsew', padx=30, pady=(12, 12))
 
+    def load_page(self):
+        """Reload data abandoned when the page was hidden before it arrived"""
+        if get_executor().was_interrupted(self):
+            self._load_profile()
+
     def _load_profile(self):
         """Load user profile from API or use fallback data"""
         self._show_loading()
@@ -131,7 +136,7 @@ class ProfilePage(tk.Frame):
                 user = self.session.get_user()
                 if not user:
                     # No user logged in - shouldn't happen but handle it
-                    self.after(0, lambda: messagebox.showerror('Error', 'No user session found. Please log in again.'))
+                    deliver(self, lambda: messagebox.showerror('Error', 'No user session found. Please log in again.'))
                     return
                 
                 # Build profile from session data first (this is always correct for current user)
@@ -178,7 +183,7 @@ class ProfilePage(tk.Frame):
                 self.privacy_show_phone.set(privacy.get('show_phone', False))
                 self.privacy_show_profile.set(privacy.get('show_profile', True))
                 
-                self.after(0, self._render_content)
+                deliver(self, self._render_content)
             except Exception as error:
                 # Fallback error handler
                 def show_with_fallback():
@@ -219,9 +224,9 @@ class ProfilePage(tk.Frame):
                         }
                     self._render_content()
                 
-                self.after(0, show_with_fallback)
+                deliver(self, show_with_fallback)
         
-        threading.Thread(target=worker, daemon=True).start()
+        run_async(self, worker)
 
     def _show_loading(self):
         """Show loading indicator"""
@@ -349,7 +354,7 @@ class ProfilePage(tk.Frame):
         
         self._add_stat_item(stats_frame, '📅', 'Events Attended', str(self.profile_data.get('events_attended', 0)))
         self._add_stat_item(stats_frame, '📋', 'Bookings Made', str(self.profile_data.get('bookings_made', 0)))
-        self._add_stat_item(stats_frame, '📆', 'Member Since', self._format_date(self.profile_data.get('joined_date', '')))
+        self._add_stat_item(stats_frame, '📆', 'Member Since', format_date(self.profile_data.get('joined_date', '')))
         
         # Personal details card
         personal_card = tk.Frame(content, bg='white', highlightthickness=1, highlightbackground='#E5E7EB')
@@ -402,7 +407,7 @@ class ProfilePage(tk.Frame):
         right_col2.pack(side='left', fill='both', expand=True)
         
         self._add_detail_row(right_col2, 'Account Status:', self.profile_data.get('status', 'Active'))
-        self._add_detail_row(right_col2, 'Joined Date:', self._format_date(self.profile_data.get('joined_date', '')))
+        self._add_detail_row(right_col2, 'Joined Date:', format_date(self.profile_data.get('joined_date', '')))
         
         # Edit button
         edit_profile_btn = create_primary_button(content, '✏️ Edit Profile', self._edit_profile, width=600, height=48)
@@ -653,13 +658,13 @@ class ProfilePage(tk.Frame):
                     messagebox.showinfo('Success', 'Profile photo updated successfully!')
                     self._load_profile()
                 
-                self.after(0, show_success)
+                deliver(self, show_success)
             except Exception as e:
                 def show_error():
                     messagebox.showerror('Error', f'Failed to upload photo: {str(e)}')
-                self.after(0, show_error)
+                deliver(self, show_error)
         
-        threading.Thread(target=worker, daemon=True).start()
+        run_async(self, worker, interruptible=False)
 
     def _check_password_strength(self, event=None):
         """Check password strength"""
@@ -766,13 +771,13 @@ class ProfilePage(tk.Frame):
                     self.strength_bar.config(bg='#E5E7EB')
                     self.strength_label.config(text='')
                 
-                self.after(0, show_success)
+                deliver(self, show_success)
             except Exception as e:
                 def show_error():
                     messagebox.showerror('Error', f'Failed to change password: {str(e)}')
-                self.after(0, show_error)
+                deliver(self, show_error)
         
-        threading.Thread(target=worker, daemon=True).start()
+        run_async(self, worker, interruptible=False)
 
     def _save_settings(self):
         """Save notification and privacy settings"""
@@ -800,13 +805,13 @@ class ProfilePage(tk.Frame):
                                       '✅ Settings saved successfully!\n\n'
                                       'Your preferences have been updated.')
                 
-                self.after(0, show_success)
+                deliver(self, show_success)
             except Exception as e:
                 def show_error():
                     messagebox.showerror('Error', f'Failed to save settings: {str(e)}')
-                self.after(0, show_error)
+                deliver(self, show_error)
         
-        threading.Thread(target=worker, daemon=True).start()
+        run_async(self, worker, interruptible=False)
 
     def _edit_profile(self):
         """Open edit profile modal"""
@@ -926,13 +931,13 @@ class ProfilePage(tk.Frame):
                     modal.destroy()
                     self._load_profile()
                 
-                self.after(0, show_success)
+                deliver(self, show_success)
             except Exception as e:
                 def show_error():
                     messagebox.showerror('Error', f'Failed to update profile: {str(e)}')
-                self.after(0, show_error)
+                deliver(self, show_error)
         
-        threading.Thread(target=worker, daemon=True).start()
+        run_async(self, worker, interruptible=False)
 
     def _delete_account(self):
         """Delete user account"""
@@ -960,13 +965,3 @@ class ProfilePage(tk.Frame):
             messagebox.showinfo('Account Deletion',
                               'Account deletion feature is not yet implemented.\n\n'
                               'Please contact an administrator to delete your account.')
-
-    def _format_date(self, date_str):
-        """Format date for display"""
-        if not date_str:
-            return 'N/A'
-        try:
-            date_obj = datetime.strptime(date_str[:10] if len(date_str) >= 10 else date_str, '%Y-%m-%d')
-            return date_obj.strftime('%B %d, %Y')
-        except:
-            return date_str or 'N/A'
@@ -1,9 +1,9 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
 from typing import Tuple
 
 from utils.api_client import APIClient
+from utils.task_executor import run_async, deliver
 from utils.button_styles import ButtonStyles
 from utils.validators import (
     validate_email,
@@ -313,9 +313,9 @@ class RegisterPage(tk.Frame):
             except Exception:
                 # If endpoint missing, do not block registration
                 msg = ''
-            self._labels.get('username', tk.Label()).config(text=msg)
+            deliver(self, lambda: self._labels.get('username', tk.Label()).config(text=msg))
 
-        threading.Thread(target=check, daemon=True).start()
+        run_async(self, check)
         return True
 
     # Submission
@@ -372,7 +372,7 @@ class RegisterPage(tk.Frame):
                 print(f"[DEBUG] JWT token stored after registration")
                 
                 # Navigate to dashboard
-                self.after(0, lambda: (self._hide_spinner(), self.controller._go_to_dashboard()))
+                deliver(self, lambda: (self._hide_spinner(), self.controller._go_to_dashboard()))
                 messagebox.showinfo("Welcome", "Registration successful. You are now logged in.")
                 
             except Exception as e:
@@ -380,9 +380,9 @@ class RegisterPage(tk.Frame):
                 def on_err():
                     self._hide_spinner()
                     messagebox.showerror("Registration failed", error_msg)
-                self.after(0, on_err)
+                deliver(self, on_err)
 
-        threading.Thread(target=worker, daemon=True).start()
+        run_async(self, worker, interruptible=False)
 
     def _show_spinner(self):
         self.spinner.grid()
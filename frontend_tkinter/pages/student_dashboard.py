@@ -1,9 +1,14 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
 from datetime import datetime
 
 from utils.api_client import APIClient
+from utils.task_executor import get_executor, run_async, deliver
+from utils.sync_manager import get_sync_manager
+from utils.request_scheduler import Priority, request_priority
+from utils.entity_store import get_entity_store
+from utils.page_loader import PageLoader
+from utils.reconciler import KeyedRows, Snapshot, set_text
 from utils.session_manager import SessionManager
 from utils.button_styles import ButtonStyles
 from utils.canvas_button import create_primary_button, create_secondary_button, create_success_button, create_danger_button, bind_mousewheel
@@ -22,12 +27,23 @@ class StudentDashboard(tk.Frame):
         self.events = []
         self.my_bookings = []
         self.registered_events = []
+
+        # Shared entity store: one copy of each event across all pages
+        self.store = get_entity_store()
+        self.store.query('events').subscribe(self._on_events_updated, owner=self)
         
         # Auto-refresh tracking
         self.auto_refresh_enabled = True
         self.auto_refresh_interval = 30000  # 30 seconds
         self.refresh_timer = None
         self.current_view = 'dashboard'
+        
+        # Widgets patched by refreshes (set when their view is rendered)
+        self._dashboard_snapshot = Snapshot()
+        self._stat_labels = {}
+        self._upcoming_rows = None
+        self._activity_rows = None
+        self._browse_rows = None
 
         # Layout: 1 row, 2 columns (sidebar, main)
         self.grid_rowconfigure(0, weight=1)
@@ -157,37 +173,56 @@ class StudentDashboard(tk.Frame):
     # Data loading
     def _load_all_data_then(self, callback):
         self._show_spinner()
-
-        def worker():
-            errors = []
-            try:
-                self.events = self.api.get('events') or []
-            except Exception as e:
-                errors.append(('events', str(e)))
-                self.events = []
-            # Note: Bookings removed - students cannot book resources
-            # try:
-            #     self.my_bookings = self.api.get('bookings/my') or []
-            # except Exception as e:
-            #     errors.append(('bookings', str(e)))
-            #     self.my_bookings = []
-            self.my_bookings = []  # Students don't have bookings
-            try:
-                self.registered_events = self.api.get('events/registered') or []
-            except Exception as e:
-                errors.append(('registered', str(e)))
-                self.registered_events = []
-
-            def done():
-                self._hide_spinner()
-                if errors:
-                    # Show first error non-blocking
-                    self._info_banner(f"Some data failed to load: {errors[0][0]}: {errors[0][1]}")
-                callback()
-
-            self.after(0, done)
-
-        threading.Thread(target=worker, daemon=True).start()
+        # Note: Bookings removed - students cannot book resources
+        self.my_bookings = []  # Students don't have bookings
+
+        def load_events():
+            events = self.api.get_cached('events', on_update=self._store_events, owner=self) or []
+            self.store.load('events', events, complete=True)
+            return self.store.all('events')
+
+        def load_registered():
+            registered_events = self.api.get_cached(
+                'events/registered', on_update=self._on_registered_updated, owner=self
+            ) or []
+            return self.store.load('events', registered_events)
+
+        def set_events(events):
+            self.events = events
+
+        def set_registered(registered_events):
+            self.registered_events = registered_events
+
+        # Both fetches are independent: run them side by side
+        loader = PageLoader(self)
+        loader.section('events', load_events, default=[], on_ready=set_events)
+        loader.section('registered', load_registered, default=[], on_ready=set_registered)
+
+        def done(loader):
+            self._hide_spinner()
+            errors = list(loader.errors.items())
+            if errors:
+                # Show first error non-blocking
+                self._info_banner(f"Some data failed to load: {errors[0][0]}: {errors[0][1]}")
+            callback()
+
+        loader.start(on_complete=done)
+
+    def _store_events(self, events):
+        """Put revalidated events in the store (subscribers repaint)"""
+        self.store.load('events', events or [], complete=True)
+
+    def _on_events_updated(self, events):
+        """Repaint when the store's events change (fetched by any page)"""
+        if self.winfo_exists() and events is not self.events:
+            self.events = events
+            self._update_views()
+
+    def _on_registered_updated(self, registered_events):
+        """Repaint when a background revalidation returns newer registrations"""
+        if self.winfo_exists():
+            self.registered_events = self.store.load('events', registered_events or [])
+            self._update_views()
 
     # Auto-refresh methods
     def _start_auto_refresh(self):
@@ -205,32 +240,56 @@ class StudentDashboard(tk.Frame):
         """Auto-refresh data in background"""
         if not self.auto_refresh_enabled:
             return
+        if getattr(self.controller, 'current_page', self) is not self:
+            return  # Hidden; load_page() restarts the cycle when shown again
         
         def worker():
             try:
-                # Silently refresh events
-                self.events = self.api.get('events') or []
-                # Refresh registered events
-                self.registered_events = self.api.get('events/registered') or []
+                # Polling yields to clicks: deferred (or dropped) while the
+                # user waits on an interactive request
+                with request_priority(Priority.BACKGROUND):
+                    # Silently pull changes since the last sync (an unchanged
+                    # collection hands back the same list object)
+                    sync = get_sync_manager()
+                    self.store.load('events', sync.sync(self.api, 'events') or [], complete=True)
+                    events = self.store.all('events')
+                    # Refresh registered events
+                    registered_events = self.store.load(
+                        'events', sync.sync(self.api, 'events/registered') or []
+                    )
+                    changed = events != self.events or registered_events != self.registered_events
+                    self.events = events
+                    self.registered_events = registered_events
                     
-                # Refresh view if on dashboard or browse events
-                if self.current_view in ['dashboard', 'browse_events']:
-                    self.after(0, self._update_views)
+                    # Refresh view if on dashboard or browse events and data changed
+                    if changed and self.current_view in ['dashboard', 'browse_events']:
+                        deliver(self, self._update_views)
                     
             except Exception:
                 pass  # Fail silently for background refresh
             
             # Schedule next refresh
-            self.after(0, self._schedule_refresh)
+            deliver(self, self._schedule_refresh)
         
-        threading.Thread(target=worker, daemon=True).start()
+        run_async(self, worker)
     
     def _update_views(self):
-        """Update current view after background refresh"""
+        """Update current view after background refresh (only what changed)"""
         if self.current_view == 'dashboard':
-            self._render_dashboard()
+            if self._is_shown(self._upcoming_rows):
+                self._patch_dashboard()
+            else:
+                self._render_dashboard()
         elif self.current_view == 'browse_events':
-            self._render_browse_events()
+            if self._is_shown(self._browse_rows):
+                self._browse_rows.reconcile(self.events)
+            else:
+                self._render_browse_events()
+    
+    @staticmethod
+    def _is_shown(rows):
+        """Whether a view's keyed rows are still on screen"""
+        return rows is not None and rows.parent.winfo_exists()
     
     def _manual_refresh(self):
         """Manual refresh triggered by user"""
@@ -242,6 +301,12 @@ class StudentDashboard(tk.Frame):
         if self.refresh_timer:
             self.after_cancel(self.refresh_timer)
     
+    def load_page(self):
+        """Resume refreshing when the controller shows this page again"""
+        if get_executor().was_interrupted(self):
+            self._manual_refresh()
+        self._start_auto_refresh()
+    
     def destroy(self):
         """Override destroy to stop auto-refresh"""
         self._stop_auto_refresh()
@@ -278,17 +343,15 @@ class StudentDashboard(tk.Frame):
         for i in range(2):
             stats.grid_columnconfigure(i, weight=1)
 
-        def card(parent, title, value, color):
+        def card(parent, name, title, color):
             f = tk.Frame(parent, bg='white', highlightthickness=1, highlightbackground='#E5E7EB')
             tk.Label(f, text=title, bg='white', fg='#6B7280').pack(anchor='w', padx=12, pady=(10, 0))
-            tk.Label(f, text=str(value), bg='white', fg=color, font=('Helvetica', 20, 'bold')).pack(anchor='w', padx=12, pady=(0, 12))
+            self._stat_labels[name] = tk.Label(f, text='', bg='white', fg=color, font=('Helvetica', 20, 'bold'))
+            self._stat_labels[name].pack(anchor='w', padx=12, pady=(0, 12))
             return f
 
-        total_events = len(self.events)
-        registered = len(self.registered_events)
-
-        c1 = card(stats, 'Total Events', total_events, colors.get('secondary', '#3498DB'))
-        c2 = card(stats, 'Registered Events', registered, colors.get('success', '#27AE60'))
+        c1 = card(stats, 'total', 'Total Events', colors.get('secondary', '#3498DB'))
+        c2 = card(stats, 'registered', 'Registered Events', colors.get('success', '#27AE60'))
         c1.grid(row=0, column=0, sticky='ew', padx=(0, 8))
         c2.grid(row=0, column=1, sticky='ew', padx=(8, 0))
 
@@ -299,19 +362,8 @@ class StudentDashboard(tk.Frame):
 
         list_frame = tk.Frame(upc, bg='white', highlightthickness=1, highlightbackground='#E5E7EB')
         list_frame.pack(fill='x')
-
-        events_sorted = sorted(self.events, key=lambda e: self._parse_dt(e.get('start_time')) or datetime.max)[:5]
-        if not events_sorted:
-            tk.Label(list_frame, text='No upcoming events', bg='white', fg='#6B7280').pack(padx=12, pady=12)
-        for ev in events_sorted:
-            row = tk.Frame(list_frame, bg='white')
-            row.pack(fill='x', padx=8, pady=4)
-            title = ev.get('title') or 'Untitled Event'
-            when = ev.get('start_time') or ''
-            tk.Label(row, text=f"📅 {title}", bg='white', font=('Helvetica', 12, 'bold')).pack(side='left', padx=(4, 8))
-            tk.Label(row, text=when, bg='white', fg='#6B7280').pack(side='left')
-            reg_btn = create_success_button(row, 'Register', lambda e=ev: self._register_event(e), width=90, height=30)
-            reg_btn.pack(side='right')
+        self._upcoming_rows = KeyedRows(list_frame, self._create_upcoming_row, empty='No upcoming events',
+                                        pack={'fill': 'x', 'padx': 8, 'pady': 4})
 
         # Recent activities
         recent = tk.Frame(self.content, bg=self.controller.colors.get('background', '#ECF0F1'))
@@ -320,29 +372,56 @@ class StudentDashboard(tk.Frame):
 
         timeline = tk.Frame(recent, bg='white', highlightthickness=1, highlightbackground='#E5E7EB')
         timeline.pack(fill='both', expand=True)
+        # Activities are (timestamp, text, icon) tuples: the tuple is its own key
+        self._activity_rows = KeyedRows(timeline, self._create_activity_row, key=lambda item: item,
+                                        signature=lambda item: item, empty='No recent activity',
+                                        pack={'fill': 'x', 'padx': 12, 'pady': 6})
+
+        self._dashboard_snapshot.reset()
+        self._patch_dashboard()
+
+    def _patch_dashboard(self):
+        """Show the latest data in the dashboard widgets (nothing if unchanged)"""
+        if not self._dashboard_snapshot.changed(self.events, self.registered_events, self.my_bookings):
+            return
+        set_text(self._stat_labels['total'], len(self.events))
+        set_text(self._stat_labels['registered'], len(self.registered_events))
+
+        self._upcoming_rows.reconcile(sorted(self.events, key=lambda e: e.start or datetime.max)[:5])
 
         items = []
         for ev in self.registered_events[:5]:
             items.append((ev.get('registered_at') or '', f"Registered for {ev.get('title')}", '✅'))
         for b in self.my_bookings[:5]:
             items.append((b.get('created_at') or '', f"Booking {b.get('status', '').title()} for resource {b.get('resource_id')}", '📚'))
-        if not items:
-            tk.Label(timeline, text='No recent activity', bg='white', fg='#6B7280').pack(padx=12, pady=12)
-        else:
-            for ts, text, icon in items:
-                row = tk.Frame(timeline, bg='white')
-                row.pack(fill='x', padx=12, pady=6)
-                tk.Label(row, text=icon, bg='white').pack(side='left', padx=(0, 8))
-                tk.Label(row, text=text, bg='white').pack(side='left')
-                tk.Label(row, text=ts, bg='white', fg='#9CA3AF').pack(side='right')
+        self._activity_rows.reconcile(items)
+
+    def _create_upcoming_row(self, parent, ev):
+        row = tk.Frame(parent, bg='white')
+        title = ev.get('title') or 'Untitled Event'
+        when = ev.get('start_time') or ''
+        tk.Label(row, text=f"📅 {title}", bg='white', font=('Helvetica', 12, 'bold')).pack(side='left', padx=(4, 8))
+        tk.Label(row, text=when, bg='white', fg='#6B7280').pack(side='left')
+        reg_btn = create_success_button(row, 'Register', lambda e=ev: self._register_event(e), width=90, height=30)
+        reg_btn.pack(side='right')
+        return row
+
+    def _create_activity_row(self, parent, item):
+        ts, text, icon = item
+        row = tk.Frame(parent, bg='white')
+        tk.Label(row, text=icon, bg='white').pack(side='left', padx=(0, 8))
+        tk.Label(row, text=text, bg='white').pack(side='left')
+        tk.Label(row, text=ts, bg='white', fg='#9CA3AF').pack(side='right')
+        return row
 
     def _render_browse_events(self):
         self.current_view = 'browse_events'
         self._clear_content()
         tk.Label(self.content, text='Browse Events', bg=self.controller.colors.get('background', '#ECF0F1'), font=('Helvetica', 14, 'bold')).pack(anchor='w', padx=16, pady=(16, 8))
-        self._render_events_table(self.events, show_register_button=True)
+        self._browse_rows = self._render_events_table(self.events, show_register_button=True)
 
     def _render_my_registrations(self):
+        self.current_view = 'my_registrations'
         self._clear_content()
         tk.Label(self.content, text='My Registrations', bg=self.controller.colors.get('background', '#ECF0F1'), font=('Helvetica', 14, 'bold')).pack(anchor='w', padx=16, pady=(16, 8))
         self._render_events_table(self.registered_events, show_register_button=False)
@@ -377,6 +456,9 @@ class StudentDashboard(tk.Frame):
             events: List of event dictionaries
             show_register_button: If True, shows Register button (for Browse Events).
                                  If False, no button column (for My Registrations).
+        
+        Returns:
+            KeyedRows holding the table rows (reconcile() patches them)
         """
         frame = tk.Frame(self.content, bg='white', highlightthickness=1, highlightbackground='#E5E7EB')
         frame.pack(fill='both', expand=True, padx=16, pady=(0, 16))
@@ -400,33 +482,35 @@ class StudentDashboard(tk.Frame):
                 header.grid_columnconfigure(col_idx, weight=0, minsize=150)
 
         # Rows
-        if not events:
-            tk.Label(frame, text='No events found', bg='white', fg='#6B7280').pack(padx=12, pady=12)
-        else:
-            for e in events:
-                row = tk.Frame(frame, bg='white')
-                row.pack(fill='x', padx=4, pady=2)
-                
-                # Configure row grid columns to match header
-                for col_idx in range(len(columns)):
-                    if col_idx == 0:
-                        row.grid_columnconfigure(col_idx, weight=1, minsize=200)
-                    else:
-                        row.grid_columnconfigure(col_idx, weight=0, minsize=150)
-                
-                # Title column
-                tk.Label(row, text=e.get('title') or 'Untitled', bg='white', font=('Helvetica', 10)).grid(row=0, column=0, sticky='w', padx=8, pady=8)
-                
-                # Start Time column
-                tk.Label(row, text=e.get('start_time') or 'TBD', bg='white', fg='#6B7280', font=('Helvetica', 10)).grid(row=0, column=1, sticky='w', padx=8, pady=8)
-                
-                # Venue column
-                tk.Label(row, text=e.get('venue') or 'TBD', bg='white', fg='#6B7280', font=('Helvetica', 10)).grid(row=0, column=2, sticky='w', padx=8, pady=8)
-                
-                # Register button column (only for Browse Events)
-                if show_register_button:
-                    reg_btn = create_success_button(row, 'Register', lambda ev=e: self._register_event(ev), width=90, height=30)
-                    reg_btn.grid(row=0, column=3, padx=8, pady=4)
+        rows = KeyedRows(frame, lambda parent, e: self._create_event_row(parent, e, len(columns), show_register_button),
+                         empty='No events found', pack={'fill': 'x', 'padx': 4, 'pady': 2})
+        rows.reconcile(events)
+        return rows
+
+    def _create_event_row(self, parent, e, column_count, show_register_button):
+        row = tk.Frame(parent, bg='white')
+        
+        # Configure row grid columns to match header
+        for col_idx in range(column_count):
+            if col_idx == 0:
+                row.grid_columnconfigure(col_idx, weight=1, minsize=200)
+            else:
+                row.grid_columnconfigure(col_idx, weight=0, minsize=150)
+        
+        # Title column
+        tk.Label(row, text=e.get('title') or 'Untitled', bg='white', font=('Helvetica', 10)).grid(row=0, column=0, sticky='w', padx=8, pady=8)
+        
+        # Start Time column
+        tk.Label(row, text=e.get('start_time') or 'TBD', bg='white', fg='#6B7280', font=('Helvetica', 10)).grid(row=0, column=1, sticky='w', padx=8, pady=8)
+        
+        # Venue column
+        tk.Label(row, text=e.get('venue') or 'TBD', bg='white', fg='#6B7280', font=('Helvetica', 10)).grid(row=0, column=2, sticky='w', padx=8, pady=8)
+        
+        # Register button column (only for Browse Events)
+        if show_register_button:
+            reg_btn = create_success_button(row, 'Register', lambda ev=e: self._register_event(ev), width=90, height=30)
+            reg_btn.grid(row=0, column=3, padx=8, pady=4)
+        return row
 
     # Actions
     def _register_event(self, event):
@@ -474,7 +558,8 @@ class StudentDashboard(tk.Frame):
         if not q:
             self._render_browse_events()
             return
-        filtered = [e for e in self.events if q in (e.get('title') or '').lower()]
+        filtered = [e for e in self.events if q in e.search_key]
+        self.current_view = 'search_results'
         self._clear_content()
         tk.Label(self.content, text=f"Search results for '{q}'", bg=self.controller.colors.get('background', '#ECF0F1'), font=('Helvetica', 14, 'bold')).pack(anchor='w', padx=16, pady=(16, 8))
         self._render_events_table(filtered)
@@ -493,14 +578,3 @@ class StudentDashboard(tk.Frame):
             self.spinner.pack_forget()
         except Exception:
             pass
-
-    @staticmethod
-    def _parse_dt(text):
-        if not text:
-            return None
-        for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d"):
-            try:
-                return datetime.strptime(text[:19], fmt)
-            except Exception:
-                continue
-        return None
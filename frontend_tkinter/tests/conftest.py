@@ -14,6 +14,9 @@ import json
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+# Keep tests away from the real on-disk response cache
+os.environ.setdefault('DATABASE_DB_CACHE_ENABLED', 'false')
+
 
 @pytest.fixture(scope='function')
 def root():
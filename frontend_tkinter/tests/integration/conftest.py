@@ -0,0 +1,43 @@
+"""
+Integration Test Fixtures
+APIClient instances pointed at the stand-in server with isolated shared state
+"""
+
+import pytest
+from contextlib import ExitStack
+from unittest.mock import patch
+
+from utils.api_client import APIClient
+from utils.performance import Cache, SingleFlight
+
+
+@pytest.fixture
+def client_patches():
+    """Extra APIClient class attributes to replace (override in a module)"""
+    return {}
+
+
+@pytest.fixture
+def make_client(client_patches):
+    """
+    Build clients for a stand-in server
+
+    Clients get their own response cache; the in-flight table and any
+    client_patches are replaced for the duration of the test.
+
+    Usage:
+        api = make_client(server, token='admin-token')
+    """
+    with ExitStack() as stack:
+        stack.enter_context(patch.object(APIClient, '_single_flight', SingleFlight()))
+        for name, value in client_patches.items():
+            stack.enter_context(patch.object(APIClient, name, value))
+
+        def build(server, token='test-token'):
+            api = APIClient()
+            api.base_url = server.base_url
+            api._cache = Cache(max_size=None)
+            api.set_auth_token(token)
+            return api
+
+        yield build
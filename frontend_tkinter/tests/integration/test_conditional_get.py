@@ -0,0 +1,87 @@
+"""
+Integration Tests for Conditional GET
+Tests ETag / Last-Modified revalidation against the local stand-in server
+"""
+
+import pytest
+
+from utils.api_client import APIClient
+from tests.stand_in_server import StandInServer
+
+
+@pytest.fixture
+def server():
+    """Stand-in backend serving fixture data"""
+    with StandInServer() as srv:
+        yield srv
+
+
+@pytest.fixture
+def client_patches():
+    """Isolate the conditional GET counters too"""
+    return {'_conditional_stats': {'conditional_requests': 0, 'not_modified': 0,
+                                   'bytes_received': 0, 'bytes_saved': 0}}
+
+
+@pytest.fixture
+def client(server, make_client):
+    """API client pointed at the stand-in with an isolated cache and counters"""
+    return make_client(server)
+
+
+@pytest.mark.integration
+class TestConditionalGet:
+    """Test conditional GET revalidation"""
+
+    def test_unchanged_list_returns_same_object(self, client, server):
+        """A 304 reuses the previously decoded object without re-parsing"""
+        first = client.get('events')
+        second = client.get('events')
+
+        assert second is first
+        assert server.stats['requests'] == 2
+        assert server.stats['not_modified'] == 1
+
+    def test_changed_list_is_downloaded(self, client, server):
+        """New data on the server produces a fresh 200 response"""
+        first = client.get('events')
+        server.update('events', first + [{'id': 99, 'title': 'New Event'}])
+
+        second = client.get('events')
+
+        assert second is not first
+        assert second[-1]['id'] == 99
+        assert server.stats['not_modified'] == 0
+
+    def test_bandwidth_savings_reported(self, client, server):
+        """Stats show bytes avoided by 304 responses"""
+        client.get('events')
+        for _ in range(4):
+            client.get('events')
+
+        stats = client.get_conditional_stats()
+        assert stats['conditional_requests'] == 4
+        assert stats['not_modified'] == 4
+        assert stats['bytes_saved'] == 4 * stats['bytes_received']
+        assert stats['bytes_saved_percent'] == pytest.approx(80)
+        assert server.stats['bytes_sent'] == stats['bytes_received']
+
+    def test_last_modified_used_without_etag(self, client, server):
+        """If-Modified-Since alone is enough for a 304"""
+        client.get('events/1')
+        key = next(k for k in client._cache._cache if k.startswith('etag:'))
+        client._cache._cache[key].value['etag'] = None
+
+        client.get('events/1')
+        assert server.stats['not_modified'] == 1
+
+    def test_validators_are_per_identity(self, client, server):
+        """A different auth token does not reuse another user's body"""
+        client.get('events')
+        other = APIClient()
+        other.base_url = server.base_url
+        other._cache = client._cache
+        other.set_auth_token('other-token')
+
+        other.get('events')
+        assert server.stats['not_modified'] == 0
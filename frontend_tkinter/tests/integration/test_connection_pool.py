@@ -0,0 +1,58 @@
+"""
+Integration Tests for the Shared Connection Pool
+Tests keep-alive reuse and warm-up against the local stand-in server
+"""
+
+import pytest
+import threading
+import time
+
+from tests.stand_in_server import StandInServer
+
+
+@pytest.fixture
+def server():
+    with StandInServer() as srv:
+        yield srv
+
+
+def wait_for(predicate, timeout=2.0):
+    deadline = time.time() + timeout
+    while not predicate() and time.time() < deadline:
+        time.sleep(0.01)
+
+
+@pytest.mark.integration
+class TestConnectionPool:
+    """Test connection reuse across requests and clients"""
+
+    def test_clients_reuse_one_connection(self, server, make_client):
+        """Sequential requests from different pages share a keep-alive connection"""
+        for endpoint in ('events', 'resources', 'events/1'):
+            make_client(server).get(endpoint)
+
+        assert server.stats['requests'] == 3
+        assert server.stats['connections'] == 1
+
+    def test_warm_up_opens_connections_for_parallel_loads(self, server, make_client):
+        """After warm_up(n), n parallel requests need no new connections"""
+        api = make_client(server)
+        api.warm_up(connections=3)
+        wait_for(lambda: server.stats['connections'] == 3)
+        time.sleep(0.05)  # let the HEAD responses return their connections
+
+        barrier = threading.Barrier(3)
+
+        def fetch(endpoint):
+            barrier.wait()
+            make_client(server).get(endpoint)
+
+        threads = [threading.Thread(target=fetch, args=(e,))
+                   for e in ('events', 'resources', 'users')]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(2)
+
+        assert server.stats['requests'] == 3
+        assert server.stats['connections'] == 3
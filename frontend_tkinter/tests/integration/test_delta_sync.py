@@ -0,0 +1,68 @@
+"""
+Integration Tests for Delta Sync
+Tests SyncManager against the stand-in server's ?since= support
+"""
+
+import pytest
+
+from utils.sync_manager import SyncManager
+from tests.stand_in_server import StandInServer
+
+
+def make_events(count):
+    return [{'id': i, 'title': f'Event {i}', 'venue': 'Main Hall', 'status': 'APPROVED'}
+            for i in range(1, count + 1)]
+
+
+@pytest.fixture
+def server():
+    """Stand-in backend with a larger events collection"""
+    with StandInServer({'events': make_events(500), 'bookings': []}) as srv:
+        yield srv
+
+
+@pytest.fixture
+def client(server, make_client):
+    """API client pointed at the stand-in with an isolated cache"""
+    return make_client(server)
+
+
+@pytest.mark.integration
+class TestDeltaSync:
+    """Test delta sync end to end"""
+
+    def test_changes_are_merged(self, client, server):
+        """Updates, inserts and deletes on the server reach the local copy"""
+        manager = SyncManager()
+        manager.sync(client, 'events')
+
+        server.upsert('events', {'id': 10, 'title': 'Renamed'})
+        server.upsert('events', {'id': 501, 'title': 'New'})
+        server.delete('events', 20)
+        rows = manager.sync(client, 'events')
+
+        assert rows == server.data['events']
+
+    def test_delta_transfers_only_changes(self, client, server):
+        """A delta sync downloads a small fraction of the full list"""
+        manager = SyncManager()
+        manager.sync(client, 'events')
+        full_bytes = server.stats['bytes_sent']
+
+        server.upsert('events', {'id': 3, 'title': 'Changed'})
+        server.reset_stats()
+        manager.sync(client, 'events')
+
+        assert server.stats['bytes_sent'] < full_bytes / 50
+
+    def test_pruned_tombstones_force_reset(self, client, server):
+        """A client older than the tombstone horizon gets a full reset"""
+        manager = SyncManager()
+        manager.sync(client, 'events')
+
+        server.delete('events', 1)
+        server.prune_tombstones('events')
+        rows = manager.sync(client, 'events')
+
+        assert rows == server.data['events']
+        assert manager.get_stats()['full_syncs'] == 2
@@ -0,0 +1,95 @@
+"""
+Integration Tests for Query Push-Down
+Tests APIClient.query against the stand-in server with and without support
+for the list parameters
+"""
+
+import pytest
+
+from tests.stand_in_server import StandInServer
+
+
+def make_data():
+    events = [{'id': i, 'title': f'Event {i:02d}', 'organizerId': 1 + i % 3,
+               'category': 'sports' if i % 2 else 'academic',
+               'start_time': f'2025-11-{i:02d}T10:00:00'} for i in range(1, 31)]
+    users = [{'id': 1, 'name': 'Ann O\'Neil', 'email': 'ann@campus.edu', 'role': 'student', 'status': 'active'},
+             {'id': 2, 'name': 'Bob & Co', 'email': 'bob@campus.edu', 'role': 'organizer', 'status': 'active'},
+             {'id': 3, 'name': 'Anna Lee', 'email': 'anna@campus.edu', 'role': 'student', 'status': 'blocked'}]
+    return {'events': events, 'users': users}
+
+
+@pytest.mark.integration
+class TestQueryPushDown:
+    """Test that filters run on the server when it supports them"""
+
+    def query(self, api):
+        return (api.query('events').where(organizerId=2, category='sports')
+                .order_by('-start_time').paginate(page=2, limit=3))
+
+    def test_server_applies_everything(self, make_client):
+        """A supporting server sends only the requested page"""
+        with StandInServer(make_data()) as server:
+            api = make_client(server)
+            result = self.query(api).fetch()
+
+            assert result.server_side
+            assert [e['id'] for e in result.items] == [7, 1]
+            assert result.total == 5
+            assert result.pages == 2
+            assert server.stats['bytes_sent'] < 600
+
+    def test_same_result_when_server_ignores_parameters(self, make_client):
+        """A server returning plain lists gives the same rows via the fallback"""
+        with StandInServer(make_data()) as pushed, \
+                StandInServer(make_data(), query_params=False) as plain:
+            expected = self.query(make_client(pushed)).fetch()
+            result = self.query(make_client(plain)).fetch()
+
+            assert [e['id'] for e in result.items] == [e['id'] for e in expected.items]
+            assert result.total == expected.total
+            assert 'organizerId' in result.evaluated
+            assert plain.stats['bytes_sent'] > 4 * pushed.stats['bytes_sent']
+
+    def test_partially_supported_parameters(self, make_client):
+        """Parameters the server skips are applied locally"""
+        with StandInServer(make_data(), ignored_params={'sort'}) as server:
+            api = make_client(server)
+            result = api.query('events').where(organizerId=3).order_by('-start_time').fetch()
+
+            assert result.evaluated == ['sort']
+            assert [e['id'] for e in result.items][:3] == [29, 26, 23]
+
+    def test_search_is_encoded(self, make_client):
+        """Reserved characters in values reach the server intact"""
+        with StandInServer(make_data()) as server:
+            api = make_client(server)
+            found = api.query('admin/users').search('bob & co').fetch()
+            students = api.query('admin/users').where(role='student').search("o'neil").fetch()
+
+            assert [u['id'] for u in found.items] == [2]
+            assert [u['id'] for u in students.items] == [1]
+
+    def test_equal_queries_share_cache_entry(self, make_client):
+        """Parameter order does not change the cache key"""
+        with StandInServer(make_data()) as server:
+            api = make_client(server)
+            api.query('events').where(category='sports', organizerId=2).fetch(cached=True)
+            api.query('events').where(organizerId=2).where(category='sports').fetch(cached=True)
+
+            assert server.stats['requests'] == 1
+
+    def test_cursor_pages(self, make_client):
+        """Cursor pagination walks the filtered rows"""
+        with StandInServer(make_data()) as server:
+            api = make_client(server)
+            query = api.query('events').where(category='academic').order_by('start_time')
+            ids, cursor = [], None
+            while True:
+                page = query.after(cursor, limit=4).fetch()
+                ids += [e['id'] for e in page.items]
+                cursor = page.next_cursor
+                if cursor is None:
+                    break
+
+            assert ids == list(range(2, 31, 2))
@@ -0,0 +1,67 @@
+"""
+Integration Tests for Batched Registration Fetches
+Tests APIClient.registrations_loader against the stand-in server
+"""
+
+import pytest
+
+from tests.stand_in_server import StandInServer
+
+
+def make_data(event_count):
+    events = [{'id': i, 'title': f'Event {i}', 'organizer_id': 1} for i in range(1, event_count + 1)]
+    registrations = [{'id': i * 10 + j, 'event_id': i, 'user': {'name': f'Student {j}'}}
+                     for i in range(1, event_count + 1) for j in range(2)]
+    return {'events': events, 'registrations': registrations}
+
+
+@pytest.fixture
+def client_patches():
+    """Isolate the shared registration loaders too"""
+    return {'_loaders': {}}
+
+
+@pytest.mark.integration
+class TestRegistrationsLoader:
+    """Test batched registration loading end to end"""
+
+    def test_bulk_endpoint_single_round_trip(self, make_client):
+        """With a bulk endpoint, 60 events cost one request"""
+        with StandInServer(make_data(60)) as server:
+            api = make_client(server)
+            result = api.registrations_loader().load_many(range(1, 61))
+
+            assert result.ok
+            assert len(result.get(5)) == 2
+            assert server.stats['requests'] == 1
+
+    def test_fan_out_without_bulk_endpoint(self, make_client):
+        """Without one, per-event requests run in parallel"""
+        with StandInServer(make_data(12), latency=0.05, bulk_endpoints=False) as server:
+            api = make_client(server)
+            result = api.registrations_loader().load_many(range(1, 13))
+
+            assert result.ok
+            assert result.get(12)[0]['event_id'] == 12
+            assert server.stats['requests'] == 13  # failed bulk probe + 12
+
+            # Later loads skip the bulk probe
+            server.reset_stats()
+            api.registrations_loader().clear()
+            api.registrations_loader().load_many([1, 2])
+            assert server.stats['requests'] == 2
+
+    def test_write_to_event_drops_its_registrations(self, make_client):
+        """Registering for an event refetches that event's registrations only"""
+        with StandInServer(make_data(3)) as server:
+            api = make_client(server)
+            loader = api.registrations_loader()
+            loader.load_many([1, 2, 3])
+
+            api._invalidate_for_write('events/2/register')
+            server.reset_stats()
+            result = loader.load_many([1, 2, 3])
+
+            assert result.ok
+            assert server.stats['requests'] == 1
+            assert loader.get_stats()['cache_hits'] == 2
@@ -0,0 +1,71 @@
+"""
+Integration Tests for Sparse Fieldsets
+Tests summary list queries and lazily cached detail records against the
+stand-in server
+"""
+
+import pytest
+
+from utils.entity_store import EntityStore
+from tests.stand_in_server import StandInServer
+
+
+def make_data():
+    events = [{'id': i, 'title': f'Event {i}', 'description': 'Details ' * 40,
+               'tags': ['campus'], 'start_time': f'2025-11-{i:02d}T10:00:00',
+               'status': 'approved'} for i in range(1, 21)]
+    return {'events': events}
+
+
+@pytest.mark.integration
+class TestSparseFields:
+    """Test summary rows for lists and full records on demand"""
+
+    def test_summary_rows_are_smaller(self, make_client):
+        """A summary query receives only the summary fields"""
+        with StandInServer(make_data()) as server:
+            api = make_client(server)
+            full = api.query('events').fetch()
+            full_bytes = server.stats['bytes_sent']
+            server.reset_stats()
+            summary = api.query('events', summary=True).fetch()
+
+            assert summary.server_side
+            assert set(summary.items[0]) == {'id', 'title', 'start_time', 'status'}
+            assert 'description' in full.items[0]
+            assert server.stats['bytes_sent'] * 4 < full_bytes
+
+    def test_detail_fetched_once(self, make_client):
+        """Opening a detail view twice fetches the full record once"""
+        with StandInServer(make_data()) as server:
+            api = make_client(server)
+            first = api.get_detail('events', 3)
+            second = api.get_detail('events', 3)
+
+            assert first['description'].startswith('Details')
+            assert second == first
+            assert server.stats['requests'] == 1
+
+    def test_summary_refresh_keeps_loaded_detail(self, make_client):
+        """Summary rows merged into the store keep a full record's fields"""
+        with StandInServer(make_data()) as server:
+            api = make_client(server)
+            store = EntityStore()
+            store.load('events', [api.get_detail('events', 3)])
+            server.upsert('events', {**server.data['events'][2], 'title': 'Renamed'})
+            store.load('events', api.query('events', summary=True).fetch().items,
+                       complete=True, partial=True)
+
+            event = store.get('events', 3)
+            assert event['title'] == 'Renamed'
+            assert event['description'].startswith('Details')
+            assert 'description' not in store.get('events', 4)
+
+    def test_server_ignoring_fields_sends_full_rows(self, make_client):
+        """Without projection support the full rows are kept"""
+        with StandInServer(make_data(), query_params=False) as server:
+            api = make_client(server)
+            result = api.query('events', summary=True).fetch()
+
+            assert len(result.items) == 20
+            assert 'description' in result.items[0]
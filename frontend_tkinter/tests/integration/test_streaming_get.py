@@ -0,0 +1,85 @@
+"""
+Integration Tests for Streaming GETs
+Tests APIClient.get_stream against the stand-in server: items, envelopes,
+conditional requests and request slots
+"""
+
+import pytest
+import threading
+from unittest.mock import patch
+
+from utils.api_client import APIClient
+from utils.request_scheduler import RequestScheduler
+from tests.stand_in_server import StandInServer
+
+
+def make_data():
+    events = [{'id': i, 'title': f'Event {i}', 'description': 'Details ' * 20,
+               'status': 'approved'} for i in range(1, 501)]
+    return {'events': events}
+
+
+@pytest.mark.integration
+class TestStreamingGet:
+    """Test list bodies decoded while they download"""
+
+    def test_stream_matches_get(self, make_client):
+        """A streamed list has the same items as get()"""
+        with StandInServer(make_data()) as server:
+            api = make_client(server)
+            api.STREAM_CHUNK_SIZE = 1024
+
+            assert list(api.get_stream('events')) == server.data['events']
+
+    def test_envelope_yields_items(self, make_client):
+        """A paginated envelope yields its page of items"""
+        with StandInServer(make_data()) as server:
+            api = make_client(server)
+            items = list(api.get_stream('events', params={'page': 2, 'limit': 10}))
+
+            assert [e['id'] for e in items] == list(range(11, 21))
+
+    def test_second_stream_is_conditional(self, make_client):
+        """An unchanged list is answered with 304 and the stored rows"""
+        with StandInServer(make_data()) as server:
+            api = make_client(server)
+            first = list(api.get_stream('events'))
+            server.reset_stats()
+            before = api.get_conditional_stats()['not_modified']
+            second = list(api.get_stream('events'))
+
+            assert second == first
+            assert api.get_conditional_stats()['not_modified'] == before + 1
+            assert server.stats['bytes_sent'] < 1024
+
+    def test_closing_early_releases_slot(self, make_client):
+        """Abandoning a stream frees its request slot"""
+        with StandInServer(make_data()) as server:
+            api = make_client(server)
+            stream = api.get_stream('events')
+            next(stream)
+            stream.close()
+
+            assert sum(api.get_scheduler_stats()['in_flight'].values()) == 0
+
+    def test_consumer_requests_run_in_stream_slot(self, make_client):
+        """API calls made while consuming a stream do not wait for a second slot"""
+        with StandInServer(make_data()) as server, \
+                patch.object(APIClient, '_scheduler', RequestScheduler(max_in_flight=1, interactive_reserved=0)):
+            api = make_client(server)
+            api.STREAM_CHUNK_SIZE = 1024
+            details = []
+
+            def consume():
+                for event in api.get_stream('events', params={'limit': 3, 'page': 1}):
+                    details.append(api.get(f"events/{event['id']}")['id'])
+
+            thread = threading.Thread(target=consume, daemon=True)
+            thread.start()
+            thread.join(5)
+
+            assert not thread.is_alive()
+            assert details == [1, 2, 3]
+            stats = api.get_scheduler_stats()
+            assert stats['nested'] == 3
+            assert sum(stats['in_flight'].values()) == 0
@@ -0,0 +1,470 @@
+"""
+Stand-in API Server
+Small local HTTP server that mimics the Java backend for tests and manual runs
+
+Serves the collections in tests/fixtures/mock_api_responses.json under
+``/api/<collection>`` and ``/api/<collection>/<id>``. Responses carry ETag
+and Last-Modified validators and honour If-None-Match / If-Modified-Since
+with 304 Not Modified, so client caching can be exercised without the
+real backend.
+
+Collections also answer ``?since=<version>`` with only the rows changed
+after that version plus tombstones for removed ids (see utils.sync_manager).
+Every change made through update()/upsert()/delete() gets the next value of
+a server-wide version counter.
+
+Collections whose rows reference a parent (``registrations`` rows with an
+``event_id``) are also served as sub-resources, ``/api/events/5/registrations``,
+and in bulk as ``/api/events/registrations?ids=5,6`` -> ``{"5": [...], ...}``
+unless ``bulk_endpoints=False``. ``latency`` adds a fixed delay per request
+so round-trip counts show up in timings; ``connect_latency`` adds one per new
+connection (a stand-in for TCP/TLS handshakes), so keep-alive reuse does too.
+HEAD on any path answers 204 (used by APIClient.warm_up()).
+
+Collection GETs also take the list query parameters of utils.query_builder
+(``field=value``, ``field__gte=...``, ``q``, ``sort``, ``page``/``limit``,
+``cursor``, ``fields``) and then answer with an envelope listing the
+``applied`` parameters. ``fields=id,title`` projects rows to those fields,
+also for ``?since=`` deltas. Names in ``ignored_params`` are left to the client, and
+``query_params=False`` ignores them all and returns plain lists like the
+current Java backend. ``/api/admin/<collection>`` serves the same rows.
+
+Usage:
+    from tests.stand_in_server import StandInServer
+
+    with StandInServer() as server:
+        api = APIClient()
+        api.base_url = server.base_url
+        api.get('events')
+
+    # Or run it for the desktop app:
+    #   python -m tests.stand_in_server --port 8080
+    #   API_BASE_URL=http://localhost:8080/api python main.py
+"""
+
+import argparse
+import copy
+import hashlib
+import json
+import os
+import threading
+import time
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+FIXTURES_PATH = os.path.join(os.path.dirname(__file__), 'fixtures', 'mock_api_responses.json')
+
+
+def load_fixture_data() -> Dict[str, List[Dict[str, Any]]]:
+    """Load the shared fixture collections"""
+    with open(FIXTURES_PATH, encoding='utf-8') as f:
+        return json.load(f)
+
+
+class StandInServer:
+    """
+    Threaded HTTP stand-in for the backend REST API
+
+    Attributes:
+        data: Collections served by the server (collection name -> items)
+        stats: Request counters (requests, not_modified, bytes_sent,
+            connections)
+    """
+
+    def __init__(self, data: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+                 host: str = '127.0.0.1', port: int = 0, latency: float = 0.0,
+                 bulk_endpoints: bool = True, connect_latency: float = 0.0,
+                 query_params: bool = True, ignored_params: Iterable[str] = ()):
+        """
+        Initialize server (call start() or use as a context manager)
+
+        Args:
+            data: Collections to serve (defaults to the fixture file)
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            latency: Seconds to wait before answering each request
+            bulk_endpoints: Serve /api/<parent>/<child>?ids=... bulk lookups
+            connect_latency: Seconds to wait before serving a new connection
+            query_params: Honour filter/sort/pagination parameters
+            ignored_params: Parameter names to ignore (left to the client)
+        """
+        self.data = copy.deepcopy(data) if data is not None else load_fixture_data()
+        self.latency = latency
+        self.connect_latency = connect_latency
+        self.bulk_endpoints = bulk_endpoints
+        self.query_params = query_params
+        self.ignored_params = set(ignored_params)
+        self._modified = {name: time.time() for name in self.data}
+        # Delta sync bookkeeping: row versions, tombstones (id -> version)
+        # and the oldest version still answerable without a reset
+        self.version = 0
+        self._row_versions: Dict[str, Dict[Any, int]] = {}
+        self._tombstones: Dict[str, Dict[Any, int]] = {}
+        self._horizon: Dict[str, int] = {}
+        for name, items in self.data.items():
+            self._row_versions[name] = {}
+            self._tombstones[name] = {}
+            self._horizon[name] = 0
+            for item in items if isinstance(items, list) else []:
+                self.version += 1
+                self._row_versions[name][item.get('id')] = self.version
+        self._lock = threading.Lock()
+        self.stats = {'requests': 0, 'not_modified': 0, 'bytes_sent': 0, 'connections': 0}
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """API base URL for APIClient.base_url"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+    def start(self) -> 'StandInServer':
+        """Serve requests on a background thread"""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Shut the server down"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> 'StandInServer':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def update(self, collection: str, items: List[Dict[str, Any]]):
+        """
+        Replace a collection, changing its validators
+
+        Args:
+            collection: Collection name (e.g. 'events')
+            items: New items
+        """
+        with self._lock:
+            old = {item.get('id'): item for item in self.data.get(collection, [])}
+            new_items = copy.deepcopy(items)
+            versions = self._row_versions.setdefault(collection, {})
+            tombstones = self._tombstones.setdefault(collection, {})
+            self._horizon.setdefault(collection, 0)
+            for item in new_items:
+                item_id = item.get('id')
+                if old.pop(item_id, None) != item:
+                    self.version += 1
+                    versions[item_id] = self.version
+                    tombstones.pop(item_id, None)
+            for item_id in old:
+                self.version += 1
+                versions.pop(item_id, None)
+                tombstones[item_id] = self.version
+            self.data[collection] = new_items
+            # Last-Modified has one-second resolution; keep it moving forward
+            self._modified[collection] = max(time.time(), self._modified.get(collection, 0) + 1)
+
+    def upsert(self, collection: str, item: Dict[str, Any]):
+        """
+        Create or replace one row (matched by id)
+        
+        Args:
+            collection: Collection name
+            item: Row with an 'id'
+        """
+        items = [row for row in self.data.get(collection, []) if row.get('id') != item.get('id')]
+        existing = [row.get('id') for row in self.data.get(collection, [])]
+        if item.get('id') in existing:
+            items.insert(existing.index(item.get('id')), item)
+        else:
+            items.append(item)
+        self.update(collection, items)
+
+    def delete(self, collection: str, item_id: Any):
+        """
+        Remove one row, leaving a tombstone for delta clients
+        
+        Args:
+            collection: Collection name
+            item_id: Id of the row to remove
+        """
+        self.update(collection, [row for row in self.data.get(collection, []) if row.get('id') != item_id])
+
+    def prune_tombstones(self, collection: str):
+        """
+        Forget a collection's tombstones (as a real server eventually would)
+        
+        Clients whose mark is older than the prune point get a full reset.
+        
+        Args:
+            collection: Collection name
+        """
+        with self._lock:
+            self._tombstones[collection] = {}
+            self._horizon[collection] = self.version
+
+    def reset_stats(self):
+        """Reset request counters"""
+        with self._lock:
+            for key in self.stats:
+                self.stats[key] = 0
+
+    def resolve(self, path: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up the payload for a request path
+
+        Args:
+            path: Request path such as '/api/events/1' or '/api/events?since=4'
+
+        Returns:
+            {'body': ..., 'modified': timestamp} or None if not found
+        """
+        parts = urlsplit(path)
+        query = parse_qs(parts.query)
+        segments = [s for s in parts.path.split('/') if s]
+        if segments[:1] == ['api']:
+            segments = segments[1:]
+        if segments[:1] == ['admin']:
+            segments = segments[1:]
+        if not segments or segments[0] not in self.data:
+            return None
+
+        collection = segments[0]
+        items = self.data[collection]
+        if len(segments) == 1:
+            if 'since' in query:
+                body = self._delta(collection, query['since'][0])
+                if 'fields' in query and self.query_params and 'fields' not in self.ignored_params:
+                    body = dict(body, items=_project(body['items'], query['fields'][0]))
+                return {'body': body, 'modified': self._modified[collection]}
+            if query and self.query_params:
+                return {'body': self._list_query(items, query),
+                        'modified': self._modified[collection]}
+            return {'body': items, 'modified': self._modified[collection]}
+        if len(segments) == 2:
+            child = segments[1]
+            if child in self.data and 'ids' in query:
+                if not self.bulk_endpoints:
+                    return None
+                ids = [i for i in query['ids'][0].split(',') if i]
+                return {'body': {i: self._children(collection, i, child) for i in ids},
+                        'modified': self._modified[child]}
+            for item in items:
+                if str(item.get('id')) == child:
+                    return {'body': item, 'modified': self._modified[collection]}
+        if len(segments) == 3 and segments[2] in self.data:
+            return {'body': self._children(collection, segments[1], segments[2]),
+                    'modified': self._modified[segments[2]]}
+        return None
+
+    def _children(self, parent: str, parent_id: str, child: str) -> List[Dict[str, Any]]:
+        """Rows of child referencing a parent row (e.g. registrations of event 5)"""
+        field = parent.rstrip('s') + '_id'
+        return [row for row in self.data[child] if str(row.get(field)) == parent_id]
+
+    def _list_query(self, items: List[Dict[str, Any]], query: Dict[str, List[str]]) -> Dict[str, Any]:
+        """Filter, search, sort and page rows for list query parameters"""
+        params = {name: values[0] for name, values in query.items() if name not in self.ignored_params}
+        applied = []
+        rows = list(items)
+        for name, value in params.items():
+            if name in ('q', 'sort', 'page', 'limit', 'cursor', 'fields'):
+                continue
+            field, _, op = name.partition('__')
+            rows = [row for row in rows if _row_matches(row.get(field), op or 'eq', value)]
+            applied.append(name)
+
+        if 'q' in params:
+            needle = params['q'].lower()
+            rows = [row for row in rows
+                    if any(isinstance(v, str) and needle in v.lower() for v in row.values())]
+            applied.append('q')
+        if 'sort' in params:
+            for spec in reversed(params['sort'].split(',')):
+                field = spec.lstrip('-')
+                present = [row for row in rows if row.get(field) is not None]
+                missing = [row for row in rows if row.get(field) is None]
+                present.sort(key=lambda row: _sort_key(row[field]), reverse=spec.startswith('-'))
+                rows = present + missing
+            applied.append('sort')
+
+        total = len(rows)
+        body = {'items': rows, 'total': total, 'applied': applied}
+        if 'limit' in params:
+            limit = max(1, int(params['limit']))
+            if 'cursor' in params:
+                offset = int(params['cursor'].lstrip('c') or 0)
+                applied.append('cursor')
+            else:
+                body['page'] = max(1, int(params.get('page', 1)))
+                offset = (body['page'] - 1) * limit
+                applied.append('page')
+            body['items'] = rows[offset:offset + limit]
+            body['limit'] = limit
+            body['next_cursor'] = f"c{offset + limit}" if offset + limit < total else None
+            applied.append('limit')
+        if 'fields' in params:
+            body['items'] = _project(body['items'], params['fields'])
+            applied.append('fields')
+        return body
+
+    def _delta(self, collection: str, since: str) -> Dict[str, Any]:
+        """Rows and tombstones newer than since (caller holds the lock)"""
+        try:
+            since_version = int(since)
+        except ValueError:
+            since_version = 0
+        versions = self._row_versions.get(collection, {})
+        reset = since_version < self._horizon.get(collection, 0)
+        if reset or since_version <= 0:
+            return {'items': self.data[collection], 'deleted': [],
+                    'version': self.version, 'reset': True}
+        return {
+            'items': [item for item in self.data[collection]
+                      if versions.get(item.get('id'), 0) > since_version],
+            'deleted': [item_id for item_id, version in self._tombstones.get(collection, {}).items()
+                        if version > since_version],
+            'version': self.version,
+            'reset': False,
+        }
+
+    def _make_handler(self):
+        """Build the request handler class bound to this server"""
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # Headers and body are separate writes; without this, delayed ACKs
+            # add ~40 ms to every keep-alive response
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with server._lock:
+                    server.stats['connections'] += 1
+                if server.connect_latency:
+                    time.sleep(server.connect_latency)
+
+            def do_HEAD(self):
+                self._send(204, b'')
+
+            def do_GET(self):
+                if server.latency:
+                    time.sleep(server.latency)
+                with server._lock:
+                    server.stats['requests'] += 1
+                    found = server.resolve(self.path)
+                    body = json.dumps(found['body']).encode('utf-8') if found else None
+
+                if found is None:
+                    self._send(404, json.dumps({'message': 'Not found'}).encode('utf-8'))
+                    return
+
+                etag = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+                last_modified = formatdate(int(found['modified']), usegmt=True)
+                headers = {'ETag': etag, 'Last-Modified': last_modified}
+
+                if self._not_modified(etag, found['modified']):
+                    with server._lock:
+                        server.stats['not_modified'] += 1
+                    self._send(304, b'', headers)
+                    return
+
+                self._send(200, body, headers)
+
+            def _not_modified(self, etag: str, modified: float) -> bool:
+                if_none_match = self.headers.get('If-None-Match')
+                if if_none_match is not None:
+                    return etag in [tag.strip() for tag in if_none_match.split(',')]
+
+                if_modified_since = self.headers.get('If-Modified-Since')
+                if if_modified_since:
+                    try:
+                        since = parsedate_to_datetime(if_modified_since).timestamp()
+                    except (TypeError, ValueError):
+                        return False
+                    return int(modified) <= since
+                return False
+
+            def _send(self, status: int, body: bytes, headers: Optional[Dict[str, str]] = None):
+                self.send_response(status)
+                if status != 304:
+                    self.send_header('Content-Type', 'application/json')
+                    self.send_header('Content-Length', str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                # Count before writing so stats are final once the client has the body
+                with server._lock:
+                    server.stats['bytes_sent'] += len(body)
+                self.end_headers()
+                if body:
+                    self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # Keep test output quiet
+
+        return Handler
+
+
+def _comparable(value: Any) -> Any:
+    """Number if the value looks like one, else lower-case text ('T' dates)"""
+    if isinstance(value, bool):
+        return str(value).lower()
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return str(value).lower().replace(' ', 't')
+
+
+def _row_matches(row_value: Any, op: str, value: str) -> bool:
+    """Whether a row value passes a query string filter"""
+    if op == 'in':
+        return any(_row_matches(row_value, 'eq', v) for v in value.split(','))
+    if op == 'overlaps':
+        return any(_row_matches(row_value, 'contains', v) for v in value.split(','))
+    if row_value is None:
+        return op == 'ne'
+    if op == 'contains':
+        if isinstance(row_value, list):
+            return any(str(item).lower() == value.lower() for item in row_value)
+        return value.lower() in str(row_value).lower()
+    a, b = _comparable(row_value), _comparable(value)
+    if type(a) is not type(b):
+        a, b = str(a), str(b)
+    return {'eq': a == b, 'ne': a != b, 'gt': a > b, 'gte': a >= b,
+            'lt': a < b, 'lte': a <= b}[op]
+
+
+def _sort_key(value: Any) -> Any:
+    comparable = _comparable(value)
+    return (0, comparable, '') if isinstance(comparable, float) else (1, 0.0, comparable)
+
+
+def _project(rows: List[Dict[str, Any]], fields: str) -> List[Dict[str, Any]]:
+    """Rows reduced to a comma-separated list of fields"""
+    names = [name for name in fields.split(',') if name]
+    return [{name: row[name] for name in names if name in row} for row in rows]
+
+
+def main():
+    """Run the stand-in server in the foreground"""
+    parser = argparse.ArgumentParser(description='Stand-in backend for the Campus Event frontend')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    args = parser.parse_args()
+
+    server = StandInServer(host=args.host, port=args.port)
+    print(f"[STAND-IN] Serving fixture data at {server.base_url}")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == '__main__':
+    main()
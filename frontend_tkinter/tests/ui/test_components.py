@@ -105,6 +105,76 @@ class TestCalendarView:
                 pytest.skip("Update method not found")
         except Exception as e:
             pytest.skip(f"CalendarView test needs adjustment: {e}")
+    
+    def test_calendar_navigation_reuses_cells(self, root, sample_events_list):
+        """Test paging rebinds the existing grids instead of rebuilding them"""
+        # Arrange
+        from components.calendar_view import CalendarView
+        
+        calendar = CalendarView(root, None, events=sample_events_list)
+        month_cells = [cell for week in calendar._month_cells for cell in week]
+        
+        # Act
+        calendar._next_period()
+        calendar._next_period()
+        calendar._go_to_today()
+        calendar._change_view('week')
+        week_cells = list(calendar._week_cells)
+        calendar._next_period()
+        calendar._change_view('month')
+        
+        # Assert
+        assert [cell for week in calendar._month_cells for cell in week] == month_cells
+        assert calendar._week_cells == week_cells
+        assert all(cell.winfo_exists() for cell in month_cells)
+        assert set(calendar._views) == {'month', 'week'}
+
+
+@pytest.mark.ui
+class TestVirtualList:
+    """Test virtualized list component"""
+    
+    def test_builds_and_recycles_visible_cards(self, root):
+        """Only cards in view are built; scrolling rebinds them"""
+        # Arrange
+        from components.virtual_list import VirtualList
+        
+        created = []
+        
+        def create_card(parent):
+            card = tk.Frame(parent)
+            card.label = tk.Label(card)
+            card.label.pack()
+            created.append(card)
+            return card
+        
+        def bind_card(card, item):
+            card.label.config(text=item)
+        
+        view = VirtualList(root, create_card, bind_card, row_height=40, overscan=1)
+        view.pack(fill='both', expand=True)
+        
+        # Act
+        view.set_items([f'Item {i}' for i in range(5000)])
+        root.update()
+        built = len(created)
+        view.scroll_to(2500)
+        root.update()
+        
+        # Assert
+        assert 0 < built < 50
+        assert len(created) == built
+        assert 'Item 2500' in [card.item for card in view.visible_cards().values()]
+    
+    def test_placeholder_when_empty(self, root):
+        """The empty-state widget replaces the cards"""
+        from components.virtual_list import VirtualList
+        
+        view = VirtualList(root, lambda parent: tk.Frame(parent), lambda card, item: None)
+        view.set_items([], empty=lambda parent: tk.Label(parent, text='Nothing here'))
+        
+        assert view.get_stats()['shown'] == 0
+        assert view._placeholder.cget('text') == 'Nothing here'
 
 
 @pytest.mark.ui
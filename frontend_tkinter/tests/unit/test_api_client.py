@@ -4,9 +4,13 @@ Tests all API client functionality including authentication, error handling, and
 """
 
 import pytest
+import re
 from unittest.mock import Mock, patch, MagicMock
+import threading
+import time
 import requests
 from utils.api_client import APIClient
+from utils.performance import Cache, SingleFlight
 
 
 class TestAPIClient:
@@ -201,6 +205,507 @@ class TestAPIClientRetry:
             client.get('events')
 
 
+class TestAPIClientCoalescing:
+    """Test single-flight coalescing of concurrent identical GETs"""
+    
+    def _start_getters(self, client_factory, endpoint, count):
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(client_factory().get(endpoint)))
+            for _ in range(count)
+        ]
+        for t in threads:
+            t.start()
+        return threads, results
+    
+    def _wait_for(self, predicate, timeout=2.0):
+        deadline = time.time() + timeout
+        while not predicate() and time.time() < deadline:
+            time.sleep(0.01)
+    
+    @patch('requests.Session.get')
+    def test_concurrent_gets_share_one_request(self, mock_get):
+        """Concurrent identical GETs from different clients hit the network once"""
+        release = threading.Event()
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = [{'id': 1}]
+        mock_response.raise_for_status = Mock()
+        
+        def slow_get(*args, **kwargs):
+            release.wait(2)
+            return mock_response
+        mock_get.side_effect = slow_get
+        
+        flight = SingleFlight()
+        with patch.object(APIClient, '_single_flight', flight):
+            threads, results = self._start_getters(APIClient, 'events', 4)
+            self._wait_for(lambda: flight.get_stats()['coalesced'] == 3)
+            release.set()
+            for t in threads:
+                t.join(2)
+        
+        assert mock_get.call_count == 1
+        assert results == [[{'id': 1}]] * 4
+        stats = flight.get_stats()
+        assert stats['executed'] == 1
+        assert stats['coalesced'] == 3
+        assert stats['in_flight'] == 0
+    
+    @patch('requests.Session.get')
+    def test_different_tokens_not_coalesced(self, mock_get):
+        """Requests with different auth identities never share a response"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = []
+        mock_response.raise_for_status = Mock()
+        mock_get.return_value = mock_response
+        
+        a, b = APIClient(), APIClient()
+        a.set_auth_token('token-a')
+        b.set_auth_token('token-b')
+        headers_a = a._get_headers()
+        headers_b = b._get_headers()
+        url = f"{a.base_url}/events"
+        
+        assert a._flight_key('GET', url, headers_a) != b._flight_key('GET', url, headers_b)
+        assert a._flight_key('GET', url, headers_a) == a._flight_key('GET', url, a._get_headers())
+    
+    @patch('requests.Session.get')
+    def test_errors_propagate_to_followers(self, mock_get):
+        """A failed leader request raises in every coalesced caller"""
+        release = threading.Event()
+        
+        def failing_get(*args, **kwargs):
+            release.wait(2)
+            raise requests.ConnectionError("down")
+        mock_get.side_effect = failing_get
+        
+        flight = SingleFlight()
+        errors = []
+        
+        def call():
+            try:
+                APIClient().get('events')
+            except requests.ConnectionError as e:
+                errors.append(e)
+        
+        with patch.object(APIClient, '_single_flight', flight):
+            threads = [threading.Thread(target=call) for _ in range(3)]
+            for t in threads:
+                t.start()
+            self._wait_for(lambda: flight.get_stats()['coalesced'] == 2)
+            release.set()
+            for t in threads:
+                t.join(2)
+        
+        assert mock_get.call_count == 1
+        assert len(errors) == 3
+        assert flight.in_flight() == 0
+
+
+class TestAPIClientCacheInvalidation:
+    """Test tag-based cache invalidation after writes"""
+    
+    def _ok(self, payload):
+        response = Mock()
+        response.status_code = 200
+        response.json.return_value = payload
+        response.raise_for_status = Mock()
+        return response
+    
+    def _client_with_cache(self):
+        client = APIClient()
+        client._cache = Cache(default_ttl=60, max_size=None)
+        return client
+    
+    def _seed(self, client):
+        """Populate the cache the way get_cached would"""
+        responses = {
+            'events?page=1': [{'id': 5}, {'id': 6}],
+            'events?page=2': [{'id': 7}, {'id': 8}],
+            'events/5': {'id': 5},
+            'events/6': {'id': 6},
+            'events/5/registrations': [{'id': 100, 'user_id': 1}],
+            'events/registered': [{'id': 9}],
+            'resources': [{'id': 5}],
+        }
+        with patch('requests.Session.get') as mock_get:
+            mock_get.side_effect = lambda url, **kw: self._ok(responses[url.split('/api/', 1)[1]])
+            for endpoint in responses:
+                client.get_cached(endpoint)
+    
+    def _cached(self, client):
+        """Endpoints in the cache (without the auth identity suffix)"""
+        return {re.sub(r'[?&]as=\w+$', '', k[len('api:'):]) for k in client._cache._cache}
+    
+    @patch('requests.Session.post')
+    def test_register_invalidates_only_affected_entries(self, mock_post):
+        """Registering for event 5 keeps unrelated events and pages cached"""
+        mock_post.return_value = self._ok({'status': 'success'})
+        client = self._client_with_cache()
+        self._seed(client)
+        
+        client.post('events/5/register', {})
+        
+        assert self._cached(client) == {'events?page=2', 'events/6', 'resources'}
+    
+    @patch('requests.Session.put')
+    def test_admin_endpoint_shares_entity_tags(self, mock_put):
+        """admin/events/6/approve invalidates event 6 cached from user endpoints"""
+        mock_put.return_value = self._ok({'status': 'success'})
+        client = self._client_with_cache()
+        self._seed(client)
+        
+        client.put('admin/events/6/approve', {})
+        
+        cached = self._cached(client)
+        assert 'events/6' not in cached
+        assert 'events?page=1' not in cached
+        assert {'events?page=2', 'events/5', 'events/5/registrations'} <= cached
+    
+    @patch('requests.Session.post')
+    def test_create_invalidates_collection_lists(self, mock_post):
+        """Creating an event drops list pages but keeps entity details"""
+        mock_post.return_value = self._ok({'id': 10})
+        client = self._client_with_cache()
+        self._seed(client)
+        
+        client.post('events', {'title': 'New'})
+        
+        assert self._cached(client) == {'events/5', 'events/6', 'events/5/registrations', 'resources'}
+    
+    @patch('requests.Session.delete')
+    def test_failed_write_keeps_cache(self, mock_delete):
+        """Nothing is invalidated when the write fails"""
+        response = Mock()
+        response.status_code = 500
+        response.raise_for_status.side_effect = requests.HTTPError("500")
+        response.json.return_value = {}
+        mock_delete.return_value = response
+        client = self._client_with_cache()
+        self._seed(client)
+        
+        with pytest.raises(requests.HTTPError):
+            client.delete('events/5')
+        
+        assert 'events/5' in self._cached(client)
+    
+    def test_invalidate_cache_prefix_is_segment_aligned(self):
+        """invalidate_cache('events/5') does not touch events/50"""
+        client = self._client_with_cache()
+        client._cache.set('api:events/5', 1)
+        client._cache.set('api:events/5/registrations', 2)
+        client._cache.set('api:events/50', 3)
+        
+        client.invalidate_cache('events/5')
+        
+        assert self._cached(client) == {'events/50'}
+
+
+class TestAPIClientStaleWhileRevalidate:
+    """Test stale-while-revalidate in get_cached"""
+    
+    def _ok(self, payload):
+        response = Mock()
+        response.status_code = 200
+        response.json.return_value = payload
+        response.raise_for_status = Mock()
+        return response
+    
+    def _client_with_stale(self, endpoint, value):
+        """Client whose cache holds a stale (but servable) value for endpoint"""
+        client = APIClient()
+        client._cache = Cache(max_size=None)
+        client._cache.set(client._cache_key(endpoint), value, ttl=1e-9, stale_ttl=60)
+        time.sleep(0.001)
+        return client
+    
+    def _inline_executor(self):
+        """Run background revalidation synchronously"""
+        executor = Mock()
+        executor.submit = lambda fn, *args, **kwargs: fn(*args, **kwargs)
+        return patch('utils.api_client.get_executor', return_value=executor)
+    
+    @patch('requests.Session.get')
+    def test_stale_value_returned_and_revalidated(self, mock_get):
+        """Stale data is returned at once and newer data goes to on_update"""
+        mock_get.return_value = self._ok([{'id': 1}, {'id': 2}])
+        client = self._client_with_stale('events', [{'id': 1}])
+        updates = []
+        
+        with self._inline_executor():
+            result = client.get_cached('events', on_update=updates.append)
+        
+        assert result == [{'id': 1}]
+        assert updates == [[{'id': 1}, {'id': 2}]]
+        assert client._cache.get(client._cache_key('events')) == [{'id': 1}, {'id': 2}]
+    
+    @patch('requests.Session.get')
+    def test_unchanged_data_does_not_notify(self, mock_get):
+        """No repaint when revalidation returns identical data"""
+        mock_get.return_value = self._ok([{'id': 1}])
+        client = self._client_with_stale('events', [{'id': 1}])
+        updates = []
+        
+        with self._inline_executor():
+            client.get_cached('events', on_update=updates.append)
+        
+        assert mock_get.call_count == 1
+        assert updates == []
+    
+    @patch('requests.Session.get')
+    def test_one_revalidation_per_key(self, mock_get):
+        """Concurrent stale readers share one background refresh"""
+        mock_get.return_value = self._ok(['new'])
+        client = self._client_with_stale('notifications', ['old'])
+        queued = []
+        executor = Mock()
+        executor.submit = lambda fn, *args, **kwargs: queued.append(fn)
+        updates = []
+        
+        with patch('utils.api_client.get_executor', return_value=executor):
+            client.get_cached('notifications', on_update=lambda d: updates.append(('a', d)))
+            client.get_cached('notifications', on_update=lambda d: updates.append(('b', d)))
+        assert len(queued) == 1
+        
+        queued[0]()
+        assert mock_get.call_count == 1
+        assert updates == [('a', ['new']), ('b', ['new'])]
+    
+    @patch('requests.Session.get')
+    def test_endpoints_without_policy_block(self, mock_get):
+        """Endpoints outside SWR_POLICIES refetch synchronously once stale"""
+        mock_get.return_value = self._ok({'name': 'fresh'})
+        client = self._client_with_stale('users/profile', {'name': 'stale'})
+        
+        assert client.get_cached('users/profile') == {'name': 'fresh'}
+        assert mock_get.call_count == 1
+    
+    @patch('requests.Session.get')
+    def test_entries_are_per_identity(self, mock_get):
+        """Another account on the same client never reads the previous one's entry"""
+        mock_get.side_effect = [self._ok([{'id': 1}]), self._ok([{'id': 2}])]
+        client = APIClient()
+        client._cache = Cache(max_size=None)
+        
+        client.set_auth_token('student-a')
+        assert client.get_cached('events/registered') == [{'id': 1}]
+        client.set_auth_token('student-b')
+        assert client.get_cached('events/registered') == [{'id': 2}]
+        assert mock_get.call_count == 2
+    
+    @patch('requests.Session.get')
+    def test_update_dropped_when_requester_cancelled(self, mock_get):
+        """A page that navigated away does not get the revalidated data"""
+        from utils.task_executor import Task
+        mock_get.return_value = self._ok([{'id': 1}, {'id': 2}])
+        client = self._client_with_stale('events', [{'id': 1}])
+        requester = Task(None, True)
+        requester.cancelled = True
+        updates = []
+        
+        with self._inline_executor(), patch('utils.api_client.current_task', return_value=requester):
+            client.get_cached('events', on_update=updates.append)
+        
+        assert updates == []
+        assert client._cache.get(client._cache_key('events')) == [{'id': 1}, {'id': 2}]
+    
+    @patch('requests.Session.get')
+    def test_async_get_owned_by_page(self, mock_get):
+        """async_get is cancelled with its owner and delivers through it"""
+        mock_get.return_value = self._ok([{'id': 1}])
+        client = APIClient()
+        client._cache = Cache(max_size=None)
+        page = Mock()
+        submitted = {}
+        executor = Mock()
+        
+        def submit(fn, *args, **kwargs):
+            submitted.update(kwargs)
+            return fn(*args)
+        executor.submit = submit
+        
+        with patch('utils.api_client.get_executor', return_value=executor), \
+                patch('utils.api_client.deliver') as deliver:
+            client.async_get('events', on_success=print, owner=page)
+        
+        assert submitted['owner'] is page
+        deliver.assert_called_once_with(page, print, [{'id': 1}])
+
+
+class TestAPIClientDiskCache:
+    """Test the persistent disk tier behind get_cached"""
+    
+    def _ok(self, payload):
+        response = Mock()
+        response.status_code = 200
+        response.json.return_value = payload
+        response.raise_for_status = Mock()
+        return response
+    
+    @pytest.fixture
+    def disk(self, tmp_path):
+        from utils.disk_cache import DiskCache
+        cache = DiskCache(str(tmp_path / 'cache.db'))
+        with patch('utils.api_client.get_disk_cache', return_value=cache):
+            yield cache
+        cache.close()
+    
+    def _client(self):
+        client = APIClient()
+        client._cache = Cache(max_size=None)
+        return client
+    
+    @patch('requests.Session.get')
+    def test_responses_written_through_to_disk(self, mock_get, disk):
+        """Fetched lists of disk-cached types are persisted with their tags"""
+        mock_get.return_value = self._ok([{'id': 1}])
+        self._client().get_cached('events')
+        
+        assert disk.get('api:events') == [{'id': 1}]
+        assert disk.invalidate_tags('events:1') == 1
+    
+    @patch('requests.Session.get')
+    def test_other_types_stay_in_memory(self, mock_get, disk):
+        """Only DISK_CACHE_TYPES are persisted"""
+        mock_get.return_value = self._ok({'name': 'me'})
+        self._client().get_cached('users/profile')
+        
+        assert disk.get_stats()['total_entries'] == 0
+    
+    @patch('requests.Session.get')
+    def test_user_scoped_paths_not_shared_through_disk(self, mock_get, disk):
+        """A second account on the same machine misses the first one's lists"""
+        mock_get.side_effect = [self._ok([{'id': 1}]), self._ok([{'id': 2}])]
+        first = self._client()
+        first.set_auth_token('student-a')
+        first.get_cached('events/registered')
+        assert disk.get_stats()['total_entries'] == 0
+        
+        # Same process restarted, another student logs in without a logout
+        second = self._client()
+        second.set_auth_token('student-b')
+        assert second.get_cached('events/registered') == [{'id': 2}]
+        assert mock_get.call_count == 2
+    
+    @patch('requests.Session.get')
+    def test_cold_start_served_from_disk(self, mock_get, disk):
+        """A new process (empty memory cache) reads fresh rows from disk"""
+        disk.set('api:resources', [{'id': 3}], ttl=60)
+        client = self._client()
+        
+        assert client.get_cached('resources') == [{'id': 3}]
+        assert mock_get.call_count == 0
+        assert client._cache.get(client._cache_key('resources')) == [{'id': 3}]
+    
+    @patch('requests.Session.get')
+    def test_stale_disk_row_shown_and_revalidated(self, mock_get, disk):
+        """Stale rows for SWR endpoints paint at once and refresh in the background"""
+        mock_get.return_value = self._ok([{'id': 1}, {'id': 2}])
+        disk.set('api:events', [{'id': 1}], ttl=0.001)
+        time.sleep(0.01)
+        executor = Mock()
+        executor.submit = lambda fn, *args, **kwargs: fn(*args, **kwargs)
+        updates = []
+        
+        with patch('utils.api_client.get_executor', return_value=executor):
+            result = self._client().get_cached('events', on_update=updates.append)
+        
+        assert result == [{'id': 1}]
+        assert updates == [[{'id': 1}, {'id': 2}]]
+        assert disk.get('api:events') == [{'id': 1}, {'id': 2}]
+    
+    @patch('requests.Session.get')
+    def test_offline_mode_serves_last_known_data(self, mock_get, disk):
+        """With offline mode on, a connection error falls back to the stale row"""
+        mock_get.side_effect = requests.ConnectionError()
+        disk.set('api:resources', [{'id': 3}], ttl=0.001)
+        time.sleep(0.01)
+        client = self._client()
+        
+        with patch.object(APIClient, '_offline_mode', return_value=False):
+            with pytest.raises(requests.ConnectionError):
+                client.get_cached('resources', swr=False)
+        with patch.object(APIClient, '_offline_mode', return_value=True):
+            assert client.get_cached('resources', swr=False) == [{'id': 3}]
+    
+    @patch('requests.Session.delete')
+    def test_writes_invalidate_disk_tier(self, mock_delete, disk):
+        """Write invalidation reaches rows persisted by an earlier session"""
+        mock_delete.return_value = self._ok({})
+        disk.set('api:events/5', {'id': 5}, tags=['events', 'events:5'])
+        disk.set('api:events/6', {'id': 6}, tags=['events', 'events:6'])
+        
+        self._client().delete('events/5')
+        
+        assert disk.get('api:events/5') is None
+        assert disk.get('api:events/6') == {'id': 6}
+
+
+class TestAPIClientHotPath:
+    """Test the shared connection pool and per-request overhead reductions"""
+    
+    def test_clients_share_sized_pool(self):
+        """Every client uses one session whose adapter is explicitly sized"""
+        a, b = APIClient(), APIClient()
+        
+        assert a.session is b.session
+        adapter = a.session.get_adapter('http://localhost:8080/api')
+        assert adapter._pool_maxsize >= 10
+    
+    def test_headers_precomputed_per_token(self):
+        """Repeated calls reuse one dict; extra headers never leak into it"""
+        client = APIClient()
+        client.set_auth_token('hot-path-token')
+        
+        first = client._get_headers()
+        extra = client._get_headers({'X-Trace': '1'})
+        
+        assert client._get_headers() is first
+        assert first == {'Content-Type': 'application/json',
+                         'Authorization': 'Bearer hot-path-token'}
+        assert extra['X-Trace'] == '1' and 'X-Trace' not in first
+        
+        other = APIClient()
+        other.set_auth_token('other-token')
+        assert other._get_headers()['Authorization'] == 'Bearer other-token'
+    
+    def test_query_parameters_encoded(self):
+        """Params are URL-encoded and appended with the right separator"""
+        assert APIClient._with_query('events', {'q': 'a&b c', 'page': 2}) == 'events?q=a%26b+c&page=2'
+        assert APIClient._with_query('events?status=open', {'limit': 5}) == 'events?status=open&limit=5'
+        assert APIClient._with_query('events', {'skip': None}) == 'events'
+        assert APIClient._with_query('events', {'id': [1, 2]}) == 'events?id=1&id=2'
+    
+    @patch('requests.Session.get')
+    def test_get_cached_params_on_endpoint_with_query(self, mock_get):
+        """get_cached params no longer produce a second '?'"""
+        mock_get.return_value = Mock(status_code=200, headers={}, content=b'[]',
+                                     json=Mock(return_value=[]))
+        client = APIClient()
+        client._cache = Cache(max_size=None)
+        with patch.object(APIClient, '_single_flight', SingleFlight()):
+            client.get_cached('events?status=open', params={'q': 'tech & data'}, swr=False)
+        
+        url = mock_get.call_args[0][0]
+        assert url.endswith('/events?status=open&q=tech+%26+data')
+    
+    def test_security_manager_imported_once(self):
+        """secure_* calls no longer import the security module per request"""
+        security_module = Mock()
+        factory = security_module.get_security_manager
+        factory.return_value.check_rate_limit.return_value = True
+        with patch.object(APIClient, '_security', None), \
+                patch.dict('sys.modules', {'utils.security': security_module}):
+            client = APIClient()
+            client.check_rate_limit('u1')
+            client.check_rate_limit('u1')
+            client.sanitize_data({'a': 1})
+        
+        assert factory.call_count == 1
+
+
 class TestAPIClientAuthentication:
     """Test authentication flows"""
     
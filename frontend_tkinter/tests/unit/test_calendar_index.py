@@ -0,0 +1,76 @@
+"""
+Unit Tests for Calendar Index
+Tests day and hour buckets, multi-day events and lazy tagging
+"""
+
+from datetime import date, datetime
+
+from utils.calendar_index import CalendarIndex
+from utils.models import to_models
+
+
+def ids(items):
+    return [(item['type'], item['id']) for item in items]
+
+
+EVENTS = [
+    {'id': 1, 'title': 'Lecture', 'start_time': '2025-11-20T09:30:00', 'end_time': '2025-11-20T11:00:00'},
+    {'id': 2, 'title': 'Retreat', 'start_time': '2025-11-21T18:00:00', 'end_time': '2025-11-23T12:00:00'},
+    {'id': 3, 'title': 'Party', 'start_time': '2025-11-20T22:00:00', 'end_time': '2025-11-21T00:00:00'},
+    {'id': 4, 'title': 'No date', 'start_time': ''},
+]
+BOOKINGS = [
+    {'id': 7, 'resource': 'Room 1', 'start_time': '2025-11-20 09:00:00', 'end_time': '2025-11-20 10:00:00'},
+]
+
+
+class TestCalendarIndex:
+    """Test lookups CalendarView makes while rendering"""
+
+    def test_day_lookup_orders_events_before_bookings(self):
+        index = CalendarIndex(EVENTS, BOOKINGS)
+
+        assert ids(index.on_date(date(2025, 11, 20))) == [('event', 1), ('event', 3), ('booking', 7)]
+        assert ids(index.on_date(datetime(2025, 11, 20, 15), 'bookings')) == [('booking', 7)]
+        assert index.on_date(date(2025, 11, 24)) == []
+
+    def test_multi_day_events_cover_each_day(self):
+        """Shown on every day up to the end; an end at midnight is not a day"""
+        index = CalendarIndex(EVENTS, BOOKINGS)
+
+        for day in (21, 22, 23):
+            assert ('event', 2) in ids(index.on_date(date(2025, 11, day)))
+        assert ids(index.on_date(date(2025, 11, 21))) == [('event', 2)]
+        assert index.count_on(date(2025, 11, 20)) == 3
+
+    def test_hour_slots(self):
+        index = CalendarIndex(EVENTS, BOOKINGS)
+
+        assert ids(index.at_hour(date(2025, 11, 20), 9)) == [('event', 1), ('booking', 7)]
+        assert ids(index.at_hour(date(2025, 11, 21), 18)) == [('event', 2)]
+        # Continues from midnight on its later days
+        assert ids(index.at_hour(date(2025, 11, 22), 0)) == [('event', 2)]
+
+    def test_items_are_tagged_once_and_lazily(self):
+        index = CalendarIndex(EVENTS, BOOKINGS)
+        assert index.get_stats()['tagged'] == 0
+
+        first = index.on_date(date(2025, 11, 20))
+        again = index.at_hour(date(2025, 11, 20), 9)
+
+        assert first[0] is again[0]
+        assert first[0]['type'] == 'event' and first[0]['title'] == 'Lecture'
+        assert 'type' not in EVENTS[0]
+        assert index.get_stats() == {'items': 4, 'undated': 1, 'days': 4, 'hours': 5, 'tagged': 3}
+
+    def test_records_use_their_parsed_times(self):
+        index = CalendarIndex(to_models('events', EVENTS[:2]))
+
+        assert ids(index.on_date(date(2025, 11, 22))) == [('event', 2)]
+
+    def test_span_is_capped(self):
+        index = CalendarIndex([{'id': 1, 'start_time': '2025-01-01T10:00:00', 'end_time': '2030-01-01T10:00:00'}],
+                              max_span_days=3)
+
+        assert index.count_on(date(2025, 1, 3)) == 1
+        assert index.count_on(date(2025, 1, 4)) == 0
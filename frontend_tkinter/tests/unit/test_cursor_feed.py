@@ -0,0 +1,155 @@
+"""
+Unit Tests for Cursor Feed
+Tests first-page loading, prefetching, the bounded window, local paging of
+plain-list responses and stale results after a restart
+"""
+
+import pytest
+import queue
+import threading
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlsplit
+
+from utils import task_executor
+from utils.cursor_feed import CursorFeed
+from utils.query_builder import ListQuery
+from utils.task_executor import TaskExecutor
+
+EVENTS = [{'id': i, 'title': f'Event {i:03d}'} for i in range(1, 101)]
+
+
+class FakePage:
+    """Stand-in page: delivered callbacks queue up until pumped (the UI thread)"""
+
+    def __init__(self):
+        self.callbacks = queue.Queue()
+
+    def after(self, delay, callback):
+        self.callbacks.put(callback)
+
+    def winfo_exists(self):
+        return True
+
+    def pump(self, count=1):
+        for _ in range(count):
+            self.callbacks.get(timeout=2)()
+
+
+class FakeAPI:
+    """Serves cursor pages of EVENTS matching q (or the whole list when plain=True)"""
+
+    def __init__(self, plain=False):
+        self.plain = plain
+        self.urls = []
+        self.gate = None
+
+    def get(self, url, priority=None):
+        self.urls.append(url)
+        if self.gate is not None:
+            self.gate.wait(2)
+        if self.plain:
+            return list(EVENTS)
+        params = {k: v[0] for k, v in parse_qs(urlsplit(url).query).items()}
+        rows = [e for e in EVENTS if params.get('q', '') in e['title']]
+        offset = int(params.get('cursor', 0))
+        end = offset + int(params['limit'])
+        return {'items': rows[offset:end], 'total': len(rows),
+                'next_cursor': str(end) if end < len(rows) else None}
+
+
+@pytest.fixture
+def executor():
+    """Fresh executor installed as the global instance"""
+    ex = TaskExecutor(io_workers=4, cpu_workers=1)
+    with patch.object(task_executor, '_global_executor', ex):
+        yield ex
+    ex.shutdown(wait=True)
+
+
+def make_feed(api, **kwargs):
+    page = FakePage()
+    shown, dropped = [], []
+    feed = CursorFeed(page, ListQuery('events', api=api), page_size=10,
+                      on_page=lambda p, at_start: shown.append((p.index, at_start)),
+                      on_drop=lambda p, at_start: dropped.append((p.index, at_start)),
+                      **kwargs)
+    return page, feed, shown, dropped
+
+
+class TestCursorFeed:
+    """Test suite for CursorFeed"""
+
+    def test_first_page_only_then_prefetch(self, executor):
+        """Starting fetches one page; showing it prefetches the next"""
+        api = FakeAPI()
+        page, feed, shown, _ = make_feed(api)
+        feed.start()
+        page.pump()
+
+        assert shown == [(0, False)]
+        assert [e['id'] for e in feed.items] == list(range(1, 11))
+        assert feed.total == 100
+
+        page.pump()  # Prefetched page 1 arrives but is only buffered
+        assert shown == [(0, False)]
+        assert len(api.urls) == 2
+
+        feed.on_scroll(0.5, 0.9)
+        assert shown == [(0, False), (1, False)]
+        assert feed.get_stats()['prefetch_hits'] == 1
+
+    def test_window_is_bounded(self, executor):
+        """Old pages are dropped and reloaded when scrolling back up"""
+        api = FakeAPI()
+        page, feed, shown, dropped = make_feed(api, max_pages=3)
+        feed.start()
+        page.pump(2)
+        for _ in range(4):
+            feed.show_next()
+            page.pump()  # Next prefetch
+
+        assert [p.index for p in feed.pages] == [2, 3, 4]
+        assert dropped == [(0, True), (1, True)]
+
+        feed.show_previous()
+        page.pump()
+        assert [p.index for p in feed.pages] == [1, 2, 3]
+        assert dropped[-1] == (4, False)
+        assert feed.items[0]['id'] == 11
+
+    def test_plain_list_is_paged_locally(self, executor):
+        """A server that ignores the cursor is asked only once"""
+        api = FakeAPI(plain=True)
+        page, feed, shown, _ = make_feed(api, max_pages=20)
+        feed.start()
+        page.pump()
+        while not feed.exhausted:
+            feed.show_next()
+
+        assert len(api.urls) == 1
+        assert len(feed.items) == 100
+        assert feed.get_stats()['local_pages'] == 9
+
+    def test_restart_ignores_stale_pages(self, executor):
+        """A page of the previous query is dropped when it arrives late"""
+        api = FakeAPI()
+        api.gate = threading.Event()
+        page, feed, shown, _ = make_feed(api)
+        feed.start()
+        feed.start(ListQuery('events', api=api).search('Event 05'))
+        api.gate.set()
+        page.pump(2)
+
+        assert shown == [(0, False)]
+        assert [e['id'] for e in feed.items] == list(range(50, 60))
+
+    def test_remove_adjusts_total(self, executor):
+        """Removed rows leave the loaded pages and the total"""
+        api = FakeAPI()
+        page, feed, _, _ = make_feed(api)
+        feed.start()
+        page.pump()
+
+        assert feed.remove(lambda e: e['id'] in (2, 3)) == 2
+        assert [e['id'] for e in feed.items] == [1, 4, 5, 6, 7, 8, 9, 10]
+        assert feed.total == 98
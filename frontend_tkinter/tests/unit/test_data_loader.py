@@ -0,0 +1,147 @@
+"""
+Unit Tests for Data Loader
+Tests tick batching, bulk fetches, bounded fan-out and per-key errors
+"""
+
+import threading
+import time
+
+from utils.data_loader import DataLoader
+
+
+class Recorder:
+    """fetch_one / fetch_many stand-ins that record calls"""
+
+    def __init__(self, fail=(), bulk_error=None, delay=0.0):
+        self.fail = set(fail)
+        self.bulk_error = bulk_error
+        self.delay = delay
+        self.one_calls = []
+        self.many_calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def one(self, key):
+        with self._lock:
+            self.one_calls.append(key)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            if key in self.fail:
+                raise RuntimeError(f"boom {key}")
+            return f"value-{key}"
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def many(self, keys):
+        self.many_calls.append(list(keys))
+        if self.bulk_error:
+            raise self.bulk_error
+        return {str(key): f"bulk-{key}" for key in keys if key not in self.fail}
+
+
+class TestDataLoader:
+    """Test suite for DataLoader"""
+
+    def test_load_many_uses_one_bulk_request(self):
+        """All keys go out in a single bulk call (string keys accepted)"""
+        rec = Recorder()
+        loader = DataLoader(rec.one, rec.many)
+
+        result = loader.load_many([1, 2, 3])
+
+        assert result.values == {1: 'bulk-1', 2: 'bulk-2', 3: 'bulk-3'}
+        assert rec.many_calls == [[1, 2, 3]]
+        assert rec.one_calls == []
+
+    def test_keys_missing_from_bulk_fetched_individually(self):
+        """Bulk gaps fall back to per-key fetches"""
+        rec = Recorder()
+        loader = DataLoader(rec.one, lambda keys: {1: 'bulk-1'})
+
+        result = loader.load_many([1, 2])
+
+        assert result.values == {1: 'bulk-1', 2: 'value-2'}
+        assert rec.one_calls == [2]
+
+    def test_bulk_failure_falls_back_to_fan_out(self):
+        """A failing bulk endpoint is skipped for later batches too"""
+        rec = Recorder(bulk_error=RuntimeError('404'))
+        loader = DataLoader(rec.one, rec.many)
+
+        assert loader.load_many([1, 2]).values == {1: 'value-1', 2: 'value-2'}
+        loader.load_many([3])
+
+        assert len(rec.many_calls) == 1
+        assert sorted(rec.one_calls) == [1, 2, 3]
+        assert not loader.bulk_supported
+
+    def test_fan_out_concurrency_is_bounded(self):
+        """No more than max_concurrency requests run at once, but they overlap"""
+        rec = Recorder(delay=0.02)
+        loader = DataLoader(rec.one, max_concurrency=3)
+
+        start = time.perf_counter()
+        result = loader.load_many(range(12))
+        elapsed = time.perf_counter() - start
+
+        assert result.ok
+        assert rec.max_active == 3
+        assert elapsed < 12 * 0.02  # faster than sequential
+
+    def test_partial_failures_reported_per_key(self):
+        """One failing id does not fail the batch"""
+        rec = Recorder(fail={2})
+        loader = DataLoader(rec.one)
+
+        result = loader.load_many([1, 2, 3])
+
+        assert set(result.values) == {1, 3}
+        assert list(result.errors) == [2]
+        assert isinstance(result.errors[2], RuntimeError)
+        assert loader.get_stats()['errors'] == 1
+
+    def test_loads_in_one_tick_are_batched(self):
+        """Separate load() calls within the window share one bulk request"""
+        rec = Recorder()
+        loader = DataLoader(rec.one, rec.many, batch_window_ms=20)
+
+        futures = [loader.load(key) for key in (1, 2, 3)]
+
+        assert [f.result(timeout=2) for f in futures] == ['bulk-1', 'bulk-2', 'bulk-3']
+        assert rec.many_calls == [[1, 2, 3]]
+
+    def test_results_memoized_and_cleared(self):
+        """Loaded keys are reused until cleared; errors are not cached"""
+        rec = Recorder(fail={2})
+        loader = DataLoader(rec.one)
+        loader.load_many([1, 2])
+        loader.load_many([1, 2])
+
+        assert rec.one_calls == [1, 2, 2]
+
+        loader.clear(1)
+        loader.load_many([1])
+        assert rec.one_calls == [1, 2, 2, 1]
+
+    def test_cache_ttl_expires(self):
+        """Values older than cache_ttl are fetched again"""
+        rec = Recorder()
+        loader = DataLoader(rec.one, cache_ttl=0.01)
+        loader.load_many([1])
+        time.sleep(0.02)
+        loader.load_many([1])
+
+        assert rec.one_calls == [1, 1]
+
+    def test_prime(self):
+        """Primed values are served without fetching"""
+        rec = Recorder()
+        loader = DataLoader(rec.one)
+        loader.prime(7, ['cached'])
+
+        assert loader.load(7).result(timeout=1) == ['cached']
+        assert rec.one_calls == []
@@ -0,0 +1,101 @@
+"""
+Unit Tests for DateTime Service
+Tests shared timestamp parsing, display formatting, relative times and
+memoization
+"""
+
+from datetime import date, datetime
+
+import pytest
+
+from utils import datetime_service
+from utils.datetime_service import (format_date, format_datetime, format_relative,
+                                    parse_date, parse_datetime)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    datetime_service.clear_cache()
+    yield
+    datetime_service.clear_cache()
+
+
+class TestParsing:
+    """Test parse_datetime and parse_date"""
+
+    @pytest.mark.parametrize('text', [
+        '2025-11-20T09:30:00',
+        '2025-11-20 09:30:00',
+        '2025-11-20T09:30',
+        '2025-11-20T09:30:00.123456Z',
+        '2025-11-20T09:30:00+02:00',
+        '2025-11-20T09:30Z',
+        '2025-11-20T09:30+02:00',
+        '2025-11-20 09:30-05:00',
+        '2025/11/20 09:30',
+        '20/11/2025 09:30',
+    ])
+    def test_timestamp_formats(self, text):
+        """ISO variants and the fallback formats give the wall-clock time"""
+        assert parse_datetime(text) == datetime(2025, 11, 20, 9, 30)
+
+    def test_zoned_times_without_seconds_are_naive(self):
+        """Comparable with naive times (records, calendar spans, sorting)"""
+        start = parse_datetime('2025-11-20T09:00Z')
+        end = parse_datetime('2025-11-20T10:00:00')
+
+        assert start.tzinfo is None and parse_datetime('2025-11-20T09:00+02:00').tzinfo is None
+        assert start < end
+        assert format_relative('2025-11-20T09:00Z')
+
+    def test_date_only_and_other_types(self):
+        assert parse_datetime('2025-11-20') == datetime(2025, 11, 20)
+        assert parse_datetime(date(2025, 11, 20)) == datetime(2025, 11, 20)
+        assert parse_datetime([2025, 11, 20, 9, 30]) == datetime(2025, 11, 20, 9, 30)
+        assert parse_date('2025-11-20T23:59:59') == date(2025, 11, 20)
+
+    @pytest.mark.parametrize('value', [None, '', 'TBD', '2025-13-45', [2025], 42])
+    def test_missing_or_invalid(self, value):
+        assert parse_datetime(value) is None
+        assert parse_date(value) is None
+
+    def test_repeated_strings_are_memoized(self):
+        """The same string is parsed once"""
+        for _ in range(5):
+            parse_datetime('2025-11-20T09:30:00')
+
+        stats = datetime_service.get_stats()['parse']
+        assert (stats['misses'], stats['hits'], stats['size']) == (1, 4, 1)
+
+
+class TestFormatting:
+    """Test display formatting"""
+
+    def test_format_date_and_datetime(self):
+        assert format_date('2025-11-20T09:30:00') == 'November 20, 2025'
+        assert format_date('2025-11-20', '%b %d, %Y') == 'Nov 20, 2025'
+        assert format_datetime(datetime(2025, 11, 20, 14, 5)) == 'November 20, 2025 02:05 PM'
+
+    def test_missing_and_unparsable(self):
+        """Missing values give the placeholder; unknown text is shown as-is"""
+        assert format_date('') == 'N/A'
+        assert format_date(None, empty='TBD') == 'TBD'
+        assert format_date('Next week') == 'Next week'
+
+    @pytest.mark.parametrize('value, expected', [
+        ('2025-11-20 11:59:30', 'Just now'),
+        ('2025-11-20 11:55:00', '5 minutes ago'),
+        ('2025-11-20 09:00:00', '3 hours ago'),
+        ('2025-11-19 09:15:00', 'Yesterday at 09:15 AM'),
+        ('2025-11-16 12:00:00', '4 days ago'),
+        ('2025-10-01 09:15:00', 'Oct 01, 2025 at 09:15 AM'),
+        ('', 'Just now'),
+        ('unknown', 'unknown'),
+    ])
+    def test_format_relative(self, value, expected):
+        assert format_relative(value, now=datetime(2025, 11, 20, 12, 0)) == expected
+
+    def test_relative_counts_whole_days(self):
+        """Older timestamps are not mistaken for today by their time of day"""
+        assert format_relative('2025-11-10 11:59:00', now=datetime(2025, 11, 20, 12, 0)) \
+            == 'Nov 10, 2025 at 11:59 AM'
@@ -0,0 +1,128 @@
+"""
+Unit Tests for Disk Cache
+Tests the persistent SQLite response cache tier
+"""
+
+import pytest
+import time
+
+from utils.disk_cache import DiskCache
+
+
+@pytest.fixture
+def disk(tmp_path):
+    """Disk cache in a temporary database file"""
+    cache = DiskCache(str(tmp_path / 'cache' / 'test_cache.db'), default_ttl=60)
+    yield cache
+    cache.close()
+
+
+class TestDiskCache:
+    """Test suite for DiskCache"""
+
+    def test_roundtrip(self, disk):
+        """Stored values come back decoded"""
+        events = [{'id': 1, 'title': 'Hackathon'}, {'id': 2, 'title': 'Career Fair'}]
+        disk.set('api:events', events)
+
+        assert disk.get('api:events') == events
+        assert disk.get('api:missing') is None
+
+    def test_survives_reopen(self, tmp_path):
+        """Entries persist across connections (i.e. app restarts)"""
+        path = str(tmp_path / 'persist.db')
+        first = DiskCache(path)
+        first.set('api:events', [{'id': 1}])
+        first.close()
+
+        second = DiskCache(path)
+        assert second.get('api:events') == [{'id': 1}]
+        assert second.get_stats()['bytes_used'] > 0
+        second.close()
+
+    def test_wal_mode(self, disk):
+        """Database uses write-ahead logging"""
+        mode = disk._conn.execute('PRAGMA journal_mode').fetchone()[0]
+        assert mode.lower() == 'wal'
+
+    def test_large_bodies_compressed(self, disk):
+        """Bodies above the threshold are zlib-compressed"""
+        events = [{'id': i, 'title': 'Event', 'description': 'x' * 50} for i in range(100)]
+        disk.set('api:events', events)
+        disk.set('api:small', {'id': 1})
+
+        rows = dict(disk._conn.execute('SELECT key, compressed FROM responses').fetchall())
+        assert rows == {'api:events': 1, 'api:small': 0}
+        assert disk.get('api:events') == events
+        assert disk.get_stats()['compression_ratio'] > 1
+
+    def test_expired_rows_served_as_stale(self, disk):
+        """Expired rows are not fresh but stay readable"""
+        disk.set('api:events', ['old'], ttl=0.01)
+        time.sleep(0.02)
+
+        assert disk.get('api:events') is None
+        assert disk.get_with_state('api:events') == (['old'], False)
+        value, remaining = disk.get_entry('api:events')
+        assert remaining < 0
+
+    def test_cleanup_removes_rows_past_max_stale(self, tmp_path):
+        """cleanup_expired only drops rows older than max_stale"""
+        disk = DiskCache(str(tmp_path / 'c.db'), max_stale=0.01)
+        disk.set('api:old', 1, ttl=0.01)
+        disk.set('api:new', 2, ttl=60)
+        time.sleep(0.05)
+
+        assert disk.cleanup_expired() == 1
+        assert disk.get('api:new') == 2
+        disk.close()
+
+    def test_byte_budget_evicts_lru(self, tmp_path):
+        """Least recently used rows are evicted past max_bytes"""
+        disk = DiskCache(str(tmp_path / 'c.db'), max_bytes=300, compress_min_bytes=10_000)
+        for i in range(3):
+            disk.set(f'api:item/{i}', 'x' * 80 + str(i))
+            time.sleep(0.001)
+        disk.get('api:item/0')
+        disk.set('api:item/3', 'y' * 80)
+
+        assert disk.get('api:item/1') is None
+        assert disk.get('api:item/0') is not None
+        stats = disk.get_stats()
+        assert stats['bytes_used'] <= 300
+        assert stats['evictions'] == 1
+        disk.close()
+
+    def test_unserializable_value_skipped(self, disk):
+        """Values that are not JSON are not stored"""
+        disk.set('api:obj', object())
+        assert disk.get_stats()['total_entries'] == 0
+
+    def test_invalidate_prefix_is_segment_aligned(self, disk):
+        """Prefix invalidation matches whole path segments and query strings"""
+        for key in ('api:events/5', 'api:events/5?full=1', 'api:events/5/registrations',
+                    'api:events/50', 'api:events/5x'):
+            disk.set(key, 1)
+
+        assert disk.invalidate_prefix('api:events/5') == 3
+        assert disk.get('api:events/50') == 1
+        assert disk.get('api:events/5x') == 1
+
+    def test_invalidate_tags(self, disk):
+        """Tagged rows are removed together with their tag index"""
+        disk.set('api:events', [1], tags=['events:list', 'events:1'])
+        disk.set('api:events/1', {'id': 1}, tags=['events:1'])
+        disk.set('api:events/2', {'id': 2}, tags=['events:2'])
+
+        assert disk.invalidate_tags('events:1') == 2
+        assert disk.get('api:events/2') == {'id': 2}
+        assert disk._conn.execute('SELECT COUNT(*) FROM response_tags').fetchone()[0] == 1
+
+    def test_clear(self, disk):
+        """clear() empties the cache"""
+        disk.set('api:events', [1], tags=['events:list'])
+        disk.clear()
+
+        stats = disk.get_stats()
+        assert stats['total_entries'] == 0
+        assert stats['bytes_used'] == 0
@@ -0,0 +1,155 @@
+"""
+Unit Tests for Entity Store
+Tests canonical rows, complete loads, live queries and subscriptions
+"""
+
+import pytest
+from unittest.mock import patch
+
+from utils import entity_store
+from utils.entity_store import EntityStore, events_by_organizer, is_pending, pending_bookings
+
+
+class FakeWidget:
+    """Owner stand-in that can be 'destroyed'"""
+
+    def __init__(self):
+        self.exists = True
+
+    def winfo_exists(self):
+        return self.exists
+
+
+@pytest.fixture
+def store():
+    """Fresh store installed as the global instance"""
+    s = EntityStore()
+    with patch.object(entity_store, '_global_store', s):
+        yield s
+
+
+class TestEntityStore:
+    """Test suite for EntityStore"""
+
+    def test_equal_rows_share_one_object(self, store):
+        """Loading the same entity from two endpoints keeps one dict"""
+        all_events = store.load('events', [{'id': 1, 'title': 'A'}, {'id': 2, 'title': 'B'}])
+        registered = store.load('events', [{'id': 2, 'title': 'B'}])
+
+        assert registered[0] is all_events[1]
+        assert store.get_stats()['rows_reused'] == 1
+
+    def test_changed_row_replaces_entity(self, store):
+        """A newer version of a row becomes the canonical one"""
+        store.load('events', [{'id': 1, 'title': 'A'}])
+        store.load('events', [{'id': 1, 'title': 'A2'}])
+
+        assert store.get('events', 1) == {'id': 1, 'title': 'A2'}
+
+    def test_complete_load_removes_missing(self, store):
+        """complete=True drops entities the server no longer lists, in server order"""
+        store.load('events', [{'id': 1}, {'id': 2}, {'id': 3}])
+        store.load('events', [{'id': 3}, {'id': 1}], complete=True)
+
+        assert store.all('events') == [{'id': 3}, {'id': 1}]
+
+    def test_complete_predicate_scopes_removal(self, store):
+        """A predicate only removes matching entities"""
+        store.load('bookings', [{'id': 1, 'status': 'PENDING'}, {'id': 2, 'status': 'APPROVED'},
+                                {'id': 3, 'status': 'PENDING'}])
+        store.load('bookings', [{'id': 3, 'status': 'PENDING'}], complete=is_pending)
+
+        assert [b['id'] for b in store.all('bookings')] == [2, 3]
+        assert [b['id'] for b in pending_bookings().rows] == [3]
+
+    def test_partial_rows_keep_detail_fields(self, store):
+        """Summary rows update a full record without dropping its other fields"""
+        full = store.load('events', [{'id': 1, 'title': 'A', 'description': 'Long text'}])[0]
+        same = store.load('events', [{'id': 1, 'title': 'A'}], partial=True)[0]
+        newer = store.load('events', [{'id': 1, 'title': 'A2'}], partial=True)[0]
+
+        assert same is full
+        assert newer == {'id': 1, 'title': 'A2', 'description': 'Long text'}
+        assert full['title'] == 'A'
+
+    def test_rows_without_id_pass_through(self, store):
+        """Rows lacking an id are returned but not stored"""
+        rows = store.load('events', [{'title': 'no id'}])
+        assert rows == [{'title': 'no id'}]
+        assert store.all('events') == []
+
+
+class TestQueries:
+    """Test live queries and subscriptions"""
+
+    def test_query_rows_identity_stable(self, store):
+        """rows is the same list object until the result changes"""
+        store.load('events', [{'id': 1, 'organizer_id': 7}])
+        query = events_by_organizer(7)
+        first = query.rows
+
+        store.load('events', [{'id': 1, 'organizer_id': 7}])  # no change
+        assert query.rows is first
+        store.load('events', [{'id': 2, 'organizer_id': 8}])  # other organizer
+        assert query.rows is first
+
+        store.load('events', [{'id': 3, 'organizerId': 7}])
+        assert [e['id'] for e in query.rows] == [1, 3]
+
+    def test_named_queries_are_shared(self, store):
+        """Every page asking for the same named query gets one object"""
+        assert events_by_organizer(5) is events_by_organizer(5)
+        assert store.query('events') is store.query('events')
+
+    def test_one_fetch_updates_every_subscriber(self, store):
+        """Subscribers on different pages are all notified once"""
+        page_a, page_b = [], []
+        store.query('events').subscribe(page_a.append, owner=FakeWidget())
+        events_by_organizer(7).subscribe(page_b.append, owner=FakeWidget())
+
+        store.load('events', [{'id': 1, 'organizer_id': 7}], complete=True)
+
+        assert page_a == [[{'id': 1, 'organizer_id': 7}]]
+        assert page_b == [[{'id': 1, 'organizer_id': 7}]]
+        assert page_a[0][0] is page_b[0][0]
+
+    def test_unaffected_query_not_notified(self, store):
+        """Changes outside a query's filter do not call its subscribers"""
+        calls = []
+        events_by_organizer(7).subscribe(calls.append)
+
+        store.load('events', [{'id': 1, 'organizer_id': 8}])
+        assert calls == []
+
+    def test_destroyed_owner_unsubscribed(self, store):
+        """Subscriptions end when the owning widget is destroyed"""
+        calls = []
+        page = FakeWidget()
+        store.query('events').subscribe(calls.append, owner=page)
+
+        page.exists = False
+        store.load('events', [{'id': 1}])
+
+        assert calls == []
+        assert store.get_stats()['subscriptions'] == 0
+
+    def test_unsubscribe_owner(self, store):
+        """unsubscribe_owner removes a page's subscriptions"""
+        calls = []
+        page = FakeWidget()
+        store.query('events').subscribe(calls.append, owner=page)
+
+        store.unsubscribe_owner(page)
+        store.load('events', [{'id': 1}])
+        assert calls == []
+
+    def test_remove_and_clear_notify(self, store):
+        """remove() and clear() update queries"""
+        calls = []
+        store.load('events', [{'id': 1}, {'id': 2}])
+        store.query('events').subscribe(calls.append)
+
+        store.remove('events', 1)
+        store.clear()
+
+        assert calls == [[{'id': 2}], []]
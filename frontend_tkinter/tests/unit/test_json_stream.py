@@ -0,0 +1,91 @@
+"""
+Unit Tests for JSON Stream
+Tests item-by-item decoding across chunk boundaries, envelope bodies,
+malformed bodies and the fast codec fallback
+"""
+
+import json
+import math
+import pytest
+
+from utils import json_stream
+from utils.json_stream import JSONListStream, iter_json_list, loads
+
+ITEMS = [
+    {'id': 1, 'title': 'Café "Launch" \\ Night 🎉', 'tags': ['a', 'b]'], 'venue': None},
+    -2.5e3,
+    12345678901234567890,
+    'text, with [brackets]',
+    [],
+    {},
+    True,
+    False,
+    None,
+    7,
+]
+BODY = json.dumps(ITEMS, ensure_ascii=False).encode('utf-8')
+
+
+def chunked(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestJSONListStream:
+    """Test suite for JSONListStream"""
+
+    def test_every_split_point(self):
+        """Splitting the body at any byte gives the same items"""
+        for split in range(1, len(BODY)):
+            stream = JSONListStream()
+            items = stream.feed(BODY[:split]) + stream.feed(BODY[split:]) + stream.close()
+            assert items == ITEMS, split
+
+    @pytest.mark.parametrize('size', [1, 3, 64])
+    def test_small_chunks(self, size):
+        """Byte-sized chunks decode and yield every item"""
+        assert list(iter_json_list(chunked(BODY, size))) == ITEMS
+
+    def test_items_yielded_before_body_ends(self):
+        """Complete items are returned by feed(), not only by close()"""
+        stream = JSONListStream()
+        first = stream.feed(b'[{"id": 1}, {"id": 2}, {"id"')
+
+        assert first == [{'id': 1}, {'id': 2}]
+        assert stream.feed(b': 3}]') == [{'id': 3}]
+        assert stream.done
+
+    def test_envelope_keeps_meta(self):
+        """An envelope yields its items; the other keys go to meta"""
+        body = json.dumps({'total': 40, 'items': ITEMS[:2], 'next_cursor': 'x'}).encode()
+        stream = JSONListStream()
+
+        assert list(iter_json_list(chunked(body, 5), stream)) == ITEMS[:2]
+        assert stream.meta == {'total': 40, 'next_cursor': 'x'}
+
+    def test_empty_list(self):
+        assert list(iter_json_list([b' [ ', b'] '])) == []
+
+    @pytest.mark.parametrize('body', [b'[1, 2', b'[1 2]', b'[1,]', b'[1] x', b''])
+    def test_malformed_body_raises(self, body):
+        """Truncated or invalid bodies raise a JSONDecodeError"""
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_json_list([body]))
+
+    def test_non_list_body_raises(self):
+        with pytest.raises(ValueError):
+            list(iter_json_list([b'{"message": "no items"}']))
+
+
+class TestLoads:
+    """Test the whole-body decoder"""
+
+    def test_loads_matches_json(self):
+        assert loads(BODY) == ITEMS
+
+    def test_loads_without_fast_codec(self, monkeypatch):
+        monkeypatch.setattr(json_stream, 'orjson', None)
+        assert loads(BODY) == ITEMS
+
+    def test_loads_accepts_what_json_accepts(self):
+        """Values the fast codec rejects fall back to the standard library"""
+        assert math.isnan(loads(b'[NaN]')[0])
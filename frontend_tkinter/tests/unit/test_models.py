@@ -0,0 +1,108 @@
+"""
+Unit Tests for Entity Models
+Tests compact records: mapping reads, shared key tables, derived attributes
+and loading through the entity store
+"""
+
+import pickle
+from datetime import datetime
+
+import pytest
+
+from utils.entity_store import EntityStore
+from utils.models import Booking, Event, Resource, User, to_model, to_models
+
+EVENT = {'id': 1, 'title': 'AI Workshop', 'startTime': '2025-11-20T09:00:00',
+         'endTime': '2025-11-20 12:00:00', 'venue': 'Hall A', 'category': 'Technology',
+         'status': 'APPROVED', 'organizerId': 7}
+
+
+class TestRecord:
+    """Test suite for Record behaviour (through Event)"""
+
+    def test_reads_like_the_row(self):
+        """get, [], in, len, iteration and equality match the source dict"""
+        event = Event.from_row(EVENT)
+
+        assert event['title'] == 'AI Workshop'
+        assert event.get('missing', 'x') == 'x'
+        assert 'venue' in event and 'description' not in event
+        assert list(event) == list(EVENT) and len(event) == len(EVENT)
+        assert event == EVENT and dict(event) == EVENT
+        assert {**event, 'title': 'B'}['title'] == 'B'
+        with pytest.raises(KeyError):
+            event['missing']
+
+    def test_read_only(self):
+        """Records cannot be edited in place; copy() gives a dict"""
+        event = Event.from_row(EVENT)
+        with pytest.raises(TypeError):
+            event['title'] = 'Changed'
+
+        copy = event.copy()
+        copy['title'] = 'Changed'
+        assert event['title'] == 'AI Workshop'
+
+    def test_rows_share_key_table_and_enum_strings(self):
+        """Rows with the same keys share one table; statuses are interned"""
+        first = Event.from_row(dict(EVENT))
+        second = Event.from_row({**EVENT, 'id': 2, 'status': ''.join(['APP', 'ROVED'])})
+
+        assert first._shape is second._shape
+        assert first['status'] is second['status']
+        assert first != second
+
+    def test_derived_attributes(self):
+        """Datetimes, lowercase enums and the search key are computed once"""
+        event = Event.from_row(EVENT)
+
+        assert event.start == datetime(2025, 11, 20, 9, 0)
+        assert event.end == datetime(2025, 11, 20, 12, 0)
+        assert (event.status, event.category, event.organizer_id) == ('approved', 'technology', 7)
+        assert 'workshop' in event.search_key and 'hall a' in event.search_key
+
+    def test_missing_and_invalid_fields(self):
+        event = Event.from_row({'id': 2, 'start_time': 'soon'})
+        assert (event.start, event.end, event.status, event.search_key) == (None, None, '', '')
+
+    def test_pickle_round_trip(self):
+        event = Event.from_row(EVENT)
+        assert pickle.loads(pickle.dumps(event)) == event
+
+
+class TestModels:
+    """Test the other entity types and the helpers"""
+
+    def test_booking_combines_date_and_time(self):
+        booking = Booking.from_row({'id': 1, 'date': '2025-11-03', 'start_time': '14:00',
+                                    'end_time': '15:30', 'status': 'Pending',
+                                    'resource_name': 'Lab 1'})
+
+        assert booking.start == datetime(2025, 11, 3, 14, 0)
+        assert booking.end == datetime(2025, 11, 3, 15, 30)
+        assert booking.status == 'pending' and 'lab 1' in booking.search_key
+
+    def test_resource_and_user(self):
+        resource = Resource.from_row({'id': 1, 'name': 'Room 101', 'type': 'CLASSROOM'})
+        user = User.from_row({'id': 1, 'name': 'Ann', 'email': 'ann@uni.edu',
+                              'role': 'ADMIN', 'created_at': '2025-01-02'})
+
+        assert resource.type == 'classroom'
+        assert (user.role, user.created) == ('admin', datetime(2025, 1, 2))
+
+    def test_to_models(self):
+        """Known types are wrapped; other types and non-objects pass through"""
+        assert isinstance(to_model('events', EVENT), Event)
+        assert to_model('notifications', {'id': 1}) == {'id': 1}
+        assert type(to_model('notifications', {'id': 1})) is dict
+        assert to_models('users', None) == []
+
+    def test_store_holds_records(self):
+        """The entity store keeps records and reuses them for equal rows"""
+        store = EntityStore()
+        first = store.load('events', [dict(EVENT)])[0]
+        again = store.load('events', [dict(EVENT)])[0]
+
+        assert isinstance(first, Event)
+        assert again is first
+        assert store.get_stats()['rows_reused'] == 1
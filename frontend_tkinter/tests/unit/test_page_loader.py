@@ -0,0 +1,192 @@
+"""
+Unit Tests for Page Loader
+Tests parallel sections, dependencies, fallbacks, per-section delivery and timing
+"""
+
+import pytest
+import threading
+import time
+from unittest.mock import patch
+
+from utils import task_executor
+from utils.page_loader import PageLoader
+from utils.task_executor import TaskExecutor
+
+
+class FakePage:
+    """Stand-in page: runs delivered callbacks immediately and logs them"""
+
+    def __init__(self):
+        self.log = []
+        self._lock = threading.Lock()
+
+    def after(self, delay, callback):
+        callback()
+
+    def winfo_exists(self):
+        return True
+
+    def record(self, name):
+        def callback(value):
+            with self._lock:
+                self.log.append((name, value))
+        return callback
+
+
+@pytest.fixture
+def executor():
+    """Fresh executor installed as the global instance"""
+    ex = TaskExecutor(io_workers=4, cpu_workers=1)
+    with patch.object(task_executor, '_global_executor', ex):
+        yield ex
+    ex.shutdown(wait=True)
+
+
+def slow(value, seconds=0.1):
+    def fetch(*args):
+        time.sleep(seconds)
+        return value
+    return fetch
+
+
+class TestPageLoader:
+    """Test suite for PageLoader"""
+
+    def test_independent_sections_run_in_parallel(self, executor):
+        """Wall-clock time is the slowest section, not the sum"""
+        page = FakePage()
+        loader = PageLoader(page)
+        for name in ('events', 'users', 'resources'):
+            loader.section(name, slow(name))
+
+        start = time.perf_counter()
+        loader.start()
+        assert loader.wait(2)
+        elapsed = time.perf_counter() - start
+
+        assert loader.values == {'events': 'events', 'users': 'users', 'resources': 'resources'}
+        assert elapsed < 0.25
+        stats = loader.get_stats()
+        assert all(ms >= 90 for ms in stats['timings_ms'].values())
+        assert stats['sequential_ms'] > stats['total_ms']
+
+    def test_dependent_section_gets_dependency_value(self, executor):
+        """depends_on passes values in order and waits for them"""
+        page = FakePage()
+        loader = PageLoader(page)
+        loader.section('events', slow([1, 2], 0.05))
+        loader.section('registrations', lambda events: {e: [] for e in events},
+                       depends_on=('events',))
+        loader.start()
+        assert loader.wait(2)
+
+        assert loader.values['registrations'] == {1: [], 2: []}
+
+    def test_fallback_used_when_fetch_fails(self, executor):
+        """admin/resources -> resources style fallback"""
+        def forbidden():
+            raise PermissionError('403')
+
+        loader = PageLoader(FakePage())
+        loader.section('resources', forbidden, fallback=lambda: ['room'], default=[])
+        loader.start()
+        assert loader.wait(2)
+
+        assert loader.values['resources'] == ['room']
+        assert loader.errors == {}
+        assert loader.get_stats()['fallbacks'] == ['resources']
+
+    def test_failures_use_default_and_propagate(self, executor):
+        """A failed section gets its default; its dependents fail without fetching"""
+        error = ConnectionError('down')
+        calls = []
+
+        def boom():
+            raise error
+
+        page = FakePage()
+        loader = PageLoader(page)
+        loader.section('events', boom, default=[], on_ready=page.record('events'))
+        loader.section('registrations', lambda events: calls.append(events),
+                       depends_on=('events',), default={})
+        loader.section('users', lambda: ['u'])
+        completed = []
+        loader.start(on_complete=completed.append)
+        assert loader.wait(2)
+
+        assert calls == []
+        assert loader.values == {'events': [], 'registrations': {}, 'users': ['u']}
+        assert loader.errors == {'events': error, 'registrations': error}
+        assert page.log == [('events', [])]
+        assert completed == [loader]
+
+    def test_sections_delivered_as_they_arrive(self, executor):
+        """A fast section renders before a slow one finishes; on_complete is last"""
+        page = FakePage()
+        loader = PageLoader(page)
+        loader.section('slow', slow('s', 0.2), on_ready=page.record('slow'))
+        loader.section('fast', slow('f', 0.01), on_ready=page.record('fast'))
+        loader.start(on_complete=lambda _: page.record('complete')(None))
+
+        time.sleep(0.1)
+        assert page.log == [('fast', 'f')]
+        assert loader.wait(2)
+        time.sleep(0.01)
+        assert [name for name, _ in page.log] == ['fast', 'slow', 'complete']
+
+    def test_invalid_graph_rejected(self, executor):
+        """Unknown dependencies and cycles fail fast"""
+        unknown = PageLoader(FakePage()).section('a', lambda x: x, depends_on=('missing',))
+        with pytest.raises(ValueError):
+            unknown.start()
+
+        cycle = (PageLoader(FakePage())
+                 .section('a', lambda b: b, depends_on=('b',))
+                 .section('b', lambda a: a, depends_on=('a',)))
+        with pytest.raises(ValueError):
+            cycle.start()
+
+    def test_cancelled_owner_stops_dependents(self, executor):
+        """Navigating away mid-load does not start the remaining sections"""
+        page = FakePage()
+        release = threading.Event()
+        calls = []
+
+        def first():
+            release.wait(2)
+            return 1
+
+        loader = PageLoader(page)
+        loader.section('first', first)
+        loader.section('second', lambda v: calls.append(v), depends_on=('first',))
+        loader.start()
+        time.sleep(0.05)
+        executor.cancel_owner(page)
+        release.set()
+        time.sleep(0.1)
+
+        assert calls == []
+        assert loader.wait(1)
+        assert loader.get_stats()['cancelled'] == ['second']
+
+    def test_cancel_before_sections_start_ends_wait(self, executor):
+        """Sections still queued when the page is cancelled count as cancelled"""
+        page = FakePage()
+        busy = threading.Event()
+        completed = []
+        # Occupy every worker so the loader's sections stay queued
+        for _ in range(4):
+            executor.submit(busy.wait, 2)
+
+        loader = PageLoader(page)
+        loader.section('a', lambda: 1)
+        loader.section('b', lambda: 2)
+        loader.section('c', lambda a: a, depends_on=('a',))
+        loader.start(on_complete=completed.append)
+        executor.cancel_owner(page)
+        busy.set()
+
+        assert loader.wait(1)
+        assert loader.done
+        assert set(loader.get_stats()['cancelled']) == {'a', 'b', 'c'}
+        assert completed == []
@@ -0,0 +1,152 @@
+"""
+Unit Tests for Query Builder
+Tests canonical encoding, refinement checks and the client-side fallback
+"""
+
+import pytest
+from datetime import date, datetime
+
+from utils.query_builder import ListQuery
+
+EVENTS = [
+    {'id': 1, 'title': 'Chess Club', 'category': 'Social', 'start_time': '2025-10-20 14:00:00',
+     'registered_count': 5, 'organizerId': 2},
+    {'id': 2, 'title': 'AI Talk', 'category': 'academic', 'start_time': '2025-10-21T09:00:00',
+     'registered_count': 40, 'organizerId': 3},
+    {'id': 3, 'title': 'Hackathon', 'category': 'Workshop', 'start_time': '2025-11-02T10:00:00',
+     'registered_count': None, 'organizerId': 2},
+    {'id': 4, 'title': 'Book Fair', 'category': 'Cultural', 'start_time': None,
+     'registered_count': 12, 'organizerId': '2'},
+]
+
+
+class TestListQuery:
+    """Test query building and evaluation"""
+
+    def test_canonical_encoded_url(self):
+        """Parameters are sorted and URL-encoded; None filters are skipped"""
+        a = (ListQuery('events').where(status='approved', role=None)
+             .search('R&D talks').order_by('-start_time').paginate(2, 9))
+        b = (ListQuery('/events/').paginate(2, 9).order_by('-start_time')
+             .search('R&D talks').where(status='approved'))
+
+        assert a.url == 'events?limit=9&page=2&q=R%26D+talks&sort=-start_time&status=approved'
+        assert a.url == b.url
+
+    def test_operator_values(self):
+        """Operators get suffixes; lists, dates and booleans are formatted"""
+        query = ListQuery('events').where(category__in=['sports', 'academic'],
+                                          start_time__gte=date(2025, 10, 1),
+                                          end_time__lt=datetime(2025, 10, 2, 8, 30),
+                                          featured=True)
+        params = dict(query.params())
+
+        assert params['category__in'] == 'academic,sports'
+        assert params['start_time__gte'] == '2025-10-01'
+        assert params['end_time__lt'] == '2025-10-02T08:30:00'
+        assert params['featured'] == 'true'
+
+        with pytest.raises(ValueError):
+            ListQuery('events').where(title__like='x')
+
+    def test_builder_is_immutable(self):
+        """Refining a query leaves the original untouched"""
+        base = ListQuery('events').where(organizerId=2)
+        base.paginate(3, 10).order_by('title')
+
+        assert base.url == 'events?organizerId=2'
+
+    def test_fallback_filters_sorts_and_pages(self):
+        """A plain list is filtered, sorted and paged on the client"""
+        query = (ListQuery('events').where(organizerId=2, category__in=['social', 'workshop', 'cultural'])
+                 .order_by('-registered_count').paginate(1, 2))
+        result = query.resolve(EVENTS)
+
+        assert [e['id'] for e in result.items] == [4, 1]
+        assert result.total == 3
+        assert result.pages == 2
+        assert result.next_cursor == '2'
+        assert not result.server_side
+        assert 'organizerId' in result.evaluated
+
+    def test_fallback_dates_and_missing_values(self):
+        """Mixed date formats compare as dates; missing values sort last"""
+        query = ListQuery('events').where(start_time__gte=date(2025, 10, 20),
+                                          start_time__lt=date(2025, 10, 22))
+        assert [e['id'] for e in query.evaluate(EVENTS).items] == [1, 2]
+
+        ordered = ListQuery('events').order_by('start_time').evaluate(EVENTS).items
+        assert [e['id'] for e in ordered] == [1, 2, 3, 4]
+        ordered = ListQuery('events').order_by('-start_time').evaluate(EVENTS).items
+        assert [e['id'] for e in ordered] == [3, 2, 1, 4]
+
+    def test_search_fields_case_insensitive(self):
+        """Search looks in the declared fields only"""
+        query = ListQuery('events').search('TALK', fields=('title',))
+        assert [e['id'] for e in query.evaluate(EVENTS).items] == [2]
+        assert ListQuery('events').search('talk', fields=('category',)).evaluate(EVENTS).items == []
+
+    def test_contains_list_field_tests_membership(self):
+        """contains matches list elements whole, text fields by substring"""
+        rooms = [{'id': 1, 'name': 'Lab A', 'amenities': ['blackboard', 'projector']},
+                 {'id': 2, 'name': 'Hall', 'amenities': ['AC', 'audio_visual']},
+                 {'id': 3, 'name': 'Annex', 'amenities': None}]
+
+        def ids(**conditions):
+            return [r['id'] for r in ListQuery('resources').where(**conditions).evaluate(rooms).items]
+
+        assert ids(amenities__contains='ac') == [2]
+        assert ids(amenities__contains='audio') == []
+        assert ids(amenities__contains='Projector') == [1]
+        assert ids(name__contains='a') == [1, 2, 3]
+
+    def test_overlaps_matches_any_value(self):
+        """overlaps keeps rows whose list field has any of the values"""
+        rooms = [{'id': 1, 'amenities': ['blackboard', 'projector']},
+                 {'id': 2, 'amenities': ['ac', 'wifi']},
+                 {'id': 3, 'amenities': []}]
+        query = ListQuery('resources').where(amenities__overlaps=['projector', 'ac'])
+
+        assert query.url == 'resources?amenities__overlaps=ac%2Cprojector'
+        assert [r['id'] for r in query.evaluate(rooms).items] == [1, 2]
+        assert ListQuery('resources').where(amenities__overlaps=['ac']).evaluate(
+            [{'id': 1, 'amenities': ['blackboard']}]).items == []
+
+    def test_envelope_applies_only_what_server_skipped(self):
+        """Parameters listed as applied are trusted, the rest run locally"""
+        query = ListQuery('events').where(organizerId=2).order_by('title').paginate(1, 10)
+        envelope = {'items': [EVENTS[2], EVENTS[0]], 'total': 2, 'applied': ['organizerId', 'page', 'limit']}
+        result = query.resolve(envelope)
+
+        assert [e['id'] for e in result.items] == [1, 3]
+        assert result.evaluated == ['sort']
+        assert result.total == 2
+
+        complete = query.resolve({'items': [EVENTS[0]], 'total': 25, 'next_cursor': 'c10'})
+        assert complete.server_side
+        assert complete.total == 25
+        assert complete.pages == 3
+        assert complete.next_cursor == 'c10'
+
+    def test_cursor_fallback(self):
+        """Cursor pages walk a plain list by offset"""
+        query = ListQuery('events').order_by('id')
+        first = query.after(None, limit=3).resolve(EVENTS)
+        second = query.after(first.next_cursor, limit=3).resolve(EVENTS)
+
+        assert [e['id'] for e in first.items] == [1, 2, 3]
+        assert [e['id'] for e in second.items] == [4]
+        assert second.next_cursor is None
+
+    def test_refinement(self):
+        """Narrower filters and longer search text refine a loaded query"""
+        loaded = ListQuery('admin/users').where(role='student').search('an', fields=('name',))
+
+        assert loaded.where(status='active').search('ann', fields=('name',)).is_refinement_of(loaded)
+        assert not ListQuery('admin/users').search('ann', fields=('name',)).is_refinement_of(loaded)
+        assert not loaded.search('bob', fields=('name',)).is_refinement_of(loaded)
+        assert not loaded.is_refinement_of(loaded.paginate(1, 10))
+
+    def test_fetch_requires_client(self):
+        with pytest.raises(RuntimeError):
+            ListQuery('events').fetch()
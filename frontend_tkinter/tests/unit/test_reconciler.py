@@ -0,0 +1,138 @@
+"""
+Unit Tests for Reconciler
+Tests snapshots, row signatures and keyed row reconciliation (without a
+display)
+"""
+
+import pytest
+
+from utils.reconciler import KeyedRows, Snapshot, row_signature, set_text
+
+
+class FakeContainer:
+    """Stand-in container: records the packing order of its rows"""
+
+    def __init__(self):
+        self.packed = []
+        self.destroyed = []
+
+
+class FakeRow:
+    """Stand-in row widget"""
+
+    def __init__(self, parent, item):
+        self.parent = parent
+        self.item = item
+
+    def pack(self, **options):
+        self.parent.packed.append(self)
+
+    def pack_forget(self):
+        if self in self.parent.packed:
+            self.parent.packed.remove(self)
+
+    def destroy(self):
+        self.pack_forget()
+        self.parent.destroyed.append(self)
+
+
+class FakeLabel:
+    def __init__(self, text=''):
+        self.text = text
+        self.configured = 0
+
+    def cget(self, option):
+        return self.text
+
+    def config(self, text):
+        self.text = text
+        self.configured += 1
+
+
+def shown(container):
+    return [row.item['title'] for row in container.packed]
+
+
+@pytest.fixture
+def container():
+    return FakeContainer()
+
+
+@pytest.fixture
+def rows(container):
+    return KeyedRows(container, FakeRow)
+
+
+class TestSignatures:
+    """Test row signatures, snapshots and label updates"""
+
+    def test_version_field_wins_over_content(self):
+        assert row_signature({'id': 1, 'title': 'A', 'updated_at': '2025-11-20'}) == ('updated_at', '2025-11-20')
+        assert row_signature({'id': 1, 'title': 'A'}) != row_signature({'id': 1, 'title': 'B'})
+
+    def test_snapshot(self):
+        events = [{'id': 1}]
+        snapshot = Snapshot()
+
+        assert snapshot.changed(events, 3)
+        assert not snapshot.changed(events, 3)
+        assert not snapshot.changed([{'id': 1}], 3)
+        assert snapshot.changed(events, 4)
+        snapshot.reset()
+        assert snapshot.changed(events, 4)
+
+    def test_set_text_skips_same_text(self):
+        label = FakeLabel('5')
+        set_text(label, 5)
+        set_text(label, 6)
+
+        assert (label.text, label.configured) == ('6', 1)
+
+
+class TestKeyedRows:
+    """Test patching rows in a container"""
+
+    def test_unchanged_data_touches_nothing(self, container, rows):
+        items = [{'id': 1, 'title': 'A'}, {'id': 2, 'title': 'B'}]
+        assert rows.reconcile(items)
+        first = list(container.packed)
+
+        assert not rows.reconcile([dict(item) for item in items])
+        assert container.packed == first
+        assert rows.get_stats()['skipped'] == 1
+
+    def test_appended_rows_are_packed_after_the_others(self, container, rows):
+        rows.reconcile([{'id': 1, 'title': 'A'}])
+        first = container.packed[0]
+        rows.reconcile([{'id': 1, 'title': 'A'}, {'id': 2, 'title': 'B'}])
+
+        assert shown(container) == ['A', 'B']
+        assert container.packed[0] is first
+        assert rows.get_stats()['created'] == 2
+
+    def test_changed_row_is_rebuilt_in_place(self, container, rows):
+        rows.reconcile([{'id': 1, 'title': 'A'}, {'id': 2, 'title': 'B'}, {'id': 3, 'title': 'C'}])
+        unchanged = container.packed[0]
+        rows.reconcile([{'id': 1, 'title': 'A'}, {'id': 2, 'title': 'B2'}, {'id': 3, 'title': 'C'}])
+
+        assert shown(container) == ['A', 'B2', 'C']
+        assert container.packed[0] is unchanged
+        assert [row.item['title'] for row in container.destroyed] == ['B']
+
+    def test_update_callback_patches_rows(self, container):
+        rows = KeyedRows(container, FakeRow, update=lambda row, item: setattr(row, 'item', item))
+        rows.reconcile([{'id': 1, 'title': 'A'}])
+        row = container.packed[0]
+        rows.reconcile([{'id': 1, 'title': 'A2'}])
+
+        assert container.packed == [row]
+        assert shown(container) == ['A2']
+        assert rows.get_stats()['updated'] == 1
+
+    def test_removed_and_reordered_rows(self, container, rows):
+        rows.reconcile([{'id': 1, 'title': 'A'}, {'id': 2, 'title': 'B'}, {'id': 3, 'title': 'C'}])
+        rows.reconcile([{'id': 3, 'title': 'C'}, {'id': 1, 'title': 'A'}])
+
+        assert shown(container) == ['C', 'A']
+        assert list(rows.rows()) == [3, 1]
+        assert rows.get_stats()['removed'] == 1
@@ -0,0 +1,198 @@
+"""
+Unit Tests for Request Scheduler
+Tests priority dispatch, reserved interactive slots, deferral and dropping
+"""
+
+import pytest
+import threading
+import time
+from unittest.mock import Mock, patch
+
+from utils.api_client import APIClient
+from utils.performance import Cache, SingleFlight
+from utils.request_scheduler import (
+    Priority, RequestDropped, RequestScheduler, current_priority, request_priority
+)
+
+
+def start(scheduler, order, name, priority, droppable=False, hold=None):
+    """Acquire a slot on a thread, record the dispatch order, hold until released"""
+    result = {}
+
+    def run():
+        try:
+            ticket = scheduler.acquire(priority, key=name, droppable=droppable)
+        except RequestDropped as e:
+            result['dropped'] = e
+            return
+        order.append(name)
+        if hold is not None:
+            hold.wait(2)
+        scheduler.release(ticket)
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return thread, result
+
+
+def wait_queued(scheduler, count, timeout=2.0):
+    deadline = time.time() + timeout
+    while sum(scheduler.get_stats()['queued'].values()) < count and time.time() < deadline:
+        time.sleep(0.005)
+
+
+class TestRequestScheduler:
+    """Test suite for RequestScheduler"""
+
+    def test_interactive_dispatched_before_queued_background(self):
+        """When a slot frees up, a queued click goes before queued polling"""
+        scheduler = RequestScheduler(max_in_flight=1, interactive_reserved=0)
+        order = []
+        release = threading.Event()
+        blocker = scheduler.acquire(Priority.INTERACTIVE)
+
+        threads = [start(scheduler, order, 'poll', Priority.BACKGROUND, hold=release)[0]]
+        wait_queued(scheduler, 1)
+        threads.append(start(scheduler, order, 'prefetch', Priority.PREFETCH, hold=release)[0])
+        wait_queued(scheduler, 2)
+        threads.append(start(scheduler, order, 'click', Priority.INTERACTIVE, hold=release)[0])
+        wait_queued(scheduler, 3)
+
+        release.set()
+        scheduler.release(blocker)
+        for thread in threads:
+            thread.join(2)
+
+        assert order == ['click', 'prefetch', 'poll']
+
+    def test_reserved_slots_keep_clicks_unblocked(self):
+        """Background work cannot take the slots reserved for interaction"""
+        scheduler = RequestScheduler(max_in_flight=3, interactive_reserved=1)
+        polls = [scheduler.acquire(Priority.BACKGROUND) for _ in range(2)]
+        order = []
+
+        thread, _ = start(scheduler, order, 'poll', Priority.BACKGROUND)
+        wait_queued(scheduler, 1)
+        assert order == []
+
+        click = scheduler.acquire(Priority.INTERACTIVE)  # immediate
+        assert scheduler.get_stats()['in_flight']['interactive'] == 1
+
+        for ticket in polls + [click]:
+            scheduler.release(ticket)
+        thread.join(2)
+        assert order == ['poll']
+
+    def test_background_deferred_while_interactive_running(self):
+        """Polling waits for in-flight clicks; prefetch does not"""
+        scheduler = RequestScheduler(max_in_flight=8, interactive_reserved=2)
+        click = scheduler.acquire(Priority.INTERACTIVE)
+        order = []
+
+        thread, _ = start(scheduler, order, 'poll', Priority.BACKGROUND)
+        prefetch = scheduler.acquire(Priority.PREFETCH)
+        scheduler.release(prefetch)
+        wait_queued(scheduler, 1)
+        assert order == []
+
+        scheduler.release(click)
+        thread.join(2)
+        assert order == ['poll']
+        assert scheduler.get_stats()['deferred'] == 1
+
+    def test_droppable_background_dropped_after_max_wait(self):
+        """Deferred background GETs are dropped; writes keep waiting"""
+        scheduler = RequestScheduler(max_in_flight=4, background_max_wait=0.05)
+        click = scheduler.acquire(Priority.INTERACTIVE)
+        order = []
+
+        get_thread, get_result = start(scheduler, order, 'get', Priority.BACKGROUND, droppable=True)
+        write_thread, _ = start(scheduler, order, 'email', Priority.BACKGROUND)
+        get_thread.join(2)
+
+        assert isinstance(get_result['dropped'], RequestDropped)
+        assert order == []
+
+        scheduler.release(click)
+        write_thread.join(2)
+        assert order == ['email']
+        assert scheduler.get_stats()['dropped'] == 1
+
+    def test_promote_lifts_queued_request(self):
+        """An interactive caller joining a queued poll makes it interactive"""
+        scheduler = RequestScheduler(max_in_flight=1, interactive_reserved=0)
+        blocker = scheduler.acquire(Priority.INTERACTIVE)
+        order = []
+        release = threading.Event()
+
+        poll, _ = start(scheduler, order, 'GET events', Priority.BACKGROUND, hold=release)
+        wait_queued(scheduler, 1)
+        other, _ = start(scheduler, order, 'other', Priority.PREFETCH, hold=release)
+        wait_queued(scheduler, 2)
+
+        assert scheduler.promote('GET events', Priority.INTERACTIVE)
+        assert not scheduler.promote('missing', Priority.INTERACTIVE)
+        release.set()
+        scheduler.release(blocker)
+        poll.join(2)
+        other.join(2)
+
+        assert order == ['GET events', 'other']
+
+    def test_request_priority_is_per_thread(self):
+        """The context applies to the calling thread only and nests"""
+        seen = []
+        with request_priority(Priority.BACKGROUND):
+            with request_priority(Priority.PREFETCH):
+                seen.append(current_priority())
+            seen.append(current_priority())
+            thread = threading.Thread(target=lambda: seen.append(current_priority()))
+            thread.start()
+            thread.join()
+        seen.append(current_priority())
+
+        assert seen == [Priority.PREFETCH, Priority.BACKGROUND,
+                        Priority.INTERACTIVE, Priority.INTERACTIVE]
+
+
+class TestAPIClientPriority:
+    """Test that APIClient requests go through the scheduler"""
+
+    @patch('requests.Session.post')
+    @patch('requests.Session.get')
+    def test_requests_carry_priority_class(self, mock_get, mock_post):
+        """GETs use the thread's class; writes accept an explicit one"""
+        response = Mock(status_code=200, headers={}, content=b'[]')
+        response.json.return_value = []
+        mock_get.return_value = response
+        mock_post.return_value = response
+        scheduler = RequestScheduler()
+
+        with patch.object(APIClient, '_scheduler', scheduler), \
+                patch.object(APIClient, '_single_flight', SingleFlight()):
+            api = APIClient()
+            api._cache = Cache(max_size=None)
+            with request_priority(Priority.BACKGROUND):
+                api.get('events')
+            api.get('resources')
+            api.post('notifications/email', {}, priority=Priority.BACKGROUND)
+
+            assert api.get_scheduler_stats()['dispatched'] == {
+                'interactive': 1, 'prefetch': 0, 'background': 2
+            }
+
+    @patch('requests.Session.get')
+    def test_dropped_poll_raises(self, mock_get):
+        """A background GET stuck behind a click fails fast instead of piling up"""
+        scheduler = RequestScheduler(background_max_wait=0.02)
+        click = scheduler.acquire(Priority.INTERACTIVE)
+
+        with patch.object(APIClient, '_scheduler', scheduler), \
+                patch.object(APIClient, '_single_flight', SingleFlight()):
+            api = APIClient()
+            api._cache = Cache(max_size=None)
+            with pytest.raises(RequestDropped):
+                api.get('events', priority=Priority.BACKGROUND)
+
+        scheduler.release(click)
+        mock_get.assert_not_called()
@@ -0,0 +1,143 @@
+"""
+Unit Tests for Sync Manager
+Tests high-water marks, upsert/tombstone merging and full-list fallback
+"""
+
+from utils.api_client import APIClient
+from utils.sync_manager import SyncManager
+
+
+class FakeAPI(APIClient):
+    """APIClient whose get() replays queued responses and records URLs"""
+
+    def __init__(self, *responses, token='token-a'):
+        super().__init__()
+        self.responses = list(responses)
+        self.requested = []
+        self.set_auth_token(token)
+
+    def get(self, endpoint, headers=None):
+        self.requested.append(endpoint)
+        return self.responses.pop(0)
+
+
+def delta(items=(), deleted=(), version=None, reset=False):
+    return {'items': list(items), 'deleted': list(deleted), 'version': version, 'reset': reset}
+
+
+class TestSyncManager:
+    """Test suite for SyncManager"""
+
+    def test_first_sync_requests_everything(self):
+        """The first sync asks for since=0 and stores the server mark"""
+        api = FakeAPI(delta([{'id': 1}, {'id': 2}], version=7, reset=True))
+        manager = SyncManager()
+
+        assert manager.sync(api, 'events') == [{'id': 1}, {'id': 2}]
+        assert api.requested == ['events?since=0']
+
+    def test_delta_merges_upserts_and_tombstones(self):
+        """Changed rows replace in place, new rows append, deleted rows go"""
+        api = FakeAPI(
+            delta([{'id': 1, 't': 'a'}, {'id': 2}, {'id': 3}], version=7, reset=True),
+            delta([{'id': 2, 't': 'b'}, {'id': 4}], deleted=[3], version=9),
+        )
+        manager = SyncManager()
+        manager.sync(api, 'events')
+
+        rows = manager.sync(api, 'events')
+
+        assert api.requested[1] == 'events?since=7'
+        assert rows == [{'id': 1, 't': 'a'}, {'id': 2, 't': 'b'}, {'id': 4}]
+        stats = manager.get_stats()
+        assert stats['delta_syncs'] == 1
+        assert stats['tombstones'] == 1
+
+    def test_inline_tombstones(self):
+        """Rows flagged deleted=true are removed"""
+        api = FakeAPI(
+            delta([{'id': 1}, {'id': 2}], version=2, reset=True),
+            delta([{'id': 1, 'deleted': True}], version=3),
+        )
+        manager = SyncManager()
+        manager.sync(api, 'events')
+
+        assert manager.sync(api, 'events') == [{'id': 2}]
+
+    def test_unchanged_returns_same_list(self):
+        """An empty delta keeps the same list object for cheap change checks"""
+        api = FakeAPI(delta([{'id': 1}], version=2, reset=True), delta(version=2),
+                      delta([{'id': 1}], version=3))
+        manager = SyncManager()
+        first = manager.sync(api, 'events')
+
+        assert manager.sync(api, 'events') is first
+        assert manager.sync(api, 'events') is first  # identical upsert
+        assert manager.get_stats()['unchanged'] == 2
+
+    def test_reset_replaces_local_copy(self):
+        """reset=true discards rows the delta would not mention"""
+        api = FakeAPI(
+            delta([{'id': 1}, {'id': 2}], version=2, reset=True),
+            delta([{'id': 5}], version=20, reset=True),
+        )
+        manager = SyncManager()
+        manager.sync(api, 'events')
+
+        assert manager.sync(api, 'events') == [{'id': 5}]
+
+    def test_mark_from_rows_without_version(self):
+        """Without a server version the newest updated_at becomes the mark"""
+        api = FakeAPI(
+            delta([{'id': 1, 'updated_at': '2025-01-02T10:00:00'},
+                   {'id': 2, 'updated_at': '2025-01-03T09:00:00'}], reset=True),
+            delta(),
+        )
+        manager = SyncManager()
+        manager.sync(api, 'events')
+        manager.sync(api, 'events')
+
+        assert api.requested[1] == 'events?since=2025-01-03T09%3A00%3A00'
+
+    def test_plain_list_falls_back_to_full_gets(self):
+        """A server that ignores since gets plain GETs afterwards"""
+        rows = [{'id': 1}]
+        api = FakeAPI(rows, rows, [{'id': 1}, {'id': 2}])
+        manager = SyncManager()
+
+        first = manager.sync(api, 'events')
+        assert manager.sync(api, 'events') is first  # 304 reuse
+        assert manager.sync(api, 'events') == [{'id': 1}, {'id': 2}]
+        assert api.requested == ['events?since=0', 'events', 'events']
+        assert manager.get_stats()['items_received'] == 3  # 304 not re-counted
+
+    def test_state_is_per_identity(self):
+        """Different auth tokens keep separate copies"""
+        manager = SyncManager()
+        alice = FakeAPI(delta([{'id': 1}], version=1, reset=True), token='alice')
+        bob = FakeAPI(delta([{'id': 2}], version=1, reset=True), token='bob')
+
+        manager.sync(alice, 'events/registered')
+        manager.sync(bob, 'events/registered')
+
+        assert manager.get_rows(alice, 'events/registered') == [{'id': 1}]
+        assert manager.get_rows(bob, 'events/registered') == [{'id': 2}]
+
+    def test_clear_forces_full_sync(self):
+        """clear() drops local copies and marks"""
+        api = FakeAPI(delta([{'id': 1}], version=3, reset=True),
+                      delta([{'id': 1}], version=3, reset=True))
+        manager = SyncManager()
+        manager.sync(api, 'events')
+
+        manager.clear()
+        manager.sync(api, 'events')
+
+        assert api.requested == ['events?since=0', 'events?since=0']
+
+    def test_existing_query_string(self):
+        """since is appended to endpoints that already have parameters"""
+        api = FakeAPI(delta([], version=1, reset=True))
+        SyncManager().sync(api, 'events?status=APPROVED')
+
+        assert api.requested == ['events?status=APPROVED&since=0']
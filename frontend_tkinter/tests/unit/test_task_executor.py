@@ -0,0 +1,183 @@
+"""
+Unit Tests for Task Executor
+Tests bounded pools, page-scoped cancellation and dropping of late results
+"""
+
+import pytest
+import threading
+import time
+from unittest.mock import patch
+
+from utils import task_executor, ui_dispatcher
+from utils.task_executor import TaskExecutor, deliver, is_cancelled
+from utils.ui_dispatcher import UIDispatcher
+
+
+class FakeWidget:
+    """Minimal stand-in for a Tk widget: runs after(0) callbacks on demand"""
+
+    def __init__(self):
+        self.scheduled = []
+        self.exists = True
+
+    def after(self, delay, callback):
+        self.scheduled.append(callback)
+
+    def winfo_exists(self):
+        return self.exists
+
+    def run_pending(self):
+        callbacks, self.scheduled = self.scheduled, []
+        for callback in callbacks:
+            callback()
+
+
+@pytest.fixture
+def executor():
+    """Fresh executor installed as the global instance"""
+    ex = TaskExecutor(io_workers=1, cpu_workers=1)
+    with patch.object(task_executor, '_global_executor', ex):
+        yield ex
+    ex.shutdown(wait=True)
+
+
+class TestTaskExecutor:
+    """Test suite for TaskExecutor"""
+
+    def test_submit_returns_future(self, executor):
+        """Submitted work returns a future with the result"""
+        future = executor.submit(lambda a, b: a + b, 2, 3)
+        assert future.result(timeout=2) == 5
+
+    def test_pool_is_bounded(self, executor):
+        """Work beyond the pool size queues instead of spawning threads"""
+        release = threading.Event()
+        running = []
+
+        def work(i):
+            running.append(i)
+            release.wait(2)
+            return i
+
+        futures = [executor.submit(work, i) for i in range(5)]
+        time.sleep(0.1)
+        assert running == [0]
+        release.set()
+        assert [f.result(timeout=2) for f in futures] == list(range(5))
+
+    def test_unknown_pool_rejected(self, executor):
+        """Only 'io' and 'cpu' pools exist"""
+        with pytest.raises(ValueError):
+            executor.submit(lambda: None, pool='gpu')
+
+    def test_cancel_owner_cancels_queued_tasks(self, executor):
+        """Cancelling an owner removes its queued tasks from the pool"""
+        page = object()
+        release = threading.Event()
+        blocker = executor.submit(release.wait, 2)
+        queued = executor.submit(lambda: 'late', owner=page)
+
+        assert executor.cancel_owner(page) == 1
+        release.set()
+        blocker.result(timeout=2)
+
+        assert queued.cancelled()
+        assert executor.was_interrupted(page)
+        assert not executor.was_interrupted(page)  # flag cleared on read
+
+    def test_uninterruptible_tasks_survive_hide(self, executor):
+        """Mutations submitted with interruptible=False keep running"""
+        page = object()
+        release = threading.Event()
+        blocker = executor.submit(release.wait, 2)
+        save = executor.submit(lambda: 'saved', owner=page, interruptible=False)
+
+        assert executor.cancel_owner(page) == 0
+        release.set()
+        blocker.result(timeout=2)
+        assert save.result(timeout=2) == 'saved'
+
+    def test_stats(self, executor):
+        """Counters track completed and failed tasks"""
+        executor.submit(lambda: 1).result(timeout=2)
+        failing = executor.submit(lambda: 1 / 0)
+        with pytest.raises(ZeroDivisionError):
+            failing.result(timeout=2)
+        time.sleep(0.05)
+
+        stats = executor.get_stats()
+        assert stats['submitted'] == 2
+        assert stats['completed'] == 1
+        assert stats['failed'] == 1
+        assert stats['pending'] == 0
+        assert stats['io_workers'] == 1
+
+
+class TestDeliver:
+    """Test delivery of results to the UI thread"""
+
+    def test_deliver_schedules_callback(self, executor):
+        """Results from live tasks reach the widget"""
+        widget = FakeWidget()
+        results = []
+        executor.submit(lambda: deliver(widget, results.append, 'data'), owner=widget).result(timeout=2)
+
+        widget.run_pending()
+        assert results == ['data']
+
+    def test_late_result_dropped_after_cancel(self, executor):
+        """A running task cancelled mid-flight has its result dropped"""
+        widget = FakeWidget()
+        started = threading.Event()
+        release = threading.Event()
+        results = []
+
+        def work():
+            started.set()
+            release.wait(2)
+            deliver(widget, results.append, 'stale')
+            return is_cancelled()
+
+        future = executor.submit(work, owner=widget)
+        started.wait(2)
+        executor.cancel_owner(widget)
+        release.set()
+
+        assert future.result(timeout=2) is True
+        widget.run_pending()
+        assert results == []
+        assert executor.get_stats()['dropped_results'] == 1
+
+    def test_finished_task_result_still_delivered(self, executor):
+        """Cancelling after a task finished does not drop its queued result"""
+        widget = FakeWidget()
+        results = []
+        executor.submit(lambda: deliver(widget, results.append, 'x'), owner=widget).result(timeout=2)
+
+        executor.cancel_owner(widget)
+        widget.run_pending()
+        assert results == ['x']
+
+    def test_destroyed_widget_skipped(self, executor):
+        """Callbacks for destroyed widgets are not run"""
+        widget = FakeWidget()
+        results = []
+        executor.submit(lambda: deliver(widget, results.append, 'x')).result(timeout=2)
+
+        widget.exists = False
+        widget.run_pending()
+        assert results == []
+
+    def test_deliver_uses_dispatcher_when_installed(self, executor):
+        """With the UI pump running, results are queued on it instead of after(0)"""
+        widget = FakeWidget()
+        pump = UIDispatcher()
+        pump._running = True
+        results = []
+        with patch.object(ui_dispatcher, '_global_dispatcher', pump):
+            executor.submit(lambda: deliver(widget, results.append, 'x')).result(timeout=2)
+
+        assert widget.scheduled == []
+        assert pump.queue_depth() == 1
+        pump.drain()
+        assert results == ['x']
@@ -0,0 +1,195 @@
+"""
+Unit Tests for Treeview Adapter
+Tests chunked population, keyed diffing and cancellation (without a display)
+"""
+
+import pytest
+
+from utils.treeview_adapter import TreeviewAdapter
+
+
+class FakeTree:
+    """Stand-in flat ttk.Treeview: attached items in order, after() queued"""
+
+    def __init__(self):
+        self.order = []
+        self.items = {}
+        self.calls = []
+        self.scheduled = {}
+        self._next_id = 0
+
+    def insert(self, parent, index, iid=None, values=(), tags=()):
+        if iid is None:
+            self._next_id += 1
+            iid = f'I{self._next_id:03d}'
+        self.items[iid] = {'values': values, 'tags': tags}
+        self.order.insert(index, iid)
+        self.calls.append('insert')
+        return iid
+
+    def delete(self, *iids):
+        for iid in iids:
+            del self.items[iid]
+            if iid in self.order:
+                self.order.remove(iid)
+        self.calls.append('delete')
+
+    def detach(self, *iids):
+        for iid in iids:
+            self.order.remove(iid)
+
+    def move(self, iid, parent, index):
+        if iid in self.order:
+            self.order.remove(iid)
+        self.order.insert(index, iid)
+        self.calls.append('move')
+
+    def item(self, iid, **options):
+        self.items[iid].update(options)
+        self.calls.append('item')
+
+    def get_children(self):
+        return tuple(self.order)
+
+    def after(self, ms, callback):
+        after_id = f'after#{len(self.scheduled)}'
+        self.scheduled[after_id] = callback
+        return after_id
+
+    def after_cancel(self, after_id):
+        del self.scheduled[after_id]
+
+    def winfo_exists(self):
+        return True
+
+    def run_pending(self):
+        """Run queued after() callbacks until none are left"""
+        while self.scheduled:
+            after_id = next(iter(self.scheduled))
+            self.scheduled.pop(after_id)()
+
+    def shown(self):
+        return [self.items[iid]['values'][1] for iid in self.order]
+
+
+def users(*names):
+    return [{'id': i, 'name': name} for i, name in names]
+
+
+@pytest.fixture
+def tree():
+    return FakeTree()
+
+
+@pytest.fixture
+def table(tree):
+    return TreeviewAdapter(tree, lambda user: (user['id'], user['name']),
+                           tags=lambda user: (user['id'],))
+
+
+class TestPopulation:
+    """Test filling the table"""
+
+    def test_small_set_fills_at_once(self, tree, table):
+        table.set_rows(users((1, 'Ann'), (2, 'Bob')))
+
+        assert tree.shown() == ['Ann', 'Bob']
+        assert tree.get_children() == ('1', '2')
+        assert tree.items['1']['tags'] == (1,)
+        assert not table.busy
+
+    def test_large_set_is_chunked(self, tree):
+        """Only the first chunk runs right away; the rest follows in after() calls"""
+        table = TreeviewAdapter(tree, lambda user: (user['id'], user['name']), budget_ms=1)
+        rows = users(*[(i, f'User {i}') for i in range(20000)])
+        table.set_rows(rows)
+
+        assert table.busy
+        assert 0 < len(tree.order) < 20000
+
+        tree.run_pending()
+        assert tree.shown() == [row['name'] for row in rows]
+        assert table.get_stats()['chunks'] > 1
+        assert not table.busy
+
+    def test_clear(self, tree, table):
+        table.set_rows(users((1, 'Ann'), (2, 'Bob')))
+        table.clear()
+
+        assert tree.order == [] and tree.items == {}
+        assert table.get_stats()['rows'] == 0
+
+
+class TestDiffing:
+    """Test updating the table from a new row set"""
+
+    def test_filter_deletes_without_reinserting(self, tree, table):
+        table.set_rows(users((1, 'Ann'), (2, 'Bob'), (3, 'Cid')))
+        tree.calls.clear()
+        table.set_rows(users((1, 'Ann'), (3, 'Cid')))
+
+        assert tree.shown() == ['Ann', 'Cid']
+        assert tree.calls == ['delete']
+
+    def test_widening_filter_inserts_in_place(self, tree, table):
+        table.set_rows(users((1, 'Ann'), (3, 'Cid')))
+        table.set_rows(users((1, 'Ann'), (2, 'Bob'), (3, 'Cid')))
+
+        assert tree.shown() == ['Ann', 'Bob', 'Cid']
+        assert table.get_stats()['moved'] == 0
+
+    def test_changed_values_are_updated(self, tree, table):
+        table.set_rows(users((1, 'Ann'), (2, 'Bob')))
+        tree.calls.clear()
+        table.set_rows(users((1, 'Ann'), (2, 'Robert')))
+
+        assert tree.shown() == ['Ann', 'Robert']
+        assert tree.calls == ['item']
+
+    def test_reorder_moves_items(self, tree, table):
+        table.set_rows(users((1, 'Ann'), (2, 'Bob'), (3, 'Cid')))
+        tree.calls.clear()
+        table.set_rows(users((3, 'Cid'), (1, 'Ann'), (2, 'Bob')))
+
+        assert tree.shown() == ['Cid', 'Ann', 'Bob']
+        assert tree.calls == ['move'] * 3
+
+    def test_rows_without_unique_keys(self, tree, table):
+        """Missing or repeated keys still get a row each"""
+        rows = [{'id': None, 'name': 'Ann'}, {'id': 1, 'name': 'Bob'}, {'id': 1, 'name': 'Bob again'}]
+        table.set_rows(rows)
+        table.set_rows(rows)
+
+        assert tree.shown() == ['Ann', 'Bob', 'Bob again']
+
+
+class TestCancellation:
+    """Test a new row set arriving mid-population"""
+
+    def test_new_filter_cancels_population(self, tree):
+        table = TreeviewAdapter(tree, lambda user: (user['id'], user['name']), budget_ms=1)
+        table.set_rows(users(*[(i, f'User {i}') for i in range(20000)]))
+        assert table.busy
+
+        table.set_rows(users((19999, 'User 19999'), (5, 'User 5'), (-1, 'New')))
+        tree.run_pending()
+
+        assert tree.shown() == ['User 19999', 'User 5', 'New']
+        assert len(tree.items) == 3
+        assert table.get_stats()['cancelled'] == 1
+
+    def test_clear_during_reorder_removes_detached_rows(self, tree):
+        """Rows detached by a cancelled reorder are deleted too"""
+        table = TreeviewAdapter(tree, lambda user: (user['id'], user['name']), budget_ms=1)
+        rows = users(*[(i, f'User {i}') for i in range(3000)])
+        table.set_rows(rows)
+        tree.run_pending()
+        table.set_rows(list(reversed(rows)))
+        assert table.busy
+
+        table.clear()
+        assert tree.items == {}
+
+        table.set_rows(rows[:2])
+        tree.run_pending()
+        assert tree.shown() == ['User 0', 'User 1']
@@ -0,0 +1,155 @@
+"""
+Unit Tests for UI Dispatcher
+Tests batching, time budgets, statistics and fallback delivery
+"""
+
+import pytest
+import threading
+import time
+from unittest.mock import patch
+
+from utils import ui_dispatcher
+from utils.ui_dispatcher import UIDispatcher, call_in_ui
+
+
+class FakeRoot:
+    """Stand-in for a Tk root that records after() calls"""
+
+    def __init__(self):
+        self.timers = {}
+        self._next_id = 0
+
+    def after(self, delay, callback):
+        self._next_id += 1
+        self.timers[self._next_id] = callback
+        return self._next_id
+
+    def after_cancel(self, after_id):
+        self.timers.pop(after_id, None)
+
+    def fire(self):
+        """Run every pending timer once"""
+        timers, self.timers = self.timers, {}
+        for callback in timers.values():
+            callback()
+
+
+@pytest.fixture
+def dispatcher():
+    """Dispatcher installed on a fake root"""
+    d = UIDispatcher(frame_ms=16, budget_ms=50)
+    root = FakeRoot()
+    d.install(root)
+    d.root = root
+    yield d
+    d.stop()
+
+
+class TestUIDispatcher:
+    """Test suite for UIDispatcher"""
+
+    def test_install_schedules_single_loop(self, dispatcher):
+        """Only one after() timer is pending regardless of queued work"""
+        for i in range(100):
+            dispatcher.post(lambda: None)
+        assert len(dispatcher.root.timers) == 1
+
+    def test_callbacks_run_in_order_on_tick(self, dispatcher):
+        """Queued callbacks run FIFO when the pump ticks"""
+        results = []
+        for i in range(5):
+            dispatcher.post(results.append, i)
+        assert results == []
+
+        dispatcher.root.fire()
+        assert results == [0, 1, 2, 3, 4]
+        assert len(dispatcher.root.timers) == 1  # rescheduled
+
+    def test_posts_from_worker_threads(self, dispatcher):
+        """post() is safe to call from many threads"""
+        results = []
+        threads = [
+            threading.Thread(target=lambda i=i: dispatcher.post(results.append, i))
+            for i in range(20)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        dispatcher.root.fire()
+        assert sorted(results) == list(range(20))
+
+    def test_budget_limits_batch(self):
+        """Work beyond the time budget is deferred to the next tick"""
+        d = UIDispatcher(budget_ms=5)
+        for _ in range(10):
+            d.post(time.sleep, 0.002)
+
+        first = d.drain()
+        assert 1 <= first < 10
+        assert d.queue_depth() == 10 - first
+        assert d.get_stats()['over_budget_ticks'] >= 1
+
+    def test_slow_callback_does_not_stall_queue(self):
+        """At least one callback runs per tick even with a tiny budget"""
+        d = UIDispatcher(budget_ms=1)
+        d.post(time.sleep, 0.005)
+        d.post(lambda: None)
+        assert d.drain() == 1
+        assert d.drain() == 1
+
+    def test_failing_callback_does_not_stop_pump(self, dispatcher):
+        """An exception in one callback is logged and the batch continues"""
+        results = []
+        dispatcher.post(lambda: 1 / 0)
+        dispatcher.post(results.append, 'after')
+
+        dispatcher.root.fire()
+        assert results == ['after']
+        assert dispatcher.get_stats()['failed'] == 1
+
+    def test_stats(self, dispatcher):
+        """Stats report queue depth, batches and latency"""
+        for i in range(3):
+            dispatcher.post(lambda: None)
+        stats = dispatcher.get_stats()
+        assert stats['queue_depth'] == 3
+        assert stats['max_queue_depth'] == 3
+
+        dispatcher.root.fire()
+        stats = dispatcher.get_stats()
+        assert stats['queue_depth'] == 0
+        assert stats['dispatched'] == 3
+        assert stats['max_batch'] == 3
+        assert stats['avg_batch'] == 3
+        assert stats['avg_latency_ms'] >= 0
+        assert stats['max_latency_ms'] >= stats['avg_latency_ms']
+
+    def test_stop_cancels_timer(self, dispatcher):
+        """stop() cancels the pending tick and keeps queued work"""
+        dispatcher.post(lambda: None)
+        dispatcher.stop()
+        assert dispatcher.root.timers == {}
+        assert not dispatcher.is_running()
+        assert dispatcher.queue_depth() == 1
+
+
+class TestCallInUI:
+    """Test the call_in_ui helper"""
+
+    def test_runs_inline_without_pump(self):
+        """Without an installed pump callbacks run immediately"""
+        results = []
+        with patch.object(ui_dispatcher, '_global_dispatcher', UIDispatcher()):
+            call_in_ui(results.append, 'now')
+        assert results == ['now']
+
+    def test_queues_when_pump_installed(self, dispatcher):
+        """With an installed pump callbacks wait for the next tick"""
+        results = []
+        with patch.object(ui_dispatcher, '_global_dispatcher', dispatcher):
+            call_in_ui(results.append, 'later')
+            assert results == []
+            dispatcher.root.fire()
+        assert results == ['later']
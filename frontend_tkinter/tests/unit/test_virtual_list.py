@@ -0,0 +1,91 @@
+"""
+Unit Tests for Virtual List
+Tests the visible-row window and card recycling (without a display)
+"""
+
+import pytest
+
+# Importing the components package loads the search component's date picker
+pytest.importorskip('tkcalendar')
+
+from components.virtual_list import CardPool, visible_range
+
+
+class FakeCard:
+    """Stand-in card widget: records its layout manager and stacking"""
+
+    def __init__(self):
+        self.manager = ''
+        self.lifted_above = None
+
+    def winfo_manager(self):
+        return self.manager
+
+    def grid_forget(self):
+        self.manager = ''
+
+    def pack_forget(self):
+        self.manager = ''
+
+    def lift(self, above):
+        self.lifted_above = above
+
+
+class TestVisibleRange:
+    """Test which items get cards for a scroll position"""
+
+    def test_top_of_list(self):
+        """The rows in view plus the overscan below"""
+        assert visible_range(0, 500, 5000, 100, overscan=2) == (0, 8)
+
+    def test_scrolled(self):
+        """Rows scrolled past (minus the overscan) have no cards"""
+        assert visible_range(10000, 500, 5000, 100, overscan=2) == (98, 108)
+
+    def test_grid_columns(self):
+        assert visible_range(1000, 300, 5000, 100, columns=3, overscan=1) == (27, 45)
+
+    def test_end_and_empty_lists(self):
+        assert visible_range(499500, 500, 5000, 100) == (4993, 5000)
+        assert visible_range(0, 500, 3, 100) == (0, 3)
+        assert visible_range(0, 500, 0, 100) == (0, 0)
+
+    def test_same_window_for_any_list_length(self):
+        """5,000 items build as many cards as 50"""
+        first, last = visible_range(0, 800, 50, 250)
+        assert visible_range(0, 800, 5000, 250) == (first, last)
+
+
+class TestCardPool:
+    """Test card recycling"""
+
+    @pytest.fixture
+    def pool(self):
+        bound = []
+        pool = CardPool(None, lambda parent: FakeCard(), lambda card, item: bound.append((card, item)))
+        pool.bound = bound
+        return pool
+
+    def test_cards_are_reused(self, pool):
+        """Released cards are bound to the next items instead of new cards"""
+        first = pool.acquire({'id': 1})
+        pool.release(first)
+        second = pool.acquire({'id': 2})
+
+        assert second is first
+        assert second.item == {'id': 2}
+        assert pool.bound[-1] == (first, {'id': 2})
+        assert pool.get_stats() == {'created': 1, 'reused': 1, 'free': 0}
+
+    def test_release_all_of_a_container(self, pool):
+        """Cards laid out in a container are freed before it is destroyed"""
+        cards = [pool.acquire({'id': i}, master='.page1') for i in range(3)]
+        for card in cards:
+            card.manager = 'grid'
+        other = pool.acquire({'id': 9}, master='.page2')
+        pool.release_all('.page1')
+
+        assert all(card.manager == '' and card.item is None for card in cards)
+        assert cards[0].lifted_above == '.page1'
+        assert other.item == {'id': 9}
+        assert pool.get_stats()['free'] == 3
@@ -1,6 +1,11 @@
 import requests
 import json
-from typing import Optional, Dict, Any, Callable
+import hashlib
+import threading
+from functools import lru_cache
+from typing import Optional, Dict, Any, Callable, Iterator, List, Tuple
+from urllib.parse import urlencode
+from requests.adapters import HTTPAdapter
 import sys
 import os
 
@@ -9,7 +14,15 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import config as config_module
 API_BASE_URL = config_module.API_BASE_URL
 
-import threading
+from utils.performance import get_single_flight
+from utils.disk_cache import get_disk_cache
+from utils.data_loader import DataLoader
+from utils.json_stream import JSONListStream, iter_json_list, loads
+from utils.query_builder import ListQuery
+from utils.request_scheduler import Priority, current_priority, get_request_scheduler, request_priority
+from utils.session_manager import SessionManager
+from utils.task_executor import current_task, deliver, get_executor
+from utils.ui_dispatcher import call_in_ui
 
 
 class RateLimitError(Exception):
@@ -17,6 +30,12 @@ class RateLimitError(Exception):
     pass
 
 
+@lru_cache(maxsize=64)
+def _header_identity(items: Tuple[Tuple[str, str], ...]) -> str:
+    """Digest of a header set (memoized: one hash per token, not per request)"""
+    return hashlib.sha256(json.dumps(items).encode('utf-8')).hexdigest()[:16]
+
+
 class APIClient:
     """
     Enhanced API Client with security and performance features
@@ -28,11 +47,85 @@ class APIClient:
     - Response caching (5 minutes default)
     - Loading state callbacks
     - Pagination support
+    - Coalescing of concurrent identical GET requests
+    - Stale-while-revalidate for frequently viewed lists
+    - Conditional GETs (ETag / Last-Modified) that reuse decoded bodies on 304
+    - Persistent on-disk cache tier for last known lists (cold start/offline)
+    - Batched per-id loaders (bulk request or bounded parallel fan-out)
+    - Priority classes: interactive requests go before background polling
+    - Shared keep-alive connection pool sized from API_MAX_CONNECTIONS
+    - Summary projections for list views; full records fetched on demand
+    - Streaming decode of large lists (get_stream); orjson when installed
     """
     
+    # In-flight GET table shared by every client (each page owns its own client)
+    _single_flight = get_single_flight()
+    
+    # Request slots shared by every client, handed out by priority class
+    _scheduler = get_request_scheduler()
+    
+    # Keep-alive connection pool shared by every client (created on first use)
+    _http_session: Optional[requests.Session] = None
+    _http_session_lock = threading.Lock()
+    
+    # Default headers per auth token, built once (treat as read-only)
+    _header_cache: Dict[Optional[str], Dict[str, str]] = {}
+    _header_cache_lock = threading.Lock()
+    HEADER_CACHE_SIZE = 8
+    
+    # Security manager, imported on first use (False if unavailable)
+    _security = None
+    
+    # Stale-while-revalidate policies by resource type:
+    # (seconds a response is fresh, extra seconds it may be served stale)
+    SWR_POLICIES: Dict[str, Tuple[int, int]] = {
+        'events': (15, 600),
+        'resources': (30, 900),
+        'notifications': (10, 300),
+    }
+    
+    # Background revalidations in progress: cache key -> update callbacks
+    _revalidating: Dict[str, List[Callable[[Any], None]]] = {}
+    _revalidating_lock = threading.Lock()
+    
+    # Resource types also persisted to the SQLite cache tier. Disk rows carry
+    # no user identity, so paths with per-user content are never persisted.
+    DISK_CACHE_TYPES = ('events', 'resources')
+    USER_SCOPED_SEGMENTS = ('registered', 'my', 'me')
+    
+    # Per-id loaders shared by every client, keyed by name and auth identity
+    _loaders: Dict[str, DataLoader] = {}
+    _loaders_lock = threading.Lock()
+    # Bulk endpoint: GET events/registrations?ids=1,2,3 -> {"1": [...], ...}
+    BULK_REGISTRATIONS_ENDPOINT = 'events/registrations'
+    
+    # Fields list views need, by resource type: query(summary=True) asks for
+    # only these (?fields=) and detail views call get_detail() for the rest.
+    # Both the backend's camelCase names and the snake_case ones are listed.
+    SUMMARY_FIELDS: Dict[str, Tuple[str, ...]] = {
+        'events': ('id', 'title', 'category', 'status', 'venue', 'capacity',
+                   'registered_count', 'available_seats',
+                   'start_time', 'startTime', 'end_time', 'endTime',
+                   'organizer_id', 'organizerId', 'organizer_name',
+                   'created_at', 'createdAt'),
+    }
+    
+    # Seconds to keep ETag / Last-Modified validators (and decoded bodies)
+    VALIDATOR_TTL = 3600
+    _conditional_stats = {
+        'conditional_requests': 0,
+        'not_modified': 0,
+        'bytes_received': 0,
+        'bytes_saved': 0,
+    }
+    _conditional_lock = threading.Lock()
+    
+    # Bytes read per chunk by get_stream()
+    STREAM_CHUNK_SIZE = 64 * 1024
+    
     def __init__(self):
         self.base_url = API_BASE_URL
-        self.session = requests.Session()
+        self.session = self._shared_session()
         self.auth_token = None
         self.timeout = 10  # seconds
         self._request_count = {}  # Track requests per user/endpoint
@@ -95,44 +188,221 @@ class APIClient:
             self.on_auth_error_callback(status_code)
     
     def _get_headers(self, headers=None):
-        """Get headers including auth token if set"""
-        default_headers = {'Content-Type': 'application/json'}
+        """
+        Get headers including auth token if set
         
+        Without extra headers the same dict is returned for every request
+        with the same token; copy it before modifying it.
+        """
         # Get token from instance or fallback to SessionManager
         token = self.auth_token
         if not token:
             # Try to get token from SessionManager if not set on this instance
             try:
-                from utils.session_manager import SessionManager
-                session = SessionManager()
-                token = session.get_token()
-            except:
+                token = SessionManager().get_token()
+            except Exception:
                 pass
         
-        if token:
-            default_headers['Authorization'] = f'Bearer {token}'
+        with self._header_cache_lock:
+            default_headers = self._header_cache.get(token)
+            if default_headers is None:
+                default_headers = {'Content-Type': 'application/json'}
+                if token:
+                    default_headers['Authorization'] = f'Bearer {token}'
+                if len(self._header_cache) >= self.HEADER_CACHE_SIZE:
+                    self._header_cache.clear()
+                self._header_cache[token] = default_headers
         
         if headers:
+            default_headers = dict(default_headers)
             default_headers.update(headers)
         return default_headers
     
-    def get(self, endpoint, headers=None):
-        """Make a GET request to the API"""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+    @classmethod
+    def clear_header_cache(cls):
+        """Forget precomputed per-token headers (e.g. on logout)"""
+        with cls._header_cache_lock:
+            cls._header_cache.clear()
+    
+    @classmethod
+    def _shared_session(cls) -> requests.Session:
+        """
+        Session with an explicitly sized keep-alive pool, shared by all clients
+        
+        Every page used to own a Session with default pool sizes, so each
+        page opened its own connections. The pool holds API_MAX_CONNECTIONS
+        connections per host (at least PERFORMANCE_MAX_REQUESTS, so a full
+        request scheduler never has to discard connections).
+        """
+        if cls._http_session is None:
+            with cls._http_session_lock:
+                if cls._http_session is None:
+                    pool_size = cls._pool_size()
+                    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+                    session = requests.Session()
+                    session.mount('http://', adapter)
+                    session.mount('https://', adapter)
+                    cls._http_session = session
+                    print(f"[API] Connection pool: {pool_size} keep-alive connections per host")
+        return cls._http_session
+    
+    @staticmethod
+    def _pool_size() -> int:
+        """Keep-alive connections per host (API_MAX_CONNECTIONS)"""
+        try:
+            from config.settings import settings
+            max_connections = int(settings.get('API_MAX_CONNECTIONS', 10) or 10)
+            max_requests = int(settings.get('PERFORMANCE_MAX_REQUESTS', 8) or 8)
+            return max(max_connections, max_requests)
+        except Exception:
+            return 10
+    
+    def warm_up(self, connections: int = 2):
+        """
+        Open keep-alive connections to the API in the background
+        
+        Called after login so the first dashboard requests skip connection
+        setup. Sends HEAD requests to the API root; responses (including
+        errors) are ignored.
+        
+        Args:
+            connections: Number of connections to open
+        """
+        url = self._build_url('')
+        
+        def connect():
+            try:
+                with request_priority(Priority.PREFETCH):
+                    with self._scheduler.slot():
+                        self.session.head(url, timeout=self.timeout)
+            except Exception:
+                pass
+        
+        executor = get_executor()
+        for _ in range(max(1, connections)):
+            executor.submit(connect)
+    
+    def _build_url(self, endpoint: str) -> str:
+        """Absolute URL for an endpoint"""
+        return f"{self.base_url}/{endpoint.lstrip('/')}"
+    
+    @staticmethod
+    def _with_query(endpoint: str, params: Optional[Dict[str, Any]]) -> str:
+        """
+        Append URL-encoded query parameters to an endpoint
+        
+        None values are skipped; lists become repeated parameters.
+        
+        Example:
+            _with_query('events?status=open', {'q': 'a&b', 'page': 2})
+            -> 'events?status=open&q=a%26b&page=2'
+        """
+        if not params:
+            return endpoint
+        query = urlencode([(k, v) for k, v in params.items() if v is not None], doseq=True)
+        if not query:
+            return endpoint
+        return f"{endpoint}{'&' if '?' in endpoint else '?'}{query}"
+    
+    @staticmethod
+    def _flight_key(method: str, url: str, headers: Dict[str, str]) -> str:
+        """
+        Build the single-flight key for a request.
+        
+        The auth identity and any extra headers are folded into a digest so
+        that callers with different tokens never share a response, and raw
+        tokens are not kept in the in-flight table.
+        """
+        return f"{method} {url} {_header_identity(tuple(sorted(headers.items())))}"
+    
+    def get_coalescing_stats(self) -> Dict[str, Any]:
+        """
+        Get request coalescing statistics (shared by all APIClient instances)
+        
+        Returns:
+            Dictionary with executed, coalesced and in-flight request counts
+        """
+        return self._single_flight.get_stats()
+    
+    def get_scheduler_stats(self) -> Dict[str, Any]:
+        """
+        Get request scheduling statistics (shared by all APIClient instances)
+        
+        Returns:
+            Dictionary with requests dispatched per priority class, deferred
+            and dropped background requests and queue waits
+        """
+        return self._scheduler.get_stats()
+    
+    def get(self, endpoint, headers=None, priority=None, params=None):
+        """
+        Make a GET request to the API
+        
+        Concurrent identical GETs (same URL, auth identity and headers) from
+        any APIClient instance share a single round-trip and receive the same
+        decoded response object, and a 304 returns the object decoded for
+        the earlier 200. Treat results as read-only: sort or filter into a
+        new list (``sorted(...)``) instead of changing them in place.
+        
+        Args:
+            endpoint: API endpoint
+            headers: Extra headers
+            priority: Priority class (default: request_priority() of the
+                calling thread, normally Priority.INTERACTIVE)
+            params: Query parameters (URL-encoded and appended)
+        """
+        url = self._build_url(self._with_query(endpoint, params))
+        request_headers = self._get_headers(headers)
+        key = self._flight_key('GET', url, request_headers)
+        if priority is None:
+            priority = current_priority()
+        # An interactive caller joining a deferred background GET lifts it
+        self._scheduler.promote(key, priority)
+        return self._single_flight.do(key, self._get_json, url, request_headers, priority)
+    
+    def _get_json(self, url, request_headers, priority=None):
+        """
+        Perform a GET request and decode the JSON body
+        
+        If an earlier response for the same URL and identity carried an ETag
+        or Last-Modified validator, the request is made conditional. On
+        304 Not Modified the previously decoded object is returned as-is,
+        without downloading or parsing the body again.
+        """
+        cache = self._get_cache()
+        flight_key = self._flight_key('GET', url, request_headers)
+        validator_key = f"etag:{flight_key}"
+        stored = cache.get(validator_key) if cache else None
+        if stored:
+            request_headers = dict(request_headers)
+            if stored['etag']:
+                request_headers['If-None-Match'] = stored['etag']
+            if stored['last_modified']:
+                request_headers['If-Modified-Since'] = stored['last_modified']
+        
         response = None
         try:
-            response = self.session.get(
-                url, 
-                headers=self._get_headers(headers), 
-                timeout=self.timeout
-            )
+            # Background GETs may be dropped: the next poll fetches the same data
+            with self._scheduler.slot(priority, key=flight_key, droppable=True):
+                response = self.session.get(
+                    url, 
+                    headers=request_headers, 
+                    timeout=self.timeout
+                )
             
             # Handle authentication errors
             if response.status_code in [401, 403]:
                 self._handle_auth_error(response.status_code)
             
+            if stored and response.status_code == 304:
+                self._record_conditional(conditional=True, not_modified=True, size=stored['size'])
+                return stored['body']
+            
             response.raise_for_status()
-            return response.json()
+            content = response.content
+            data = loads(content) if isinstance(content, (bytes, bytearray)) else response.json()
+            self._store_validators(validator_key, response, data, conditional=bool(stored))
+            return data
         except requests.Timeout:
             raise requests.Timeout(f"Request timed out after {self.timeout} seconds")
         except requests.ConnectionError:
@@ -148,23 +418,215 @@ class APIClient:
         except json.JSONDecodeError:
             raise ValueError("Invalid JSON response from server")
     
-    def post(self, endpoint, data=None, headers=None):
+    def get_stream(self, endpoint, headers=None, priority=None, params=None) -> Iterator[Any]:
+        """
+        Make GET request for a list and yield its items as they are decoded
+        
+        The body is read in STREAM_CHUNK_SIZE chunks and decoded item by item
+        (see utils.json_stream), so a worker can hand the first rows to the UI
+        while the rest is still arriving, and no single parse holds the GIL
+        for the whole list. An envelope body yields its items.
+        
+        Requests are conditional like get(): on 304 the stored rows are
+        yielded again, and a complete 200 body is stored for the next one.
+        Streams are not coalesced with other callers. The request slot is
+        held until the body has been read (or the generator is closed);
+        requests the consumer makes meanwhile on the same thread run in
+        that slot instead of waiting for another one.
+        
+        Args:
+            endpoint: API endpoint
+            headers: Extra headers
+            priority: Priority class (default: request_priority() of the
+                calling thread)
+            params: Query parameters (URL-encoded and appended)
+        
+        Yields:
+            List items in server order
+        """
+        url = self._build_url(self._with_query(endpoint, params))
+        request_headers = self._get_headers(headers)
+        if priority is None:
+            priority = current_priority()
+        cache = self._get_cache()
+        flight_key = self._flight_key('GET', url, request_headers)
+        validator_key = f"etag:{flight_key}"
+        stored = cache.get(validator_key) if cache else None
+        if stored:
+            request_headers = dict(request_headers)
+            if stored['etag']:
+                request_headers['If-None-Match'] = stored['etag']
+            if stored['last_modified']:
+                request_headers['If-Modified-Since'] = stored['last_modified']
+        
+        response = None
+        try:
+            with self._scheduler.slot(priority, key=flight_key, droppable=True):
+                response = self.session.get(
+                    url,
+                    headers=request_headers,
+                    timeout=self.timeout,
+                    stream=True
+                )
+        
+                if response.status_code in [401, 403]:
+                    self._handle_auth_error(response.status_code)
+        
+                if stored and response.status_code == 304:
+                    self._record_conditional(conditional=True, not_modified=True, size=stored['size'])
+                    body = stored['body']
+                    yield from (body.get('items') or [] if isinstance(body, dict) else body)
+                    return
+        
+                response.raise_for_status()
+                stream = JSONListStream()
+                items = []
+                for item in iter_json_list(response.iter_content(chunk_size=self.STREAM_CHUNK_SIZE), stream):
+                    items.append(item)
+                    yield item
+        
+            data = dict(stream.meta, items=items) if stream.meta else items
+            self._store_validators(validator_key, response, data, conditional=bool(stored),
+                                   size=stream.bytes_fed)
+        except requests.Timeout:
+            raise requests.Timeout(f"Request timed out after {self.timeout} seconds")
+        except requests.ConnectionError:
+            raise requests.ConnectionError("Failed to connect to the server")
+        except requests.HTTPError as e:
+            if response is not None:
+                error_message = self._format_error_message(response)
+                raise requests.HTTPError(error_message)
+            else:
+                raise requests.HTTPError(f"HTTP error: {str(e)}")
+        except requests.RequestException as e:
+            raise requests.RequestException(f"Request failed: {str(e)}")
+        except json.JSONDecodeError:
+            raise ValueError("Invalid JSON response from server")
+        finally:
+            if response is not None:
+                response.close()
+    
+    def _store_validators(self, validator_key: str, response, data: Any, conditional: bool,
+                          size: Optional[int] = None):
+        """Remember a 200 response's validators and decoded body for the next conditional GET"""
+        if size is None:
+            content = getattr(response, 'content', None)
+            size = len(content) if isinstance(content, (bytes, bytearray)) else 0
+        self._record_conditional(conditional=conditional, not_modified=False, size=size)
+        
+        headers = getattr(response, 'headers', None) or {}
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        etag = etag if isinstance(etag, str) else None
+        last_modified = last_modified if isinstance(last_modified, str) else None
+        
+        cache = self._get_cache()
+        if cache and (etag or last_modified):
+            cache.set(validator_key, {
+                'etag': etag,
+                'last_modified': last_modified,
+                'body': data,
+                'size': size,
+            }, ttl=self.VALIDATOR_TTL)
+    
+    @classmethod
+    def _record_conditional(cls, conditional: bool, not_modified: bool, size: int):
+        """Update conditional GET counters"""
+        with cls._conditional_lock:
+            if conditional:
+                cls._conditional_stats['conditional_requests'] += 1
+            if not_modified:
+                cls._conditional_stats['not_modified'] += 1
+                cls._conditional_stats['bytes_saved'] += size
+            else:
+                cls._conditional_stats['bytes_received'] += size
+    
+    def get_conditional_stats(self) -> Dict[str, Any]:
+        """
+        Get conditional GET statistics (shared by all APIClient instances)
+        
+        Returns:
+            Dictionary with conditional request, 304 and byte counts
+        """
+        with self._conditional_lock:
+            stats = dict(self._conditional_stats)
+        total = stats['bytes_received'] + stats['bytes_saved']
+        stats['bytes_saved_percent'] = (stats['bytes_saved'] / total * 100) if total else 0
+        return stats
+    
+    def registrations_loader(self) -> DataLoader:
+        """
+        Get the loader for events/{id}/registrations
+        
+        Ids requested together (or within one tick) are fetched with one
+        bulk request if the server supports it, otherwise in parallel with
+        at most PERFORMANCE_FETCH_CONCURRENCY requests in flight. Results
+        are shared by every page for 30 seconds; writes to an event drop
+        its entry.
+        
+        Example:
+            result = api.registrations_loader().load_many(event_ids)
+            registrations = result.get(event_id, [])
+            failed = result.errors  # {event_id: exception}
+        """
+        key = 'registrations ' + self._flight_key('GET', self.base_url, self._get_headers())
+        with self._loaders_lock:
+            loader = self._loaders.get(key)
+            if loader is None:
+                loader = DataLoader(
+                    fetch_one=self._fetch_registrations,
+                    fetch_many=self._fetch_registrations_bulk,
+                    max_concurrency=self._fetch_concurrency(),
+                )
+                self._loaders[key] = loader
+            return loader
+    
+    def _fetch_registrations(self, event_id) -> List[Dict[str, Any]]:
+        """Fetch one event's registrations"""
+        return self.get(f'events/{event_id}/registrations') or []
+    
+    def _fetch_registrations_bulk(self, event_ids: List[Any]) -> Dict[str, List[Dict[str, Any]]]:
+        """Fetch registrations for many events in one request"""
+        ids = ','.join(str(event_id) for event_id in event_ids)
+        response = self.get(self.BULK_REGISTRATIONS_ENDPOINT, params={'ids': ids})
+        if not isinstance(response, dict):
+            raise ValueError("Bulk registrations response is not an object")
+        return response
+    
+    @staticmethod
+    def _fetch_concurrency() -> int:
+        """Max parallel per-id requests (PERFORMANCE_FETCH_CONCURRENCY)"""
+        try:
+            from config.settings import settings
+            return int(settings.get('PERFORMANCE_FETCH_CONCURRENCY', 6) or 6)
+        except Exception:
+            return 6
+    
+    @classmethod
+    def clear_loaders(cls):
+        """Drop all per-id loaders and their results (e.g. on logout)"""
+        with cls._loaders_lock:
+            cls._loaders.clear()
+    
+    def post(self, endpoint, data=None, headers=None, priority=None):
         """Make a POST request to the API"""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        url = self._build_url(endpoint)
         response = None
         try:
-            response = self.session.post(
-                url,
-                json=data,
-                headers=self._get_headers(headers),
-                timeout=self.timeout
-            )
+            with self._scheduler.slot(priority):
+                response = self.session.post(
+                    url,
+                    json=data,
+                    headers=self._get_headers(headers),
+                    timeout=self.timeout
+                )
             
             # Handle authentication errors
             if response.status_code in [401, 403]:
                 self._handle_auth_error(response.status_code)
             
             response.raise_for_status()
+            self._invalidate_for_write(endpoint)
             return response.json()
         except requests.Timeout:
             raise requests.Timeout(f"Request timed out after {self.timeout} seconds")
@@ -181,23 +643,25 @@ class APIClient:
         except json.JSONDecodeError:
             raise ValueError("Invalid JSON response from server")
     
-    def put(self, endpoint, data, headers=None):
+    def put(self, endpoint, data, headers=None, priority=None):
         """Make a PUT request with JSON data"""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        url = self._build_url(endpoint)
         response = None
         try:
-            response = self.session.put(
-                url, 
-                json=data, 
-                headers=self._get_headers(headers), 
-                timeout=self.timeout
-            )
+            with self._scheduler.slot(priority):
+                response = self.session.put(
+                    url, 
+                    json=data, 
+                    headers=self._get_headers(headers), 
+                    timeout=self.timeout
+                )
             
             # Handle authentication errors
             if response.status_code in [401, 403]:
                 self._handle_auth_error(response.status_code)
             
             response.raise_for_status()
+            self._invalidate_for_write(endpoint)
             return response.json()
         except requests.Timeout:
             raise requests.Timeout(f"Request timed out after {self.timeout} seconds")
@@ -214,22 +678,24 @@ class APIClient:
         except json.JSONDecodeError:
             raise ValueError("Invalid JSON response from server")
     
-    def delete(self, endpoint, headers=None):
+    def delete(self, endpoint, headers=None, priority=None):
         """Make a DELETE request"""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        url = self._build_url(endpoint)
         response = None
         try:
-            response = self.session.delete(
-                url, 
-                headers=self._get_headers(headers), 
-                timeout=self.timeout
-            )
+            with self._scheduler.slot(priority):
+                response = self.session.delete(
+                    url, 
+                    headers=self._get_headers(headers), 
+                    timeout=self.timeout
+                )
             
             # Handle authentication errors
             if response.status_code in [401, 403]:
                 self._handle_auth_error(response.status_code)
             
             response.raise_for_status()
+            self._invalidate_for_write(endpoint)
             # DELETE might not return JSON, so handle gracefully
             try:
                 return response.json()
@@ -259,14 +725,11 @@ class APIClient:
         Returns:
             Sanitized dictionary
         """
-        try:
-            # Import security module only when needed to avoid circular imports
-            from utils.security import get_security_manager
-            security = get_security_manager()
-            return security.sanitize_form_data(data, exclude_keys=exclude_keys or [])
-        except ImportError:
+        security = self._security_manager()
+        if security is None:
             # Fall back to basic sanitization if security module not available
             return data
+        return security.sanitize_form_data(data, exclude_keys=exclude_keys or [])
     
     def check_rate_limit(self, user_id: Optional[str] = None) -> bool:
         """
@@ -281,21 +744,31 @@ class APIClient:
         Raises:
             RateLimitError: If rate limit is exceeded
         """
-        try:
-            from utils.security import get_security_manager
-            security = get_security_manager()
-            
-            identifier = user_id or "anonymous"
-            if not security.check_rate_limit(identifier):
-                remaining = security.get_remaining_requests(identifier)
-                raise RateLimitError(
-                    f"Rate limit exceeded. Try again later. "
-                    f"Remaining requests: {remaining}"
-                )
-            return True
-        except ImportError:
+        security = self._security_manager()
+        if security is None:
             # No rate limiting if security module not available
             return True
+        
+        identifier = user_id or "anonymous"
+        if not security.check_rate_limit(identifier):
+            remaining = security.get_remaining_requests(identifier)
+            raise RateLimitError(
+                f"Rate limit exceeded. Try again later. "
+                f"Remaining requests: {remaining}"
+            )
+        return True
+    
+    @classmethod
+    def _security_manager(cls):
+        """Security manager, imported once (None if the module is unavailable)"""
+        if cls._security is None:
+            try:
+                # Imported lazily to avoid circular imports
+                from utils.security import get_security_manager
+                cls._security = get_security_manager()
+            except ImportError:
+                cls._security = False
+        return cls._security or None
     
     def secure_post(self, endpoint: str, data: Dict[str, Any], user_id: Optional[str] = None, 
                    sanitize: bool = True, exclude_keys: Optional[list] = None, 
@@ -401,6 +874,31 @@ class APIClient:
         # Make request
         return self.delete(endpoint, headers=headers)
     
+    def _get_disk_cache(self, endpoint: Optional[str] = None):
+        """
+        Get the on-disk cache tier (None when disabled)
+        
+        Args:
+            endpoint: If given, only return the tier for DISK_CACHE_TYPES
+                paths without USER_SCOPED_SEGMENTS
+        """
+        if endpoint is not None:
+            if self._resource_parts(endpoint)[0] not in self.DISK_CACHE_TYPES:
+                return None
+            segments = endpoint.split('?')[0].split('/')
+            if any(segment in self.USER_SCOPED_SEGMENTS for segment in segments):
+                return None
+        return get_disk_cache()
+    
+    @staticmethod
+    def _offline_mode() -> bool:
+        """Whether FEATURE_OFFLINE_MODE is on"""
+        try:
+            from config.settings import settings
+            return bool(settings.get('FEATURE_OFFLINE_MODE', False))
+        except Exception:
+            return False
+    
     def _get_cache(self):
         """Get cache instance (lazy initialization)"""
         if self._cache is None:
@@ -421,25 +919,54 @@ class APIClient:
         self._loading_callbacks.append(callback)
     
     def _notify_loading(self, is_loading: bool):
-        """Notify all callbacks of loading state change"""
+        """Notify all callbacks of loading state change (on the UI thread)"""
         for callback in self._loading_callbacks:
-            try:
-                callback(is_loading)
-            except Exception as e:
-                print(f"Error in loading callback: {e}")
+            call_in_ui(self._run_loading_callback, callback, is_loading)
+    
+    @staticmethod
+    def _run_loading_callback(callback: Callable[[bool], None], is_loading: bool):
+        """Run one loading callback, logging failures"""
+        try:
+            callback(is_loading)
+        except Exception as e:
+            print(f"Error in loading callback: {e}")
     
     def get_cached(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
                    ttl: int = 300, user_id: Optional[str] = None,
-                   headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+                   headers: Optional[Dict[str, str]] = None,
+                   on_update: Optional[Callable[[Any], None]] = None,
+                   swr: bool = True, owner: Any = None) -> Dict[str, Any]:
         """
         Make cached GET request
         
+        Endpoints whose resource type is in SWR_POLICIES use
+        stale-while-revalidate: once the policy's fresh period passes, the
+        stale value is returned immediately and refetched in the background.
+        If the refetched data differs, on_update receives it (on the UI
+        thread when the dispatcher is installed) unless the task that asked
+        has been cancelled since, or its owner destroyed.
+        
+        Memory entries are kept per auth identity, so a different account
+        on the same client never sees them.
+        
+        Lookups go to memory first, then to the on-disk tier for
+        DISK_CACHE_TYPES. Disk rows are shared between accounts, so
+        user-scoped paths (events/registered, bookings/my) stay in memory.
+        On a cold start, stale rows from disk are served at once for SWR
+        endpoints (and revalidated). With FEATURE_OFFLINE_MODE on, the last
+        known data is returned when the server cannot be
+        reached instead of raising.
+        
         Args:
             endpoint: API endpoint
             params: Query parameters
-            ttl: Cache time to live in seconds (default: 5 minutes)
+            ttl: Cache time to live in seconds (default: 5 minutes; SWR
+                endpoints use their policy's fresh period instead)
             user_id: User identifier for rate limiting
             headers: Additional headers
+            on_update: Callback for newer data after a stale response
+            swr: Set False to always block on stale data
+            owner: Page (widget) on_update is delivered to
         
         Returns:
             Response JSON (from cache or API)
@@ -447,52 +974,326 @@ class APIClient:
         Example:
             # Cache events for 5 minutes
             events = api.get_cached("events", ttl=300)
+            
+            # Paint instantly, repaint if the server has something newer
+            events = api.get_cached("events", on_update=self._show_events, owner=self)
         """
         cache = self._get_cache()
-        
-        # Generate cache key
-        cache_key = f"api:{endpoint}"
-        if params:
-            cache_key += ":" + json.dumps(params, sort_keys=True)
+        policy = self._swr_policy(endpoint) if swr else None
+        cache_key = self._cache_key(endpoint, params, headers)
         
         # Check cache
         if cache:
-            cached_value = cache.get(cache_key)
+            if policy:
+                cached_value, fresh = cache.get_with_state(cache_key)
+            else:
+                cached_value, fresh = cache.get(cache_key), True
+            
             if cached_value is not None:
-                print(f"[CACHE HIT] {endpoint}")
+                if fresh:
+                    print(f"[CACHE HIT] {endpoint}")
+                else:
+                    print(f"[CACHE STALE] {endpoint}")
+                    self._revalidate(cache_key, endpoint, params, policy, user_id, headers,
+                                     cached_value, on_update, owner)
                 return cached_value
         
+        # Then the disk tier
+        disk = self._get_disk_cache(endpoint)
+        last_known = None
+        if disk:
+            entry = disk.get_entry(self._cache_key(endpoint, params, shared=True))
+            if entry is not None:
+                value, remaining = entry
+                if remaining > 0:
+                    print(f"[DISK HIT] {endpoint}")
+                    if cache:
+                        cache.set(cache_key, value, ttl=remaining, stale_ttl=policy[1] if policy else 0,
+                                  tags=self._cache_tags(endpoint, value))
+                    return value
+                if policy:
+                    print(f"[DISK STALE] {endpoint}")
+                    self._revalidate(cache_key, endpoint, params, policy, user_id,
+                                     headers, value, on_update, owner)
+                    return value
+                last_known = value
+        
         # Make API call
         print(f"[CACHE MISS] {endpoint}")
-        
+        try:
+            return self._fetch_and_cache(cache_key, endpoint, params, ttl, policy, user_id, headers)
+        except (requests.ConnectionError, requests.Timeout):
+            if last_known is not None and self._offline_mode():
+                print(f"[CACHE OFFLINE] {endpoint} (serving last known data)")
+                return last_known
+            raise
+    
+    def _fetch_and_cache(self, cache_key: str, endpoint: str, params: Optional[Dict[str, Any]],
+                         ttl: int, policy: Optional[Tuple[int, int]],
+                         user_id: Optional[str], headers: Optional[Dict[str, str]]) -> Any:
+        """Fetch an endpoint and store the response under cache_key"""
+        disk_key = self._cache_key(endpoint, params, shared=True)
         # Add params to endpoint if provided
-        if params:
-            param_str = "&".join([f"{k}={v}" for k, v in params.items()])
-            endpoint = f"{endpoint}?{param_str}"
+        endpoint = self._with_query(endpoint, params)
         
         response = self.secure_get(endpoint, user_id=user_id, headers=headers)
         
-        # Cache response
-        if cache and response:
-            cache.set(cache_key, response, ttl=ttl)
+        # Cache response in memory and (for DISK_CACHE_TYPES) on disk
+        if response:
+            fresh_ttl, stale_ttl = policy if policy else (ttl, 0)
+            tags = self._cache_tags(endpoint, response)
+            cache = self._get_cache()
+            if cache:
+                cache.set(cache_key, response, ttl=fresh_ttl, stale_ttl=stale_ttl, tags=tags)
+            disk = self._get_disk_cache(endpoint)
+            if disk:
+                disk.set(disk_key, response, ttl=fresh_ttl, tags=tags)
         
         return response
     
+    def _cache_key(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                   headers: Optional[Dict[str, str]] = None, shared: bool = False) -> str:
+        """
+        Response cache key for an endpoint
+        
+        The path comes first so prefix invalidation can find the key. The
+        auth identity (as in _flight_key) is appended unless shared=True, so
+        callers with different tokens never read each other's entries.
+        
+        Example:
+            'events/registered' -> 'api:events/registered?as=3f9c...'
+        """
+        cache_key = f"api:{endpoint}"
+        if params:
+            cache_key += ("&" if "?" in cache_key else "?") + json.dumps(params, sort_keys=True)
+        if not shared:
+            identity_key = _header_identity(tuple(sorted(self._get_headers(headers).items())))
+            cache_key += ("&" if "?" in cache_key else "?") + f"as={identity_key}"
+        return cache_key
+    
+    def _swr_policy(self, endpoint: str) -> Optional[Tuple[int, int]]:
+        """Stale-while-revalidate policy for an endpoint (None if it has none)"""
+        rtype, _, _ = self._resource_parts(endpoint)
+        return self.SWR_POLICIES.get(rtype)
+    
+    def _revalidate(self, cache_key: str, endpoint: str, params: Optional[Dict[str, Any]],
+                    policy: Tuple[int, int], user_id: Optional[str],
+                    headers: Optional[Dict[str, str]], stale_value: Any,
+                    on_update: Optional[Callable[[Any], None]], owner: Any = None):
+        """
+        Refresh a stale cache entry in the background
+        
+        Only one revalidation runs per key; callers arriving while it runs
+        just add their on_update callback to it. The refresh itself has no
+        owner (it updates the cache for everyone); each callback remembers
+        the task that asked for it and is dropped if that task was cancelled.
+        """
+        waiter = (current_task(), owner, on_update)
+        with self._revalidating_lock:
+            waiting = self._revalidating.get(cache_key)
+            if waiting is not None:
+                if on_update:
+                    waiting.append(waiter)
+                return
+            self._revalidating[cache_key] = [waiter] if on_update else []
+        
+        # Revalidation is never more urgent than prefetching
+        priority = max(current_priority(), Priority.PREFETCH)
+        
+        def worker():
+            response = None
+            try:
+                with request_priority(priority):
+                    response = self._fetch_and_cache(cache_key, endpoint, params, 0, policy,
+                                                     user_id, headers)
+            except Exception as e:
+                print(f"[CACHE] Revalidation failed for {endpoint}: {e}")
+            finally:
+                with self._revalidating_lock:
+                    callbacks = self._revalidating.pop(cache_key, [])
+            
+            if response and response != stale_value:
+                print(f"[CACHE UPDATED] {endpoint}")
+                for task, owner, callback in callbacks:
+                    self._deliver(owner, self._notify_update, task, callback, response)
+        
+        get_executor().submit(worker)
+    
+    @staticmethod
+    def _deliver(owner: Any, callback: Callable, *args):
+        """
+        Run a callback on the UI thread
+        
+        With an owner the callback goes through task_executor.deliver, so it
+        is dropped once the calling task is cancelled or the owner is gone.
+        """
+        if owner is not None:
+            deliver(owner, callback, *args)
+        else:
+            call_in_ui(callback, *args)
+    
+    @staticmethod
+    def _notify_update(task: Any, callback: Callable[[Any], None], response: Any):
+        """Pass revalidated data on unless the requesting task was cancelled"""
+        if task is not None and task.cancelled:
+            get_executor().record_dropped_result()
+            return
+        callback(response)
+    
     def invalidate_cache(self, pattern: str):
         """
-        Invalidate cache entries matching pattern
+        Invalidate cache entries under an endpoint prefix
         
         Args:
-            pattern: Pattern to match (e.g., "events" invalidates all event caches)
+            pattern: Endpoint prefix (e.g., "events" invalidates all event
+                caches, "events/5" only event 5 and its sub-resources)
         
         Example:
             # Invalidate all event caches after creating new event
             api.invalidate_cache("events")
         """
+        removed = 0
         cache = self._get_cache()
         if cache:
-            cache.invalidate_pattern(f"api:{pattern}")
-            print(f"[CACHE INVALIDATED] {pattern}")
+            removed += cache.invalidate_prefix(f"api:{pattern}")
+        disk = self._get_disk_cache()
+        if disk:
+            removed += disk.invalidate_prefix(f"api:{pattern}")
+        print(f"[CACHE INVALIDATED] {pattern} ({removed} entries)")
+    
+    @staticmethod
+    def _resource_parts(endpoint: str) -> Tuple[str, Optional[str], bool]:
+        """
+        Split an endpoint into resource type and entity id
+        
+        A leading 'admin/' is ignored so admin and user endpoints share tags.
+        
+        Returns:
+            (type, id or None, True if the endpoint is the bare collection)
+        
+        Example:
+            'admin/events/5/approve' -> ('events', '5', False)
+            'events/registered'      -> ('events', None, False)
+        """
+        segments = [s for s in endpoint.split('?')[0].split('/') if s]
+        if segments and segments[0] == 'admin':
+            segments = segments[1:]
+        if not segments:
+            return '', None, False
+        
+        entity_id = segments[1] if len(segments) > 1 and segments[1].isdigit() else None
+        return segments[0], entity_id, len(segments) == 1
+    
+    @classmethod
+    def _cache_tags(cls, endpoint: str, response: Any) -> List[str]:
+        """
+        Tags for a cached GET response
+        
+        - '<type>' for everything of that resource type
+        - '<type>:<id>' for an entity, its sub-resources, and every list
+          view that contains it
+        - '<type>:list' for the bare collection (any page/filter)
+        - '<type>:views' for named views such as 'events/registered'
+        """
+        rtype, entity_id, is_collection = cls._resource_parts(endpoint)
+        if not rtype:
+            return []
+        
+        tags = [rtype]
+        if entity_id is not None:
+            tags.append(f"{rtype}:{entity_id}")
+            return tags
+        tags.append(f"{rtype}:list" if is_collection else f"{rtype}:views")
+        
+        items = response
+        if isinstance(response, dict):
+            items = next(
+                (response[k] for k in ('data', 'items', 'content', rtype) if isinstance(response.get(k), list)),
+                []
+            )
+        if isinstance(items, list):
+            id_field = f"{rtype[:-1] if rtype.endswith('s') else rtype}_id"
+            for item in items:
+                if isinstance(item, dict):
+                    item_id = item.get('id', item.get(id_field))
+                    if item_id is not None:
+                        tags.append(f"{rtype}:{item_id}")
+        return tags
+    
+    def _invalidate_for_write(self, endpoint: str):
+        """
+        Drop cached responses made stale by a successful write
+        
+        Writes to an entity ('events/5', 'events/5/register') drop that
+        entity, its sub-resources, lists containing it and the type's named
+        views. Writes to a collection ('events') drop the collection lists
+        and named views. Other entities stay cached.
+        """
+        rtype, entity_id, _ = self._resource_parts(endpoint)
+        if not rtype:
+            return
+        
+        if entity_id is not None:
+            tags = (f"{rtype}:{entity_id}", f"{rtype}:views")
+        else:
+            tags = (f"{rtype}:list", f"{rtype}:views")
+        
+        removed = 0
+        cache = self._get_cache()
+        if cache:
+            removed += cache.invalidate_tags(*tags)
+        disk = self._get_disk_cache(endpoint)
+        if disk:
+            removed += disk.invalidate_tags(*tags)
+        if removed:
+            print(f"[CACHE INVALIDATED] {', '.join(tags)} ({removed} entries)")
+        
+        if rtype == 'events' and entity_id is not None:
+            with self._loaders_lock:
+                loaders = list(self._loaders.values())
+            for loader in loaders:
+                loader.clear(entity_id, int(entity_id))
+    
+    def query(self, endpoint: str, summary: bool = False) -> ListQuery:
+        """
+        Start a list query with server-side filters, sort and pagination
+        
+        Args:
+            endpoint: Collection endpoint
+            summary: Request only SUMMARY_FIELDS of the resource type (full
+                rows if the type has none or the server ignores fields)
+        
+        Returns:
+            ListQuery bound to this client
+        
+        Example:
+            result = api.query('admin/users').where(role='student').paginate(1, 50).fetch()
+            users, total = result.items, result.total
+        """
+        query = ListQuery(endpoint, api=self)
+        if summary:
+            query = query.fields(*self.SUMMARY_FIELDS.get(self._resource_parts(endpoint)[0], ()))
+        return query
+    
+    def get_detail(self, endpoint: str, entity_id: Any, ttl: int = 300) -> Dict[str, Any]:
+        """
+        Full record of one entity, for detail views of summary rows
+        
+        Fetched when first needed and cached; writes to the entity
+        invalidate it like any other cached GET.
+        
+        Args:
+            endpoint: Collection endpoint (e.g. 'events')
+            entity_id: Entity id
+            ttl: Cache time to live in seconds
+        
+        Returns:
+            Entity JSON
+        
+        Example:
+            event = api.get_detail('events', 5)
+        """
+        return self.get_cached(f"{endpoint.strip('/')}/{entity_id}", ttl=ttl)
     
     def get_paginated(self, endpoint: str, page: int = 1, limit: int = 20,
                      user_id: Optional[str] = None, cache: bool = True,
@@ -519,8 +1320,7 @@ class APIClient:
         params = {"page": page, "limit": limit}
         
         # Add params to endpoint
-        param_str = f"page={page}&limit={limit}"
-        paginated_endpoint = f"{endpoint}?{param_str}" if "?" not in endpoint else f"{endpoint}&{param_str}"
+        paginated_endpoint = self._with_query(endpoint, params)
         
         if cache:
             return self.get_cached(paginated_endpoint, ttl=300, user_id=user_id, headers=headers)
@@ -530,7 +1330,7 @@ class APIClient:
     def async_get(self, endpoint: str, on_success: Callable[[Dict[str, Any]], None],
                   on_error: Optional[Callable[[Exception], None]] = None,
                   user_id: Optional[str] = None, cache: bool = True,
-                  headers: Optional[Dict[str, str]] = None):
+                  headers: Optional[Dict[str, str]] = None, owner: Any = None):
         """
         Make asynchronous GET request (non-blocking)
         
@@ -541,6 +1341,16 @@ class APIClient:
             user_id: User identifier for rate limiting
             cache: Whether to use caching
             headers: Additional headers
+            owner: Page that owns the request; hiding it (navigate) cancels
+                the request and destroying it drops late callbacks
+        
+        Callbacks run on the Tk main thread when the UI dispatcher is
+        installed, so they may update widgets directly. With caching on,
+        on_success may run twice for stale-while-revalidate endpoints: once
+        with the stale value and again when newer data arrives.
+        
+        Returns:
+            Future for the request (runs on the shared I/O pool)
         
         Example:
             def on_done(data):
@@ -549,36 +1359,38 @@ class APIClient:
             def on_fail(error):
                 messagebox.showerror("Error", str(error))
             
-            api.async_get("events", on_success=on_done, on_error=on_fail)
+            api.async_get("events", on_success=on_done, on_error=on_fail, owner=self)
         """
         def worker():
             self._notify_loading(True)
             try:
                 if cache:
-                    result = self.get_cached(endpoint, user_id=user_id, headers=headers)
+                    # Stale responses are followed by a second on_success
+                    # call once fresher data arrives
+                    result = self.get_cached(endpoint, user_id=user_id, headers=headers,
+                                             on_update=on_success, owner=owner)
                 else:
                     result = self.secure_get(endpoint, user_id=user_id, headers=headers)
                 
-                # Call success callback
-                on_success(result)
+                # Call success callback on the UI thread
+                self._deliver(owner, on_success, result)
             except Exception as e:
-                # Call error callback
+                # Call error callback on the UI thread
                 if on_error:
-                    on_error(e)
+                    self._deliver(owner, on_error, e)
                 else:
                     print(f"Error in async GET: {e}")
             finally:
                 self._notify_loading(False)
         
-        thread = threading.Thread(target=worker, daemon=True)
-        thread.start()
+        return get_executor().submit(worker, owner=owner)
     
     def async_post(self, endpoint: str, data: Dict[str, Any],
                    on_success: Callable[[Dict[str, Any]], None],
                    on_error: Optional[Callable[[Exception], None]] = None,
                    user_id: Optional[str] = None, sanitize: bool = True,
                    exclude_keys: Optional[list] = None,
-                   headers: Optional[Dict[str, str]] = None):
+                   headers: Optional[Dict[str, str]] = None, owner: Any = None):
         """
         Make asynchronous POST request (non-blocking)
         
@@ -591,12 +1403,21 @@ class APIClient:
             sanitize: Whether to sanitize input
             exclude_keys: Keys to exclude from sanitization
             headers: Additional headers
+            owner: Page that owns the request; the POST still completes if
+                the page is hidden, but callbacks are dropped once it is
+                destroyed
+        
+        Callbacks run on the Tk main thread when the UI dispatcher is
+        installed, so they may update widgets directly.
+        
+        Returns:
+            Future for the request (runs on the shared I/O pool)
         
         Example:
             def on_created(response):
                 messagebox.showinfo("Success", "Event created!")
             
-            api.async_post("events", event_data, on_success=on_created)
+            api.async_post("events", event_data, on_success=on_created, owner=self)
         """
         def worker():
             self._notify_loading(True)
@@ -607,19 +1428,16 @@ class APIClient:
                     headers=headers
                 )
                 
-                # Invalidate cache for this endpoint
-                self.invalidate_cache(endpoint.split('?')[0].split('/')[0])
-                
-                # Call success callback
-                on_success(result)
+                # Call success callback on the UI thread
+                self._deliver(owner, on_success, result)
             except Exception as e:
-                # Call error callback
+                # Call error callback on the UI thread
                 if on_error:
-                    on_error(e)
+                    self._deliver(owner, on_error, e)
                 else:
                     print(f"Error in async POST: {e}")
             finally:
                 self._notify_loading(False)
         
-        thread = threading.Thread(target=worker, daemon=True)
-        thread.start()
\ No newline at end of file
+        # A mutation the user asked for is not interrupted by navigating away
+        return get_executor().submit(worker, owner=owner, interruptible=False)
\ No newline at end of file
@@ -0,0 +1,150 @@
+"""
+Calendar Index
+Date and hour buckets of events and bookings for calendar rendering
+
+CalendarView used to answer "what is on this day / in this hour slot" by
+scanning every event and booking, re-parsing each start_time, for each of
+the 42 month cells or 7 x 13 week slots, and copying every match into a
+new ``{'type': ..., **row}`` dict. A month render cost cells x items.
+
+The index is built once per data update:
+
+- every item is parsed once (records from utils.models already carry
+  their parsed ``start``/``end``) and added to the bucket of each day it
+  covers, so multi-day events show on all of their days
+- hour buckets hold items by start hour on their first day; on the
+  following days of a multi-day item it continues from 00:00
+- the ``type``-tagged copy of an item is made the first time a view asks
+  for it and reused afterwards, so only items in view are ever copied
+
+Usage:
+    from utils.calendar_index import CalendarIndex
+
+    index = CalendarIndex(events, bookings)
+    index.on_date(date(2025, 11, 20))        # events then bookings
+    index.at_hour(date(2025, 11, 20), 14)
+"""
+
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from utils.datetime_service import parse_datetime
+from utils.models import Record
+
+KINDS = {'all': ('event', 'booking'), 'events': ('event',), 'bookings': ('booking',)}
+
+
+def _start_end(item: Any) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """Parsed start and end of an event or booking"""
+    if isinstance(item, Record) and hasattr(item, 'start'):
+        return item.start, item.end
+    return parse_datetime(item.get('start_time')), parse_datetime(item.get('end_time'))
+
+
+class CalendarIndex:
+    """
+    Events and bookings bucketed by day and by (day, hour)
+
+    Lookups return the items' type-tagged copies (shared between lookups;
+    treat them as read-only).
+    """
+
+    def __init__(self, events: Iterable[Any] = (), bookings: Iterable[Any] = (),
+                 max_span_days: int = 180):
+        """
+        Build the index
+
+        Args:
+            events: Event rows ('start_time', optional 'end_time')
+            bookings: Booking rows ('start_time', optional 'end_time')
+            max_span_days: Longest span an item is spread over; items
+                ending later (or with a bad end) only cover this many days
+        """
+        self.max_span_days = max(1, max_span_days)
+        self._items: List[Tuple[str, Any]] = []       # (type, row)
+        self._tagged: List[Optional[Dict[str, Any]]] = []
+        # day -> {type: [item positions]}, (day, hour) -> {type: [positions]}
+        self._days: Dict[date, Dict[str, List[int]]] = {}
+        self._hours: Dict[Tuple[date, int], Dict[str, List[int]]] = {}
+        self._undated = 0
+        for kind, rows in (('event', events), ('booking', bookings)):
+            for row in rows or ():
+                self._add(kind, row)
+
+    def _add(self, kind: str, row: Any):
+        start, end = _start_end(row)
+        if start is None:
+            self._undated += 1
+            return
+        position = len(self._items)
+        self._items.append((kind, row))
+        self._tagged.append(None)
+
+        first = start.date()
+        last = first
+        if end is not None and end > start:
+            # An end at midnight does not put the item on that day
+            last = (end - timedelta(microseconds=1)).date()
+        days = min((last - first).days, self.max_span_days - 1)
+
+        self._days.setdefault(first, {}).setdefault(kind, []).append(position)
+        self._hours.setdefault((first, start.hour), {}).setdefault(kind, []).append(position)
+        for offset in range(1, days + 1):
+            day = first + timedelta(days=offset)
+            self._days.setdefault(day, {}).setdefault(kind, []).append(position)
+            self._hours.setdefault((day, 0), {}).setdefault(kind, []).append(position)
+
+    def _collect(self, bucket: Optional[Dict[str, List[int]]], kinds: Tuple[str, ...]) -> List[Dict[str, Any]]:
+        if not bucket:
+            return []
+        result = []
+        for kind in kinds:
+            for position in bucket.get(kind, ()):
+                tagged = self._tagged[position]
+                if tagged is None:
+                    tagged = self._tagged[position] = {'type': kind, **self._items[position][1]}
+                result.append(tagged)
+        return result
+
+    def on_date(self, day: date, item_type: str = 'all') -> List[Dict[str, Any]]:
+        """
+        Items on a day
+
+        Args:
+            day: Date (a datetime counts as its date)
+            item_type: 'all', 'events' or 'bookings'
+
+        Returns:
+            Type-tagged items, events before bookings, in input order
+        """
+        if isinstance(day, datetime):
+            day = day.date()
+        return self._collect(self._days.get(day), KINDS[item_type])
+
+    def at_hour(self, day: date, hour: int) -> List[Dict[str, Any]]:
+        """Type-tagged items starting in (or continuing from 00:00 into) an hour slot"""
+        if isinstance(day, datetime):
+            day = day.date()
+        return self._collect(self._hours.get((day, hour)), KINDS['all'])
+
+    def count_on(self, day: date) -> int:
+        """Number of items on a day (without copying them)"""
+        if isinstance(day, datetime):
+            day = day.date()
+        return sum(len(positions) for positions in self._days.get(day, {}).values())
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get index statistics
+
+        Returns:
+            Dictionary with items indexed and skipped (no start), day and
+            hour buckets, and tagged copies made so far
+        """
+        return {
+            'items': len(self._items),
+            'undated': self._undated,
+            'days': len(self._days),
+            'hours': len(self._hours),
+            'tagged': sum(1 for tagged in self._tagged if tagged is not None),
+        }
@@ -0,0 +1,323 @@
+"""
+Cursor Feed
+Cursor-paginated, prefetching window over a list query for infinite scroll
+
+Browse pages used to download a whole collection before showing the first
+card, so time to first card grew with the number of events. A
+``CursorFeed`` loads a ``ListQuery`` one page at a time instead:
+
+- ``start()`` fetches only the first page
+- as soon as a page is shown, the next one is fetched in the background at
+  prefetch priority, so scrolling down usually shows it without waiting
+- ``on_scroll(first, last)`` (wired to the canvas' yscrollcommand) shows the
+  next page once the view passes ``prefetch_at`` and reloads dropped pages
+  when scrolling back up
+- at most ``max_pages`` pages stay loaded; older ones are dropped from the
+  other end of the window, so memory and widget count stay bounded
+
+When the server ignores the cursor and returns the whole (filtered) list,
+the feed keeps that list and serves later pages from it without further
+requests.
+
+All state changes and callbacks happen on the UI thread.
+
+Usage:
+    from utils.cursor_feed import CursorFeed
+
+    feed = CursorFeed(self, self.api.query('events').order_by('start_time'),
+                      page_size=12, on_page=self._add_page, on_drop=self._drop_page)
+    feed.start()
+    canvas.configure(yscrollcommand=lambda f, l: (scrollbar.set(f, l), feed.on_scroll(f, l)))
+"""
+
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from utils.query_builder import ListQuery, QueryResult
+from utils.request_scheduler import Priority, request_priority
+from utils.task_executor import deliver, run_async
+
+
+class FeedPage:
+    """
+    One loaded page
+
+    Attributes:
+        index: Page number in the feed (0 for the first page)
+        cursor: Cursor the page was fetched with (None for the first page)
+        items: Rows of the page
+        next_cursor: Cursor of the following page (None on the last page)
+    """
+
+    __slots__ = ('index', 'cursor', 'items', 'next_cursor')
+
+    def __init__(self, index: int, cursor: Optional[str], items: List[Dict[str, Any]],
+                 next_cursor: Optional[str]):
+        self.index = index
+        self.cursor = cursor
+        self.items = items
+        self.next_cursor = next_cursor
+
+
+class CursorFeed:
+    """
+    Window of consecutive pages of a list query
+
+    Callbacks (all on the UI thread):
+        on_page(page, at_start): a page entered the window at the top
+            (at_start=True) or bottom
+        on_drop(page, at_start): a page left the window at the top or bottom
+        on_error(error): a fetch failed
+        on_loading(is_loading): a page the user is waiting for started or
+            stopped loading (background prefetches are not reported)
+    """
+
+    def __init__(self, owner: Any, query: ListQuery, page_size: int = 20, max_pages: int = 5,
+                 prefetch_at: float = 0.75,
+                 on_page: Optional[Callable[[FeedPage, bool], None]] = None,
+                 on_drop: Optional[Callable[[FeedPage, bool], None]] = None,
+                 on_error: Optional[Callable[[Exception], None]] = None,
+                 on_loading: Optional[Callable[[bool], None]] = None):
+        """
+        Initialize feed (call start() to load the first page)
+
+        Args:
+            owner: Page that owns the fetches (hiding it cancels them)
+            query: List query to page through (its own pagination is replaced)
+            page_size: Rows per page
+            max_pages: Pages kept loaded at once (at least 2)
+            prefetch_at: Scroll fraction past which the next page is shown
+            on_page, on_drop, on_error, on_loading: See class docstring
+        """
+        self.owner = owner
+        self.query = query
+        self.page_size = max(1, int(page_size))
+        self.max_pages = max(2, int(max_pages))
+        self.prefetch_at = prefetch_at
+        self.on_page = on_page
+        self.on_drop = on_drop
+        self.on_error = on_error
+        self.on_loading = on_loading
+
+        self.total: Optional[int] = None
+        self._pages: Deque[FeedPage] = deque()
+        self._cursors: Dict[int, Optional[str]] = {0: None}
+        self._last_index: Optional[int] = None  # Index of the final page, once known
+        self._prefetched: Dict[int, FeedPage] = {}
+        self._fetching: Dict[int, bool] = {}  # index -> shown when it arrives
+        self._local_rows: Optional[List[Dict[str, Any]]] = None
+        self._generation = 0
+        self._stats = {'requests': 0, 'prefetch_hits': 0, 'local_pages': 0, 'dropped': 0}
+
+    @property
+    def pages(self) -> List[FeedPage]:
+        """Loaded pages, top to bottom"""
+        return list(self._pages)
+
+    @property
+    def items(self) -> List[Dict[str, Any]]:
+        """Rows of every loaded page, top to bottom"""
+        return [item for page in self._pages for item in page.items]
+
+    @property
+    def loading(self) -> bool:
+        """Whether a page the user is waiting for is being fetched"""
+        return any(self._fetching.values())
+
+    @property
+    def exhausted(self) -> bool:
+        """Whether the last page is loaded"""
+        return bool(self._pages) and self._pages[-1].index == self._last_index
+
+    def start(self, query: Optional[ListQuery] = None,
+              rows: Optional[List[Dict[str, Any]]] = None):
+        """
+        (Re)load from the first page
+
+        Pages of the previous query are forgotten without on_drop calls;
+        callers clear their display first.
+
+        Args:
+            query: New query (e.g. after the filters changed)
+            rows: Page through these rows instead of fetching (the query
+                is applied to them locally)
+        """
+        if query is not None:
+            self.query = query
+        self._generation += 1
+        self._pages.clear()
+        self._cursors = {0: None}
+        self._last_index = None
+        self._prefetched.clear()
+        self._fetching.clear()
+        self._local_rows = list(rows) if rows is not None else None
+        self.total = None
+        self._request(0, show=True)
+
+    def on_scroll(self, first: Any, last: Any):
+        """
+        Scroll position changed (yscrollcommand arguments)
+
+        Args:
+            first: Fraction of the content above the view
+            last: Fraction of the content up to the bottom of the view
+        """
+        first, last = float(first), float(last)
+        if first <= 0.0 and last >= 1.0 and len(self._pages) >= self.max_pages:
+            return  # Everything fits: don't cycle pages through the window
+        if last >= self.prefetch_at:
+            self.show_next()
+        elif first <= 1.0 - self.prefetch_at:
+            self.show_previous()
+
+    def show_next(self):
+        """Show the page below the window (prefetched if possible)"""
+        if not self._pages or self.exhausted:
+            return
+        self._show(self._pages[-1].index + 1)
+
+    def show_previous(self):
+        """Reload the page above the window if it was dropped"""
+        if not self._pages or self._pages[0].index == 0:
+            return
+        self._show(self._pages[0].index - 1)
+
+    def remove(self, predicate: Callable[[Dict[str, Any]], bool]) -> int:
+        """
+        Remove loaded rows (e.g. after a delete) without refetching
+
+        Returns:
+            Number of rows removed
+        """
+        removed = 0
+        for page in self._pages:
+            kept = [item for item in page.items if not predicate(item)]
+            removed += len(page.items) - len(kept)
+            page.items = kept
+        if self._local_rows is not None:
+            self._local_rows = [item for item in self._local_rows if not predicate(item)]
+        if removed and self.total is not None:
+            self.total = max(0, self.total - removed)
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get feed statistics
+
+        Returns:
+            Dictionary with requests made, pages shown from the prefetch
+            buffer or a local list, pages dropped and the current window
+        """
+        stats = dict(self._stats)
+        stats['window'] = [page.index for page in self._pages]
+        stats['total'] = self.total
+        return stats
+
+    def _show(self, index: int):
+        """Show page index now if it is buffered, otherwise fetch it"""
+        page = self._prefetched.pop(index, None)
+        if page is not None:
+            self._stats['prefetch_hits'] += 1
+            self._add(page)
+        elif index in self._fetching:
+            if not self._fetching[index]:
+                self._fetching[index] = True  # A prefetch is running; show it when it lands
+                self._set_loading(True)
+        elif index in self._cursors:
+            self._request(index, show=True)
+
+    def _request(self, index: int, show: bool):
+        """Fetch page index (shown on arrival, or buffered if a prefetch)"""
+        cursor = self._cursors[index]
+        if self._local_rows is not None:
+            # The server returned everything already: page locally
+            self._stats['local_pages'] += 1
+            result = self.query.after(cursor, limit=self.page_size).evaluate(self._local_rows)
+            self._accept(index, cursor, result, show)
+            return
+
+        self._fetching[index] = show
+        if show:
+            self._set_loading(True)
+        self._stats['requests'] += 1
+        query = self.query.after(cursor, limit=self.page_size)
+        generation = self._generation
+        priority = Priority.INTERACTIVE if show else Priority.PREFETCH
+
+        def worker():
+            try:
+                with request_priority(priority):
+                    result, error = query.fetch(), None
+            except Exception as e:
+                result, error = None, e
+            deliver(self.owner, self._arrive, generation, index, cursor, result, error)
+
+        run_async(self.owner, worker)
+
+    def _arrive(self, generation: int, index: int, cursor: Optional[str],
+                result: Optional[QueryResult], error: Optional[Exception]):
+        """A fetch finished (UI thread)"""
+        if generation != self._generation:
+            return  # Query changed meanwhile
+        show = self._fetching.pop(index, True)
+        if show and not self.loading:
+            self._set_loading(False)
+
+        if error is not None:
+            if show and self.on_error is not None:
+                self.on_error(error)
+            return
+        self._accept(index, cursor, result, show)
+
+    def _accept(self, index: int, cursor: Optional[str], result: QueryResult, show: bool):
+        """Record a fetched page, then show or buffer it"""
+        if result.all_items is not None and self._local_rows is None:
+            self._local_rows = result.all_items
+        if result.total is not None:
+            self.total = result.total
+        self._cursors[index + 1] = result.next_cursor
+        if result.next_cursor is None:
+            self._last_index = index
+
+        page = FeedPage(index, cursor, result.items, result.next_cursor)
+        if show:
+            self._add(page)
+        else:
+            self._prefetched[index] = page
+
+    def _add(self, page: FeedPage):
+        """Put a page into the window, dropping from the other end if full"""
+        if self._pages and page.index == self._pages[0].index - 1:
+            at_start = True
+        elif not self._pages or page.index == self._pages[-1].index + 1:
+            at_start = False
+        else:
+            return  # No longer adjacent to the window
+
+        if at_start:
+            self._pages.appendleft(page)
+        else:
+            self._pages.append(page)
+        if self.on_page is not None:
+            self.on_page(page, at_start)
+
+        while len(self._pages) > self.max_pages:
+            dropped = self._pages.pop() if at_start else self._pages.popleft()
+            self._stats['dropped'] += 1
+            if self.on_drop is not None:
+                self.on_drop(dropped, not at_start)
+
+        if not at_start:
+            self._prefetch(page.index + 1)
+
+    def _prefetch(self, index: int):
+        """Fetch the page after the window in the background"""
+        if index in self._prefetched or index in self._fetching or index not in self._cursors:
+            return
+        if self._last_index is not None and index > self._last_index:
+            return
+        self._request(index, show=False)
+
+    def _set_loading(self, is_loading: bool):
+        if self.on_loading is not None:
+            self.on_loading(is_loading)
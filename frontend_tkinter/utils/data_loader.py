@@ -0,0 +1,300 @@
+"""
+Data Loader
+Batches per-id fetches into bulk requests or bounded parallel fan-out
+
+Loading "the registrations of each of my events" used to be a loop of
+sequential ``events/{id}/registrations`` calls: 60 events, 60 round-trips
+back to back. ``DataLoader`` collects the ids requested within a short
+window (one "tick") and fetches them together:
+
+- with a bulk fetch function, one request per batch
+- otherwise (or if the bulk request fails), one request per id with at most
+  ``max_concurrency`` in flight
+- each id succeeds or fails on its own; ``load_many`` reports both
+- results are memoized for ``cache_ttl`` seconds and concurrent requests
+  for the same id share one fetch
+
+Usage:
+    loader = DataLoader(
+        fetch_one=lambda event_id: api.get(f'events/{event_id}/registrations'),
+        fetch_many=lambda ids: api.get(
+            'events/registrations?ids=' + ','.join(map(str, ids))),
+    )
+
+    result = loader.load_many([1, 2, 3])
+    for event_id, error in result.errors.items():
+        print(f"registrations for {event_id} failed: {error}")
+
+    future = loader.load(4)  # batched with other loads in the same tick
+"""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from utils.request_scheduler import current_priority, request_priority
+
+
+class BatchResult:
+    """
+    Outcome of load_many
+
+    Attributes:
+        values: Loaded values by key
+        errors: Exceptions by key for keys that failed
+    """
+
+    def __init__(self):
+        self.values: Dict[Hashable, Any] = {}
+        self.errors: Dict[Hashable, Exception] = {}
+
+    @property
+    def ok(self) -> bool:
+        """True if every key loaded"""
+        return not self.errors
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Value for key, or default if it failed"""
+        return self.values.get(key, default)
+
+
+class DataLoader:
+    """
+    Per-key loader with tick batching, bulk fetches and bounded fan-out
+
+    fetch_one(key) returns the value for one key. fetch_many(keys), if
+    given, returns a dict of values for many keys at once; keys missing from
+    its result are fetched individually.
+    """
+
+    # Shared pool for fan-out requests (per-batch concurrency is limited
+    # separately by max_concurrency)
+    _pool: Optional[ThreadPoolExecutor] = None
+    _pool_lock = threading.Lock()
+    POOL_WORKERS = 16
+
+    # After a failed bulk request, fetch individually for this long
+    BULK_RETRY_SECONDS = 600
+
+    def __init__(self, fetch_one: Callable[[Hashable], Any],
+                 fetch_many: Optional[Callable[[List[Hashable]], Dict[Hashable, Any]]] = None,
+                 max_concurrency: int = 6, batch_window_ms: float = 5,
+                 max_batch_size: int = 100, cache_ttl: Optional[float] = 30):
+        """
+        Initialize data loader
+
+        Args:
+            fetch_one: Fetch the value for one key
+            fetch_many: Optional bulk fetch returning {key: value}
+            max_concurrency: Max parallel fetch_one calls per batch
+            batch_window_ms: How long load() waits to collect more keys
+            max_batch_size: Keys per bulk request
+            cache_ttl: Seconds to memoize values (None/0 disables)
+        """
+        self.fetch_one = fetch_one
+        self.fetch_many = fetch_many
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.batch_window = batch_window_ms / 1000.0
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.cache_ttl = cache_ttl
+        self._bulk_retry_at = 0.0
+
+        self._lock = threading.Lock()
+        self._futures: Dict[Hashable, Tuple[Future, float]] = {}
+        self._pending: List[Tuple[Hashable, Future]] = []
+        self._timer: Optional[threading.Timer] = None
+        self._stats = {
+            'loads': 0,
+            'cache_hits': 0,
+            'batches': 0,
+            'bulk_requests': 0,
+            'single_requests': 0,
+            'errors': 0,
+        }
+
+    def load(self, key: Hashable) -> Future:
+        """
+        Request one key (batched with other keys requested in this tick)
+
+        Args:
+            key: Key to load
+
+        Returns:
+            Future resolving to the value (or raising the fetch error)
+        """
+        with self._lock:
+            future, is_new = self._future_for(key)
+            if is_new:
+                self._pending.append((key, future))
+                if self._timer is None:
+                    self._timer = threading.Timer(self.batch_window, self.dispatch)
+                    self._timer.daemon = True
+                    self._timer.start()
+        return future
+
+    def load_many(self, keys: Iterable[Hashable]) -> BatchResult:
+        """
+        Load many keys now and wait for all of them
+
+        Args:
+            keys: Keys to load (duplicates are fetched once)
+
+        Returns:
+            BatchResult with values and per-key errors
+        """
+        futures = {}
+        with self._lock:
+            for key in keys:
+                if key in futures:
+                    continue
+                future, is_new = self._future_for(key)
+                if is_new:
+                    self._pending.append((key, future))
+                futures[key] = future
+        self.dispatch()
+
+        result = BatchResult()
+        for key, future in futures.items():
+            try:
+                result.values[key] = future.result()
+            except Exception as e:
+                result.errors[key] = e
+        return result
+
+    def prime(self, key: Hashable, value: Any):
+        """Seed the cache with a value fetched elsewhere"""
+        future = Future()
+        future.set_result(value)
+        with self._lock:
+            self._futures[key] = (future, time.monotonic())
+
+    def clear(self, *keys: Hashable):
+        """
+        Forget memoized values
+
+        Args:
+            *keys: Keys to forget (all keys if none given)
+        """
+        with self._lock:
+            if keys:
+                for key in keys:
+                    self._futures.pop(key, None)
+            else:
+                self._futures.clear()
+
+    def dispatch(self):
+        """Fetch every pending key now (normally called by the tick timer)"""
+        with self._lock:
+            batch, self._pending = self._pending, []
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if batch:
+                self._stats['batches'] += 1
+        if not batch:
+            return
+
+        remaining = []
+        for start in range(0, len(batch), self.max_batch_size):
+            chunk = batch[start:start + self.max_batch_size]
+            remaining.extend(self._run_bulk(chunk) if self.bulk_supported else chunk)
+        if remaining:
+            self._run_fan_out(remaining)
+
+    @property
+    def bulk_supported(self) -> bool:
+        """Whether the next batch will try fetch_many"""
+        return self.fetch_many is not None and time.monotonic() >= self._bulk_retry_at
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get loader statistics
+
+        Returns:
+            Dictionary with loads, cache hits, batches and request counts
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['cached_keys'] = len(self._futures)
+            stats['bulk_supported'] = self.bulk_supported
+            return stats
+
+    def _future_for(self, key: Hashable) -> Tuple[Future, bool]:
+        """Memoized future for key, or a new one. Lock must be held."""
+        self._stats['loads'] += 1
+        entry = self._futures.get(key)
+        if entry is not None:
+            future, created = entry
+            expired = (future.done() and
+                       (future.exception() is not None or
+                        not self.cache_ttl or time.monotonic() - created > self.cache_ttl))
+            if not expired:
+                self._stats['cache_hits'] += 1
+                return future, False
+
+        future = Future()
+        self._futures[key] = (future, time.monotonic())
+        return future, True
+
+    def _run_bulk(self, batch: List[Tuple[Hashable, Future]]) -> List[Tuple[Hashable, Future]]:
+        """Resolve a batch with fetch_many; return entries it did not cover"""
+        with self._lock:
+            self._stats['bulk_requests'] += 1
+        try:
+            values = self.fetch_many([key for key, _ in batch]) or {}
+        except Exception as e:
+            print(f"[DATA LOADER] Bulk fetch failed, fetching individually: {e}")
+            self._bulk_retry_at = time.monotonic() + self.BULK_RETRY_SECONDS
+            return batch
+
+        missing = []
+        for key, future in batch:
+            if key in values:
+                future.set_result(values[key])
+            elif str(key) in values:
+                future.set_result(values[str(key)])
+            else:
+                missing.append((key, future))
+        return missing
+
+    def _run_fan_out(self, batch: List[Tuple[Hashable, Future]]):
+        """Resolve entries with fetch_one, at most max_concurrency at a time"""
+        pool = self._get_pool()
+        queue = list(batch)
+        priority = current_priority()  # fan-out requests keep the caller's class
+        running: Dict[Future, Tuple[Hashable, Future]] = {}
+
+        while queue or running:
+            while queue and len(running) < self.max_concurrency:
+                key, future = queue.pop(0)
+                running[pool.submit(self._fetch_one_as, priority, key)] = (key, future)
+                with self._lock:
+                    self._stats['single_requests'] += 1
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for request in done:
+                key, future = running.pop(request)
+                error = request.exception()
+                if error is None:
+                    future.set_result(request.result())
+                else:
+                    with self._lock:
+                        self._stats['errors'] += 1
+                    future.set_exception(error)
+
+    def _fetch_one_as(self, priority: int, key: Hashable) -> Any:
+        """fetch_one on a pool thread with the dispatching thread's priority"""
+        with request_priority(priority):
+            return self.fetch_one(key)
+
+    @classmethod
+    def _get_pool(cls) -> ThreadPoolExecutor:
+        """Shared fan-out pool (separate from the task executor, so a task
+        waiting on fan-out requests never starves them)"""
+        if cls._pool is None:
+            with cls._pool_lock:
+                if cls._pool is None:
+                    cls._pool = ThreadPoolExecutor(max_workers=cls.POOL_WORKERS,
+                                                   thread_name_prefix='fanout')
+        return cls._pool
@@ -0,0 +1,193 @@
+"""
+DateTime Service
+Shared, memoized parsing and formatting of API timestamps
+
+Pages each had their own ``_parse_dt`` / ``_parse_date`` / ``_format_date``
+that looped over ``strptime`` formats on every call, so a list render or a
+calendar month parsed the same few hundred strings over and over. This
+module is the one place timestamps are read and written:
+
+- ``parse_datetime(value)`` -> naive datetime or None. ISO text (``T`` or
+  space separated, optional seconds, fraction, ``Z`` or offset - the
+  wall-clock part is kept) takes a ``fromisoformat`` fast path; a few other
+  formats are tried with ``strptime`` after that
+- ``parse_date(value)`` -> date or None
+- ``format_datetime(value, fmt)`` / ``format_date(value)`` -> display text;
+  unparsable text is returned as-is and missing values as ``empty``
+- ``format_relative(value)`` -> "5 minutes ago", "Yesterday at 09:15 AM"
+
+Parsed and formatted results are memoized per distinct string (bounded
+LRU caches), so repeated timestamps cost one dictionary lookup. Results
+are immutable datetimes and strings, safe to share between threads.
+
+Usage:
+    from utils.datetime_service import format_date, parse_datetime
+
+    start = parse_datetime(event.get('start_time'))
+    label = format_date(booking.get('date'))          # "November 20, 2025"
+    short = format_datetime(event.get('start_time'), '%b %d, %I:%M %p')
+"""
+
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+# Distinct strings remembered by the parse and format caches
+PARSE_CACHE_SIZE = 8192
+FORMAT_CACHE_SIZE = 8192
+
+# Tried after the ISO fast path
+FALLBACK_FORMATS = (
+    '%Y/%m/%d %H:%M:%S',
+    '%Y/%m/%d %H:%M',
+    '%Y/%m/%d',
+    '%d/%m/%Y %H:%M',
+    '%d/%m/%Y',
+)
+
+DISPLAY_DATE = '%B %d, %Y'
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_text(text: str) -> Optional[datetime]:
+    """Parse one timestamp string (memoized)"""
+    text = text.strip()
+    if len(text) >= 10 and text[4] == '-' and text[7] == '-':
+        # 2025-11-20, 2025-11-20T09:00, 2025-11-20 09:00:00.123Z, ...+02:00;
+        # the fraction and zone are dropped at any precision (naive results)
+        for candidate in (text, text[:19]):
+            try:
+                return datetime.fromisoformat(candidate).replace(microsecond=0, tzinfo=None)
+            except ValueError:
+                continue
+    for fmt in FALLBACK_FORMATS:
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def parse_datetime(value: Any) -> Optional[datetime]:
+    """
+    Parse an API timestamp
+
+    Args:
+        value: ISO text, datetime, date, or a [year, month, day, hour,
+            minute, second] list (Jackson's LocalDateTime array form)
+
+    Returns:
+        Naive datetime, or None if missing or unparsable
+    """
+    if isinstance(value, str):
+        return _parse_text(value) if value else None
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=None)
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    if isinstance(value, (list, tuple)) and len(value) >= 3:
+        try:
+            return datetime(*(int(part) for part in value[:6]))
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
+def parse_date(value: Any) -> Optional[date]:
+    """
+    Parse the calendar date of an API timestamp
+
+    Returns:
+        date, or None if missing or unparsable
+    """
+    parsed = parse_datetime(value)
+    return parsed.date() if parsed else None
+
+
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
+def _format_text(text: str, fmt: str) -> Optional[str]:
+    """Format one timestamp string (memoized); None if unparsable"""
+    parsed = _parse_text(text)
+    return parsed.strftime(fmt) if parsed else None
+
+
+def format_datetime(value: Any, fmt: str = '%B %d, %Y %I:%M %p', empty: str = 'N/A') -> str:
+    """
+    Format an API timestamp for display
+
+    Args:
+        value: Anything parse_datetime() accepts
+        fmt: strftime format
+        empty: Text for a missing value
+
+    Returns:
+        Formatted text; unparsable text is returned unchanged
+    """
+    if not value:
+        return empty
+    if isinstance(value, str):
+        formatted = _format_text(value, fmt)
+        return value if formatted is None else formatted
+    parsed = parse_datetime(value)
+    return parsed.strftime(fmt) if parsed else str(value)
+
+
+def format_date(value: Any, fmt: str = DISPLAY_DATE, empty: str = 'N/A') -> str:
+    """Format the date of an API timestamp (default "November 20, 2025")"""
+    return format_datetime(value, fmt, empty)
+
+
+def format_relative(value: Any, now: Optional[datetime] = None, empty: str = 'Just now') -> str:
+    """
+    Format a past timestamp relative to now
+
+    Args:
+        value: Anything parse_datetime() accepts
+        now: Reference time (default: datetime.now())
+        empty: Text for a missing value
+
+    Returns:
+        "Just now", "5 minutes ago", "3 hours ago", "Yesterday at 09:15 AM",
+        "4 days ago" or "Nov 20, 2025 at 09:15 AM"; unparsable text unchanged
+    """
+    if not value:
+        return empty
+    timestamp = parse_datetime(value)
+    if timestamp is None:
+        return str(value)
+    diff = (now or datetime.now()) - timestamp
+
+    if diff.days == 0 and diff.seconds < 60:
+        return 'Just now'
+    if diff.days == 0 and diff.seconds < 3600:
+        minutes = diff.seconds // 60
+        return f'{minutes} minute{"s" if minutes > 1 else ""} ago'
+    if diff.days == 0:
+        hours = diff.seconds // 3600
+        return f'{hours} hour{"s" if hours > 1 else ""} ago'
+    if diff.days == 1:
+        return 'Yesterday at ' + timestamp.strftime('%I:%M %p')
+    if 1 < diff.days < 7:
+        return f'{diff.days} days ago'
+    return format_datetime(timestamp, '%b %d, %Y at %I:%M %p')
+
+
+def get_stats() -> Dict[str, Any]:
+    """
+    Get memo cache statistics
+
+    Returns:
+        Dictionary with hits, misses and size of the parse and format caches
+    """
+    stats = {}
+    for name, cached in (('parse', _parse_text), ('format', _format_text)):
+        info = cached.cache_info()
+        stats[name] = {'hits': info.hits, 'misses': info.misses,
+                       'size': info.currsize, 'max_size': info.maxsize}
+    return stats
+
+
+def clear_cache():
+    """Forget memoized results (e.g. in tests)"""
+    _parse_text.cache_clear()
+    _format_text.cache_clear()
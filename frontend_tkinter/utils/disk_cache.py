@@ -0,0 +1,385 @@
+"""
+Disk Cache
+Persistent second-tier API response cache backed by SQLite
+
+The in-memory ``Cache`` is lost when the app exits, so every cold start
+waited on the network before painting anything. ``DiskCache`` keeps the last
+known response bodies in the SQLite file configured by
+``[DATABASE] sqlite_db`` (default ``cache/local_cache.db``):
+
+- bodies are stored as compact JSON, zlib-compressed above a size threshold
+- each row has a TTL; expired rows stay readable as "stale" so cold starts
+  and offline mode can still show the last known data
+- total stored bytes are bounded; least recently used rows go first
+- WAL journaling so reads never block on the writer
+- rows carry the same tags as memory entries, so write invalidation is
+  precise in both tiers
+
+Usage:
+    from utils.disk_cache import get_disk_cache
+
+    disk = get_disk_cache()  # None when disabled in settings
+    if disk:
+        disk.set("api:events", events, ttl=300, tags=["events:list"])
+        value, fresh = disk.get_with_state("api:events")
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class DiskCache:
+    """
+    SQLite-backed response cache with TTLs, compression and a byte budget
+
+    Features:
+    - Thread-safe (one connection guarded by a lock)
+    - WAL journal mode
+    - Compressed bodies
+    - LRU eviction by stored bytes
+    - Tag and path-prefix invalidation
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            body BLOB NOT NULL,
+            compressed INTEGER NOT NULL,
+            size INTEGER NOT NULL,
+            raw_size INTEGER NOT NULL,
+            expires_at REAL NOT NULL,
+            accessed_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at);
+        CREATE INDEX IF NOT EXISTS idx_responses_expires ON responses(expires_at);
+        CREATE TABLE IF NOT EXISTS response_tags (
+            tag TEXT NOT NULL,
+            key TEXT NOT NULL,
+            PRIMARY KEY (tag, key)
+        );
+        CREATE INDEX IF NOT EXISTS idx_response_tags_key ON response_tags(key);
+    """
+
+    def __init__(self, path: str, max_bytes: int = 100 * 1024 * 1024,
+                 default_ttl: int = 300, compress_min_bytes: int = 1024,
+                 max_stale: int = 7 * 24 * 3600):
+        """
+        Open (or create) the cache database
+
+        Args:
+            path: SQLite file path (':memory:' for a private in-memory db)
+            max_bytes: Maximum total stored (compressed) body bytes
+            default_ttl: Default time to live in seconds
+            compress_min_bytes: Bodies at least this large are compressed
+            max_stale: Seconds an expired row is kept for stale/offline reads
+        """
+        if path != ':memory:':
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.compress_min_bytes = compress_min_bytes
+        self.max_stale = max_stale
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(self.SCHEMA)
+        self._bytes = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        self._stats = {'hits': 0, 'stale_hits': 0, 'misses': 0, 'writes': 0, 'evictions': 0}
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a fresh (unexpired) value
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None if not found/expired
+        """
+        value, fresh = self.get_with_state(key)
+        return value if fresh else None
+
+    def get_with_state(self, key: str) -> Tuple[Optional[Any], bool]:
+        """
+        Get a value including expired rows kept for stale reads
+
+        Args:
+            key: Cache key
+
+        Returns:
+            (value, is_fresh) - value is None if not stored
+        """
+        entry = self.get_entry(key)
+        if entry is None:
+            return None, False
+        value, remaining = entry
+        return value, remaining > 0
+
+    def get_entry(self, key: str) -> Optional[Tuple[Any, float]]:
+        """
+        Get a value and its remaining lifetime
+
+        Args:
+            key: Cache key
+
+        Returns:
+            (value, seconds until expiry - negative once expired) or None
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT body, compressed, expires_at FROM responses WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                self._stats['misses'] += 1
+                return None
+
+            body, compressed, expires_at = row
+            self._conn.execute('UPDATE responses SET accessed_at = ? WHERE key = ?', (now, key))
+            remaining = expires_at - now
+            self._stats['hits' if remaining > 0 else 'stale_hits'] += 1
+
+        try:
+            return self._decode(body, compressed), remaining
+        except (zlib.error, ValueError):
+            self.invalidate(key)
+            return None
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None,
+            tags: Optional[List[str]] = None):
+        """
+        Store a value
+
+        Values that cannot be JSON encoded, or that are larger than the
+        whole budget, are skipped.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+            ttl: Time to live in seconds (uses default if None)
+            tags: Labels for invalidate_tags (e.g. 'events:5')
+        """
+        try:
+            raw = json.dumps(value, separators=(',', ':')).encode('utf-8')
+        except (TypeError, ValueError):
+            return
+
+        compressed = len(raw) >= self.compress_min_bytes
+        body = zlib.compress(raw) if compressed else raw
+        if len(body) > self.max_bytes:
+            return
+
+        now = time.time()
+        expires_at = now + (ttl or self.default_ttl)
+        with self._lock:
+            self._conn.execute('BEGIN')
+            try:
+                self._delete_keys([key])
+                self._conn.execute(
+                    'INSERT INTO responses (key, body, compressed, size, raw_size, expires_at, accessed_at) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    (key, body, int(compressed), len(body), len(raw), expires_at, now)
+                )
+                if tags:
+                    self._conn.executemany(
+                        'INSERT OR IGNORE INTO response_tags (tag, key) VALUES (?, ?)',
+                        [(tag, key) for tag in set(tags)]
+                    )
+                self._bytes += len(body)
+                self._stats['writes'] += 1
+                self._evict()
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                self._bytes = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+                raise
+
+    def invalidate(self, key: str):
+        """
+        Remove one entry
+
+        Args:
+            key: Cache key
+        """
+        with self._lock:
+            self._delete_keys([key])
+
+    def invalidate_prefix(self, prefix: str) -> int:
+        """
+        Remove all keys under a path prefix (whole segments, like Cache)
+
+        Args:
+            prefix: Key path prefix
+
+        Returns:
+            Number of entries removed
+        """
+        prefix = prefix.rstrip('/')
+        with self._lock:
+            # '/'+1 == '0' and '?'+1 == '@', so these ranges select exactly
+            # the keys continuing with '/...' or '?...' (index friendly)
+            rows = self._conn.execute(
+                'SELECT key FROM responses WHERE key = ? '
+                'OR (key >= ? AND key < ?) OR (key >= ? AND key < ?)',
+                (prefix, prefix + '/', prefix + '0', prefix + '?', prefix + '@')
+            ).fetchall()
+            return self._delete_keys([row[0] for row in rows])
+
+    def invalidate_tags(self, *tags: str) -> int:
+        """
+        Remove all keys carrying any of the given tags
+
+        Args:
+            *tags: Tags passed to set()
+
+        Returns:
+            Number of entries removed
+        """
+        if not tags:
+            return 0
+        placeholders = ','.join('?' * len(tags))
+        with self._lock:
+            rows = self._conn.execute(
+                f'SELECT DISTINCT key FROM response_tags WHERE tag IN ({placeholders})', tags
+            ).fetchall()
+            return self._delete_keys([row[0] for row in rows])
+
+    def cleanup_expired(self) -> int:
+        """
+        Remove rows that expired more than max_stale seconds ago
+
+        Returns:
+            Number of entries removed
+        """
+        cutoff = time.time() - self.max_stale
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT key FROM responses WHERE expires_at < ?', (cutoff,)
+            ).fetchall()
+            return self._delete_keys([row[0] for row in rows])
+
+    def clear(self):
+        """Remove every entry"""
+        with self._lock:
+            self._conn.execute('DELETE FROM responses')
+            self._conn.execute('DELETE FROM response_tags')
+            self._bytes = 0
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get disk cache statistics
+
+        Returns:
+            Dictionary with entry counts, byte usage and hit counters
+        """
+        with self._lock:
+            entries, raw_bytes = self._conn.execute(
+                'SELECT COUNT(*), COALESCE(SUM(raw_size), 0) FROM responses'
+            ).fetchone()
+            stats = dict(self._stats)
+            stats.update({
+                'path': self.path,
+                'total_entries': entries,
+                'bytes_used': self._bytes,
+                'max_bytes': self.max_bytes,
+                'bytes_percent': (self._bytes / self.max_bytes * 100) if self.max_bytes else 0,
+                'compression_ratio': round(raw_bytes / self._bytes, 2) if self._bytes else 0,
+            })
+            return stats
+
+    def _decode(self, body: bytes, compressed: int) -> Any:
+        """Decode a stored body"""
+        raw = zlib.decompress(body) if compressed else body
+        return json.loads(raw)
+
+    def _delete_keys(self, keys: List[str]) -> int:
+        """Delete rows and their tags, keeping the byte total. Lock must be held."""
+        removed = 0
+        for key in keys:
+            row = self._conn.execute('SELECT size FROM responses WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                continue
+            self._conn.execute('DELETE FROM responses WHERE key = ?', (key,))
+            self._conn.execute('DELETE FROM response_tags WHERE key = ?', (key,))
+            self._bytes -= row[0]
+            removed += 1
+        return removed
+
+    def _evict(self):
+        """Delete least recently used rows until within budget. Lock must be held."""
+        while self._bytes > self.max_bytes:
+            rows = self._conn.execute(
+                'SELECT key FROM responses ORDER BY accessed_at LIMIT 16'
+            ).fetchall()
+            if not rows:
+                self._bytes = 0
+                break
+            for (key,) in rows:
+                self._stats['evictions'] += self._delete_keys([key])
+                if self._bytes <= self.max_bytes:
+                    break
+
+
+_global_disk_cache: Optional[DiskCache] = None
+_global_disk_lock = threading.Lock()
+_global_disk_checked = False
+
+
+def get_disk_cache() -> Optional[DiskCache]:
+    """
+    Get global disk cache instance
+
+    Configured by [DATABASE] sqlite_db, db_cache_enabled and db_max_size
+    (MB). Relative paths are resolved against the frontend directory.
+
+    Returns:
+        DiskCache, or None if disabled or the database cannot be opened
+    """
+    global _global_disk_cache, _global_disk_checked
+    if _global_disk_checked:
+        return _global_disk_cache
+
+    with _global_disk_lock:
+        if _global_disk_checked:
+            return _global_disk_cache
+
+        enabled, path, max_mb, ttl = True, 'cache/local_cache.db', 100, 300
+        try:
+            from config.settings import settings
+            enabled = settings.get('DATABASE_DB_CACHE_ENABLED', enabled)
+            path = settings.get('DATABASE_SQLITE_DB', path) or path
+            max_mb = settings.get('DATABASE_DB_MAX_SIZE', max_mb) or max_mb
+            ttl = settings.get('CACHE_TTL', ttl) or ttl
+        except Exception:
+            pass
+
+        if enabled:
+            if path != ':memory:' and not os.path.isabs(path):
+                app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+                path = os.path.join(app_dir, path)
+            try:
+                _global_disk_cache = DiskCache(
+                    path, max_bytes=int(float(max_mb) * 1024 * 1024), default_ttl=ttl
+                )
+                _global_disk_cache.cleanup_expired()
+            except (sqlite3.Error, OSError) as e:
+                print(f"[DISK CACHE] Disabled, could not open {path}: {e}")
+                _global_disk_cache = None
+
+        _global_disk_checked = True
+        return _global_disk_cache
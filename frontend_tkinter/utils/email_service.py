@@ -16,8 +16,9 @@ Usage:
 """
 
 from utils.api_client import APIClient
+from utils.request_scheduler import Priority
 from utils.session_manager import SessionManager
-from datetime import datetime, timedelta
+from utils.datetime_service import format_date
 import threading
 from typing import Dict, Any, List, Optional, Callable
 
@@ -61,10 +62,12 @@ class EmailService:
             "type": email_type,
             "data": data
         }
+        # Fire-and-forget sends yield to the user's own requests (never dropped)
+        priority = Priority.BACKGROUND if async_send else None
         
         def send_request():
             try:
-                response = self.api.post("notifications/email", payload)
+                response = self.api.post("notifications/email", payload, priority=priority)
                 print(f"[EMAIL] Sent {email_type} to {to}")
                 if on_success:
                     on_success(response)
@@ -417,7 +420,8 @@ class EmailService:
         
         def send_request():
             try:
-                response = self.api.post("notifications/email/bulk", payload)
+                response = self.api.post("notifications/email/bulk", payload,
+                                         priority=Priority.BACKGROUND)
                 print(f"[EMAIL] Bulk sent {email_type} to {len(recipients)} recipients")
                 if on_success:
                     on_success(response)
@@ -437,19 +441,7 @@ class EmailService:
         if not date_str or date_str == 'TBD':
             return 'TBD'
         
-        try:
-            # Try parsing different date formats
-            for fmt in ["%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S"]:
-                try:
-                    dt = datetime.strptime(date_str[:19] if 'T' in date_str or ' ' in date_str else date_str, fmt)
-                    return dt.strftime("%B %d, %Y")  # e.g., "October 15, 2025"
-                except ValueError:
-                    continue
-            
-            # If parsing fails, return as-is
-            return date_str
-        except Exception:
-            return date_str
+        return format_date(date_str)  # e.g., "October 15, 2025"
     
     def _format_time(self, time_str: str) -> str:
         """Format time string to readable format."""
@@ -0,0 +1,371 @@
+"""
+Entity Store
+Normalized in-memory store of API entities shared by all pages
+
+Every page used to keep its own copy of the same rows (``all_events``,
+``my_events``, ``events``, ...), so memory grew with pages x entities and a
+fetch on one page left the others stale. The store keeps exactly one record
+per (entity type, id); pages load fetched rows into it and read observable
+queries over it:
+
+- ``load(type, rows)`` upserts rows and returns the canonical objects; equal
+  rows keep the existing object, so lists on different pages share them.
+  Events, bookings, resources and users are stored as compact read-only
+  records (utils.models) with parsed datetimes and lowercase search keys
+- ``complete=True`` (or a predicate) marks the rows as the full server-side
+  set, removing entities that are no longer there
+- ``partial=True`` marks summary rows (a sparse fieldset): their fields are
+  merged into the stored entity, so a full record loaded by a detail view
+  keeps its other fields
+- ``query(type, where=...)`` is a live view; ``rows`` returns the same list
+  object until the result changes
+- ``subscribe(callback, owner=page)`` calls back on the UI thread whenever
+  the query result changes, until the owning widget is destroyed
+
+Rows are shared between pages and read-only: use ``dict(row)`` for an
+editable copy, and load the server's response after a write.
+
+Usage:
+    from utils.entity_store import get_entity_store, events_by_organizer
+
+    store = get_entity_store()
+    store.load('events', api.get('events'), complete=True)
+
+    mine = events_by_organizer(user_id)
+    mine.subscribe(self._on_my_events_changed, owner=self)
+    self.my_events = mine.rows
+"""
+
+import threading
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Union
+
+from utils.models import to_model
+from utils.ui_dispatcher import call_in_ui
+
+
+class Query:
+    """
+    Live filtered view over one entity type
+
+    Attributes:
+        entity_type: Entity type the query reads
+        name: Name the query is registered under (None if anonymous)
+    """
+
+    def __init__(self, store: 'EntityStore', entity_type: str,
+                 where: Optional[Callable[[Dict[str, Any]], bool]] = None,
+                 order_by: Optional[Callable[[Dict[str, Any]], Any]] = None,
+                 name: Optional[str] = None):
+        self.entity_type = entity_type
+        self.name = name
+        self._store = store
+        self._where = where
+        self._order_by = order_by
+        self._rows: List[Dict[str, Any]] = []
+        self._version = -1
+        self._subscribers: List[Tuple[Callable[[List[Dict[str, Any]]], None], Any]] = []
+
+    @property
+    def rows(self) -> List[Dict[str, Any]]:
+        """Current result (same list object while unchanged)"""
+        with self._store._lock:
+            self._refresh()
+            return self._rows
+
+    def subscribe(self, callback: Callable[[List[Dict[str, Any]]], None], owner: Any = None):
+        """
+        Call back with the new rows whenever the result changes
+
+        Args:
+            callback: Receives the new rows on the UI thread
+            owner: Widget whose destruction ends the subscription
+        """
+        with self._store._lock:
+            self._refresh()
+            self._subscribers.append((callback, owner))
+            self._store._watch(self)
+
+    def unsubscribe(self, callback: Optional[Callable] = None, owner: Any = None):
+        """
+        Remove subscriptions by callback and/or owner
+
+        Args:
+            callback: Callback passed to subscribe()
+            owner: Remove every subscription of this owner
+        """
+        with self._store._lock:
+            self._subscribers = [
+                (cb, own) for cb, own in self._subscribers
+                if not ((callback is None or cb == callback) and (owner is None or own is owner))
+            ]
+
+    def _refresh(self) -> bool:
+        """Recompute if the type changed. Store lock must be held."""
+        version = self._store._versions.get(self.entity_type, 0)
+        if version == self._version:
+            return False
+        self._version = version
+
+        entities = self._store._entities.get(self.entity_type, {}).values()
+        rows = [row for row in entities if self._where is None or self._where(row)]
+        if self._order_by is not None:
+            rows.sort(key=self._order_by)
+        if len(rows) == len(self._rows) and all(a is b for a, b in zip(rows, self._rows)):
+            return False
+        self._rows = rows
+        return True
+
+    def _live_subscribers(self):
+        """Drop subscriptions whose owner widget is gone. Store lock must be held."""
+        alive = []
+        for callback, owner in self._subscribers:
+            exists = getattr(owner, 'winfo_exists', None)
+            try:
+                if exists is not None and not exists():
+                    continue
+            except Exception:
+                continue
+            alive.append((callback, owner))
+        self._subscribers = alive
+        return alive
+
+
+class EntityStore:
+    """
+    Thread-safe normalized store of entities keyed by type and id
+
+    Loads may happen on worker threads; subscribers are notified through
+    the UI dispatcher.
+    """
+
+    def __init__(self, id_field: str = 'id'):
+        """
+        Initialize entity store
+
+        Args:
+            id_field: Row field holding the entity id
+        """
+        self.id_field = id_field
+        self._entities: Dict[str, Dict[Hashable, Dict[str, Any]]] = {}
+        self._versions: Dict[str, int] = {}
+        self._queries: Dict[Tuple[str, str], Query] = {}
+        self._watched: Dict[str, List[Query]] = {}
+        self._lock = threading.RLock()
+        self._stats = {'loads': 0, 'rows_loaded': 0, 'rows_reused': 0, 'notifications': 0}
+
+    def load(self, entity_type: str, rows: Optional[List[Dict[str, Any]]],
+             complete: Union[bool, Callable[[Dict[str, Any]], bool]] = False,
+             partial: bool = False) -> List[Dict[str, Any]]:
+        """
+        Upsert fetched rows
+
+        Args:
+            entity_type: Entity type (e.g. 'events')
+            rows: Rows from the API (rows without an id are passed through)
+            complete: True if rows are every entity of this type, or a
+                predicate if they are every entity matching it (e.g. all
+                pending bookings); other matching entities are removed
+            partial: Rows hold only some fields; merge them into stored
+                entities instead of replacing them
+
+        Returns:
+            The canonical objects for rows, in the same order (records for
+            types with a model in utils.models)
+        """
+        rows = rows or []
+        with self._lock:
+            entities = self._entities.setdefault(entity_type, {})
+            canonical = []
+            changed = False
+            seen = set()
+            reused = 0
+
+            for row in rows:
+                row_id = row.get(self.id_field) if isinstance(row, Mapping) else None
+                if row_id is None:
+                    canonical.append(row)
+                    continue
+                seen.add(row_id)
+                existing = entities.get(row_id)
+                if partial and existing is not None and existing is not row:
+                    row = {**existing, **row}
+                if existing is row or (existing is not None and existing == row):
+                    canonical.append(existing)
+                    reused += 1
+                    continue
+                row = to_model(entity_type, row)
+                entities[row_id] = row
+                canonical.append(row)
+                changed = True
+
+            if complete is True:
+                # Full load: drop missing entities and keep the server's order
+                ordered = {row[self.id_field]: row for row in canonical
+                           if isinstance(row, Mapping) and row.get(self.id_field) is not None}
+                changed = changed or list(ordered) != list(entities)
+                self._entities[entity_type] = ordered
+            elif complete:
+                stale = [entity_id for entity_id, entity in entities.items()
+                         if entity_id not in seen and complete(entity)]
+                for entity_id in stale:
+                    del entities[entity_id]
+                changed = changed or bool(stale)
+
+            self._stats['loads'] += 1
+            self._stats['rows_loaded'] += len(rows)
+            self._stats['rows_reused'] += reused
+            if changed:
+                self._touch(entity_type)
+            return canonical
+
+    def remove(self, entity_type: str, *entity_ids: Hashable) -> int:
+        """
+        Remove entities (e.g. after a successful delete)
+
+        Returns:
+            Number of entities removed
+        """
+        with self._lock:
+            entities = self._entities.get(entity_type, {})
+            removed = sum(1 for entity_id in entity_ids if entities.pop(entity_id, None) is not None)
+            if removed:
+                self._touch(entity_type)
+            return removed
+
+    def get(self, entity_type: str, entity_id: Hashable) -> Optional[Dict[str, Any]]:
+        """Get one entity by id"""
+        with self._lock:
+            return self._entities.get(entity_type, {}).get(entity_id)
+
+    def all(self, entity_type: str) -> List[Dict[str, Any]]:
+        """Get every entity of a type (the unfiltered query's rows)"""
+        return self.query(entity_type).rows
+
+    def query(self, entity_type: str, where: Optional[Callable[[Dict[str, Any]], bool]] = None,
+              order_by: Optional[Callable[[Dict[str, Any]], Any]] = None,
+              name: Optional[str] = None) -> Query:
+        """
+        Get a live query
+
+        Named queries (and the unfiltered query of each type) are shared, so
+        every page asking for "pending bookings" reads the same result list.
+
+        Args:
+            entity_type: Entity type
+            where: Row predicate (None for all rows)
+            order_by: Sort key
+            name: Register under this name for reuse
+
+        Returns:
+            Query
+        """
+        if where is None and order_by is None and name is None:
+            name = '*'
+        with self._lock:
+            if name is not None:
+                query = self._queries.get((entity_type, name))
+                if query is None:
+                    query = Query(self, entity_type, where, order_by, name)
+                    self._queries[(entity_type, name)] = query
+                return query
+            return Query(self, entity_type, where, order_by)
+
+    def unsubscribe_owner(self, owner: Any):
+        """Remove every subscription held by a widget"""
+        with self._lock:
+            for queries in self._watched.values():
+                for query in queries:
+                    query.unsubscribe(owner=owner)
+
+    def clear(self):
+        """Remove every entity (e.g. on logout) and notify subscribers"""
+        with self._lock:
+            for entity_type in list(self._entities):
+                self._entities[entity_type] = {}
+                self._touch(entity_type)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get store statistics
+
+        Returns:
+            Dictionary with entity counts per type, loads, reused rows and
+            notifications sent
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entities'] = {t: len(e) for t, e in self._entities.items()}
+            stats['queries'] = len(self._queries)
+            stats['subscriptions'] = sum(
+                len(q._subscribers) for queries in self._watched.values() for q in queries
+            )
+            return stats
+
+    def _watch(self, query: Query):
+        """Track a query with subscribers. Lock must be held."""
+        queries = self._watched.setdefault(query.entity_type, [])
+        if query not in queries:
+            queries.append(query)
+
+    def _touch(self, entity_type: str):
+        """Bump a type's version and notify changed queries. Lock must be held."""
+        self._versions[entity_type] = self._versions.get(entity_type, 0) + 1
+        queries = self._watched.get(entity_type, [])
+        for query in list(queries):
+            subscribers = query._live_subscribers()
+            if not subscribers:
+                queries.remove(query)
+                continue
+            if query._refresh():
+                rows = query._rows
+                for callback, _ in subscribers:
+                    self._stats['notifications'] += 1
+                    call_in_ui(callback, rows)
+
+
+_global_store: Optional[EntityStore] = None
+_global_store_lock = threading.Lock()
+
+
+def get_entity_store() -> EntityStore:
+    """Get global entity store instance"""
+    global _global_store
+    if _global_store is None:
+        with _global_store_lock:
+            if _global_store is None:
+                _global_store = EntityStore()
+    return _global_store
+
+
+def _organizer_of(event: Dict[str, Any]) -> Any:
+    """Backend returns organizerId (camelCase); fixtures use organizer_id"""
+    organizer = event.get('organizerId')
+    return organizer if organizer is not None else event.get('organizer_id')
+
+
+def is_pending(row: Dict[str, Any]) -> bool:
+    """Whether a row (event or booking) is awaiting approval"""
+    return (row.get('status') or '').lower() == 'pending'
+
+
+def organized_by(organizer_id: Any) -> Callable[[Dict[str, Any]], bool]:
+    """Predicate: event created by an organizer"""
+    return lambda event: _organizer_of(event) == organizer_id
+
+
+def events_by_organizer(organizer_id: Any) -> Query:
+    """Live query: events created by an organizer"""
+    return get_entity_store().query(
+        'events', where=organized_by(organizer_id), name=f'by_organizer:{organizer_id}'
+    )
+
+
+def pending_events() -> Query:
+    """Live query: events awaiting approval"""
+    return get_entity_store().query('events', where=is_pending, name='pending')
+
+
+def pending_bookings() -> Query:
+    """Live query: bookings awaiting approval"""
+    return get_entity_store().query('bookings', where=is_pending, name='pending')
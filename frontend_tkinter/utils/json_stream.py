@@ -0,0 +1,225 @@
+"""
+JSON Stream
+Incremental decoding of large JSON list responses
+
+``response.json()`` parses a whole body in one call. For a list of a few
+thousand events that is one long C call holding the GIL, so the UI thread
+stalls until the worker is done, and the raw bytes, the text and the decoded
+list are all alive at the same time. ``JSONListStream`` decodes a top-level
+array item by item as chunks arrive:
+
+    stream = JSONListStream()
+    for chunk in response.iter_content(chunk_size=65536):
+        for item in stream.feed(chunk):
+            handle(item)
+    for item in stream.close():
+        handle(item)
+
+or simply ``for item in iter_json_list(response.iter_content(65536))``.
+
+Each item is a short decode of its own, so other threads get the GIL in
+between, and text is dropped once its items are decoded. A body that is not
+a top-level array (an ``{"items": [...], "total": 120}`` envelope) is
+buffered and decoded whole when the stream closes; its items are returned
+and the other keys are kept in ``stream.meta``.
+
+``loads()`` decodes a whole body with orjson when it is installed (optional
+fast codec) and with the standard library otherwise.
+"""
+
+import codecs
+import json
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Name of the fast codec in use, or None for the standard library
+FAST_CODEC: Optional[str] = 'orjson' if orjson is not None else None
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+def loads(data) -> Any:
+    """
+    Decode a complete JSON document
+
+    Uses orjson if available. Documents orjson rejects but the standard
+    library accepts (NaN, Infinity) are decoded with json.
+
+    Args:
+        data: bytes or str
+
+    Returns:
+        Decoded object
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+class JSONListStream:
+    """Incremental decoder for a JSON array that arrives in chunks"""
+
+    def __init__(self):
+        self._text = codecs.getincrementaldecoder('utf-8')()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._pos = 0
+        # start -> first -> (value <-> sep) -> done, or start -> whole
+        self._state = 'start'
+        self._raw: Optional[List[bytes]] = []
+        self.meta: Dict[str, Any] = {}
+        self.items_decoded = 0
+        self.bytes_fed = 0
+
+    @property
+    def done(self) -> bool:
+        """Whether the closing bracket (or the whole body) has been decoded"""
+        return self._state == 'done'
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """
+        Add the next chunk of the body
+
+        Args:
+            chunk: Raw bytes (may split characters, strings or numbers)
+
+        Returns:
+            Items completed by this chunk, in order
+
+        Raises:
+            json.JSONDecodeError: If the array is malformed
+        """
+        self.bytes_fed += len(chunk)
+        if self._raw is not None:
+            self._raw.append(chunk)
+        if self._state == 'whole':
+            return []
+        return self._consume(self._text.decode(chunk), final=False)
+
+    def close(self) -> List[Any]:
+        """
+        Finish the body
+
+        Returns:
+            Remaining items (all items of an envelope body)
+
+        Raises:
+            json.JSONDecodeError: If the body is truncated or malformed
+            ValueError: If the body is neither a list nor an envelope
+        """
+        if self._state == 'whole' or (self._state == 'start' and self._raw is not None):
+            data = loads(b''.join(self._raw))
+            self._raw = None
+            self._state = 'done'
+            if isinstance(data, list):
+                return self._count(data)
+            if isinstance(data, dict) and isinstance(data.get('items'), list):
+                self.meta = {k: v for k, v in data.items() if k != 'items'}
+                return self._count(data['items'])
+            raise ValueError('JSON body is not a list')
+
+        items = self._consume(self._text.decode(b'', final=True), final=True)
+        if self._state != 'done':
+            raise json.JSONDecodeError('Unterminated array', self._buffer, len(self._buffer))
+        return items
+
+    def _count(self, items: List[Any]) -> List[Any]:
+        self.items_decoded += len(items)
+        return items
+
+    def _consume(self, text: str, final: bool) -> List[Any]:
+        """Decode every complete item in the buffer"""
+        if text:
+            self._buffer = self._buffer[self._pos:] + text
+            self._pos = 0
+        buf = self._buffer
+        pos = self._pos
+        items = []
+
+        if self._state == 'start':
+            pos = _WHITESPACE.match(buf, pos).end()
+            if pos == len(buf):
+                self._pos = pos
+                return items
+            if buf[pos] != '[':
+                # Envelope or other document: decoded whole on close()
+                self._state = 'whole'
+                self._buffer = ''
+                self._pos = 0
+                return items
+            self._state = 'first'
+            self._raw = None
+            pos += 1
+
+        while self._state != 'done':
+            pos = _WHITESPACE.match(buf, pos).end()
+            if pos == len(buf):
+                break
+            char = buf[pos]
+
+            if self._state == 'sep':
+                if char == ',':
+                    self._state = 'value'
+                    pos += 1
+                    continue
+                if char != ']':
+                    raise json.JSONDecodeError("Expecting ',' delimiter", buf, pos)
+                self._state = 'done'
+                pos += 1
+                break
+
+            if char == ']' and self._state == 'first':
+                self._state = 'done'
+                pos += 1
+                break
+
+            try:
+                item, end = self._decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if final:
+                    raise
+                break  # Incomplete item: wait for more text
+            if not final and char not in '{["':
+                after = _WHITESPACE.match(buf, end).end()
+                if after == len(buf) or buf[after] not in ',]':
+                    break  # A number may continue in the next chunk ("-2." + "5")
+            items.append(item)
+            self._state = 'sep'
+            pos = end
+
+        if self._state == 'done':
+            rest = _WHITESPACE.match(buf, pos).end()
+            if rest != len(buf):
+                raise json.JSONDecodeError('Extra data', buf, rest)
+        self._pos = pos
+        return self._count(items)
+
+
+def iter_json_list(chunks: Iterable[bytes],
+                   stream: Optional[JSONListStream] = None) -> Iterator[Any]:
+    """
+    Yield the items of a JSON list body as its chunks are decoded
+
+    Args:
+        chunks: Iterable of raw byte chunks (e.g. response.iter_content())
+        stream: Decoder to use, to read its meta afterwards (default: new)
+
+    Yields:
+        List items (an envelope's items) in order
+    """
+    stream = stream if stream is not None else JSONListStream()
+    for chunk in chunks:
+        if chunk:
+            yield from stream.feed(chunk)
+    yield from stream.close()
@@ -0,0 +1,284 @@
+"""
+Entity Models
+Compact, read-only records for events, bookings, resources and users
+
+Rows used to stay the dicts ``json.loads`` produced: one hash table per row,
+a private copy of every repeated string ("APPROVED", "Technology"), and
+timestamps parsed again by each page on every filter, sort and render.
+Records are built once when rows are loaded into the entity store:
+
+- values live in one tuple per row; the key -> index table is shared by
+  every row with the same keys (one per endpoint, in practice)
+- enum-like fields (status, category, role, ...) are interned
+- derived attributes are computed once: ``start`` / ``end`` datetimes,
+  lowercase ``status`` / ``category`` / ``role``, and ``search_key``
+  (lowercase text of the searchable fields, for ``q in row.search_key``)
+
+Records are read-only mappings, so code that reads rows with
+``row.get('title')`` or ``row['id']`` works unchanged. Use ``dict(row)``
+(or ``row.copy()``) for an editable copy or a JSON request body.
+
+Usage:
+    from utils.models import Event, to_models
+
+    events = to_models('events', api.get('events'))
+    upcoming = sorted((e for e in events if e.start and e.start > now),
+                      key=lambda e: e.start)
+    matches = [e for e in events if q in e.search_key]
+"""
+
+import sys
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from utils.datetime_service import parse_datetime
+
+
+def _first(row: 'Record', *names: str) -> Any:
+    """First non-None value among alternative spellings (camelCase/snake_case)"""
+    for name in names:
+        value = row.get(name)
+        if value is not None:
+            return value
+    return None
+
+
+def _lower(value: Any) -> str:
+    """Interned lowercase text of an enum-like value ('' if missing)"""
+    return sys.intern(str(value).lower()) if value else ''
+
+
+class Record(Mapping):
+    """
+    Read-only row backed by a shared key table and a value tuple
+
+    Subclasses list enum-like fields in INTERNED, searchable fields in
+    SEARCH_FIELDS, and compute their derived attributes in _derive().
+    """
+
+    __slots__ = ('_shape', '_values', 'search_key')
+
+    # Raw fields whose string values are interned
+    INTERNED: Tuple[str, ...] = ()
+    # Fields joined (lowercase) into search_key
+    SEARCH_FIELDS: Tuple[str, ...] = ()
+
+    # Key tuple -> {key: index}, per class
+    _shapes: Dict[Tuple[str, ...], Dict[str, int]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._shapes = {}
+
+    @classmethod
+    def from_row(cls, row: Mapping) -> 'Record':
+        """
+        Build a record from a decoded JSON object
+
+        Args:
+            row: Dict (or record) from the API
+
+        Returns:
+            Record of this class (row itself if it already is one)
+        """
+        if type(row) is cls:
+            return row
+        keys = tuple(row)
+        shape = cls._shapes.get(keys)
+        if shape is None:
+            shape = cls._shapes.setdefault(keys, {key: i for i, key in enumerate(keys)})
+        values = list(row.values())
+        for field in cls.INTERNED:
+            index = shape.get(field)
+            if index is not None and type(values[index]) is str:
+                values[index] = sys.intern(values[index])
+
+        record = cls.__new__(cls)
+        record._shape = shape
+        record._values = tuple(values)
+        record.search_key = '\n'.join(
+            str(value).lower() for value in map(record.get, cls.SEARCH_FIELDS) if value
+        )
+        record._derive()
+        return record
+
+    def _derive(self):
+        """Compute derived attributes (override in subclasses)"""
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[self._shape[key]]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        index = self._shape.get(key)
+        return default if index is None else self._values[index]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._shape
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._shape)
+
+    def __len__(self) -> int:
+        return len(self._shape)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Record) and other._shape is self._shape:
+            return self._values == other._values
+        if isinstance(other, Mapping):
+            if tuple(other) == tuple(self._shape):
+                return self._values == tuple(other.values())
+            return dict(self) == dict(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def copy(self) -> Dict[str, Any]:
+        """Editable dict copy (like dict.copy())"""
+        return dict(zip(self._shape, self._values))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.copy()!r})"
+
+    def __reduce__(self):
+        return type(self).from_row, (self.copy(),)
+
+
+class Event(Record):
+    """
+    Event row
+
+    Attributes:
+        start, end: Start and end datetimes (None if missing or invalid)
+        status: Lowercase status ('' if missing)
+        category: Lowercase category ('' if missing)
+        organizer_id: organizerId / organizer_id
+    """
+
+    __slots__ = ('start', 'end', 'status', 'category', 'organizer_id')
+
+    INTERNED = ('status', 'category', 'venue', 'organizer_name', 'organizerName')
+    SEARCH_FIELDS = ('title', 'venue', 'category', 'organizer_name', 'organizerName')
+
+    def _derive(self):
+        self.start = parse_datetime(_first(self, 'start_time', 'startTime'))
+        self.end = parse_datetime(_first(self, 'end_time', 'endTime'))
+        self.status = _lower(self.get('status'))
+        self.category = _lower(self.get('category'))
+        self.organizer_id = _first(self, 'organizerId', 'organizer_id')
+
+
+class Booking(Record):
+    """
+    Resource booking row
+
+    Attributes:
+        start, end: Start and end datetimes; a time-only start_time/end_time
+            is combined with the booking's date
+        status: Lowercase status ('' if missing)
+        resource_id: resourceId / resource_id
+        user_id: userId / user_id
+    """
+
+    __slots__ = ('start', 'end', 'status', 'resource_id', 'user_id')
+
+    INTERNED = ('status', 'resource_name', 'resource_type', 'user_role', 'priority', 'date')
+    SEARCH_FIELDS = ('resource_name', 'user_name', 'user_email', 'purpose')
+
+    def _derive(self):
+        day = _first(self, 'date', 'booking_date', 'bookingDate')
+        self.start = self._at(day, _first(self, 'start_time', 'startTime'))
+        self.end = self._at(day, _first(self, 'end_time', 'endTime'))
+        self.status = _lower(self.get('status'))
+        self.resource_id = _first(self, 'resourceId', 'resource_id')
+        self.user_id = _first(self, 'userId', 'user_id')
+
+    @staticmethod
+    def _at(day: Any, time: Any) -> Optional[datetime]:
+        if isinstance(time, str) and len(time) <= 8 and isinstance(day, str):
+            return parse_datetime(f"{day[:10]}T{time}")
+        return parse_datetime(time)
+
+
+class Resource(Record):
+    """
+    Bookable resource row
+
+    Attributes:
+        status: Lowercase status ('' if missing)
+        type: Lowercase resource type ('' if missing)
+    """
+
+    __slots__ = ('status', 'type')
+
+    INTERNED = ('status', 'type', 'building', 'location')
+    SEARCH_FIELDS = ('name', 'code', 'type', 'location')
+
+    def _derive(self):
+        self.status = _lower(self.get('status'))
+        self.type = _lower(self.get('type'))
+
+
+class User(Record):
+    """
+    User row
+
+    Attributes:
+        role: Lowercase role ('' if missing)
+        status: Lowercase account status ('' if missing)
+        created: Account creation datetime (None if missing)
+    """
+
+    __slots__ = ('role', 'status', 'created')
+
+    INTERNED = ('role', 'status', 'department')
+    SEARCH_FIELDS = ('name', 'email', 'username', 'student_id')
+
+    def _derive(self):
+        self.role = _lower(self.get('role'))
+        self.status = _lower(self.get('status'))
+        self.created = parse_datetime(_first(self, 'created_at', 'createdAt'))
+
+
+# Model class per entity type (endpoint name)
+MODELS: Dict[str, type] = {
+    'events': Event,
+    'bookings': Booking,
+    'resources': Resource,
+    'users': User,
+}
+
+
+def to_model(entity_type: str, row: Any) -> Any:
+    """
+    Wrap one row in its entity type's model
+
+    Args:
+        entity_type: Entity type (e.g. 'events')
+        row: Row from the API
+
+    Returns:
+        Record, or the row unchanged if the type has no model or the row
+        is not an object
+    """
+    model = MODELS.get(entity_type)
+    if model is None or not isinstance(row, Mapping):
+        return row
+    return model.from_row(row)
+
+
+def to_models(entity_type: str, rows: Optional[Iterable[Any]]) -> List[Any]:
+    """
+    Wrap rows in their entity type's model (see to_model)
+
+    Args:
+        entity_type: Entity type (e.g. 'events')
+        rows: Rows from the API (None is treated as empty)
+
+    Returns:
+        List of records
+    """
+    model = MODELS.get(entity_type)
+    if model is None:
+        return list(rows or [])
+    return [model.from_row(row) if isinstance(row, Mapping) else row for row in rows or []]
@@ -0,0 +1,302 @@
+"""
+Page Loader
+Declarative, dependency-aware parallel data loading for pages
+
+Dashboards used to fetch everything they need one call after another in a
+single worker, so the first render waited for the sum of all latencies.
+With ``PageLoader`` a page declares its sections (one fetch each) and how
+they depend on each other; the loader then:
+
+- starts every section whose dependencies are met at once, on the shared
+  I/O pool and owned by the page (navigating away cancels them)
+- tries a section's ``fallback`` if its fetch fails (e.g. the
+  ``admin/resources`` -> ``resources`` fallback)
+- hands each section's value to its ``on_ready`` callback on the UI thread
+  as soon as it arrives, then calls ``on_complete`` once everything is done
+- marks the sections not yet started as cancelled when the page cancels
+  its tasks, so ``wait()``/``done`` still return
+- records per-section timing and reports wall-clock vs. sequential time
+
+Usage:
+    from utils.page_loader import PageLoader
+
+    loader = PageLoader(self, name='AdminDashboard')
+    loader.section('users', lambda: self.api.get('admin/users'),
+                   default=[], on_ready=self._set_users)
+    loader.section('resources', lambda: self.api.get('admin/resources'),
+                   fallback=lambda: self.api.get('resources'), default=[])
+    loader.section('registrations', self._fetch_registrations,
+                   depends_on=('events',))  # called with the events value
+    loader.start(on_complete=lambda loader: self._hide_spinner())
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from utils.task_executor import deliver, is_cancelled, run_async
+
+
+class Section:
+    """
+    One declared fetch of a page
+
+    Attributes:
+        name: Section name (also the key of its value)
+        depends_on: Sections whose values are passed to fetch
+        status: 'pending', 'running', 'done', 'failed' or 'cancelled'
+        value: Fetched value (default if the section failed)
+        error: Exception if the fetch (and fallback) failed
+        used_fallback: Whether the value came from the fallback fetch
+        duration_ms: Time spent fetching (None until finished)
+    """
+
+    def __init__(self, name: str, fetch: Callable, depends_on: Iterable[str] = (),
+                 fallback: Optional[Callable] = None, default: Any = None,
+                 on_ready: Optional[Callable[[Any], None]] = None):
+        self.name = name
+        self.fetch = fetch
+        self.depends_on = tuple(depends_on)
+        self.fallback = fallback
+        self.default = default
+        self.on_ready = on_ready
+        self.status = 'pending'
+        self.value: Any = default
+        self.error: Optional[Exception] = None
+        self.used_fallback = False
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        if self.started is None or self.finished is None:
+            return None
+        return (self.finished - self.started) * 1000.0
+
+
+class PageLoader:
+    """
+    Runs a page's declared sections concurrently, respecting dependencies
+
+    No thread ever blocks waiting for another section: each finished section
+    submits the sections it unblocks, so loaders can be nested in pool
+    tasks without starving the pool.
+    """
+
+    # Section statuses that need no more work
+    FINISHED = ('done', 'failed', 'cancelled')
+
+    def __init__(self, owner: Any, name: Optional[str] = None):
+        """
+        Initialize page loader
+
+        Args:
+            owner: Page that owns the fetches and receives the callbacks
+            name: Name used in timing logs (defaults to the owner's class)
+        """
+        self.owner = owner
+        self.name = name or type(owner).__name__
+        self._sections: Dict[str, Section] = {}
+        self._on_complete: Optional[Callable[['PageLoader'], None]] = None
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._started: Optional[float] = None
+        self._finished: Optional[float] = None
+        self._cancelled = False
+
+    def section(self, name: str, fetch: Callable, depends_on: Iterable[str] = (),
+                fallback: Optional[Callable] = None, default: Any = None,
+                on_ready: Optional[Callable[[Any], None]] = None) -> 'PageLoader':
+        """
+        Declare a section
+
+        Args:
+            name: Unique section name
+            fetch: Fetch function; called with the values of depends_on
+            depends_on: Names of sections that must finish first
+            fallback: Fetch tried (with the same arguments) if fetch fails
+            default: Value used if the section fails
+            on_ready: Called on the UI thread with the value (or default)
+
+        Returns:
+            self, so declarations can be chained
+        """
+        if self._started is not None:
+            raise RuntimeError("Cannot add sections after start()")
+        if name in self._sections:
+            raise ValueError(f"Duplicate section '{name}'")
+        self._sections[name] = Section(name, fetch, depends_on, fallback, default, on_ready)
+        return self
+
+    def start(self, on_complete: Optional[Callable[['PageLoader'], None]] = None) -> 'PageLoader':
+        """
+        Start loading
+
+        Args:
+            on_complete: Called on the UI thread with the loader once every
+                section has finished (after all on_ready callbacks)
+
+        Returns:
+            self
+        """
+        self._check_graph()
+        self._on_complete = on_complete
+        with self._lock:
+            self._started = time.perf_counter()
+            ready = [s for s in self._sections.values() if not s.depends_on]
+            for section in ready:
+                section.status = 'running'
+        if not self._sections:
+            self._finish()
+        for section in ready:
+            self._submit(section)
+        return self
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until every section finished or was cancelled (for scripts and tests)"""
+        return self._done.wait(timeout)
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    @property
+    def values(self) -> Dict[str, Any]:
+        """Section values by name (defaults for failed sections)"""
+        return {name: s.value for name, s in self._sections.items()}
+
+    @property
+    def errors(self) -> Dict[str, Exception]:
+        """Errors by section name"""
+        return {name: s.error for name, s in self._sections.items() if s.error is not None}
+
+    @property
+    def timings(self) -> Dict[str, Optional[float]]:
+        """Fetch time per section in milliseconds"""
+        return {name: s.duration_ms for name, s in self._sections.items()}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get load statistics
+
+        Returns:
+            Dictionary with per-section timings, wall-clock time and the
+            time the same fetches would have taken one after another
+        """
+        with self._lock:
+            timings = self.timings
+            finished = self._finished or time.perf_counter()
+            return {
+                'sections': len(self._sections),
+                'failed': [name for name, s in self._sections.items() if s.status == 'failed'],
+                'cancelled': [name for name, s in self._sections.items() if s.status == 'cancelled'],
+                'fallbacks': [name for name, s in self._sections.items() if s.used_fallback],
+                'timings_ms': timings,
+                'total_ms': (finished - self._started) * 1000.0 if self._started else None,
+                'sequential_ms': sum(t for t in timings.values() if t is not None),
+            }
+
+    def _check_graph(self):
+        """Reject unknown dependencies and cycles before starting"""
+        for section in self._sections.values():
+            for dep in section.depends_on:
+                if dep not in self._sections:
+                    raise ValueError(f"Section '{section.name}' depends on unknown section '{dep}'")
+
+        visiting, visited = set(), set()
+
+        def visit(name):
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle through section '{name}'")
+            visiting.add(name)
+            for dep in self._sections[name].depends_on:
+                visit(dep)
+            visiting.discard(name)
+            visited.add(name)
+
+        for name in self._sections:
+            visit(name)
+
+    def _run_section(self, section: Section):
+        """Fetch one section, deliver it and start the sections it unblocks"""
+        args = [self._sections[dep].value for dep in section.depends_on]
+        failed_dep = next((dep for dep in section.depends_on
+                           if self._sections[dep].status == 'failed'), None)
+
+        section.started = time.perf_counter()
+        if failed_dep is not None:
+            section.error = self._sections[failed_dep].error
+        else:
+            try:
+                section.value = section.fetch(*args)
+            except Exception as e:
+                section.error = e
+                if section.fallback is not None:
+                    try:
+                        section.value = section.fallback(*args)
+                        section.error = None
+                        section.used_fallback = True
+                    except Exception:
+                        pass
+        section.finished = time.perf_counter()
+        if section.error is not None:
+            section.value = section.default
+
+        if section.on_ready is not None:
+            deliver(self.owner, section.on_ready, section.value)
+
+        with self._lock:
+            section.status = 'failed' if section.error is not None else 'done'
+            if is_cancelled():
+                # Owner navigated away: don't start more work for it
+                self._cancel_pending()
+            if self._cancelled:
+                ready = []
+            else:
+                ready = [s for s in self._sections.values()
+                         if s.status == 'pending' and
+                         all(self._sections[d].status in ('done', 'failed') for d in s.depends_on)]
+            for s in ready:
+                s.status = 'running'
+            finished = all(s.status in self.FINISHED for s in self._sections.values())
+
+        for s in ready:
+            self._submit(s)
+        if finished:
+            self._finish()
+
+    def _submit(self, section: Section):
+        """Run a section on the pool, owned by the page"""
+        future = run_async(self.owner, self._run_section, section)
+        future.add_done_callback(lambda f: f.cancelled() and self._on_dropped(section))
+
+    def _on_dropped(self, section: Section):
+        """A queued section was cancelled before it ran"""
+        with self._lock:
+            section.status = 'cancelled'
+            self._cancel_pending()
+            finished = all(s.status in self.FINISHED for s in self._sections.values())
+        if finished:
+            self._finish()
+
+    def _cancel_pending(self):
+        """Mark the sections not started yet as cancelled (lock held)"""
+        self._cancelled = True
+        for s in self._sections.values():
+            if s.status == 'pending':
+                s.status = 'cancelled'
+
+    def _finish(self):
+        """Log timings and call on_complete (unless the page cancelled the load)"""
+        self._finished = time.perf_counter()
+        stats = self.get_stats()
+        parts = ', '.join(
+            f"{name} {ms:.0f}ms" for name, ms in stats['timings_ms'].items() if ms is not None
+        )
+        print(f"[PAGE LOADER] {self.name}: {parts} "
+              f"(total {stats['total_ms']:.0f}ms, sequential {stats['sequential_ms']:.0f}ms)")
+        if self._on_complete is not None and not self._cancelled:
+            deliver(self.owner, self._on_complete, self)
+        self._done.set()
@@ -1,39 +1,149 @@
 """
 Performance Optimization Utilities
-Provides caching, lazy loading, debouncing, and pagination support
+Provides caching, request coalescing, lazy loading, debouncing, and pagination support
 """
 
 import time
+import heapq
+import sys
 import threading
+from collections import OrderedDict
 from typing import Any, Callable, Dict, Optional, List, Tuple
-from datetime import datetime, timedelta
 from functools import wraps
+from concurrent.futures import Future
 import json
 
 
+class _CacheEntry:
+    """Internal cache slot: value, freshness/expiry times, estimated size and tags"""
+    
+    __slots__ = ('value', 'fresh_until', 'expiry', 'size', 'seq', 'tags')
+    
+    def __init__(self, value: Any, fresh_until: float, expiry: float, size: int, seq: int,
+                 tags: Tuple[str, ...] = ()):
+        self.value = value
+        self.fresh_until = fresh_until
+        self.expiry = expiry
+        self.size = size
+        self.seq = seq
+        self.tags = tags
+
+
+class _TrieNode:
+    """Node of the cache key prefix trie"""
+    
+    __slots__ = ('children', 'keys')
+    
+    def __init__(self):
+        self.children: Dict[str, '_TrieNode'] = {}
+        self.keys: set = set()
+
+
+def _key_segments(key: str) -> List[str]:
+    """
+    Split a cache key into trie segments
+    
+    The path is split on '/' and the query string (if any) becomes one final
+    segment, so 'api:events/5?page=2' -> ['api:events', '5', '?page=2'].
+    """
+    path, sep, query = key.partition('?')
+    segments = path.rstrip('/').split('/')
+    if sep:
+        segments.append('?' + query)
+    return segments
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Estimate the memory footprint of a value in bytes
+    
+    Walks dicts, lists, tuples and sets (JSON-shaped API payloads) and sums
+    sys.getsizeof for every object reached. Shared objects are counted once.
+    
+    Args:
+        value: Value to measure
+    
+    Returns:
+        Approximate size in bytes
+    """
+    seen = set()
+    stack = [value]
+    total = 0
+    
+    while stack:
+        obj = stack.pop()
+        obj_id = id(obj)
+        if obj_id in seen:
+            continue
+        seen.add(obj_id)
+        total += sys.getsizeof(obj)
+        
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+    
+    return total
+
+
 class Cache:
     """
-    Thread-safe cache with TTL (Time To Live) support
+    Thread-safe LRU cache with TTL (Time To Live) support and a memory budget
+    
+    Entries live in an ordered dict (least recently used first) with a
+    min-heap of expiry times alongside, so get/set/evict are O(1) amortized
+    and expired entries can be purged without scanning the whole cache.
+    
+    Keys are also indexed by tag and by path prefix, so targeted
+    invalidation touches only the affected keys.
+    
+    An entry may outlive its TTL by a stale window (stale_ttl). get() treats
+    it as missing once the TTL passes, but get_with_state() still returns it
+    so callers can serve stale data while revalidating.
     
     Features:
-    - Automatic expiry based on TTL
+    - Automatic expiry based on TTL (lazily on access, on insert, and
+      optionally from a background sweeper thread)
     - Thread-safe operations
-    - Cache invalidation
-    - Size limits
+    - Cache invalidation by key, tag or path prefix
+    - Size limits by entry count and by estimated payload bytes
+    - Hit/miss/eviction statistics
     """
     
-    def __init__(self, default_ttl: int = 300, max_size: int = 100):
+    def __init__(self, default_ttl: int = 300, max_size: Optional[int] = 100,
+                 max_bytes: Optional[int] = None, cleanup_interval: Optional[float] = None):
         """
         Initialize cache
         
         Args:
             default_ttl: Default time to live in seconds (default: 5 minutes)
-            max_size: Maximum number of cached items
+            max_size: Maximum number of cached items (None for no count limit)
+            max_bytes: Maximum estimated payload size in bytes (None for no limit)
+            cleanup_interval: Seconds between background expiry sweeps
+                (None disables the sweeper; expiry then happens lazily)
         """
-        self._cache: Dict[str, Tuple[Any, datetime]] = {}
+        self._cache: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._expiry_heap: List[Tuple[float, int, str]] = []
+        self._seq = 0
+        self._bytes = 0
+        self._tags: Dict[str, set] = {}
+        self._trie = _TrieNode()
         self._lock = threading.Lock()
         self.default_ttl = default_ttl
         self.max_size = max_size
+        self.max_bytes = max_bytes
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._rejected = 0
+        
+        self._sweeper: Optional[threading.Thread] = None
+        self._stop_sweeper = threading.Event()
+        if cleanup_interval:
+            self.start_sweeper(cleanup_interval)
     
     def get(self, key: str) -> Optional[Any]:
         """
@@ -46,37 +156,94 @@ class Cache:
             Cached value or None if not found/expired
         """
         with self._lock:
-            if key not in self._cache:
+            entry = self._lookup(key)
+            if entry is None or time.monotonic() > entry.fresh_until:
+                self._misses += 1
                 return None
             
-            value, expiry = self._cache[key]
-            
-            # Check if expired
-            if datetime.now() > expiry:
-                del self._cache[key]
-                return None
+            self._hits += 1
+            return entry.value
+    
+    def get_with_state(self, key: str) -> Tuple[Optional[Any], bool]:
+        """
+        Get value from cache, including stale values inside their stale window
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            (value, is_fresh) - value is None if not found or fully expired
+        """
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is None:
+                self._misses += 1
+                return None, False
             
-            return value
+            fresh = time.monotonic() <= entry.fresh_until
+            if fresh:
+                self._hits += 1
+            else:
+                self._stale_hits += 1
+            return entry.value, fresh
+    
+    def _lookup(self, key: str) -> Optional[_CacheEntry]:
+        """Find a live entry and mark it recently used. Lock must be held."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        
+        # Check if expired (past TTL and stale window)
+        if time.monotonic() > entry.expiry:
+            self._remove(key)
+            self._expirations += 1
+            return None
+        
+        self._cache.move_to_end(key)
+        return entry
     
-    def set(self, key: str, value: Any, ttl: Optional[int] = None):
+    def set(self, key: str, value: Any, ttl: Optional[int] = None,
+            tags: Optional[List[str]] = None, stale_ttl: int = 0):
         """
         Set value in cache
         
+        Values larger than the whole byte budget are not cached.
+        
         Args:
             key: Cache key
             value: Value to cache
             ttl: Time to live in seconds (uses default if None)
+            tags: Labels for invalidate_tags (e.g. 'events:5')
+            stale_ttl: Extra seconds the value stays available to
+                get_with_state() after the TTL passes
         """
+        size = estimate_size(value) if self.max_bytes else 0
+        ttl = ttl or self.default_ttl
+        
         with self._lock:
-            # Check size limit
-            if len(self._cache) >= self.max_size and key not in self._cache:
-                # Remove oldest entry
-                oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k][1])
-                del self._cache[oldest_key]
+            if key in self._cache:
+                self._remove(key)
+            
+            if self.max_bytes and size > self.max_bytes:
+                self._rejected += 1
+                return
             
-            ttl = ttl or self.default_ttl
-            expiry = datetime.now() + timedelta(seconds=ttl)
-            self._cache[key] = (value, expiry)
+            now = time.monotonic()
+            fresh_until = now + ttl
+            expiry = fresh_until + max(0, stale_ttl)
+            self._seq += 1
+            entry_tags = tuple(set(tags)) if tags else ()
+            self._cache[key] = _CacheEntry(value, fresh_until, expiry, size, self._seq, entry_tags)
+            self._bytes += size
+            for tag in entry_tags:
+                self._tags.setdefault(tag, set()).add(key)
+            self._trie_insert(key)
+            heapq.heappush(self._expiry_heap, (expiry, self._seq, key))
+            
+            # Expired entries go first, then least recently used
+            self._purge_expired(now)
+            self._evict()
+            self._compact_heap()
     
     def invalidate(self, key: str):
         """
@@ -87,32 +254,187 @@ class Cache:
         """
         with self._lock:
             if key in self._cache:
-                del self._cache[key]
+                self._remove(key)
     
     def invalidate_pattern(self, pattern: str):
         """
         Invalidate all keys matching pattern
         
+        Scans every key; prefer invalidate_prefix or invalidate_tags.
+        
         Args:
             pattern: Pattern to match (simple substring match)
         """
         with self._lock:
             keys_to_remove = [k for k in self._cache.keys() if pattern in k]
             for key in keys_to_remove:
-                del self._cache[key]
+                self._remove(key)
+    
+    def invalidate_prefix(self, prefix: str) -> int:
+        """
+        Invalidate all keys under a path prefix
+        
+        Matching is by whole path segment: 'api:events/5' removes
+        'api:events/5', 'api:events/5?x=1' and 'api:events/5/registrations'
+        but not 'api:events/50'.
+        
+        Args:
+            prefix: Key path prefix
+        
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            node = self._trie
+            for segment in _key_segments(prefix):
+                node = node.children.get(segment)
+                if node is None:
+                    return 0
+            
+            keys = []
+            stack = [node]
+            while stack:
+                current = stack.pop()
+                keys.extend(current.keys)
+                stack.extend(current.children.values())
+            
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+    
+    def invalidate_tags(self, *tags: str) -> int:
+        """
+        Invalidate all keys carrying any of the given tags
+        
+        Args:
+            *tags: Tags passed to set()
+        
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            keys = set()
+            for tag in tags:
+                keys.update(self._tags.get(tag, ()))
+            for key in keys:
+                self._remove(key)
+            return len(keys)
     
     def clear(self):
         """Clear all cache entries"""
         with self._lock:
             self._cache.clear()
+            self._expiry_heap.clear()
+            self._tags.clear()
+            self._trie = _TrieNode()
+            self._bytes = 0
     
-    def cleanup_expired(self):
-        """Remove all expired entries"""
+    def cleanup_expired(self) -> int:
+        """
+        Remove all expired entries
+        
+        Returns:
+            Number of entries removed
+        """
         with self._lock:
-            now = datetime.now()
-            expired_keys = [k for k, (_, expiry) in self._cache.items() if now > expiry]
-            for key in expired_keys:
-                del self._cache[key]
+            removed = self._purge_expired(time.monotonic())
+            self._compact_heap()
+            return removed
+    
+    def start_sweeper(self, interval: float):
+        """
+        Start a daemon thread that calls cleanup_expired periodically
+        
+        Args:
+            interval: Seconds between sweeps
+        """
+        if self._sweeper is not None and self._sweeper.is_alive():
+            return
+        self._stop_sweeper.clear()
+        
+        def sweep():
+            while not self._stop_sweeper.wait(interval):
+                self.cleanup_expired()
+        
+        self._sweeper = threading.Thread(target=sweep, name='cache-sweeper', daemon=True)
+        self._sweeper.start()
+    
+    def stop_sweeper(self):
+        """Stop the background sweeper thread"""
+        self._stop_sweeper.set()
+        self._sweeper = None
+    
+    def _remove(self, key: str):
+        """Remove an entry and its tag/trie records (heap records go lazily). Lock must be held."""
+        entry = self._cache.pop(key)
+        self._bytes -= entry.size
+        
+        for tag in entry.tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+        
+        self._trie_remove(key)
+    
+    def _trie_insert(self, key: str):
+        """Add a key to the prefix trie. Lock must be held."""
+        node = self._trie
+        for segment in _key_segments(key):
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[segment] = _TrieNode()
+            node = child
+        node.keys.add(key)
+    
+    def _trie_remove(self, key: str):
+        """Remove a key from the prefix trie, pruning empty branches. Lock must be held."""
+        path = [self._trie]
+        segments = _key_segments(key)
+        for segment in segments:
+            node = path[-1].children.get(segment)
+            if node is None:
+                return
+            path.append(node)
+        
+        path[-1].keys.discard(key)
+        for depth in range(len(segments), 0, -1):
+            node = path[depth]
+            if node.keys or node.children:
+                break
+            del path[depth - 1].children[segments[depth - 1]]
+    
+    def _purge_expired(self, now: float) -> int:
+        """Pop expired entries off the expiry heap. Lock must be held."""
+        heap = self._expiry_heap
+        removed = 0
+        while heap and heap[0][0] <= now:
+            _, seq, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            # Skip stale heap records for keys that were replaced or removed
+            if entry is not None and entry.seq == seq:
+                self._remove(key)
+                removed += 1
+        self._expirations += removed
+        return removed
+    
+    def _evict(self):
+        """Evict least recently used entries until within limits. Lock must be held."""
+        while self._cache and (
+            (self.max_size is not None and len(self._cache) > self.max_size) or
+            (self.max_bytes and self._bytes > self.max_bytes)
+        ):
+            self._remove(next(iter(self._cache)))
+            self._evictions += 1
+    
+    def _compact_heap(self):
+        """Drop stale heap records once they outnumber live entries. Lock must be held."""
+        if len(self._expiry_heap) > 2 * len(self._cache) + 64:
+            self._expiry_heap = [
+                (entry.expiry, entry.seq, key) for key, entry in self._cache.items()
+            ]
+            heapq.heapify(self._expiry_heap)
     
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -123,18 +445,126 @@ class Cache:
         """
         with self._lock:
             total = len(self._cache)
-            now = datetime.now()
-            expired = sum(1 for _, expiry in self._cache.values() if now > expiry)
+            now = time.monotonic()
+            expired = sum(1 for entry in self._cache.values() if now > entry.fresh_until)
+            lookups = self._hits + self._stale_hits + self._misses
+            
+            if self.max_size:
+                usage = total / self.max_size * 100
+            elif self.max_bytes:
+                usage = self._bytes / self.max_bytes * 100
+            else:
+                usage = 0
             
             return {
                 "total_entries": total,
                 "expired_entries": expired,
                 "valid_entries": total - expired,
                 "max_size": self.max_size,
-                "usage_percent": (total / self.max_size * 100) if self.max_size > 0 else 0
+                "usage_percent": usage,
+                "bytes_used": self._bytes,
+                "max_bytes": self.max_bytes,
+                "bytes_percent": (self._bytes / self.max_bytes * 100) if self.max_bytes else 0,
+                "hits": self._hits,
+                "stale_hits": self._stale_hits,
+                "misses": self._misses,
+                "hit_rate": (self._hits / lookups * 100) if lookups else 0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "rejected_oversize": self._rejected,
+                "tags": len(self._tags),
             }
 
 
+class SingleFlight:
+    """
+    Coalesce concurrent identical calls into a single execution
+
+    The first caller for a key (the "leader") runs the function; callers
+    that arrive with the same key while it is still running wait on the
+    leader's future and receive the same result (or exception). Once the
+    call finishes the key is released, so later calls run again.
+
+    Features:
+    - Thread-safe in-flight table keyed by caller-supplied string
+    - Shared result objects (treat them as read-only)
+    - Counters for executed vs. coalesced calls
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._executed = 0
+        self._coalesced = 0
+
+    def do(self, key: str, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run func once per key for all concurrent callers
+
+        Args:
+            key: Identity of the call (e.g. method + URL + auth)
+            func: Function to call if no identical call is in flight
+            *args: Function arguments
+            **kwargs: Function keyword arguments
+
+        Returns:
+            Result of func (shared between coalesced callers)
+        """
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is None:
+                future = Future()
+                self._inflight[key] = future
+                self._executed += 1
+                leader = True
+            else:
+                self._coalesced += 1
+                leader = False
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            self._inflight.pop(key, None)
+        future.set_result(result)
+        return result
+
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running"""
+        with self._lock:
+            return len(self._inflight)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get coalescing statistics
+
+        Returns:
+            Dictionary with executed, coalesced and in-flight counts
+        """
+        with self._lock:
+            total = self._executed + self._coalesced
+            return {
+                "executed": self._executed,
+                "coalesced": self._coalesced,
+                "in_flight": len(self._inflight),
+                "coalesced_percent": (self._coalesced / total * 100) if total > 0 else 0
+            }
+
+    def reset_stats(self):
+        """Reset counters (in-flight calls are unaffected)"""
+        with self._lock:
+            self._executed = 0
+            self._coalesced = 0
+
+
 class Debouncer:
     """
     Debounce function calls
@@ -480,13 +910,41 @@ class AsyncImageLoader:
 
 
 # Global instances
-_global_cache = Cache()
+def _create_global_cache() -> Cache:
+    """Build the shared cache from [CACHE] settings (max_size is in MB)"""
+    ttl, max_mb = 300, 50
+    try:
+        from config.settings import settings
+        ttl = settings.get('CACHE_TTL', ttl) or ttl
+        max_mb = settings.get('CACHE_MAX_SIZE', max_mb) or max_mb
+    except Exception:
+        pass
+    return Cache(
+        default_ttl=ttl,
+        max_size=None,
+        max_bytes=int(float(max_mb) * 1024 * 1024)
+    )
+
+
+# Seconds between expiry sweeps of the global cache (sweeper starts on first get_cache())
+GLOBAL_CACHE_SWEEP_INTERVAL = 60
+
+_global_cache = _create_global_cache()
+_global_cache_sweeping = False
+_global_lock = threading.Lock()
 _global_lazy_loader = LazyLoader()
 _global_image_loader = AsyncImageLoader()
+_global_single_flight = SingleFlight()
 
 
 def get_cache() -> Cache:
-    """Get global cache instance"""
+    """Get global cache instance (starts its expiry sweeper on first use)"""
+    global _global_cache_sweeping
+    if not _global_cache_sweeping:
+        with _global_lock:
+            if not _global_cache_sweeping:
+                _global_cache.start_sweeper(GLOBAL_CACHE_SWEEP_INTERVAL)
+                _global_cache_sweeping = True
     return _global_cache
 
 
@@ -500,6 +958,11 @@ def get_image_loader() -> AsyncImageLoader:
     return _global_image_loader
 
 
+def get_single_flight() -> SingleFlight:
+    """Get global single-flight (request coalescing) instance"""
+    return _global_single_flight
+
+
 # Decorators
 
 def cached(ttl: int = 300, key_prefix: str = ""):
@@ -0,0 +1,434 @@
+"""
+Query Builder
+Server-side filter, sort and pagination for list endpoints
+
+Pages used to download whole collections and filter them in Python (every
+event, to keep the organizer's own), or glued query strings together with
+unescaped f-strings. ``ListQuery`` describes what a page wants and turns it
+into a canonical, URL-encoded request:
+
+    GET admin/users?limit=50&page=1&q=ann&role=student&sort=-created_at
+
+- ``where(field=value)`` filters on equality; ``where(field__op=value)``
+  with op in gt, gte, lt, lte, ne, in, contains (substring of a text
+  field, member of a list field), overlaps (list field shares any value)
+- ``search(text, fields)`` sends ``q=text``
+- ``order_by('-start_time', 'title')`` sends ``sort=-start_time,title``
+- ``paginate(page, limit)`` or ``after(cursor, limit)`` send page/limit or
+  cursor/limit
+- ``fields('id', 'title')`` sends ``fields=id,title`` so list views receive
+  summary rows instead of full records (sparse fieldset)
+
+Parameters are sorted, so equal queries have equal URLs and share cache
+entries and in-flight requests. A server that supports the parameters
+answers with an envelope:
+
+    {"items": [...], "total": 120, "next_cursor": "abc", "applied": [...]}
+
+``applied`` (optional) lists the parameter names the server honoured.
+Everything it did not apply is evaluated on the client, so a server that
+ignores the parameters and returns a plain list still gives the right
+result. A server that paginates must apply every filter it is sent,
+otherwise pages are filtered locally after slicing. A server that ignores
+``fields`` sends full rows; they are kept as they are.
+
+Usage:
+    result = (api.query('events')
+              .where(organizerId=user_id, status__in=['approved', 'pending'])
+              .order_by('start_time')
+              .paginate(page=2, limit=9)
+              .fetch())
+    render(result.items, pages=result.pages)
+"""
+
+import re
+import threading
+from datetime import date, datetime
+from math import ceil
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import urlencode
+
+from utils.datetime_service import parse_datetime
+
+OPERATORS = ('eq', 'ne', 'gt', 'gte', 'lt', 'lte', 'in', 'contains', 'overlaps')
+
+_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}')
+
+
+def _format(value: Any) -> str:
+    """Query string form of a filter value"""
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, datetime):
+        return value.strftime('%Y-%m-%dT%H:%M:%S')
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return ','.join(sorted(_format(v) for v in value))
+    return str(value)
+
+
+def _coerce(value: Any) -> Any:
+    """Comparable form of a row or filter value (dates parsed, text lowered)"""
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=None)
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    if isinstance(value, str):
+        if _DATE_RE.match(value):
+            parsed = parse_datetime(value)
+            if parsed is not None:
+                return parsed
+        return value.lower()
+    return value
+
+
+def _rank(value: Any) -> int:
+    """Sort bucket so values of different types never compare directly"""
+    if isinstance(value, (int, float)):
+        return 0
+    if isinstance(value, datetime):
+        return 1
+    return 2
+
+
+def _pair(a: Any, b: Any) -> Tuple[Any, Any]:
+    """Coerce two values to a comparable pair (text if the types differ)"""
+    a, b = _coerce(a), _coerce(b)
+    if _rank(a) != _rank(b) or (_rank(a) == 2 and not (isinstance(a, str) and isinstance(b, str))):
+        return str(a).lower(), str(b).lower()
+    return a, b
+
+
+def _matches(row_value: Any, op: str, value: Any) -> bool:
+    """Whether a row value passes one filter"""
+    if op == 'in':
+        values = value if isinstance(value, (list, tuple, set, frozenset)) else [value]
+        return any(_matches(row_value, 'eq', v) for v in values)
+    if op == 'overlaps':
+        values = value if isinstance(value, (list, tuple, set, frozenset)) else [value]
+        return any(_matches(row_value, 'contains', v) for v in values)
+    if row_value is None:
+        return op == 'ne' and value is not None
+    if op == 'contains':
+        needle = str(value).lower()
+        if isinstance(row_value, (list, tuple, set, frozenset)):
+            return any(str(item).lower() == needle for item in row_value)
+        return needle in str(row_value).lower()
+    a, b = _pair(row_value, value)
+    if op == 'eq':
+        return a == b
+    if op == 'ne':
+        return a != b
+    if op == 'gt':
+        return a > b
+    if op == 'gte':
+        return a >= b
+    if op == 'lt':
+        return a < b
+    if op == 'lte':
+        return a <= b
+    raise ValueError(f"Unknown operator '{op}'")
+
+
+class QueryResult:
+    """
+    One page of a list query
+
+    Attributes:
+        items: Rows of this page
+        total: Rows matching the query on all pages (None if unknown)
+        page: Page number (None for cursor queries)
+        limit: Page size (None if unpaginated)
+        next_cursor: Cursor of the next page (None on the last page)
+        evaluated: Parameters the client applied because the server did not
+        all_items: Every matching row, when the client paged a full list
+            (None if the server paged)
+    """
+
+    def __init__(self, items: List[Dict[str, Any]], total: Optional[int] = None,
+                 page: Optional[int] = None, limit: Optional[int] = None,
+                 next_cursor: Optional[str] = None, evaluated: Iterable[str] = (),
+                 all_items: Optional[List[Dict[str, Any]]] = None):
+        self.items = items
+        self.total = total
+        self.page = page
+        self.limit = limit
+        self.next_cursor = next_cursor
+        self.evaluated = list(evaluated)
+        self.all_items = all_items
+
+    @property
+    def pages(self) -> int:
+        """Number of pages (at least 1)"""
+        if not self.limit or self.total is None:
+            return 1
+        return max(1, ceil(self.total / self.limit))
+
+    @property
+    def server_side(self) -> bool:
+        """True if the server applied every parameter"""
+        return not self.evaluated
+
+
+class ListQuery:
+    """
+    Immutable description of a list request
+
+    Builder methods return a new query, so a base query can be shared and
+    refined. Bind a client with APIClient.query() to use fetch().
+    """
+
+    # Parameter combinations already reported as evaluated locally
+    _reported: Set[Tuple[str, Tuple[str, ...]]] = set()
+    _reported_lock = threading.Lock()
+
+    def __init__(self, endpoint: str, api: Any = None):
+        """
+        Initialize query
+
+        Args:
+            endpoint: Collection endpoint (e.g. 'events', 'admin/users')
+            api: APIClient used by fetch()
+        """
+        self.endpoint = endpoint.split('?')[0].strip('/')
+        self.api = api
+        self.filters: Tuple[Tuple[str, str, Any], ...] = ()
+        self.search_text: Optional[str] = None
+        self.search_fields: Tuple[str, ...] = ()
+        self.sort: Tuple[str, ...] = ()
+        self.page: Optional[int] = None
+        self.limit: Optional[int] = None
+        self.cursor: Optional[str] = None
+        self.projection: Tuple[str, ...] = ()
+
+    def _copy(self) -> 'ListQuery':
+        query = ListQuery.__new__(ListQuery)
+        query.__dict__.update(self.__dict__)
+        return query
+
+    def where(self, **conditions: Any) -> 'ListQuery':
+        """
+        Add filters; None values are ignored so optional filters chain
+
+        Args:
+            **conditions: field=value (equality) or field__op=value
+
+        Example:
+            query.where(status='approved', start_time__gte=datetime.now())
+        """
+        query = self._copy()
+        filters = list(self.filters)
+        for name, value in conditions.items():
+            if value is None:
+                continue
+            field, _, op = name.partition('__')
+            op = op or 'eq'
+            if op not in OPERATORS:
+                raise ValueError(f"Unknown operator '{op}' in '{name}'")
+            filters.append((field, op, value))
+        query.filters = tuple(filters)
+        return query
+
+    def search(self, text: Optional[str], fields: Iterable[str] = ()) -> 'ListQuery':
+        """
+        Full-text search
+
+        Args:
+            text: Search text (None/blank for no search)
+            fields: Row fields the client-side fallback searches
+        """
+        query = self._copy()
+        text = (text or '').strip()
+        query.search_text = text or None
+        query.search_fields = tuple(fields)
+        return query
+
+    def order_by(self, *fields: str) -> 'ListQuery':
+        """Sort by fields; prefix a field with '-' for descending"""
+        query = self._copy()
+        query.sort = tuple(f for f in fields if f)
+        return query
+
+    def paginate(self, page: int = 1, limit: int = 20) -> 'ListQuery':
+        """Request one page (1-indexed)"""
+        query = self._copy()
+        query.page, query.limit, query.cursor = max(1, int(page)), max(1, int(limit)), None
+        return query
+
+    def after(self, cursor: Optional[str], limit: int = 20) -> 'ListQuery':
+        """Request the page after a cursor (None for the first page)"""
+        query = self._copy()
+        query.page, query.limit, query.cursor = None, max(1, int(limit)), cursor
+        return query
+
+    def fields(self, *names: str) -> 'ListQuery':
+        """
+        Request only these row fields (no arguments for full rows)
+
+        Example:
+            api.query('events').fields('id', 'title', 'start_time')
+        """
+        query = self._copy()
+        query.projection = tuple(sorted(set(n for n in names if n)))
+        return query
+
+    def params(self) -> List[Tuple[str, str]]:
+        """Canonical (sorted) query parameters"""
+        params = []
+        for field, op, value in self.filters:
+            params.append((field if op == 'eq' else f"{field}__{op}", _format(value)))
+        if self.search_text:
+            params.append(('q', self.search_text))
+        if self.sort:
+            params.append(('sort', ','.join(self.sort)))
+        if self.page is not None:
+            params.append(('page', str(self.page)))
+        if self.limit is not None:
+            params.append(('limit', str(self.limit)))
+        if self.cursor is not None:
+            params.append(('cursor', self.cursor))
+        if self.projection:
+            params.append(('fields', ','.join(self.projection)))
+        return sorted(params)
+
+    @property
+    def url(self) -> str:
+        """Endpoint with the encoded parameters (also the cache key)"""
+        params = self.params()
+        return f"{self.endpoint}?{urlencode(params)}" if params else self.endpoint
+
+    def is_refinement_of(self, other: 'ListQuery') -> bool:
+        """
+        Whether this query's rows are a subset of other's unpaginated rows,
+        so they can be filtered locally instead of fetched again
+        """
+        if other.endpoint != self.endpoint or other.limit is not None:
+            return False
+        if other.projection and not set(self.projection or ('*',)) <= set(other.projection):
+            return False  # Rows of other may lack fields this query needs
+        if not all(f in self.filters for f in other.filters):
+            return False
+        if other.search_text:
+            if not self.search_text or other.search_fields != self.search_fields:
+                return False
+            if other.search_text.lower() not in self.search_text.lower():
+                return False
+        return True
+
+    def fetch(self, priority: Optional[int] = None, cached: bool = False,
+              ttl: int = 300) -> QueryResult:
+        """
+        Run the query with the bound APIClient
+
+        Args:
+            priority: Request priority class
+            cached: Go through the response cache (keyed by url)
+            ttl: Cache time to live in seconds
+
+        Returns:
+            QueryResult
+        """
+        if self.api is None:
+            raise RuntimeError("Query is not bound to an APIClient (use api.query())")
+        if cached:
+            response = self.api.get_cached(self.url, ttl=ttl)
+        else:
+            response = self.api.get(self.url, priority=priority)
+        return self.resolve(response)
+
+    def resolve(self, response: Any) -> QueryResult:
+        """
+        Turn a server response into a result, applying on the client
+        whatever the server did not
+
+        Args:
+            response: Envelope ({'items': [...], ...}) or plain list
+        """
+        names = {name for name, _ in self.params()}
+        if isinstance(response, dict) and isinstance(response.get('items'), list):
+            rows = response['items']
+            applied = names if response.get('applied') is None else set(response['applied'])
+        else:
+            rows = response if isinstance(response, list) else []
+            applied = set()
+            response = {}
+
+        evaluated = []
+        for field, op, value in self.filters:
+            name = field if op == 'eq' else f"{field}__{op}"
+            if name not in applied:
+                rows = [row for row in rows if _matches(row.get(field), op, value)]
+                evaluated.append(name)
+        if self.search_text and 'q' not in applied:
+            rows = [row for row in rows if self._search_matches(row)]
+            evaluated.append('q')
+        if self.sort and 'sort' not in applied:
+            rows = self._sorted(rows)
+            evaluated.append('sort')
+
+        paged = self.limit is not None
+        server_paged = paged and ({'page', 'cursor', 'limit'} & names) <= applied
+        if server_paged:
+            total = response.get('total')
+            next_cursor = response.get('next_cursor')
+            all_items = None
+        else:
+            total = len(rows) if paged or evaluated else response.get('total', len(rows))
+            next_cursor = None
+            all_items = None
+            if paged:
+                all_items = rows
+                if self.page is not None:
+                    offset = (self.page - 1) * self.limit
+                else:
+                    try:
+                        offset = max(0, int(self.cursor or 0))
+                    except ValueError:
+                        offset = 0
+                end = offset + self.limit
+                next_cursor = str(end) if end < len(rows) else None
+                rows = rows[offset:end]
+                evaluated.extend(n for n in ('page', 'cursor', 'limit') if n in names)
+
+        if evaluated:
+            self._report(evaluated)
+        return QueryResult(rows, total=total, page=self.page, limit=self.limit,
+                           next_cursor=next_cursor, evaluated=evaluated, all_items=all_items)
+
+    def evaluate(self, rows: List[Dict[str, Any]]) -> QueryResult:
+        """Apply the whole query to rows on the client"""
+        return self.resolve(list(rows))
+
+    def _search_matches(self, row: Dict[str, Any]) -> bool:
+        needle = self.search_text.lower()
+        fields = self.search_fields or [k for k, v in row.items() if isinstance(v, str)]
+        return any(needle in str(row.get(field) or '').lower() for field in fields)
+
+    def _sorted(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Stable multi-field sort; missing values last in both directions"""
+        rows = list(rows)
+        for spec in reversed(self.sort):
+            descending = spec.startswith('-')
+            field = spec.lstrip('-+')
+
+            def key(row, field=field, descending=descending):
+                value = _coerce(row.get(field))
+                present = value is not None
+                rank = _rank(value) if present else 0
+                value = value if present else 0
+                if rank == 2 and not isinstance(value, str):
+                    value = str(value).lower()
+                return (present, rank, value) if descending else (not present, rank, value)
+
+            rows.sort(key=key, reverse=descending)
+        return rows
+
+    def _report(self, evaluated: List[str]):
+        """Log once per endpoint which parameters were evaluated locally"""
+        marker = (self.endpoint, tuple(sorted(evaluated)))
+        with self._reported_lock:
+            if marker in self._reported:
+                return
+            self._reported.add(marker)
+        print(f"[QUERY] {self.endpoint}: server ignored {', '.join(evaluated)}; applied on the client")
@@ -0,0 +1,219 @@
+"""
+Reconciler
+Patches refreshed data into widgets that already show an older snapshot
+
+The dashboards used to destroy and rebuild their whole content on every
+30-second auto-refresh tick, even when the server returned identical data,
+so a dashboard left open all day froze briefly twice a minute. The helpers
+here let a view build its widgets once and then apply only the difference:
+
+- ``Snapshot`` remembers the data a view last showed; ``changed(...)`` is
+  False when nothing differs, so the refresh can skip the view entirely
+- ``KeyedRows`` keeps one row widget per item in a container, keyed by id
+  and compared by version or content fingerprint: new items get a row,
+  removed items lose theirs, changed items are patched (or rebuilt) and
+  unchanged rows are not touched
+- ``set_text`` updates a label only when its text changed
+
+Usage:
+    from utils.reconciler import KeyedRows, Snapshot, set_text
+
+    self._rows = KeyedRows(list_frame, self._create_row, empty='No events',
+                           pack={'fill': 'x', 'padx': 8, 'pady': 4})
+
+    def _patch(self):
+        if not self._snapshot.changed(self.events):
+            return
+        set_text(self._total_label, len(self.events))
+        self._rows.reconcile(self.events[:5])
+"""
+
+import tkinter as tk
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+# Row fields the API bumps whenever an entity changes
+VERSION_FIELDS = ('version', 'updated_at', 'updatedAt')
+
+
+def row_signature(row: Any) -> Any:
+    """
+    Value that changes whenever a row changes
+
+    Args:
+        row: Row (dict or record)
+
+    Returns:
+        The row's version field if it has one, else its content
+    """
+    for name in VERSION_FIELDS:
+        version = row.get(name)
+        if version is not None:
+            return name, version
+    return tuple(row.items())
+
+
+def set_text(label: Any, value: Any):
+    """Set a label's text unless it already shows it"""
+    text = str(value)
+    if label.cget('text') != text:
+        label.config(text=text)
+
+
+class Snapshot:
+    """Remembers the data a view last showed"""
+
+    def __init__(self):
+        self._data = None
+
+    def changed(self, *data: Any) -> bool:
+        """
+        Whether the data differs from the last call (and remember it)
+
+        Args:
+            data: What the view shows (lists, counts, ...); the same objects
+                or equal values count as unchanged
+
+        Returns:
+            True on the first call and whenever anything changed
+        """
+        previous = self._data
+        self._data = data
+        if previous is None or len(previous) != len(data):
+            return True
+        return any(old is not new and old != new for old, new in zip(previous, data))
+
+    def reset(self):
+        """Forget the last data (the view was rebuilt)"""
+        self._data = None
+
+
+class KeyedRows:
+    """
+    One row widget per keyed item in a container
+
+    Features:
+    - Rows are matched to items by key; unchanged rows are left alone
+    - Changed rows are patched with update(), or rebuilt in place
+    - Optional empty-state label when there are no items
+    """
+
+    def __init__(self, parent: Any, create: Callable[[Any, Any], Any],
+                 update: Optional[Callable[[Any, Any], None]] = None,
+                 key: Callable[[Any], Hashable] = lambda item: item.get('id'),
+                 signature: Callable[[Any], Any] = row_signature,
+                 empty: Optional[str] = None, empty_pady: int = 12,
+                 pack: Optional[Dict[str, Any]] = None):
+        """
+        Initialize keyed rows
+
+        Args:
+            parent: Container the rows are packed into (after its other
+                children)
+            create: Callback(parent, item) -> row widget (not packed)
+            update: Optional callback(row, item) that patches a row; without
+                it changed rows are rebuilt
+            key: Callback(item) -> unique key
+            signature: Callback(item) -> value that changes with the item
+                (default: version field or content)
+            empty: Text shown when there are no items
+            empty_pady: Vertical padding of the empty-state label
+            pack: pack() options of each row
+        """
+        self.parent = parent
+        self.create = create
+        self.update = update
+        self.key = key
+        self.signature = signature
+        self.empty = empty
+        self.empty_pady = empty_pady
+        self.pack = pack or {'fill': 'x'}
+        self._rows: Dict[Hashable, Any] = {}       # key -> row widget
+        self._signatures: Dict[Hashable, Any] = {}
+        self._order: List[Hashable] = []
+        self._empty_label = None
+        self._shown_once = False
+        self._stats = {'reconciles': 0, 'skipped': 0, 'created': 0, 'updated': 0,
+                       'rebuilt': 0, 'removed': 0}
+
+    def reconcile(self, items: List[Any]) -> bool:
+        """
+        Show a new item list
+
+        Args:
+            items: Items in display order (repeated keys are dropped)
+
+        Returns:
+            False if nothing changed (no widget was touched)
+        """
+        keyed = {}
+        for item in items:
+            keyed.setdefault(self.key(item), item)
+        signatures = {key: self.signature(item) for key, item in keyed.items()}
+        order = list(keyed)
+        if self._shown_once and order == self._order and signatures == self._signatures:
+            self._stats['skipped'] += 1
+            return False
+        self._shown_once = True
+        self._stats['reconciles'] += 1
+
+        for key in [key for key in self._rows if key not in keyed]:
+            self._rows.pop(key).destroy()
+            del self._signatures[key]
+            self._stats['removed'] += 1
+        survivors = [key for key in self._order if key in keyed]
+
+        rebuilt = False
+        for key, item in keyed.items():
+            row = self._rows.get(key)
+            if row is None:
+                self._rows[key] = self.create(self.parent, item)
+                self._stats['created'] += 1
+            elif self._signatures[key] != signatures[key]:
+                if self.update is not None:
+                    self.update(row, item)
+                    self._stats['updated'] += 1
+                else:
+                    row.destroy()
+                    self._rows[key] = self.create(self.parent, item)
+                    self._stats['rebuilt'] += 1
+                    rebuilt = True
+        self._signatures = signatures
+
+        # Rows that stayed in order only need the new ones packed after them
+        if not rebuilt and order[:len(survivors)] == survivors:
+            fresh = order[len(survivors):]
+        else:
+            for key in survivors:
+                if key in self._rows:
+                    self._rows[key].pack_forget()
+            fresh = order
+        for key in fresh:
+            self._rows[key].pack(**self.pack)
+        self._order = order
+
+        self._show_empty(not order)
+        return True
+
+    def rows(self) -> Dict[Hashable, Any]:
+        """Row widgets by key, in display order"""
+        return {key: self._rows[key] for key in self._order}
+
+    def _show_empty(self, show: bool):
+        if self.empty is None:
+            return
+        if show and self._empty_label is None:
+            self._empty_label = tk.Label(self.parent, text=self.empty, bg='white', fg='#6B7280')
+            self._empty_label.pack(padx=12, pady=self.empty_pady)
+        elif not show and self._empty_label is not None:
+            self._empty_label.destroy()
+            self._empty_label = None
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get reconciliation statistics
+
+        Returns:
+            Dictionary with rows created, updated, rebuilt and removed, and
+            reconciles applied or skipped
+        """
+        return {**self._stats, 'rows': len(self._rows)}
@@ -0,0 +1,306 @@
+"""
+Request Scheduler
+Priority classes for API requests: user clicks go before background polling
+
+Every page refreshes itself in the background (dashboards every 30 s,
+notifications, SWR revalidations) and e-mails are sent from background
+threads. Those requests used to compete on equal terms with the request
+behind a click on "Approve" or "Register". Each API request now carries a
+priority class and must get a slot from the shared scheduler:
+
+- ``INTERACTIVE``: the user is waiting (default)
+- ``PREFETCH``: data the user will probably need soon (SWR revalidation)
+- ``BACKGROUND``: polling and fire-and-forget work (auto-refresh, e-mail)
+
+Queued requests are dispatched highest class first (FIFO within a class).
+A few slots are reserved for interactive requests, so a click never waits
+behind a burst of refreshes. Background requests are deferred while any
+interactive request is queued or running; background GETs that stay
+deferred for too long are dropped (``RequestDropped``), since the next poll
+fetches the same data anyway. Writes are never dropped.
+
+The class is taken from ``request_priority()`` on the calling thread unless
+passed explicitly.
+
+Usage:
+    from utils.request_scheduler import Priority, request_priority
+
+    def worker():
+        with request_priority(Priority.BACKGROUND):
+            events = sync.sync(self.api, 'events')
+
+    api.post('events/5/approve', priority=Priority.INTERACTIVE)
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Optional
+
+
+class Priority:
+    """Request priority classes (lower value is dispatched first)"""
+
+    INTERACTIVE = 0
+    PREFETCH = 1
+    BACKGROUND = 2
+
+    NAMES = {INTERACTIVE: 'interactive', PREFETCH: 'prefetch', BACKGROUND: 'background'}
+
+
+class RequestDropped(Exception):
+    """Raised when a deferred background request is dropped"""
+    pass
+
+
+_context = threading.local()
+
+
+def current_priority() -> int:
+    """Priority class for requests made on the calling thread"""
+    return getattr(_context, 'priority', Priority.INTERACTIVE)
+
+
+@contextmanager
+def request_priority(priority: int):
+    """
+    Make requests on the calling thread with a priority class
+
+    Args:
+        priority: Priority.INTERACTIVE, PREFETCH or BACKGROUND
+    """
+    previous = getattr(_context, 'priority', None)
+    _context.priority = priority
+    try:
+        yield
+    finally:
+        if previous is None:
+            del _context.priority
+        else:
+            _context.priority = previous
+
+
+class _Ticket:
+    """A request waiting for (or holding) a slot"""
+
+    __slots__ = ('priority', 'key', 'queued_at')
+
+    def __init__(self, priority: int, key: Optional[str]):
+        self.priority = priority
+        self.key = key
+        self.queued_at = time.monotonic()
+
+
+class RequestScheduler:
+    """
+    Limits concurrent API requests and dispatches them by priority class
+
+    Thread-safe; requests block in acquire() until they may run. slot() is
+    re-entrant: a thread already holding a slot (e.g. while it consumes a
+    streamed body) runs nested requests in that slot, so holding a slot
+    never waits for another slot and the scheduler cannot deadlock.
+    """
+
+    def __init__(self, max_in_flight: int = 8, interactive_reserved: int = 2,
+                 background_max_wait: float = 10.0):
+        """
+        Initialize scheduler
+
+        Args:
+            max_in_flight: Max concurrent requests
+            interactive_reserved: Slots only interactive requests may use
+            background_max_wait: Seconds a background GET may stay deferred
+                before it is dropped (None: never drop)
+        """
+        self.max_in_flight = max(1, int(max_in_flight))
+        self.interactive_reserved = min(max(0, int(interactive_reserved)), self.max_in_flight - 1)
+        self.background_max_wait = background_max_wait
+
+        self._cond = threading.Condition()
+        self._held = threading.local()  # Ticket held by slot() on this thread
+        self._queues: Dict[int, Deque[_Ticket]] = {p: deque() for p in Priority.NAMES}
+        self._running: Dict[int, int] = {p: 0 for p in Priority.NAMES}
+        self._stats = {
+            'dispatched': {name: 0 for name in Priority.NAMES.values()},
+            'deferred': 0,
+            'dropped': 0,
+            'promoted': 0,
+            'nested': 0,
+            'max_wait_ms': {name: 0.0 for name in Priority.NAMES.values()},
+        }
+
+    def acquire(self, priority: Optional[int] = None, key: Optional[str] = None,
+                droppable: bool = False) -> _Ticket:
+        """
+        Wait for a slot
+
+        Args:
+            priority: Priority class (default: the calling thread's)
+            key: Request identity, so promote() can find the ticket
+            droppable: Background request may be dropped instead of waiting
+                longer than background_max_wait
+
+        Returns:
+            Ticket to pass to release()
+
+        Raises:
+            RequestDropped: If a droppable background request waited too long
+        """
+        ticket = _Ticket(current_priority() if priority is None else priority, key)
+        with self._cond:
+            self._queues[ticket.priority].append(ticket)
+            deferred = False
+            while not self._can_run(ticket):
+                deferred = True
+                timeout = None
+                if droppable and ticket.priority == Priority.BACKGROUND and \
+                        self.background_max_wait is not None:
+                    timeout = ticket.queued_at + self.background_max_wait - time.monotonic()
+                    if timeout <= 0:
+                        self._queues[ticket.priority].remove(ticket)
+                        self._stats['dropped'] += 1
+                        self._cond.notify_all()
+                        raise RequestDropped(
+                            f"Background request dropped after {self.background_max_wait:.0f}s "
+                            f"behind interactive work"
+                        )
+                self._cond.wait(timeout)
+
+            self._queues[ticket.priority].popleft()
+            self._running[ticket.priority] += 1
+            name = Priority.NAMES[ticket.priority]
+            self._stats['dispatched'][name] += 1
+            if deferred:
+                self._stats['deferred'] += 1
+            waited = (time.monotonic() - ticket.queued_at) * 1000.0
+            if waited > self._stats['max_wait_ms'][name]:
+                self._stats['max_wait_ms'][name] = waited
+            if deferred:
+                # Others may be runnable now that the head of this class moved
+                self._cond.notify_all()
+        return ticket
+
+    def release(self, ticket: _Ticket):
+        """Give back a slot taken by acquire()"""
+        with self._cond:
+            self._running[ticket.priority] -= 1
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, priority: Optional[int] = None, key: Optional[str] = None,
+             droppable: bool = False):
+        """
+        Hold a slot for the duration of a with-block (see acquire())
+
+        A thread that already holds a slot reuses it instead of waiting.
+        """
+        held = getattr(self._held, 'ticket', None)
+        if held is not None:
+            with self._cond:
+                self._stats['nested'] += 1
+            yield held
+            return
+        ticket = self.acquire(priority, key, droppable)
+        self._held.ticket = ticket
+        try:
+            yield ticket
+        finally:
+            if getattr(self._held, 'ticket', None) is ticket:
+                self._held.ticket = None
+            self.release(ticket)
+
+    def promote(self, key: str, priority: Optional[int] = None) -> bool:
+        """
+        Raise the class of a queued request
+
+        Used when an interactive caller joins a coalesced request that a
+        background caller started, so the click does not wait behind polling.
+
+        Args:
+            key: Request identity passed to acquire()
+            priority: New class (default: the calling thread's)
+
+        Returns:
+            True if a queued ticket was promoted
+        """
+        priority = current_priority() if priority is None else priority
+        with self._cond:
+            for queued_priority in range(priority + 1, Priority.BACKGROUND + 1):
+                queue = self._queues[queued_priority]
+                for ticket in list(queue):
+                    if ticket.key == key:
+                        queue.remove(ticket)
+                        ticket.priority = priority
+                        self._queues[priority].append(ticket)
+                        self._stats['promoted'] += 1
+                        self._cond.notify_all()
+                        return True
+        return False
+
+    def interactive_pending(self) -> bool:
+        """Whether any interactive request is queued or running"""
+        with self._cond:
+            return bool(self._queues[Priority.INTERACTIVE] or self._running[Priority.INTERACTIVE])
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get scheduler statistics
+
+        Returns:
+            Dictionary with requests dispatched per class, deferred, dropped,
+            promoted and nested counts, longest queue wait per class, and current
+            queue lengths
+        """
+        with self._cond:
+            stats = {
+                'dispatched': dict(self._stats['dispatched']),
+                'deferred': self._stats['deferred'],
+                'dropped': self._stats['dropped'],
+                'promoted': self._stats['promoted'],
+                'nested': self._stats['nested'],
+                'max_wait_ms': dict(self._stats['max_wait_ms']),
+            }
+            stats['queued'] = {Priority.NAMES[p]: len(q) for p, q in self._queues.items()}
+            stats['in_flight'] = {Priority.NAMES[p]: n for p, n in self._running.items()}
+            return stats
+
+    def _can_run(self, ticket: _Ticket) -> bool:
+        """Whether ticket may take a slot now. Lock must be held."""
+        priority = ticket.priority
+        if self._queues[priority][0] is not ticket:
+            return False  # FIFO within a class
+        if any(self._queues[p] for p in range(priority)):
+            return False  # A higher class is waiting
+        in_flight = sum(self._running.values())
+        if priority == Priority.INTERACTIVE:
+            return in_flight < self.max_in_flight
+        if in_flight >= self.max_in_flight - self.interactive_reserved:
+            return False
+        if priority == Priority.BACKGROUND and self._running[Priority.INTERACTIVE]:
+            return False  # Defer polling while the user is waiting on a request
+        return True
+
+
+_global_scheduler: Optional[RequestScheduler] = None
+_global_scheduler_lock = threading.Lock()
+
+
+def get_request_scheduler() -> RequestScheduler:
+    """Get global request scheduler instance (limits from settings)"""
+    global _global_scheduler
+    if _global_scheduler is None:
+        with _global_scheduler_lock:
+            if _global_scheduler is None:
+                max_in_flight, reserved, max_wait = 8, 2, 10.0
+                try:
+                    from config.settings import settings
+                    max_in_flight = settings.get('PERFORMANCE_MAX_REQUESTS', max_in_flight) or max_in_flight
+                    reserved = settings.get('PERFORMANCE_INTERACTIVE_RESERVED', reserved)
+                    max_wait = settings.get('PERFORMANCE_BACKGROUND_MAX_WAIT', max_wait)
+                except Exception:
+                    pass
+                _global_scheduler = RequestScheduler(max_in_flight=max_in_flight,
+                                                     interactive_reserved=reserved,
+                                                     background_max_wait=max_wait)
+    return _global_scheduler
@@ -0,0 +1,260 @@
+"""
+Sync Manager
+Delta synchronisation of polled collections on top of APIClient
+
+The dashboards poll whole lists (``events``, ``events/registered``,
+``admin/bookings/pending``, ...) every refresh interval. With thousands of
+events most of those bytes are rows the client already has. ``SyncManager``
+keeps a local copy of each collection plus a high-water mark and asks the
+server only for what changed since then:
+
+    GET <endpoint>?since=<mark>
+
+    {
+        "items":   [...],        # rows created or updated after <mark>
+        "deleted": [3, 17],      # ids removed after <mark> (tombstones)
+        "version": 1234,         # new high-water mark
+        "reset":   false         # true: "items" is the full list, replace
+    }
+
+Rows may also carry tombstones inline as ``{"id": 3, "deleted": true}``.
+When the response has no ``version``, the mark is the largest
+``version``/``updated_at`` seen on the rows. A server that ignores ``since``
+and returns a plain list is handled as a full replace, and later syncs of
+that collection go back to plain (conditional) GETs.
+
+``sync()`` returns the same list object while nothing changed, so callers can
+keep using ``is`` to skip re-rendering, just like with 304 responses.
+
+Usage:
+    from utils.sync_manager import get_sync_manager
+
+    events = get_sync_manager().sync(self.api, 'events')
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+from urllib.parse import quote
+
+
+class SyncState:
+    """
+    Local copy of one collection
+
+    Attributes:
+        items: Rows by id, in server order (new rows appended)
+        rows: List handed to callers (rebuilt only when something changed)
+        mark: High-water mark for the next ``since`` request (None: full sync)
+        delta_supported: False once the server answered ``since`` with a list
+        response: Last plain-list response (a 304 hands back this object)
+    """
+
+    def __init__(self):
+        self.items: 'OrderedDict[Any, Dict[str, Any]]' = OrderedDict()
+        self.rows: Optional[List[Dict[str, Any]]] = None
+        self.mark: Any = None
+        self.delta_supported = True
+        self.response: Any = None
+        self.lock = threading.Lock()
+
+
+class SyncManager:
+    """
+    Per-collection delta sync with tombstone merging
+
+    State is kept per endpoint and auth identity, so two users on the same
+    machine never see each other's ``events/registered``.
+    """
+
+    MARK_FIELDS = ('version', 'updated_at', 'updatedAt')
+
+    def __init__(self, id_field: str = 'id'):
+        """
+        Initialize sync manager
+
+        Args:
+            id_field: Row field used to match upserts and tombstones
+        """
+        self.id_field = id_field
+        self._states: Dict[str, SyncState] = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            'full_syncs': 0,
+            'delta_syncs': 0,
+            'unchanged': 0,
+            'items_received': 0,
+            'tombstones': 0,
+        }
+
+    def sync(self, api, endpoint: str) -> List[Dict[str, Any]]:
+        """
+        Bring the local copy of a collection up to date
+
+        Args:
+            api: APIClient to fetch with (its token selects the state)
+            endpoint: Collection endpoint (e.g. 'events')
+
+        Returns:
+            Current rows; the same list object as last time if unchanged
+        """
+        state = self._state_for(api, endpoint)
+        with state.lock:
+            if state.delta_supported:
+                # since=0 asks a delta-aware server for everything plus a mark
+                mark = state.mark if state.rows is not None and state.mark is not None else 0
+                separator = '&' if '?' in endpoint else '?'
+                response = api.get(f"{endpoint}{separator}since={quote(str(mark))}")
+            else:
+                response = api.get(endpoint)
+            self._apply(state, response)
+            return state.rows
+
+    def get_rows(self, api, endpoint: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get the local copy without contacting the server
+
+        Returns:
+            Rows from the last sync, or None if never synced
+        """
+        return self._state_for(api, endpoint).rows
+
+    def reset(self, api=None, endpoint: Optional[str] = None):
+        """
+        Forget local copies so the next sync is a full one
+
+        Args:
+            api: With endpoint, reset only that collection for this identity
+            endpoint: Collection endpoint (all collections if None)
+        """
+        with self._lock:
+            if api is None or endpoint is None:
+                self._states.clear()
+            else:
+                self._states.pop(self._state_key(api, endpoint), None)
+
+    def clear(self):
+        """Forget all local copies (e.g. on logout)"""
+        self.reset()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get sync statistics
+
+        Returns:
+            Dictionary with full/delta sync counts, rows received and
+            tombstones applied
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['collections'] = len(self._states)
+        return stats
+
+    def _state_key(self, api, endpoint: str) -> str:
+        """Key local state by URL and auth identity (as conditional GET does)"""
+        url = f"{api.base_url}/{endpoint.lstrip('/')}"
+        return api._flight_key('GET', url, api._get_headers())
+
+    def _state_for(self, api, endpoint: str) -> SyncState:
+        key = self._state_key(api, endpoint)
+        with self._lock:
+            state = self._states.get(key)
+            if state is None:
+                state = self._states[key] = SyncState()
+            return state
+
+    def _apply(self, state: SyncState, response: Any):
+        """Merge a sync response into state. state.lock must be held."""
+        if isinstance(response, dict) and 'items' in response:
+            rows = response.get('items') or []
+            deleted = list(response.get('deleted') or [])
+            replace = bool(response.get('reset')) or state.rows is None
+            mark = response.get('version')
+        else:
+            # Plain list: the server ignores ?since= for this endpoint
+            if state.delta_supported:
+                print("[SYNC] Server returned a full list; using plain GETs for this collection")
+            state.delta_supported = False
+            if response is not None and response is state.response:
+                self._count('full_syncs', 0, 0, changed=False)
+                return  # 304: same decoded object
+            state.response = response
+            rows = response if isinstance(response, list) else []
+            deleted = []
+            replace = True
+            mark = None
+
+        live = []
+        for row in rows:
+            if isinstance(row, dict) and row.get('deleted') is True:
+                deleted.append(row.get(self.id_field))
+            else:
+                live.append(row)
+
+        if replace:
+            changed = state.rows is None or live != state.rows
+            if changed:
+                state.items = OrderedDict(
+                    (row.get(self.id_field), row) for row in live
+                    if isinstance(row, dict) and row.get(self.id_field) is not None
+                )
+                state.rows = live
+        else:
+            changed = False
+            for row in live:
+                row_id = row.get(self.id_field) if isinstance(row, dict) else None
+                if row_id is None or state.items.get(row_id) == row:
+                    continue
+                state.items[row_id] = row
+                changed = True
+            for row_id in deleted:
+                if state.items.pop(row_id, None) is not None:
+                    changed = True
+            if changed:
+                state.rows = list(state.items.values())
+
+        if mark is None and state.delta_supported:
+            mark = self._max_mark(live, None if replace else state.mark)
+        state.mark = mark
+
+        self._count('full_syncs' if replace else 'delta_syncs', len(live), len(deleted), changed)
+
+    def _count(self, kind: str, received: int, tombstones: int, changed: bool):
+        """Update sync counters"""
+        with self._lock:
+            self._stats[kind] += 1
+            self._stats['items_received'] += received
+            self._stats['tombstones'] += tombstones
+            if not changed:
+                self._stats['unchanged'] += 1
+
+    def _max_mark(self, rows: List[Dict[str, Any]], current: Any) -> Any:
+        """Largest version/updated_at on rows (falls back to current)"""
+        mark = current
+        for row in rows:
+            if not isinstance(row, dict):
+                continue
+            for field in self.MARK_FIELDS:
+                value = row.get(field)
+                if value is not None:
+                    try:
+                        if mark is None or value > mark:
+                            mark = value
+                    except TypeError:
+                        pass
+                    break
+        return mark
+
+
+_global_sync_manager: Optional[SyncManager] = None
+_global_sync_lock = threading.Lock()
+
+
+def get_sync_manager() -> SyncManager:
+    """Get global sync manager instance"""
+    global _global_sync_manager
+    if _global_sync_manager is None:
+        with _global_sync_lock:
+            if _global_sync_manager is None:
+                _global_sync_manager = SyncManager()
+    return _global_sync_manager
@@ -0,0 +1,369 @@
+"""
+Task Executor
+Bounded, page-scoped background task execution for the Tkinter frontend
+
+Pages used to start a fresh ``threading.Thread`` for every action, with no
+upper bound and no way to stop work for a page the user had already left.
+This module replaces that with two shared thread pools (I/O and CPU) whose
+tasks are owned by the page that submitted them:
+
+- ``run_async(page, fn)`` submits work and returns a ``Future``
+- ``deliver(widget, callback)`` hands a result back to the Tk main loop via
+  the UI dispatcher (see ``utils.ui_dispatcher``), dropping it if the
+  submitting task was cancelled or the widget is gone
+- ``cancel_owner(page)`` cancels a page's queued tasks and marks its running
+  tasks so their late results are discarded
+
+Usage:
+    from utils.task_executor import run_async, deliver
+
+    def worker():
+        events = self.api.get('events')
+        deliver(self, lambda: self._render(events))
+
+    run_async(self, worker)
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Set
+
+from utils.ui_dispatcher import get_dispatcher
+
+
+class Task:
+    """
+    A unit of work submitted to the TaskExecutor
+
+    Attributes:
+        owner_key: Identity of the owning page (None for unowned tasks)
+        interruptible: Whether hiding the owner cancels this task
+        cancelled: Set once the owner cancels its tasks
+        future: Future for the task's return value
+    """
+
+    __slots__ = ('owner_key', 'interruptible', 'cancelled', 'future')
+
+    def __init__(self, owner_key: Optional[int], interruptible: bool = True):
+        self.owner_key = owner_key
+        self.interruptible = interruptible
+        self.cancelled = False
+        self.future: Optional[Future] = None
+
+
+_current = threading.local()
+
+
+def current_task() -> Optional[Task]:
+    """Get the task running on the calling thread (None outside the executor)"""
+    return getattr(_current, 'task', None)
+
+
+def is_cancelled() -> bool:
+    """
+    Check whether the calling task has been cancelled
+
+    Long-running workers can poll this to stop early.
+    """
+    task = current_task()
+    return task is not None and task.cancelled
+
+
+class TaskExecutor:
+    """
+    Shared executor with separate I/O and CPU thread pools
+
+    Features:
+    - Bounded pools (no thread per click)
+    - Tasks return futures
+    - Per-owner tracking and cancellation
+    - Late results from cancelled tasks are dropped by deliver()
+    """
+
+    IO = 'io'
+    CPU = 'cpu'
+
+    def __init__(self, io_workers: int = 8, cpu_workers: int = 2):
+        """
+        Initialize executor
+
+        Args:
+            io_workers: Threads for network/disk bound work
+            cpu_workers: Threads for parsing/sorting bound work
+        """
+        self.io_workers = max(1, int(io_workers))
+        self.cpu_workers = max(1, int(cpu_workers))
+        self._pools = {
+            self.IO: ThreadPoolExecutor(max_workers=self.io_workers, thread_name_prefix='campus-io'),
+            self.CPU: ThreadPoolExecutor(max_workers=self.cpu_workers, thread_name_prefix='campus-cpu'),
+        }
+        self._lock = threading.Lock()
+        self._tasks: Dict[int, Set[Task]] = {}
+        self._interrupted: Set[int] = set()
+        self._watched: Set[int] = set()
+        self._stats = {
+            'submitted': 0,
+            'completed': 0,
+            'failed': 0,
+            'cancelled': 0,
+            'dropped_results': 0,
+        }
+
+    def submit(self, fn: Callable, *args, owner: Any = None, pool: str = IO,
+               interruptible: bool = True, **kwargs) -> Future:
+        """
+        Submit work to a pool
+
+        Args:
+            fn: Function to run in the background
+            *args: Function arguments
+            owner: Page (or other object) that owns the task
+            pool: TaskExecutor.IO or TaskExecutor.CPU
+            interruptible: If False the task survives its owner being hidden
+                (use for user-initiated mutations such as approve/save)
+            **kwargs: Function keyword arguments
+
+        Returns:
+            Future resolving to fn's return value
+        """
+        if pool not in self._pools:
+            raise ValueError(f"Unknown pool '{pool}' (expected 'io' or 'cpu')")
+
+        owner_key = id(owner) if owner is not None else None
+        task = Task(owner_key, interruptible)
+
+        with self._lock:
+            self._stats['submitted'] += 1
+            if owner_key is not None:
+                self._tasks.setdefault(owner_key, set()).add(task)
+
+        if owner is not None:
+            self._watch_owner(owner)
+
+        task.future = self._pools[pool].submit(self._run, task, fn, args, kwargs)
+        task.future.add_done_callback(lambda f, t=task: self._finish(t, f))
+        return task.future
+
+    def _run(self, task: Task, fn: Callable, args: tuple, kwargs: dict) -> Any:
+        """Run a task with it registered as the thread's current task"""
+        _current.task = task
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _current.task = None
+
+    def _finish(self, task: Task, future: Future):
+        """Bookkeeping once a task completes, fails or is cancelled"""
+        with self._lock:
+            owned = self._tasks.get(task.owner_key)
+            if owned is not None:
+                owned.discard(task)
+                if not owned:
+                    del self._tasks[task.owner_key]
+
+            if future.cancelled():
+                self._stats['cancelled'] += 1
+            elif future.exception() is not None:
+                self._stats['failed'] += 1
+                print(f"[EXECUTOR] Task failed: {future.exception()}")
+            else:
+                self._stats['completed'] += 1
+
+    def _watch_owner(self, owner: Any):
+        """Cancel an owner's tasks when its widget is destroyed"""
+        if not hasattr(owner, 'bind'):
+            return
+        if threading.current_thread() is not threading.main_thread():
+            return  # Tk may only be touched from the main thread
+
+        key = id(owner)
+        with self._lock:
+            if key in self._watched:
+                return
+            self._watched.add(key)
+
+        def on_destroy(event, owner=owner):
+            if event.widget is owner:
+                self.cancel_owner(owner, include_uninterruptible=True)
+                with self._lock:
+                    self._watched.discard(id(owner))
+                    self._interrupted.discard(id(owner))
+
+        try:
+            owner.bind('<Destroy>', on_destroy, add='+')
+        except Exception:
+            with self._lock:
+                self._watched.discard(key)
+
+    def cancel_owner(self, owner: Any, include_uninterruptible: bool = False) -> int:
+        """
+        Cancel an owner's tasks
+
+        Queued tasks are removed from the pool; running tasks are flagged so
+        that deliver() drops their results.
+
+        Args:
+            owner: Page whose tasks should be cancelled
+            include_uninterruptible: Also cancel tasks submitted with
+                interruptible=False (used when the owner is destroyed)
+
+        Returns:
+            Number of tasks cancelled
+        """
+        if owner is None:
+            return 0
+
+        key = id(owner)
+        with self._lock:
+            tasks = [
+                t for t in self._tasks.get(key, ())
+                if t.interruptible or include_uninterruptible
+            ]
+            for task in tasks:
+                task.cancelled = True
+            if tasks:
+                self._interrupted.add(key)
+
+        for task in tasks:
+            if task.future is not None:
+                task.future.cancel()
+
+        if tasks:
+            print(f"[EXECUTOR] Cancelled {len(tasks)} task(s) for {type(owner).__name__}")
+        return len(tasks)
+
+    def was_interrupted(self, owner: Any, clear: bool = True) -> bool:
+        """
+        Check whether an owner had work cancelled since the last check
+
+        Pages use this in load_page() to reload data that was abandoned when
+        the user navigated away before it arrived.
+
+        Args:
+            owner: Page to check
+            clear: Reset the flag after reading it
+        """
+        key = id(owner)
+        with self._lock:
+            interrupted = key in self._interrupted
+            if clear:
+                self._interrupted.discard(key)
+            return interrupted
+
+    def pending_count(self, owner: Any = None) -> int:
+        """
+        Number of tracked (queued or running) tasks
+
+        Args:
+            owner: Restrict the count to one owner
+        """
+        with self._lock:
+            if owner is not None:
+                return len(self._tasks.get(id(owner), ()))
+            return sum(len(tasks) for tasks in self._tasks.values())
+
+    def record_dropped_result(self):
+        """Count a result that was discarded because its task was cancelled"""
+        with self._lock:
+            self._stats['dropped_results'] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get executor statistics
+
+        Returns:
+            Dictionary with pool sizes and task counters
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['io_workers'] = self.io_workers
+            stats['cpu_workers'] = self.cpu_workers
+            stats['pending'] = sum(len(tasks) for tasks in self._tasks.values())
+            stats['owners'] = len(self._tasks)
+            return stats
+
+    def shutdown(self, wait: bool = False):
+        """Stop accepting work and cancel queued tasks"""
+        for pool in self._pools.values():
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+
+_global_executor: Optional[TaskExecutor] = None
+_global_lock = threading.Lock()
+
+
+def get_executor() -> TaskExecutor:
+    """Get global task executor instance (pool sizes from settings)"""
+    global _global_executor
+    if _global_executor is None:
+        with _global_lock:
+            if _global_executor is None:
+                io_workers, cpu_workers = 8, 2
+                try:
+                    from config.settings import settings
+                    io_workers = settings.get('PERFORMANCE_IO_WORKERS', io_workers) or io_workers
+                    cpu_workers = settings.get('PERFORMANCE_CPU_WORKERS', cpu_workers) or cpu_workers
+                except Exception:
+                    pass
+                _global_executor = TaskExecutor(io_workers=io_workers, cpu_workers=cpu_workers)
+    return _global_executor
+
+
+def run_async(owner: Any, fn: Callable, *args, pool: str = TaskExecutor.IO,
+              interruptible: bool = True, **kwargs) -> Future:
+    """
+    Submit work owned by a page to the global executor
+
+    Args:
+        owner: Page that owns the task (None for app-level work)
+        fn: Function to run in the background
+        pool: TaskExecutor.IO or TaskExecutor.CPU
+        interruptible: If False the task survives its owner being hidden
+
+    Returns:
+        Future resolving to fn's return value
+    """
+    return get_executor().submit(fn, *args, owner=owner, pool=pool,
+                                 interruptible=interruptible, **kwargs)
+
+
+def deliver(widget: Any, callback: Callable, *args):
+    """
+    Schedule a callback on the Tk main loop for the calling task
+
+    Callbacks go through the UI dispatcher pump when it is installed (one
+    batched drain per frame) and fall back to ``widget.after(0, ...)``
+    otherwise. The callback is dropped if the task that produced it has been cancelled
+    (before or after scheduling) or if the widget no longer exists.
+
+    Args:
+        widget: Tk widget whose main loop should run the callback
+        callback: Function to call on the main thread
+        *args: Callback arguments
+    """
+    task = current_task()
+    if task is not None and task.cancelled:
+        get_executor().record_dropped_result()
+        return
+
+    def run():
+        if task is not None and task.cancelled:
+            get_executor().record_dropped_result()
+            return
+        try:
+            if not widget.winfo_exists():
+                return
+        except Exception:
+            return
+        callback(*args)
+
+    dispatcher = get_dispatcher()
+    if dispatcher.is_running():
+        dispatcher.post(run)
+        return
+
+    try:
+        widget.after(0, run)
+    except Exception:
+        # Widget destroyed or main loop already gone
+        pass
@@ -100,6 +100,132 @@ class TestCache(unittest.TestCase):
         # Should have entries
         stats = self.cache.get_stats()
         self.assertGreater(stats['total_entries'], 0)
+    
+    def test_lru_eviction(self):
+        """Test least recently used entry is evicted first"""
+        for i in range(5):
+            self.cache.set(f"key{i}", f"value{i}")
+        
+        # Touch key0 so key1 becomes least recently used
+        self.cache.get("key0")
+        self.cache.set("key5", "value5")
+        
+        self.assertEqual(self.cache.get("key0"), "value0")
+        self.assertIsNone(self.cache.get("key1"))
+        self.assertEqual(self.cache.get_stats()['evictions'], 1)
+    
+    def test_byte_budget(self):
+        """Test eviction by estimated payload size"""
+        cache = Cache(default_ttl=60, max_size=None, max_bytes=20000)
+        
+        for i in range(20):
+            cache.set(f"page{i}", {"data": [f"{i}-{j}".ljust(100, "x") for j in range(20)]})
+        
+        stats = cache.get_stats()
+        self.assertLessEqual(stats['bytes_used'], 20000)
+        self.assertLess(stats['total_entries'], 20)
+        self.assertIsNone(cache.get("page0"))
+        self.assertIsNotNone(cache.get("page19"))
+    
+    def test_oversize_value_not_cached(self):
+        """Test values larger than the whole budget are rejected"""
+        cache = Cache(max_size=None, max_bytes=1000)
+        cache.set("big", "x" * 5000)
+        
+        self.assertIsNone(cache.get("big"))
+        self.assertEqual(cache.get_stats()['rejected_oversize'], 1)
+    
+    def test_overwrite_resets_expiry(self):
+        """Test re-setting a key replaces its old expiry"""
+        self.cache.set("key", "old", ttl=1)
+        self.cache.set("key", "new", ttl=100)
+        time.sleep(1.1)
+        
+        self.assertEqual(self.cache.cleanup_expired(), 0)
+        self.assertEqual(self.cache.get("key"), "new")
+    
+    def test_background_sweeper(self):
+        """Test sweeper removes expired entries without reads"""
+        cache = Cache(default_ttl=1, max_size=10, cleanup_interval=0.2)
+        try:
+            cache.set("temp", "value")
+            time.sleep(1.5)
+            self.assertEqual(cache.get_stats()['total_entries'], 0)
+        finally:
+            cache.stop_sweeper()
+    
+    def test_global_cache_sweeper_starts_on_first_use(self):
+        """Test importing the module starts no thread; get_cache() does"""
+        from utils import performance
+        self.assertIsNone(performance._create_global_cache()._sweeper)
+        
+        cache = performance.get_cache()
+        self.assertTrue(cache._sweeper.is_alive())
+        self.assertIs(performance.get_cache()._sweeper, cache._sweeper)
+    
+    def test_invalidate_prefix(self):
+        """Test prefix invalidation matches whole path segments"""
+        cache = Cache(max_size=None)
+        cache.set("api:events/5", 1)
+        cache.set("api:events/5/registrations", 2)
+        cache.set("api:events/5?fields=title", 3)
+        cache.set("api:events/50", 4)
+        cache.set("api:events", 5)
+        
+        self.assertEqual(cache.invalidate_prefix("api:events/5"), 3)
+        self.assertEqual(cache.get("api:events/50"), 4)
+        self.assertEqual(cache.get("api:events"), 5)
+        
+        self.assertEqual(cache.invalidate_prefix("api:events"), 2)
+        self.assertEqual(cache.get_stats()['total_entries'], 0)
+    
+    def test_invalidate_tags(self):
+        """Test tag invalidation removes only tagged keys"""
+        cache = Cache(max_size=None)
+        cache.set("page1", [1, 2], tags=["events:1", "events:2"])
+        cache.set("page2", [3], tags=["events:3"])
+        cache.set("detail1", {}, tags=["events:1"])
+        
+        self.assertEqual(cache.invalidate_tags("events:1"), 2)
+        self.assertIsNone(cache.get("page1"))
+        self.assertEqual(cache.get("page2"), [3])
+        
+        # Index entries for removed keys are gone too
+        self.assertEqual(cache.invalidate_tags("events:2"), 0)
+    
+    def test_eviction_cleans_indexes(self):
+        """Test evicted and expired keys leave no tag or trie records"""
+        for i in range(10):
+            self.cache.set(f"api:events/{i}", i, tags=[f"events:{i}"])
+        
+        stats = self.cache.get_stats()
+        self.assertEqual(stats['total_entries'], 5)
+        self.assertEqual(stats['tags'], 5)
+        self.assertEqual(self.cache.invalidate_prefix("api:events/0"), 0)
+        self.assertEqual(self.cache.invalidate_prefix("api:events"), 5)
+        self.assertEqual(self.cache._trie.children, {})
+    
+    def test_stale_window(self):
+        """Test stale values are served by get_with_state but not get"""
+        self.cache.set("events", [1], ttl=1, stale_ttl=100)
+        self.assertEqual(self.cache.get_with_state("events"), ([1], True))
+        
+        time.sleep(1.1)
+        self.assertIsNone(self.cache.get("events"))
+        self.assertEqual(self.cache.get_with_state("events"), ([1], False))
+        self.assertEqual(self.cache.cleanup_expired(), 0)
+        self.assertEqual(self.cache.get_stats()['stale_hits'], 1)
+    
+    def test_hit_rate_stats(self):
+        """Test hit/miss counters"""
+        self.cache.set("key", "value")
+        self.cache.get("key")
+        self.cache.get("missing")
+        
+        stats = self.cache.get_stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['hit_rate'], 50)
 
 
 class TestPaginator(unittest.TestCase):
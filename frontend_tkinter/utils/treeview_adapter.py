@@ -0,0 +1,193 @@
+"""
+Treeview Adapter
+Keeps a ttk.Treeview in sync with a list of rows without freezing the window
+
+Tables used to be refilled with ``delete(*get_children())`` and one
+``insert()`` per row in a single loop on the Tk thread. A filter keystroke
+over a few thousand users froze the window for the whole refill. The
+adapter replaces that loop:
+
+- rows are keyed (by user id, ...) and the item id is the key, so a new row
+  set is diffed against what the table shows: rows that left are deleted in
+  one call, rows that stayed keep their item (and selection) and are only
+  updated when their values changed, new rows are inserted
+- the work runs in ``after()`` chunks with a per-chunk time budget; the
+  first chunk runs at once so the top of the table appears immediately
+- a new ``set_rows()`` cancels the population in progress and diffs from
+  whatever the table shows at that moment
+
+Usage:
+    from utils.treeview_adapter import TreeviewAdapter
+
+    table = TreeviewAdapter(tree, lambda user: (user['id'], user['name']))
+    table.set_rows(users)          # on every filter change
+"""
+
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+
+class TreeviewAdapter:
+    """
+    Chunked, diffing population of a flat ttk.Treeview
+
+    Features:
+    - Item ids are row keys; unchanged rows are left alone
+    - Time-budgeted after() chunks keep the window responsive
+    - A newer row set cancels the population in progress
+    """
+
+    def __init__(self, tree: Any, row_values: Callable[[Any], Sequence[Any]],
+                 key: Callable[[Any], Hashable] = lambda row: row.get('id'),
+                 tags: Optional[Callable[[Any], Tuple[str, ...]]] = None,
+                 budget_ms: float = 8.0, delay_ms: int = 1):
+        """
+        Initialize adapter
+
+        Args:
+            tree: ttk.Treeview to fill (top-level items only)
+            row_values: Callback(row) -> column values
+            key: Callback(row) -> unique key (rows without one are always
+                inserted as new)
+            tags: Optional callback(row) -> item tags
+            budget_ms: Maximum time spent per chunk
+            delay_ms: Delay between chunks in milliseconds
+        """
+        self.tree = tree
+        self.row_values = row_values
+        self.key = key
+        self.tags = tags
+        self.budget_ms = max(1.0, float(budget_ms))
+        self.delay_ms = max(1, int(delay_ms))
+        self._values: Dict[str, Tuple[Any, ...]] = {}  # item id -> shown values
+        self._pending: List[Tuple[str, Any, bool]] = []  # (item id, row, is new)
+        self._position = 0
+        self._reorder = False
+        self._after_id = None
+        self._stats = {
+            'populations': 0,
+            'cancelled': 0,
+            'chunks': 0,
+            'inserted': 0,
+            'updated': 0,
+            'moved': 0,
+            'deleted': 0,
+            'unchanged': 0,
+        }
+
+    @property
+    def busy(self) -> bool:
+        """Whether a population is still in progress"""
+        return self._after_id is not None
+
+    def set_rows(self, rows: Sequence[Any]):
+        """
+        Show a new row set (cancels a population in progress)
+
+        Args:
+            rows: Rows in display order
+        """
+        if self.busy:
+            self._stats['cancelled'] += 1
+        self.cancel()
+        self._stats['populations'] += 1
+
+        # Item id per row; repeated or missing keys get no id (inserted as new)
+        pending = []
+        wanted = set()
+        for row in rows:
+            key = self.key(row)
+            iid = None if key is None else str(key)
+            if iid is not None and iid in wanted:
+                iid = None
+            if iid is not None:
+                wanted.add(iid)
+            pending.append((iid, row, iid not in self._values))
+
+        stale = [iid for iid in self._values if iid not in wanted]
+        if stale:
+            self.tree.delete(*stale)
+            for iid in stale:
+                del self._values[iid]
+            self._stats['deleted'] += len(stale)
+
+        # Rows that stayed keep their place unless the order changed (or an
+        # earlier population was cancelled with rows still detached)
+        shown = [iid for iid in self.tree.get_children() if iid in wanted]
+        kept = [iid for iid, _, is_new in pending if iid is not None and not is_new]
+        self._reorder = shown != kept
+        if self._reorder and shown:
+            self.tree.detach(*shown)
+
+        self._pending = pending
+        self._position = 0
+        self._step()
+
+    def cancel(self):
+        """Stop the population in progress (rows shown so far stay)"""
+        if self._after_id is not None:
+            self.tree.after_cancel(self._after_id)
+            self._after_id = None
+        self._pending = []
+        self._position = 0
+
+    def clear(self):
+        """Cancel and remove every row (including rows still detached)"""
+        self.cancel()
+        if self._values:
+            self.tree.delete(*self._values)
+        self._stats['deleted'] += len(self._values)
+        self._values.clear()
+
+    def _step(self):
+        """Apply pending rows until the chunk's time budget is used"""
+        self._after_id = None
+        if not self.tree.winfo_exists():
+            return
+        self._stats['chunks'] += 1
+        deadline = time.perf_counter() + self.budget_ms / 1000.0
+        pending = self._pending
+        index = self._position
+        while index < len(pending):
+            iid, row, is_new = pending[index]
+            values = tuple(self.row_values(row))
+            if is_new:
+                options = {'values': values}
+                if self.tags is not None:
+                    options['tags'] = self.tags(row)
+                if iid is not None:
+                    options['iid'] = iid
+                iid = self.tree.insert('', index, **options)
+                self._values[iid] = values
+                self._stats['inserted'] += 1
+            else:
+                if self._reorder:
+                    self.tree.move(iid, '', index)
+                    self._stats['moved'] += 1
+                if self._values[iid] != values:
+                    options = {'values': values}
+                    if self.tags is not None:
+                        options['tags'] = self.tags(row)
+                    self.tree.item(iid, **options)
+                    self._values[iid] = values
+                    self._stats['updated'] += 1
+                else:
+                    self._stats['unchanged'] += 1
+            index += 1
+            if index % 25 == 0 and time.perf_counter() >= deadline:
+                break
+        self._position = index
+        if index < len(pending):
+            self._after_id = self.tree.after(self.delay_ms, self._step)
+        else:
+            self._pending = []
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get population statistics
+
+        Returns:
+            Dictionary with rows inserted, updated, moved, deleted and
+            unchanged, chunks run and populations cancelled
+        """
+        return {**self._stats, 'rows': len(self._values), 'busy': self.busy}
@@ -0,0 +1,261 @@
+"""
+UI Dispatcher
+Single main-thread pump for handing worker results to Tkinter
+
+Tk widgets may only be touched from the main thread. Workers used to reach
+the UI in two ways: some called callbacks directly on the worker thread
+(unsafe), others scheduled one ``after(0, ...)`` per result (hundreds of Tcl
+timer events during a dashboard load). The dispatcher replaces both:
+
+- workers ``post()`` callbacks onto a thread-safe queue
+- one ``after()`` loop on the root window drains the queue once per frame,
+  running as many callbacks as fit in a per-tick time budget
+- anything left over waits for the next tick, so the window stays responsive
+
+Usage:
+    from utils.ui_dispatcher import get_dispatcher
+
+    # Once, on the main thread
+    get_dispatcher().install(root)
+
+    # From any thread
+    get_dispatcher().post(label.config, text="Loaded")
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Optional
+
+
+class UIDispatcher:
+    """
+    Thread-safe callback queue drained by a Tk ``after()`` loop
+
+    Features:
+    - post() is safe from any thread
+    - Callbacks run on the main thread in FIFO order
+    - Frame-sized batches with a per-tick time budget
+    - Queue depth and drain latency statistics
+    """
+
+    def __init__(self, frame_ms: int = 16, budget_ms: float = 8.0):
+        """
+        Initialize dispatcher
+
+        Args:
+            frame_ms: Delay between drain ticks in milliseconds
+            budget_ms: Maximum time spent running callbacks per tick
+        """
+        self.frame_ms = max(1, int(frame_ms))
+        self.budget_ms = max(1.0, float(budget_ms))
+        self._queue: deque = deque()
+        self._root = None
+        self._after_id = None
+        self._running = False
+        self._lock = threading.Lock()
+        self._stats = {
+            'posted': 0,
+            'dispatched': 0,
+            'failed': 0,
+            'ticks': 0,
+            'busy_ticks': 0,
+            'over_budget_ticks': 0,
+            'max_queue_depth': 0,
+            'max_batch': 0,
+            'total_latency': 0.0,
+            'max_latency': 0.0,
+        }
+
+    def install(self, root: Any):
+        """
+        Start the drain loop on a Tk root window
+
+        Must be called from the main thread.
+
+        Args:
+            root: Tk root (or any widget living for the whole session)
+        """
+        self.stop()
+        self._root = root
+        self._running = True
+        self._schedule()
+        print(f"[DISPATCH] Pump installed ({self.frame_ms}ms frame, {self.budget_ms:g}ms budget)")
+
+    def stop(self):
+        """Stop the drain loop (queued callbacks are kept)"""
+        self._running = False
+        if self._root is not None and self._after_id is not None:
+            try:
+                self._root.after_cancel(self._after_id)
+            except Exception:
+                pass
+        self._after_id = None
+
+    def is_running(self) -> bool:
+        """Check whether the drain loop is active"""
+        return self._running
+
+    def post(self, callback: Callable, *args, **kwargs):
+        """
+        Queue a callback to run on the main thread
+
+        Args:
+            callback: Function to call
+            *args: Callback arguments
+            **kwargs: Callback keyword arguments
+        """
+        # deque.append is atomic, so workers never block on the UI thread
+        self._queue.append((time.perf_counter(), callback, args, kwargs))
+        with self._lock:
+            self._stats['posted'] += 1
+            depth = len(self._queue)
+            if depth > self._stats['max_queue_depth']:
+                self._stats['max_queue_depth'] = depth
+
+    def queue_depth(self) -> int:
+        """Number of callbacks waiting to run"""
+        return len(self._queue)
+
+    def drain(self, budget_ms: Optional[float] = None) -> int:
+        """
+        Run queued callbacks until the queue is empty or the budget is spent
+
+        At least one callback runs per call so a slow callback cannot stall
+        the queue forever.
+
+        Args:
+            budget_ms: Time budget (defaults to the dispatcher's budget)
+
+        Returns:
+            Number of callbacks run
+        """
+        budget = (self.budget_ms if budget_ms is None else budget_ms) / 1000.0
+        start = time.perf_counter()
+        deadline = start + budget
+        count = 0
+        latency_total = 0.0
+        latency_max = 0.0
+        failed = 0
+
+        while self._queue:
+            try:
+                posted_at, callback, args, kwargs = self._queue.popleft()
+            except IndexError:
+                break
+
+            latency = time.perf_counter() - posted_at
+            latency_total += latency
+            if latency > latency_max:
+                latency_max = latency
+
+            try:
+                callback(*args, **kwargs)
+            except Exception as e:
+                failed += 1
+                print(f"[DISPATCH] Callback failed: {e}")
+            count += 1
+
+            if time.perf_counter() >= deadline:
+                break
+
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self._stats['ticks'] += 1
+            if count:
+                self._stats['busy_ticks'] += 1
+                self._stats['dispatched'] += count
+                self._stats['failed'] += failed
+                self._stats['total_latency'] += latency_total
+                if latency_max > self._stats['max_latency']:
+                    self._stats['max_latency'] = latency_max
+                if count > self._stats['max_batch']:
+                    self._stats['max_batch'] = count
+            if elapsed > budget:
+                self._stats['over_budget_ticks'] += 1
+
+        return count
+
+    def _tick(self):
+        """One pump iteration: drain a batch, then reschedule"""
+        self._after_id = None
+        if not self._running:
+            return
+        try:
+            self.drain()
+        finally:
+            self._schedule()
+
+    def _schedule(self):
+        """Schedule the next tick on the root window"""
+        if not self._running or self._root is None:
+            return
+        try:
+            self._after_id = self._root.after(self.frame_ms, self._tick)
+        except Exception:
+            # Root destroyed; fall back to inline delivery
+            self._running = False
+            self._after_id = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get dispatcher statistics
+
+        Returns:
+            Dictionary with queue depth, batch sizes and drain latency
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        dispatched = stats['dispatched']
+        busy_ticks = stats['busy_ticks']
+        stats['queue_depth'] = len(self._queue)
+        stats['running'] = self._running
+        stats['avg_batch'] = round(dispatched / busy_ticks, 2) if busy_ticks else 0
+        stats['avg_latency_ms'] = round(stats.pop('total_latency') / dispatched * 1000, 2) if dispatched else 0
+        stats['max_latency_ms'] = round(stats.pop('max_latency') * 1000, 2)
+        return stats
+
+    def reset_stats(self):
+        """Reset statistics"""
+        with self._lock:
+            for key in self._stats:
+                self._stats[key] = 0.0 if key in ('total_latency', 'max_latency') else 0
+
+
+_global_dispatcher: Optional[UIDispatcher] = None
+_global_lock = threading.Lock()
+
+
+def get_dispatcher() -> UIDispatcher:
+    """Get global UI dispatcher instance (timings from settings)"""
+    global _global_dispatcher
+    if _global_dispatcher is None:
+        with _global_lock:
+            if _global_dispatcher is None:
+                frame_ms, budget_ms = 16, 8
+                try:
+                    from config.settings import settings
+                    frame_ms = settings.get('PERFORMANCE_UI_FRAME_MS', frame_ms) or frame_ms
+                    budget_ms = settings.get('PERFORMANCE_UI_BUDGET_MS', budget_ms) or budget_ms
+                except Exception:
+                    pass
+                _global_dispatcher = UIDispatcher(frame_ms=frame_ms, budget_ms=budget_ms)
+    return _global_dispatcher
+
+
+def call_in_ui(callback: Callable, *args, **kwargs):
+    """
+    Run a callback on the main thread via the dispatcher
+
+    If no pump is installed (scripts, tests) the callback runs inline.
+
+    Args:
+        callback: Function to call
+        *args: Callback arguments
+        **kwargs: Callback keyword arguments
+    """
+    dispatcher = get_dispatcher()
+    if dispatcher.is_running():
+        dispatcher.post(callback, *args, **kwargs)
+    else:
+        callback(*args, **kwargs)